@@ -0,0 +1,21 @@
+extern crate pyo3;
+extern crate rayon;
+
+use pyo3::prelude::*;
+
+#[pyfunction]
+#[pyo3(signature = (num_threads))]
+pub fn set_rayon_threads(num_threads: usize) -> bool {
+    // The global thread pool of rayon can only be built once,
+    // return false if it has been built by the first parallel call or before.
+    rayon::ThreadPoolBuilder::new()
+        .num_threads(num_threads)
+        .build_global()
+        .is_ok()
+}
+
+#[pyfunction]
+#[pyo3(signature = ())]
+pub fn rayon_threads() -> usize {
+    rayon::current_num_threads()
+}
@@ -14,6 +14,10 @@ pub enum QubitDegree {
 #[pyfunction]
 #[pyo3(signature = (target, start, end, step))]
 pub fn cycling_slice_rust(target: &str, start: i32, end: i32, step: i32) -> PyResult<String> {
+    cycling_slice_kernel(target, start, end, step)
+}
+
+pub fn cycling_slice_kernel(target: &str, start: i32, end: i32, step: i32) -> PyResult<String> {
     let length = target.len() as i32;
     let slice_check = vec![
         (
@@ -66,6 +70,10 @@ pub fn cycling_slice_rust(target: &str, start: i32, end: i32, step: i32) -> PyRe
 #[pyfunction]
 #[pyo3(signature = (num_qubits, degree=None))]
 pub fn qubit_selector_rust(num_qubits: i32, degree: Option<QubitDegree>) -> PyResult<(i32, i32)> {
+    qubit_selector_kernel(num_qubits, degree)
+}
+
+pub fn qubit_selector_kernel(num_qubits: i32, degree: Option<QubitDegree>) -> PyResult<(i32, i32)> {
     let full_subsystem: Vec<i32> = (0..num_qubits).collect();
 
     let item_range: (i32, i32) = match degree {
@@ -132,9 +140,17 @@ pub fn degree_handler_rust(
     allsystems_size: i32,
     degree: Option<QubitDegree>,
     measure: Option<(i32, i32)>,
+) -> ((i32, i32), (i32, i32), i32) {
+    degree_handler_kernel(allsystems_size, degree, measure)
+}
+
+pub fn degree_handler_kernel(
+    allsystems_size: i32,
+    degree: Option<QubitDegree>,
+    measure: Option<(i32, i32)>,
 ) -> ((i32, i32), (i32, i32), i32) {
     // Determine degree
-    let actual_deg: (i32, i32) = qubit_selector_rust(allsystems_size, degree).unwrap();
+    let actual_deg: (i32, i32) = qubit_selector_kernel(allsystems_size, degree).unwrap();
     let subsystems_size: i32 = actual_deg.1 - actual_deg.0;
 
     let bitstring_range: (i32, i32) = actual_deg.clone();
@@ -170,7 +186,7 @@ pub fn degree_handler_rust(
             tmp
         }
         None => {
-            let tmp: PyResult<(i32, i32)> = qubit_selector_rust(
+            let tmp: PyResult<(i32, i32)> = qubit_selector_kernel(
                 allsystems_size,
                 Some(QubitDegree::Pair(actual_deg.0, actual_deg.1)),
             );
@@ -212,7 +228,7 @@ pub fn test_construct() {
                 println!("| Inputqubits range: {} to {}", start, end);
             }
         }
-        match qubit_selector_rust(num_qubits, degree.clone()) {
+        match qubit_selector_kernel(num_qubits, degree.clone()) {
             Ok(item_range) => {
                 let (start, end) = item_range;
                 println!("| Selected qubits range: {} to {}", start, end);
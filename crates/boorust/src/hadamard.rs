@@ -6,7 +6,15 @@ use std::collections::HashMap;
 
 #[pyfunction]
 #[pyo3(signature = (shots, counts))]
-pub fn purity_echo_core_rust(shots: i32, counts: Vec<HashMap<String, i32>>) -> PyResult<f64> {
+pub fn purity_echo_core_rust(
+    py: Python<'_>,
+    shots: i32,
+    counts: Vec<HashMap<String, i32>>,
+) -> PyResult<f64> {
+    py.allow_threads(move || purity_echo_core_kernel(shots, counts))
+}
+
+pub fn purity_echo_core_kernel(shots: i32, counts: Vec<HashMap<String, i32>>) -> PyResult<f64> {
     let only_counts = &counts[0];
     let sample_shots: i32 = only_counts.values().sum();
 
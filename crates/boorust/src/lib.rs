@@ -1,15 +1,19 @@
+mod concurrency;
 mod construct;
 mod hadamard;
+mod magsq;
 mod randomized;
 mod tool;
 
 extern crate pyo3;
 use pyo3::prelude::*;
 
+use crate::concurrency::{rayon_threads, set_rayon_threads};
 use crate::construct::{
     cycling_slice_rust, degree_handler_rust, qubit_selector_rust, test_construct,
 };
 use crate::hadamard::purity_echo_core_rust;
+use crate::magsq::{magnetic_square_core_rust, magsq_cell_rust, zz_correlator_rust};
 use crate::randomized::echo::v1::{echo_cell_rust, overlap_echo_core_rust};
 use crate::randomized::echo::v2::{echo_cell_2_rust, overlap_echo_core_2_rust};
 use crate::randomized::entropy::v1::{entangled_entropy_core_rust, purity_cell_rust};
@@ -23,6 +27,14 @@ fn boorust(m: &Bound<'_, PyModule>) -> PyResult<()> {
     Ok(())
 }
 
+// The GIL is released only around the loop-heavy `*_kernel` paths,
+// which run over the counts or the bitstrings:
+// the functions taking `py: Python<'_>` extract their arguments into Rust-owned values,
+// then call them inside `py.allow_threads`,
+// so the other Python threads keep running during the computation.
+// The constant-time helpers, `ensemble_cell_rust`, `hamming_distance_rust`,
+// `cycling_slice_rust`, `qubit_selector_rust` and `degree_handler_rust`, keep the GIL,
+// since releasing it costs more than they do.
 fn register_child_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     let randomized = PyModule::new(parent_module.py(), "randomized")?;
     // construct
@@ -50,18 +62,29 @@ fn register_child_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     let hadamard = PyModule::new(parent_module.py(), "hadamard")?;
     hadamard.add_function(wrap_pyfunction!(purity_echo_core_rust, &hadamard)?)?;
 
+    let magsq = PyModule::new(parent_module.py(), "magsq")?;
+    magsq.add_function(wrap_pyfunction!(magsq_cell_rust, &magsq)?)?;
+    magsq.add_function(wrap_pyfunction!(magnetic_square_core_rust, &magsq)?)?;
+    magsq.add_function(wrap_pyfunction!(zz_correlator_rust, &magsq)?)?;
+
     let dummy = PyModule::new(parent_module.py(), "dummy")?;
     dummy.add_function(wrap_pyfunction!(make_two_bit_str_32, &dummy)?)?;
     dummy.add_function(wrap_pyfunction!(make_dummy_case_32, &dummy)?)?;
     dummy.add_function(wrap_pyfunction!(make_two_bit_str_unlimit, &dummy)?)?;
 
+    let concurrency = PyModule::new(parent_module.py(), "concurrency")?;
+    concurrency.add_function(wrap_pyfunction!(set_rayon_threads, &concurrency)?)?;
+    concurrency.add_function(wrap_pyfunction!(rayon_threads, &concurrency)?)?;
+
     let test = PyModule::new(parent_module.py(), "test")?;
     test.add_function(wrap_pyfunction!(test_construct, &test)?)?;
 
     parent_module.add_submodule(&randomized)?;
     parent_module.add_submodule(&construct)?;
     parent_module.add_submodule(&hadamard)?;
+    parent_module.add_submodule(&magsq)?;
     parent_module.add_submodule(&dummy)?;
+    parent_module.add_submodule(&concurrency)?;
     parent_module.add_submodule(&test)?;
     Ok(())
 }
@@ -0,0 +1,144 @@
+extern crate pyo3;
+extern crate rayon;
+
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use rayon::prelude::*;
+use std::collections::HashMap;
+use std::time::Instant;
+
+#[pyfunction]
+#[pyo3(signature = (single_counts, shots))]
+pub fn zz_correlator_rust(
+    py: Python<'_>,
+    single_counts: HashMap<String, i32>,
+    shots: i32,
+) -> PyResult<Vec<Vec<f64>>> {
+    py.allow_threads(move || zz_correlator_kernel(single_counts, shots))
+}
+
+pub fn zz_correlator_kernel(
+    single_counts: HashMap<String, i32>,
+    shots: i32,
+) -> PyResult<Vec<Vec<f64>>> {
+    let sample_shots: i32 = single_counts.values().sum();
+    if sample_shots != shots {
+        return Err(PyValueError::new_err(format!(
+            "shots {} does not match sample_shots {}",
+            shots, sample_shots
+        )));
+    }
+    let num_qubits = match single_counts.keys().next() {
+        Some(bitstring) => bitstring.len(),
+        None => return Ok(Vec::new()),
+    };
+
+    // The spins of each outcome with the qubit i on the column i,
+    // which is the reversed order of the bitstring.
+    let (spins, weights): (Vec<Vec<f64>>, Vec<f64>) = single_counts
+        .iter()
+        .map(|(bitstring, count)| {
+            let spin = bitstring
+                .bytes()
+                .rev()
+                .map(|b| if b == b'1' { -1.0 } else { 1.0 })
+                .collect::<Vec<f64>>();
+            (spin, *count as f64 / shots as f64)
+        })
+        .unzip();
+
+    let correlators = (0..num_qubits)
+        .into_par_iter()
+        .map(|i| {
+            let mut row = vec![0.0; num_qubits];
+            for (spin, weight) in spins.iter().zip(weights.iter()) {
+                let weighted = spin[i] * weight;
+                for (j, s_j) in spin.iter().enumerate() {
+                    row[j] += weighted * s_j;
+                }
+            }
+            row
+        })
+        .collect::<Vec<Vec<f64>>>();
+
+    Ok(correlators)
+}
+
+#[pyfunction]
+#[pyo3(signature = (idx, single_counts, shots))]
+pub fn magsq_cell_rust(
+    py: Python<'_>,
+    idx: i32,
+    single_counts: HashMap<String, i32>,
+    shots: i32,
+) -> PyResult<(i32, f64)> {
+    py.allow_threads(move || magsq_cell_kernel(idx, &single_counts, shots))
+}
+
+pub fn magsq_cell_kernel(
+    idx: i32,
+    single_counts: &HashMap<String, i32>,
+    shots: i32,
+) -> PyResult<(i32, f64)> {
+    let sample_shots: i32 = single_counts.values().sum();
+    if sample_shots != shots {
+        return Err(PyValueError::new_err(format!(
+            "shots {} does not match sample_shots {} of counts {}",
+            shots, sample_shots, idx
+        )));
+    }
+
+    let mut magnetsq_cell: f64 = 0.0;
+    for (bits, count) in single_counts {
+        let bytes = bits.as_bytes();
+        if bytes.len() != 2 {
+            return Err(PyValueError::new_err(format!(
+                "Bits must be 2 bit: {}",
+                bits
+            )));
+        }
+        let ratio = *count as f64 / shots as f64;
+        magnetsq_cell += if bytes[0] == bytes[1] { ratio } else { -ratio };
+    }
+    Ok((idx, magnetsq_cell))
+}
+
+#[pyfunction]
+#[pyo3(signature = (counts, shots, num_qubits))]
+pub fn magnetic_square_core_rust(
+    py: Python<'_>,
+    counts: Vec<HashMap<String, i32>>,
+    shots: i32,
+    num_qubits: i32,
+) -> PyResult<(f64, HashMap<i32, f64>, i32, f64, String)> {
+    py.allow_threads(move || magnetic_square_core_kernel(counts, shots, num_qubits))
+}
+
+pub fn magnetic_square_core_kernel(
+    counts: Vec<HashMap<String, i32>>,
+    shots: i32,
+    num_qubits: i32,
+) -> PyResult<(f64, HashMap<i32, f64>, i32, f64, String)> {
+    let begin = Instant::now();
+    let length = counts.len() as i32;
+
+    let magnetsq_cell_items = counts
+        .par_iter()
+        .enumerate()
+        .map(|(idx, single_counts)| magsq_cell_kernel(idx as i32, single_counts, shots))
+        .collect::<PyResult<Vec<(i32, f64)>>>()?;
+    let magnetsq_cell_dict: HashMap<i32, f64> = magnetsq_cell_items.into_iter().collect();
+
+    let num_qubits_f64 = num_qubits as f64;
+    let magnetsq =
+        (magnetsq_cell_dict.values().sum::<f64>() + num_qubits_f64) / (num_qubits_f64.powi(2));
+    let taken = begin.elapsed().as_secs_f64();
+
+    Ok((
+        magnetsq,
+        magnetsq_cell_dict,
+        length,
+        taken,
+        format!(", rust, {} counts.", length),
+    ))
+}
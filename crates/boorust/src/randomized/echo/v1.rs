@@ -7,12 +7,31 @@ use rayon::prelude::*;
 use std::collections::HashMap;
 use std::time::Instant;
 
-use crate::construct::{cycling_slice_rust, degree_handler_rust, QubitDegree};
+use crate::construct::{cycling_slice_kernel, degree_handler_kernel, QubitDegree};
 use crate::randomized::randomized::ensemble_cell_rust;
 
 #[pyfunction]
 #[pyo3(signature = (idx, first_counts, second_counts, bit_string_range, subsystem_size))]
 pub fn echo_cell_rust(
+    py: Python<'_>,
+    idx: i32,
+    first_counts: HashMap<String, i32>,
+    second_counts: HashMap<String, i32>,
+    bit_string_range: (i32, i32),
+    subsystem_size: i32,
+) -> (i32, f64) {
+    py.allow_threads(move || {
+        echo_cell_kernel(
+            idx,
+            first_counts,
+            second_counts,
+            bit_string_range,
+            subsystem_size,
+        )
+    })
+}
+
+pub fn echo_cell_kernel(
     idx: i32,
     first_counts: HashMap<String, i32>,
     second_counts: HashMap<String, i32>,
@@ -50,7 +69,7 @@ pub fn echo_cell_rust(
     } else {
         // cycling
         for (bit_string, count) in &first_counts {
-            let key = cycling_slice_rust(&bit_string, bit_string_range.0, bit_string_range.1, 1);
+            let key = cycling_slice_kernel(&bit_string, bit_string_range.0, bit_string_range.1, 1);
             let substring = match key {
                 Ok(string) => string.to_string(),
                 Err(err) => {
@@ -63,7 +82,7 @@ pub fn echo_cell_rust(
             *entry += count;
         }
         for (bit_string, count) in &second_counts {
-            let key = cycling_slice_rust(&bit_string, bit_string_range.0, bit_string_range.1, 1);
+            let key = cycling_slice_kernel(&bit_string, bit_string_range.0, bit_string_range.1, 1);
             let substring = match key {
                 Ok(string) => string.to_string(),
                 Err(err) => {
@@ -94,6 +113,16 @@ pub fn echo_cell_rust(
 #[pyfunction]
 #[pyo3(signature = (shots, counts, degree=None, measure=None))]
 pub fn overlap_echo_core_rust(
+    py: Python<'_>,
+    shots: i32,
+    counts: Vec<HashMap<String, i32>>,
+    degree: Option<QubitDegree>,
+    measure: Option<(i32, i32)>,
+) -> (HashMap<i32, f64>, (i32, i32), (i32, i32), &'static str, f64) {
+    py.allow_threads(move || overlap_echo_core_kernel(shots, counts, degree, measure))
+}
+
+pub fn overlap_echo_core_kernel(
     shots: i32,
     counts: Vec<HashMap<String, i32>>,
     degree: Option<QubitDegree>,
@@ -108,7 +137,7 @@ pub fn overlap_echo_core_rust(
 
     // Determine degree
     let (bitstring_range, actual_measure, subsystems_size) =
-        degree_handler_rust(allsystems_size, degree, measure);
+        degree_handler_kernel(allsystems_size, degree, measure);
 
     assert!(
         counts.len() % 2 == 0,
@@ -132,7 +161,7 @@ pub fn overlap_echo_core_rust(
         .par_iter()
         .enumerate()
         .map(|(identifier, (data, data2))| {
-            let result: (i32, f64) = echo_cell_rust(
+            let result: (i32, f64) = echo_cell_kernel(
                 identifier as i32,
                 data.clone(),
                 data2.clone(),
@@ -12,6 +12,23 @@ use crate::randomized::randomized::ensemble_cell_rust;
 #[pyfunction]
 #[pyo3(signature = (idx, first_counts, second_counts, selected_classical_registers))]
 pub fn echo_cell_2_rust(
+    py: Python<'_>,
+    idx: i32,
+    first_counts: HashMap<String, i32>,
+    second_counts: HashMap<String, i32>,
+    selected_classical_registers: Vec<i32>,
+) -> (i32, f64, Vec<i32>) {
+    py.allow_threads(move || {
+        echo_cell_2_kernel(
+            idx,
+            first_counts,
+            second_counts,
+            selected_classical_registers,
+        )
+    })
+}
+
+pub fn echo_cell_2_kernel(
     idx: i32,
     first_counts: HashMap<String, i32>,
     second_counts: HashMap<String, i32>,
@@ -91,6 +108,23 @@ pub fn echo_cell_2_rust(
 #[pyfunction]
 #[pyo3(signature = (shots, first_counts, second_counts, selected_classical_registers=None))]
 pub fn overlap_echo_core_2_rust(
+    py: Python<'_>,
+    shots: i32,
+    first_counts: Vec<HashMap<String, i32>>,
+    second_counts: Vec<HashMap<String, i32>>,
+    selected_classical_registers: Option<Vec<i32>>,
+) -> (HashMap<i32, f64>, Vec<i32>, &'static str, f64) {
+    py.allow_threads(move || {
+        overlap_echo_core_2_kernel(
+            shots,
+            first_counts,
+            second_counts,
+            selected_classical_registers,
+        )
+    })
+}
+
+pub fn overlap_echo_core_2_kernel(
     shots: i32,
     first_counts: Vec<HashMap<String, i32>>,
     second_counts: Vec<HashMap<String, i32>>,
@@ -147,7 +181,7 @@ pub fn overlap_echo_core_2_rust(
         .par_iter()
         .enumerate()
         .map(|(identifier, (data, data2))| {
-            let result: (i32, f64, Vec<i32>) = echo_cell_2_rust(
+            let result: (i32, f64, Vec<i32>) = echo_cell_2_kernel(
                 identifier as i32,
                 data.clone(),
                 data2.clone(),
@@ -7,12 +7,24 @@ use rayon::prelude::*;
 use std::collections::HashMap;
 use std::time::Instant;
 
-use crate::construct::{cycling_slice_rust, degree_handler_rust, QubitDegree};
+use crate::construct::{cycling_slice_kernel, degree_handler_kernel, QubitDegree};
 use crate::randomized::randomized::ensemble_cell_rust;
 
 #[pyfunction]
 #[pyo3(signature = (idx, single_counts, bit_string_range, subsystem_size))]
 pub fn purity_cell_rust(
+    py: Python<'_>,
+    idx: i32,
+    single_counts: HashMap<String, i32>,
+    bit_string_range: (i32, i32),
+    subsystem_size: i32,
+) -> (i32, f64) {
+    py.allow_threads(move || {
+        purity_cell_kernel(idx, single_counts, bit_string_range, subsystem_size)
+    })
+}
+
+pub fn purity_cell_kernel(
     idx: i32,
     single_counts: HashMap<String, i32>,
     bit_string_range: (i32, i32),
@@ -34,7 +46,7 @@ pub fn purity_cell_rust(
     } else {
         // cycling
         for (bit_string, count) in &single_counts {
-            let key = cycling_slice_rust(&bit_string, bit_string_range.0, bit_string_range.1, 1);
+            let key = cycling_slice_kernel(&bit_string, bit_string_range.0, bit_string_range.1, 1);
             let substring = match key {
                 Ok(string) => string.to_string(),
                 Err(err) => {
@@ -65,6 +77,16 @@ pub fn purity_cell_rust(
 #[pyfunction]
 #[pyo3(signature = (shots, counts, degree=None, measure=None))]
 pub fn entangled_entropy_core_rust(
+    py: Python<'_>,
+    shots: i32,
+    counts: Vec<HashMap<String, i32>>,
+    degree: Option<QubitDegree>,
+    measure: Option<(i32, i32)>,
+) -> (HashMap<i32, f64>, (i32, i32), (i32, i32), &'static str, f64) {
+    py.allow_threads(move || entangled_entropy_core_kernel(shots, counts, degree, measure))
+}
+
+pub fn entangled_entropy_core_kernel(
     shots: i32,
     counts: Vec<HashMap<String, i32>>,
     degree: Option<QubitDegree>,
@@ -79,13 +101,13 @@ pub fn entangled_entropy_core_rust(
 
     // Determine degree
     let (bitstring_range, actual_measure, subsystems_size) =
-        degree_handler_rust(allsystems_size, degree, measure);
+        degree_handler_kernel(allsystems_size, degree, measure);
 
     let begin: Instant = Instant::now();
 
     let mut purity_loader_2: HashMap<i32, f64> = HashMap::new();
     let result_vec = counts.par_iter().enumerate().map(|(identifier, data)| {
-        let result: (i32, f64) = purity_cell_rust(
+        let result: (i32, f64) = purity_cell_kernel(
             identifier as i32,
             data.clone(),
             bitstring_range,
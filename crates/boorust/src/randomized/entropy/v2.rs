@@ -12,6 +12,15 @@ use crate::randomized::randomized::ensemble_cell_rust;
 #[pyfunction]
 #[pyo3(signature = (idx, single_counts, selected_classical_registers))]
 pub fn purity_cell_2_rust(
+    py: Python<'_>,
+    idx: i32,
+    single_counts: HashMap<String, i32>,
+    selected_classical_registers: Vec<i32>,
+) -> (i32, f64, Vec<i32>) {
+    py.allow_threads(move || purity_cell_2_kernel(idx, single_counts, selected_classical_registers))
+}
+
+pub fn purity_cell_2_kernel(
     idx: i32,
     single_counts: HashMap<String, i32>,
     selected_classical_registers: Vec<i32>,
@@ -57,6 +66,17 @@ pub fn purity_cell_2_rust(
 #[pyfunction]
 #[pyo3(signature = (shots, counts, selected_classical_registers=None))]
 pub fn entangled_entropy_core_2_rust(
+    py: Python<'_>,
+    shots: i32,
+    counts: Vec<HashMap<String, i32>>,
+    selected_classical_registers: Option<Vec<i32>>,
+) -> (HashMap<i32, f64>, Vec<i32>, &'static str, f64) {
+    py.allow_threads(move || {
+        entangled_entropy_core_2_kernel(shots, counts, selected_classical_registers)
+    })
+}
+
+pub fn entangled_entropy_core_2_kernel(
     shots: i32,
     counts: Vec<HashMap<String, i32>>,
     selected_classical_registers: Option<Vec<i32>>,
@@ -80,7 +100,7 @@ pub fn entangled_entropy_core_2_rust(
     let begin: Instant = Instant::now();
 
     let result_vec = counts.par_iter().enumerate().map(|(identifier, data)| {
-        let result: (i32, f64, Vec<i32>) = purity_cell_2_rust(
+        let result: (i32, f64, Vec<i32>) = purity_cell_2_kernel(
             identifier as i32,
             data.clone(),
             selected_classical_registers_actual.clone(),
@@ -27,7 +27,15 @@ fn generate_bits(num: usize, bits: Option<Arc<Vec<String>>>) -> Arc<Vec<String>>
 
 #[pyfunction]
 #[pyo3(signature = (bitlen, num=None))]
-pub fn make_two_bit_str_32(bitlen: usize, num: Option<usize>) -> PyResult<Vec<String>> {
+pub fn make_two_bit_str_32(
+    py: Python<'_>,
+    bitlen: usize,
+    num: Option<usize>,
+) -> PyResult<Vec<String>> {
+    py.allow_threads(move || make_two_bit_str_32_kernel(bitlen, num))
+}
+
+pub fn make_two_bit_str_32_kernel(bitlen: usize, num: Option<usize>) -> PyResult<Vec<String>> {
     const ULTMAX: usize = 31;
     let mut is_less_than_16 = false;
     let mut less_slice = 0;
@@ -155,18 +163,31 @@ pub fn make_two_bit_str_32(bitlen: usize, num: Option<usize>) -> PyResult<Vec<St
 
 #[pyfunction]
 #[pyo3(signature = (num))]
-pub fn make_two_bit_str_unlimit(num: usize) -> Vec<String> {
+pub fn make_two_bit_str_unlimit(py: Python<'_>, num: usize) -> Vec<String> {
+    py.allow_threads(move || make_two_bit_str_unlimit_kernel(num))
+}
+
+pub fn make_two_bit_str_unlimit_kernel(num: usize) -> Vec<String> {
     Arc::try_unwrap(generate_bits(num, None)).unwrap_or_else(|arc| (*arc).clone())
 }
 
 #[pyfunction]
 #[pyo3(signature = (n_a, shot_per_case, bitstring_num=None))]
 pub fn make_dummy_case_32(
+    py: Python<'_>,
+    n_a: usize,
+    shot_per_case: usize,
+    bitstring_num: Option<usize>,
+) -> PyResult<HashMap<String, usize>> {
+    py.allow_threads(move || make_dummy_case_32_kernel(n_a, shot_per_case, bitstring_num))
+}
+
+pub fn make_dummy_case_32_kernel(
     n_a: usize,
     shot_per_case: usize,
     bitstring_num: Option<usize>,
 ) -> PyResult<HashMap<String, usize>> {
-    let raw_bitstring_cases = make_two_bit_str_32(n_a, bitstring_num);
+    let raw_bitstring_cases = make_two_bit_str_32_kernel(n_a, bitstring_num);
     let bitstring_cases = match raw_bitstring_cases {
         Ok(cases) => cases,
         Err(_) => {
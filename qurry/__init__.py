@@ -11,8 +11,8 @@ import sys
 from .qurrech import EchoListen, WaveFunctionOverlap
 from .qurrent import EntropyMeasure, ShadowUnveil
 
-# from .qurmagsq import MagnetSquare
-# from .qurstrop import StringOperator
+from .qurmagsq import MagnetSquare
+from .qurstrop import StringOperator
 
 from .qurrium import WavesExecuter, SamplingExecuter
 
@@ -40,8 +40,10 @@ try:
     sys.modules["qurry.boorust.construct"] = qurry.boorust.construct  # type: ignore
     sys.modules["qurry.boorust.randomized"] = qurry.boorust.randomized  # type: ignore
     sys.modules["qurry.boorust.hadamard"] = qurry.boorust.hadamard  # type: ignore
+    sys.modules["qurry.boorust.magsq"] = qurry.boorust.magsq  # type: ignore
     sys.modules["qurry.boorust.dummy"] = qurry.boorust.dummy  # type: ignore
     sys.modules["qurry.boorust.test"] = qurry.boorust.test  # type: ignore
+    sys.modules["qurry.boorust.concurrency"] = qurry.boorust.concurrency  # type: ignore
     RUST_AVAILABLE = True
     FAILED_RUST_IMPORT = None
 except ModuleNotFoundError as qurry_boorust_import_error:
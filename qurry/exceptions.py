@@ -124,6 +124,11 @@ class QurryTranspileConfigurationIgnored(QurryWarning):
     """Transpile configuration ignored warning."""
 
 
+class QurryTranspileCacheInvalid(QurryWarning):
+    """Transpile cache entry invalid warning,
+    the entry will be removed and the circuit will be transpiled again."""
+
+
 class QurryPendingTagTooMany(QurryWarning):
     """Pending tag too many warning."""
 
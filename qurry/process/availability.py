@@ -7,10 +7,10 @@ Availability for the post-processing module.
 
 from typing import Union, Literal, Optional, Callable
 
-PostProcessingBackendLabel = Union[Literal["Cython", "Rust", "Python"], str]
+PostProcessingBackendLabel = Union[Literal["Cython", "Rust", "Python", "Dense"], str]
 """The backend label for post-processing."""
 
-BACKEND_TYPES: list[PostProcessingBackendLabel] = ["Python", "Cython", "Rust"]
+BACKEND_TYPES: list[PostProcessingBackendLabel] = ["Python", "Cython", "Rust", "Dense"]
 
 
 def availablility(
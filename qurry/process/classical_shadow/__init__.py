@@ -15,4 +15,22 @@ from .classical_shadow import (
     expectation_rho,
     trace_rho_square,
     classical_shadow_complex,
+    ClassicalShadowSubsystems,
+    classical_shadow_subsystems,
+    reduced_density_matrix,
+    expectation_product,
+)
+from .rho_m_core import SHADOW_DENSE_MAX_QUBITS
+from .purity import (
+    ShadowDistributions,
+    snapshot_outcomes,
+    marginal_distributions,
+    snapshot_distributions,
+    snapshot_overlaps,
+    trace_rho_square_groups,
+)
+from .observable import (
+    ShadowObservables,
+    shadow_observables,
+    pauli_observables,
 )
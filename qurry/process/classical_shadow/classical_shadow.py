@@ -6,13 +6,22 @@ Postprocessing - Classical Shadow - Classical Shadow
 
 """
 
+import time
 from typing import Literal, Union, Optional, TypedDict, Iterable
 import warnings
-from itertools import combinations
 import tqdm
 import numpy as np
 
-from .rho_m_core import rho_m_core_py
+from .rho_m_cell import rho_m_cell_py
+from .rho_m_core import rho_m_core_py, SHADOW_DENSE_MAX_QUBITS
+from .purity import (
+    dense_preferred,
+    snapshot_outcomes,
+    marginal_distributions,
+    snapshot_distributions,
+    trace_rho_square_groups,
+)
+from .unitary_set import SNAPSHOT_LOOKUP, PAULI_MATRIX
 from ..availability import (
     availablility,
     default_postprocessing_backend,
@@ -36,11 +45,11 @@ class ClassicalShadowBasic(TypedDict):
     """The basic information of the classical shadow."""
 
     rho_m_dict: dict[int, np.ndarray[tuple[int, int], np.dtype[np.complex128]]]
-    """The dictionary of Rho M."""
+    """The dictionary of Rho M, which is empty unless the dense matrices are requested."""
     rho_m_i_dict: dict[
         int, dict[int, np.ndarray[tuple[Literal[2], Literal[2]], np.dtype[np.complex128]]]
     ]
-    """The dictionary of Rho M I."""
+    """The dictionary of Rho M I, the snapshots in the factorized form."""
     classical_registers_actually: list[int]
     """The list of the selected_classical_registers."""
     taking_time: float
@@ -54,6 +63,134 @@ class ClassicalShadowExpectation(ClassicalShadowBasic):
     """The expectation value of Rho."""
 
 
+def reduced_density_matrix(
+    shots: int,
+    counts: list[dict[str, int]],
+    random_unitary_um: dict[int, dict[int, Union[Literal[0, 1, 2], int]]],
+    selected_classical_registers: Iterable[int],
+) -> np.ndarray[tuple[int, int], np.dtype[np.complex128]]:
+    """Calculate the reduced density matrix of a small subsystem on demand.
+
+    The snapshots are accumulated one by one without being kept,
+    so the memory only scales with the size of the subsystem.
+    The classical registers are sorted in the descending order
+    as the order of Kronecker product in :func:`rho_m_cell_py`.
+
+    Args:
+        shots (int):
+            The number of shots.
+        counts (list[dict[str, int]]):
+            The list of the counts.
+        random_unitary_um (dict[int, dict[int, Union[Literal[0, 1, 2], int]]]):
+            The shadow direction of the unitary operators.
+        selected_classical_registers (Iterable[int]):
+            The classical registers of the subsystem,
+            at most :const:`SHADOW_DENSE_MAX_QUBITS` qubits.
+
+    Raises:
+        ValueError: The subsystem is too large.
+
+    Returns:
+        np.ndarray[tuple[int, int], np.dtype[np.complex128]]:
+            The reduced density matrix of the subsystem.
+    """
+    selected_classical_registers = list(selected_classical_registers)
+    if len(selected_classical_registers) > SHADOW_DENSE_MAX_QUBITS:
+        raise ValueError(
+            f"The reduced density matrix of {len(selected_classical_registers)} qubits "
+            + f"is too large, it is only available for at most {SHADOW_DENSE_MAX_QUBITS} qubits."
+        )
+
+    dim = 2 ** len(selected_classical_registers)
+    reduced_rho = np.zeros((dim, dim), dtype=np.complex128)
+    for idx, single_counts in enumerate(counts):
+        sample_shots = sum(single_counts.values())
+        assert sample_shots == shots, f"shots {shots} does not match sample_shots {sample_shots}"
+        _, rho_m, _, _ = rho_m_cell_py(
+            idx, single_counts, random_unitary_um[idx], selected_classical_registers
+        )
+        reduced_rho += rho_m
+    reduced_rho /= len(counts)
+
+    return reduced_rho
+
+
+def expectation_product(
+    shots: int,
+    counts: list[dict[str, int]],
+    random_unitary_um: dict[int, dict[int, Union[Literal[0, 1, 2], int]]],
+    operators: dict[
+        int,
+        Union[
+            Literal["I", "X", "Y", "Z"],
+            str,
+            np.ndarray[tuple[Literal[2], Literal[2]], np.dtype[np.complex128]],
+        ],
+    ],
+) -> complex:
+    r"""Calculate the expectation value of a product of single-qubit operators on demand.
+
+    The trace with each snapshot of the outcome :math:`s` factorizes into single-qubit traces,
+    .. math::
+        \text{tr}(O \hat{\rho}_s) = \prod_{i}
+        \text{tr}\left(O_i (3 U_{M_i}^{\dagger} |s_i\rangle\langle s_i| U_{M_i}
+        - \mathbb{1})\right)
+
+    so no dense matrix is built and the cost is linear in the number of qubits.
+    The qubits not in `operators` are acted by the identity.
+
+    Args:
+        shots (int):
+            The number of shots.
+        counts (list[dict[str, int]]):
+            The list of the counts.
+        random_unitary_um (dict[int, dict[int, Union[Literal[0, 1, 2], int]]]):
+            The shadow direction of the unitary operators.
+        operators (dict[int, Union[str, np.ndarray]]):
+            The single-qubit operator on each classical register,
+            either the label in :data:`PAULI_MATRIX` or a 2x2 matrix.
+
+    Raises:
+        ValueError: The label of Pauli operator is invalid.
+
+    Returns:
+        complex: The expectation value of the operator.
+    """
+    classical_registers = list(operators)
+    operator_matrices = []
+    for ci in classical_registers:
+        op = operators[ci]
+        if isinstance(op, str):
+            if op not in PAULI_MATRIX:
+                raise ValueError(
+                    f"Invalid Pauli operator '{op}' on classical register {ci}, "
+                    + f"available operators: {list(PAULI_MATRIX)}."
+                )
+            op = PAULI_MATRIX[op]
+        operator_matrices.append(np.asarray(op, dtype=np.complex128).reshape(2, 2))
+    operator_array = np.array(operator_matrices, dtype=np.complex128).reshape(-1, 2, 2)
+    factor_index = np.arange(len(classical_registers))
+
+    expectation_sum = 0j
+    for idx, single_counts in enumerate(counts):
+        num_classical_register = len(next(iter(single_counts)))
+        bits = np.frombuffer("".join(single_counts).encode(), dtype=np.uint8).reshape(
+            -1, num_classical_register
+        )
+        positions = [num_classical_register - ci - 1 for ci in classical_registers]
+        outcomes = (bits[:, positions] == ord("1")).astype(np.intp)
+        num_counts = np.fromiter(single_counts.values(), dtype=np.float64)
+        sample_shots = num_counts.sum()
+        assert sample_shots == shots, f"shots {shots} does not match sample_shots {sample_shots}"
+
+        directions = [random_unitary_um[idx][ci] for ci in classical_registers]
+        single_traces = np.einsum("kbxy,kyx->kb", SNAPSHOT_LOOKUP[directions], operator_array)
+        snapshot_traces = np.prod(single_traces[factor_index, outcomes], axis=1)
+        expectation_sum += num_counts @ snapshot_traces / shots
+
+    return complex(expectation_sum / len(counts))
+
+
 def expectation_rho_core(
     rho_m_dict: dict[int, np.ndarray[tuple[int, int], np.dtype[np.complex128]]],
     selected_classical_registers_sorted: list[int],
@@ -95,6 +232,9 @@ def expectation_rho(
 ) -> ClassicalShadowExpectation:
     """Expectation value of Rho.
 
+    The dense matrices are built,
+    so it is only available for at most :const:`SHADOW_DENSE_MAX_QUBITS` qubits.
+
     Args:
         shots (int):
             The number of shots.
@@ -133,6 +273,7 @@ def expectation_rho(
         counts,
         random_unitary_um,
         selected_classical_registers,
+        dense=True,
     )
     if pbar is not None:
         pbar.set_description(msg)
@@ -161,12 +302,16 @@ class ClassicalShadowPurity(ClassicalShadowBasic):
     """The purity calculated by classical shadow."""
     entropy: float
     """The entropy calculated by classical shadow."""
+    purity_error: Optional[float]
+    """The error of the purity by the median of means, None for a single group."""
+    num_groups: int
+    """The number of groups of the median of means."""
 
 
 def trace_rho_square_core(
     rho_m_dict: dict[int, np.ndarray[tuple[int, int], np.dtype[np.complex128]]],
 ) -> float:
-    """Calculate the trace of Rho square.
+    """Calculate the trace of Rho square from the dense snapshots.
 
     Args:
         rho_m_dict (dict[int, np.ndarray[tuple[int, int], np.dtype[np.complex128]]]):
@@ -177,22 +322,17 @@ def trace_rho_square_core(
     """
 
     num_n_u = len(rho_m_dict)
-    rho_traced_sum = 0
-    num_n_u_combinations = 0
-
-    rho_m_dict_combinations = combinations(rho_m_dict.items(), 2)
-    for (_idx1, rho_m1), (_idx2, rho_m2) in rho_m_dict_combinations:
-
-        rho_traced_sum += np.trace(np.kron(rho_m1, rho_m2))
-        rho_traced_sum += np.trace(np.kron(rho_m2, rho_m1))
-        num_n_u_combinations += 2
-    assert num_n_u_combinations == num_n_u * (num_n_u - 1), (
-        f"The number of combinations: {num_n_u_combinations} "
-        + f"and the number of rho_m_dict: {num_n_u} are different."
+    assert num_n_u > 1, f"At least 2 snapshots are required, but get {num_n_u}."
+
+    rho_m_array = np.array(list(rho_m_dict.values()))
+    rho_m_sum = rho_m_array.sum(axis=0)
+    # The sum of tr(rho_n rho_m) over all pairs n != m.
+    rho_traced_sum = np.einsum("ij,ji->", rho_m_sum, rho_m_sum) - np.einsum(
+        "nij,nji->", rho_m_array, rho_m_array
     )
     rho_traced_sum /= num_n_u * (num_n_u - 1)
 
-    return rho_traced_sum
+    return float(rho_traced_sum.real)
 
 
 def trace_rho_square(
@@ -201,10 +341,14 @@ def trace_rho_square(
     random_unitary_um: dict[int, dict[int, Union[Literal[0, 1, 2], int]]],
     selected_classical_registers: Iterable[int],
     backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
+    num_groups: int = 1,
     pbar: Optional[tqdm.tqdm] = None,
 ) -> ClassicalShadowPurity:
     """Trace of Rho square.
 
+    The purity is the U-statistics over the pairs of snapshots by :func:`trace_rho_square_groups`,
+    which becomes the median of means of the groups if `num_groups` is larger than 1.
+
     Args:
         shots (int):
             The number of shots.
@@ -217,12 +361,16 @@ def trace_rho_square(
         backend (PostProcessingBackendLabel, optional):
             The backend for the postprocessing.
             Defaults to DEFAULT_PROCESS_BACKEND.
+        num_groups (int, optional):
+            The number of groups of the median of means for the purity,
+            the plain U-statistics over all pairs is used if it is 1.
+            Defaults to 1.
         pbar (Optional[tqdm.tqdm], optional):
             The progress bar.
             Defaults to None.
 
     Returns:
-        float: The trace of Rho.
+        ClassicalShadowPurity: The trace of Rho square.
     """
 
     if backend == "Rust":
@@ -247,12 +395,21 @@ def trace_rho_square(
     if pbar is not None:
         pbar.set_description(msg)
 
-    trace_rho_sum = trace_rho_square_core(rho_m_dict=rho_m_dict)
+    begin = time.time()
+    distributions, directions = snapshot_distributions(
+        shots, counts, random_unitary_um, selected_classical_registers_sorted
+    )
+    trace_rho_sum, purity_error, num_groups = trace_rho_square_groups(
+        distributions, directions, num_groups
+    )
     entropy = -np.log2(trace_rho_sum)
+    taken += round(time.time() - begin, 3)
 
     return ClassicalShadowPurity(
         purity=trace_rho_sum,
         entropy=entropy,
+        purity_error=purity_error,
+        num_groups=num_groups,
         rho_m_dict=rho_m_dict,
         rho_m_i_dict=rho_m_i_dict,
         classical_registers_actually=selected_classical_registers_sorted,
@@ -260,72 +417,19 @@ def trace_rho_square(
     )
 
 
-def trace_rho_m_square_core(
-    rho_m_i_dict: dict[
-        int, dict[int, np.ndarray[tuple[Literal[2], Literal[2]], np.dtype[np.complex128]]]
-    ],
-    selected_classical_registers_sorted: list[int],
-) -> float:
-    """Calculate the trace of Rho square.
-
-    Args:
-        rho_m_dict (dict[int, np.ndarray[tuple[int, int], np.dtype[np.complex128]]]):
-            The dictionary of Rho M.
-
-    Returns:
-        float: The trace of Rho square.
-    """
-
-    num_n_u = len(rho_m_i_dict)
-    rho_traced_sum = 0
-    num_n_u_combinations = 0
-
-    rho_m_dict_combinations = combinations(rho_m_i_dict.items(), 2)
-    for (_idx1, rho_m_i_dict_1), (_idx2, rho_m_i_dict_2) in rho_m_dict_combinations:
-        rho_m_a_target = {}
-        rho_m_b_target = {}
-        for ci1, rho_m_i_1 in rho_m_i_dict_1.items():
-            if ci1 in selected_classical_registers_sorted:
-                rho_m_b_target[ci1] = rho_m_i_1
-            else:
-                rho_m_a_target[ci1] = rho_m_i_1
-        for ci2, rho_m_i_2 in rho_m_i_dict_2.items():
-            if ci2 in selected_classical_registers_sorted:
-                rho_m_a_target[ci2] = rho_m_i_2
-            else:
-                rho_m_b_target[ci2] = rho_m_i_2
-        assert list(rho_m_a_target.keys()) == list(rho_m_b_target.keys()), (
-            f"The keys of rho_m_a_target: {list(rho_m_a_target.keys())} "
-            + f"and the keys of rho_m_b_target: {list(rho_m_b_target.keys())} are different."
-        )
-
-        rho_m_a = rho_m_a_target[selected_classical_registers_sorted[0]]
-        rho_m_b = rho_m_b_target[selected_classical_registers_sorted[0]]
-        for ci in selected_classical_registers_sorted[1:]:
-            rho_m_a = np.kron(rho_m_a, rho_m_a_target[ci])
-            rho_m_b = np.kron(rho_m_b, rho_m_b_target[ci])
-
-        rho_traced_sum += np.trace(np.kron(rho_m_a, rho_m_b))
-        rho_traced_sum += np.trace(np.kron(rho_m_b, rho_m_a))
-        num_n_u_combinations += 2
-    assert num_n_u_combinations == num_n_u * (num_n_u - 1), (
-        f"The number of combinations: {num_n_u_combinations} "
-        + f"and the number of rho_m_dict: {num_n_u} are different."
-    )
-    rho_traced_sum /= num_n_u * (num_n_u - 1)
-
-    return rho_traced_sum
-
-
 class ClassicalShadowComplex(ClassicalShadowBasic):
     """The expectation value of Rho and the purity calculated by classical shadow."""
 
-    expect_rho: np.ndarray[tuple[int, int], np.dtype[np.complex128]]
-    """The expectation value of Rho."""
+    expect_rho: Optional[np.ndarray[tuple[int, int], np.dtype[np.complex128]]]
+    """The expectation value of Rho, which is None unless the dense matrices are requested."""
     purity: float
     """The purity calculated by classical shadow."""
     entropy: float
     """The entropy calculated by classical shadow."""
+    purity_error: Optional[float]
+    """The error of the purity by the median of means, None for a single group."""
+    num_groups: int
+    """The number of groups of the median of means."""
 
 
 def classical_shadow_complex(
@@ -334,10 +438,18 @@ def classical_shadow_complex(
     random_unitary_um: dict[int, dict[int, Union[Literal[0, 1, 2], int]]],
     selected_classical_registers: Iterable[int],
     backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
+    dense: bool = False,
+    num_groups: int = 1,
     pbar: Optional[tqdm.tqdm] = None,
 ) -> ClassicalShadowComplex:
     """Calculate the expectation value of Rho and the purity by classical shadow.
 
+    The snapshots are kept in the factorized form of single-qubit matrices,
+    the dense matrices of the snapshots and the expectation value of Rho
+    are only built when `dense` is True.
+    The purity is the U-statistics over the pairs of snapshots by :func:`trace_rho_square_groups`,
+    which becomes the median of means of the groups if `num_groups` is larger than 1.
+
     Args:
         shots (int):
             The number of shots.
@@ -350,6 +462,14 @@ def classical_shadow_complex(
         backend (PostProcessingBackendLabel, optional):
             The backend for the postprocessing.
             Defaults to DEFAULT_PROCESS_BACKEND.
+        dense (bool, optional):
+            Whether to build the dense matrices,
+            only available for at most :const:`SHADOW_DENSE_MAX_QUBITS` qubits.
+            Defaults to False.
+        num_groups (int, optional):
+            The number of groups of the median of means for the purity,
+            the plain U-statistics over all pairs is used if it is 1.
+            Defaults to 1.
         pbar (Optional[tqdm.tqdm], optional):
             The progress bar.
             Defaults to None.
@@ -377,28 +497,151 @@ def classical_shadow_complex(
         counts,
         random_unitary_um,
         selected_classical_registers,
+        dense=dense,
     )
     if pbar is not None:
         pbar.set_description(msg)
 
-    expect_rho = expectation_rho_core(
-        rho_m_dict=rho_m_dict,
-        selected_classical_registers_sorted=selected_classical_registers_sorted,
+    expect_rho = (
+        expectation_rho_core(
+            rho_m_dict=rho_m_dict,
+            selected_classical_registers_sorted=selected_classical_registers_sorted,
+        )
+        if dense
+        else None
     )
 
-    # trace_rho_sum = trace_rho_square_core(rho_m_dict=rho_m_dict)
-    trace_rho_sum = trace_rho_m_square_core(
-        rho_m_i_dict=rho_m_i_dict,
-        selected_classical_registers_sorted=selected_classical_registers_sorted,
+    begin = time.time()
+    distributions, directions = snapshot_distributions(
+        shots, counts, random_unitary_um, selected_classical_registers_sorted
+    )
+    trace_rho_sum, purity_error, num_groups = trace_rho_square_groups(
+        distributions, directions, num_groups
     )
     entropy = -np.log2(trace_rho_sum)
+    taken += round(time.time() - begin, 3)
 
     return ClassicalShadowComplex(
         expect_rho=expect_rho,
         purity=trace_rho_sum,
         entropy=entropy,
+        purity_error=purity_error,
+        num_groups=num_groups,
         rho_m_dict=rho_m_dict,
         rho_m_i_dict=rho_m_i_dict,
         classical_registers_actually=selected_classical_registers_sorted,
         taking_time=taken,
     )
+
+
+class ClassicalShadowSubsystems(TypedDict):
+    """The purity and the entropy of many subsystems calculated by classical shadow."""
+
+    subsystems: list[list[int]]
+    """The classical registers of each subsystem in the descending order."""
+    purities: list[float]
+    """The purity of each subsystem."""
+    entropies: list[float]
+    """The second Renyi entropy of each subsystem."""
+    purity_errors: list[Optional[float]]
+    """The error of the purity of each subsystem by the median of means,
+    None for a single group."""
+    num_groups: int
+    """The number of groups of the median of means."""
+    taking_time: float
+    """The time taken for the calculation."""
+
+
+def classical_shadow_subsystems(
+    shots: int,
+    counts: list[dict[str, int]],
+    random_unitary_um: dict[int, dict[int, Union[Literal[0, 1, 2], int]]],
+    subsystems: Iterable[Iterable[int]],
+    num_groups: int = 1,
+    pbar: Optional[tqdm.tqdm] = None,
+) -> ClassicalShadowSubsystems:
+    """Calculate the purity and the entropy of many subsystems by classical shadow.
+
+    The counts are read and the shadow directions are collected only once for all subsystems,
+    then the purity of each subsystem is given by :func:`trace_rho_square_groups`
+    over the same observed outcomes of all classical registers with the mask of its qubits,
+    except that the subsystems small enough for :func:`dense_preferred`
+    use their dense marginal distributions.
+
+    Args:
+        shots (int):
+            The number of shots.
+        counts (list[dict[str, int]]):
+            The list of the counts.
+        random_unitary_um (dict[int, dict[int, Union[Literal[0, 1, 2], int]]]):
+            The shadow direction of the unitary operators.
+        subsystems (Iterable[Iterable[int]]):
+            The classical registers of each subsystem.
+        num_groups (int, optional):
+            The number of groups of the median of means for the purity,
+            the plain U-statistics over all pairs is used if it is 1.
+            Defaults to 1.
+        pbar (Optional[tqdm.tqdm], optional):
+            The progress bar.
+            Defaults to None.
+
+    Raises:
+        ValueError: The classical registers of a subsystem are invalid.
+
+    Returns:
+        ClassicalShadowSubsystems: The purity and the entropy of each subsystem.
+    """
+    begin = time.time()
+    outcomes, ratios, cell_index = snapshot_outcomes(shots, counts)
+    num_classical_register = outcomes.shape[1]
+    subsystems_sorted = [sorted(subsystem, reverse=True) for subsystem in subsystems]
+    for subsystem in subsystems_sorted:
+        if len(subsystem) == 0 or len(set(subsystem)) != len(subsystem):
+            raise ValueError(f"Invalid subsystem {subsystem}, it should be non-empty and unique.")
+        if not all(0 <= ci < num_classical_register for ci in subsystem):
+            raise ValueError(
+                f"Invalid subsystem {subsystem} for {num_classical_register} classical registers."
+            )
+
+    registers_all = list(range(num_classical_register))[::-1]
+    distributions_all = marginal_distributions(
+        outcomes, ratios, cell_index, len(counts), registers_all, dense=False
+    )
+    directions_all = np.array(
+        [[random_unitary_um[idx][ci] for ci in registers_all] for idx in range(len(counts))],
+        dtype=np.intp,
+    ).reshape(len(counts), num_classical_register)
+
+    purities, purity_errors = [], []
+    for subsystem_idx, subsystem in enumerate(subsystems_sorted):
+        if pbar is not None:
+            pbar.set_description(
+                f"| Subsystem {subsystem_idx + 1}/{len(subsystems_sorted)}: {subsystem}"
+            )
+        columns = [num_classical_register - ci - 1 for ci in subsystem]
+        if dense_preferred(len(subsystem), len(distributions_all.ratios), len(counts)):
+            purity, purity_error, num_groups = trace_rho_square_groups(
+                marginal_distributions(
+                    outcomes, ratios, cell_index, len(counts), subsystem, dense=True
+                ),
+                directions_all[:, columns],
+                num_groups,
+            )
+        else:
+            selected = np.zeros(num_classical_register, dtype=np.bool_)
+            selected[columns] = True
+            purity, purity_error, num_groups = trace_rho_square_groups(
+                distributions_all, directions_all, num_groups, selected
+            )
+        purities.append(purity)
+        purity_errors.append(purity_error)
+    taken = round(time.time() - begin, 3)
+
+    return ClassicalShadowSubsystems(
+        subsystems=subsystems_sorted,
+        purities=purities,
+        entropies=[float(-np.log2(purity)) for purity in purities],
+        purity_errors=purity_errors,
+        num_groups=num_groups,
+        taking_time=taken,
+    )
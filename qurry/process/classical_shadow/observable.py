@@ -0,0 +1,281 @@
+"""
+================================================================
+Postprocessing - Classical Shadow - Observable
+(:mod:`qurry.process.classical_shadow.observable`)
+================================================================
+
+The expectation values of Pauli observables from classical shadow,
+which are evaluated from the counts and the shadow directions without any density matrix.
+
+The trace of a Pauli operator :math:`P` with a single-qubit snapshot
+only depends on :math:`P`, the shadow direction :math:`d` and the outcome :math:`b`,
+
+.. math::
+    \\text{tr}\\left(P (3 U_d^{\\dagger} |b\\rangle\\langle b| U_d - \\mathbb{1})\\right)
+    = (-1)^{b} \\, \\text{tr}\\left(P (3 U_d^{\\dagger} |0\\rangle\\langle 0| U_d
+    - \\mathbb{1})\\right)
+
+for :math:`P \\neq \\mathbb{1}`, so the snapshot of a Pauli string is
+the product of the outcome-independent coefficients of the unitary
+and the parity of the outcomes on its support.
+All Pauli strings and all counts are evaluated in one pass,
+then the snapshots are combined by the median of means.
+
+"""
+
+import time
+from typing import Optional, Sequence, TypedDict, Union
+import numpy as np
+import tqdm
+
+from qiskit.quantum_info import SparsePauliOp
+
+from .unitary_set import SNAPSHOT_LOOKUP, PAULI_MATRIX
+from ..availability import availablility
+
+BACKEND_AVAILABLE = availablility(
+    "classical_shadow.observable",
+    [],
+)
+
+PAULI_CODE: dict[str, int] = {label: code for code, label in enumerate(PAULI_MATRIX)}
+"""The code of each Pauli label, which is the index in :data:`PAULI_SNAPSHOT_TRACE`."""
+PAULI_SNAPSHOT_TRACE: np.ndarray[tuple[int, int], np.dtype[np.float64]] = np.rint(
+    [
+        [np.trace(pauli @ SNAPSHOT_LOOKUP[um, 0]).real for um in range(len(SNAPSHOT_LOOKUP))]
+        for pauli in PAULI_MATRIX.values()
+    ]
+)
+"""The trace of each Pauli operator with the single-qubit snapshot of the outcome 0,
+the entry `[code, um]` is 1 for the identity, and 0 or :math:`\\pm 3` for the others."""
+OBSERVABLE_CHUNK_SIZE = 4096
+"""The number of outcomes evaluated at once, which limits the memory of the parity pass."""
+
+
+def pauli_observables(
+    observables: Union[Sequence[str], SparsePauliOp],
+) -> tuple[list[str], Optional[np.ndarray[tuple[int], np.dtype[np.complex128]]]]:
+    """Read the labels and the coefficients of the Pauli observables.
+
+    Args:
+        observables (Union[Sequence[str], SparsePauliOp]):
+            The Pauli strings or the :class:`qiskit.quantum_info.SparsePauliOp`.
+
+    Raises:
+        ValueError: The labels of the Pauli strings are invalid.
+
+    Returns:
+        tuple[list[str], Optional[np.ndarray[tuple[int], np.dtype[np.complex128]]]]:
+            The labels of the Pauli strings, and the coefficients
+            which are None if the observables are not a SparsePauliOp.
+    """
+    if isinstance(observables, SparsePauliOp):
+        labels = observables.paulis.to_labels()
+        coefficients = np.asarray(observables.coeffs, dtype=np.complex128)
+    else:
+        labels = [str(label) for label in observables]
+        coefficients = None
+
+    if len({len(label) for label in labels}) > 1:
+        raise ValueError(
+            f"The Pauli strings should have the same length, but get {set(map(len, labels))}."
+        )
+    invalid = [label for label in labels if any(p not in PAULI_CODE for p in label)]
+    if len(invalid) > 0:
+        raise ValueError(
+            f"Invalid Pauli strings {invalid}, available Pauli operators: {list(PAULI_CODE)}."
+        )
+    return labels, coefficients
+
+
+def shadow_pauli_snapshots(
+    shots: int,
+    counts: list[dict[str, int]],
+    random_unitary_um: dict[int, dict[int, int]],
+    labels: Sequence[str],
+) -> np.ndarray[tuple[int, int], np.dtype[np.float64]]:
+    """Calculate the snapshot of each Pauli string for each random unitary in one pass.
+
+    Args:
+        shots (int):
+            The number of shots.
+        counts (list[dict[str, int]]):
+            The list of the counts.
+        random_unitary_um (dict[int, dict[int, int]]):
+            The shadow direction of the unitary operators.
+        labels (Sequence[str]):
+            The Pauli strings on the classical registers,
+            which are in the same order as the bitstrings.
+
+    Returns:
+        np.ndarray[tuple[int, int], np.dtype[np.float64]]:
+            The snapshots with the shape `(len(counts), len(labels))`.
+    """
+    num_classical_register = len(next(iter(counts[0])))
+    assert all(
+        len(label) == num_classical_register for label in labels
+    ), f"The Pauli strings should act on {num_classical_register} classical registers."
+
+    codes = np.array([[PAULI_CODE[p] for p in label] for label in labels], dtype=np.intp).reshape(
+        len(labels), num_classical_register
+    )
+    supports = (codes != 0).astype(np.float64)
+    directions = np.array(
+        [
+            [random_unitary_um[idx][ci] for ci in range(num_classical_register - 1, -1, -1)]
+            for idx in range(len(counts))
+        ],
+        dtype=np.intp,
+    ).reshape(len(counts), num_classical_register)
+
+    # The outcome-independent coefficient of each unitary and each Pauli string.
+    coefficients = np.ones((len(counts), len(labels)), dtype=np.float64)
+    for j in range(num_classical_register):
+        coefficients *= PAULI_SNAPSHOT_TRACE[codes[None, :, j], directions[:, j, None]]
+
+    cell_index = np.repeat(
+        np.arange(len(counts)), np.fromiter((len(single_counts) for single_counts in counts), int)
+    )
+    num_counts = np.fromiter(
+        (num for single_counts in counts for num in single_counts.values()), dtype=np.float64
+    )
+    sum_counts = np.bincount(cell_index, weights=num_counts, minlength=len(counts))
+    mismatched = np.flatnonzero(sum_counts != shots)
+    assert len(mismatched) == 0, (
+        f"Shots: {shots} must be equal to the sum of counts: "
+        + f"{sum_counts[mismatched].tolist()} at the counts {mismatched.tolist()}."
+    )
+    outcomes = np.frombuffer(
+        "".join("".join(single_counts) for single_counts in counts).encode(), dtype=np.uint8
+    ).reshape(-1, num_classical_register) == ord("1")
+
+    parity_sums = np.zeros((len(counts), len(labels)), dtype=np.float64)
+    for begin in range(0, len(outcomes), OBSERVABLE_CHUNK_SIZE):
+        chunk = slice(begin, begin + OBSERVABLE_CHUNK_SIZE)
+        parity = (outcomes[chunk].astype(np.float64) @ supports.T) % 2
+        np.add.at(parity_sums, cell_index[chunk], num_counts[chunk, None] * (1 - 2 * parity))
+
+    return coefficients * parity_sums / shots
+
+
+def median_of_means(
+    snapshots: np.ndarray[tuple[int, int], np.dtype[np.float64]],
+    num_groups: int,
+) -> tuple[
+    np.ndarray[tuple[int], np.dtype[np.float64]],
+    np.ndarray[tuple[int], np.dtype[np.float64]],
+]:
+    """The median of means of the snapshots and its error.
+
+    The snapshots are split into `num_groups` consecutive groups,
+    the estimate is the median of the group means,
+    and the error is the standard error of the group means.
+    The error falls back to the standard error of the snapshots for a single group.
+
+    Args:
+        snapshots (np.ndarray[tuple[int, int], np.dtype[np.float64]]):
+            The snapshots with the shape `(N_U, number of observables)`.
+        num_groups (int):
+            The number of groups, which is clipped to the number of snapshots.
+
+    Returns:
+        tuple[
+            np.ndarray[tuple[int], np.dtype[np.float64]],
+            np.ndarray[tuple[int], np.dtype[np.float64]],
+        ]: The estimates and the errors.
+    """
+    num_snapshots = len(snapshots)
+    assert num_snapshots > 0, "At least 1 snapshot is required."
+    num_groups = max(1, min(num_groups, num_snapshots))
+
+    group_means = np.array(
+        [group.mean(axis=0) for group in np.array_split(snapshots, num_groups, axis=0)]
+    )
+    estimates = np.median(group_means, axis=0)
+    if num_groups > 1:
+        errors = group_means.std(axis=0, ddof=1) / np.sqrt(num_groups)
+    elif num_snapshots > 1:
+        errors = snapshots.std(axis=0, ddof=1) / np.sqrt(num_snapshots)
+    else:
+        errors = np.full(snapshots.shape[1:], np.nan)
+    return estimates, errors
+
+
+class ShadowObservables(TypedDict):
+    """The expectation values of Pauli observables by classical shadow."""
+
+    observables: list[str]
+    """The Pauli strings."""
+    expectations: list[float]
+    """The expectation value of each Pauli string."""
+    errors: list[float]
+    """The error of each expectation value."""
+    value: Optional[float]
+    """The expectation value of the SparsePauliOp, None for the Pauli strings."""
+    value_error: Optional[float]
+    """The error of the expectation value of the SparsePauliOp, None for the Pauli strings."""
+    num_groups: int
+    """The number of groups of the median of means."""
+    taking_time: float
+    """The time taken for the calculation."""
+
+
+def shadow_observables(
+    shots: int,
+    counts: list[dict[str, int]],
+    random_unitary_um: dict[int, dict[int, int]],
+    observables: Union[Sequence[str], SparsePauliOp],
+    num_groups: int = 10,
+    pbar: Optional[tqdm.tqdm] = None,
+) -> ShadowObservables:
+    """Calculate the expectation values of Pauli observables by classical shadow,
+    all Pauli strings are evaluated in one pass and combined by the median of means.
+
+    Args:
+        shots (int):
+            The number of shots.
+        counts (list[dict[str, int]]):
+            The list of the counts.
+        random_unitary_um (dict[int, dict[int, int]]):
+            The shadow direction of the unitary operators.
+        observables (Union[Sequence[str], SparsePauliOp]):
+            The Pauli strings or the :class:`qiskit.quantum_info.SparsePauliOp`
+            on the classical registers, which are in the same order as the bitstrings.
+            The coefficients of the SparsePauliOp should be real.
+        num_groups (int, optional):
+            The number of groups of the median of means. Defaults to 10.
+        pbar (Optional[tqdm.tqdm], optional):
+            The progress bar. Defaults to None.
+
+    Raises:
+        ValueError: The coefficients of the SparsePauliOp are not real.
+
+    Returns:
+        ShadowObservables: The expectation values of the Pauli observables.
+    """
+    labels, coefficients = pauli_observables(observables)
+    if coefficients is not None and not np.allclose(coefficients.imag, 0):
+        raise ValueError("The coefficients of the SparsePauliOp should be real.")
+    if isinstance(pbar, tqdm.tqdm):
+        pbar.set_description(f"| {len(labels)} Pauli observables being calculated.")
+
+    begin = time.time()
+    snapshots = shadow_pauli_snapshots(shots, counts, random_unitary_um, labels)
+    num_groups = max(1, min(num_groups, len(counts)))
+    expectations, errors = median_of_means(snapshots, num_groups)
+    if coefficients is None:
+        value, value_error = None, None
+    else:
+        values, value_errors = median_of_means(snapshots @ coefficients.real[:, None], num_groups)
+        value, value_error = float(values[0]), float(value_errors[0])
+    taking_time = round(time.time() - begin, 3)
+
+    return ShadowObservables(
+        observables=labels,
+        expectations=expectations.tolist(),
+        errors=errors.tolist(),
+        value=value,
+        value_error=value_error,
+        num_groups=num_groups,
+        taking_time=taking_time,
+    )
@@ -0,0 +1,465 @@
+"""
+================================================================
+Postprocessing - Classical Shadow - Purity
+(:mod:`qurry.process.classical_shadow.purity`)
+================================================================
+
+The purity from classical shadow by the U-statistics of the snapshots,
+
+.. math::
+    \\text{tr}(\\rho^2) \\approx \\frac{1}{N_U (N_U - 1)}
+    \\sum_{n \\neq m} \\text{tr}(\\hat{\\rho}_n \\hat{\\rho}_m)
+
+The overlap of two snapshots factorizes into single-qubit overlaps of the outcomes,
+
+.. math::
+    \\text{tr}(\\hat{\\rho}_n \\hat{\\rho}_m) = \\sum_{s, s'} p_n(s) p_m(s')
+    \\prod_{i} \\text{tr}\\left(\\sigma_{d_{n,i}}(s_i) \\sigma_{d_{m,i}}(s'_i)\\right)
+
+where :math:`p_n` is the distribution of the outcomes of the selected qubits
+under the :math:`n`-th random unitary, and :math:`\\sigma_{d}(b)` is the single-qubit snapshot.
+So the overlaps of many pairs are given by contracting the distributions
+with :data:`SNAPSHOT_OVERLAP` qubit by qubit, without any density matrix.
+The sum runs over the observed outcomes only unless the dense distributions are smaller,
+so a subsystem of many qubits never allocates the :math:`2^k` outcomes.
+
+"""
+
+from typing import Literal, NamedTuple, Optional, Union
+import numpy as np
+
+from .unitary_set import SNAPSHOT_LOOKUP
+from ..availability import availablility
+
+BACKEND_AVAILABLE = availablility(
+    "classical_shadow.purity",
+    [],
+)
+
+SNAPSHOT_OVERLAP: np.ndarray[
+    tuple[Literal[3], Literal[3], Literal[2], Literal[2]], np.dtype[np.float64]
+] = np.einsum("dbxy,eayx->deba", SNAPSHOT_LOOKUP, SNAPSHOT_LOOKUP).real
+"""The overlap of single-qubit snapshots, the entry `[d, d', b, b']` is
+:math:`\\text{tr}(\\sigma_{d}(b) \\sigma_{d'}(b'))`,
+which is 5 or -4 for the same direction and 1/2 for the different directions."""
+OVERLAP_CHUNK_ELEMENTS = 2**22
+"""The number of elements of the distributions contracted at once,
+which limits the memory of the overlap kernel."""
+DENSE_DISTRIBUTIONS_MAX_ELEMENTS = 2**24
+"""The maximum number of elements of the dense distributions of all snapshots."""
+
+
+def snapshot_outcomes(
+    shots: int,
+    counts: list[dict[str, int]],
+) -> tuple[
+    np.ndarray[tuple[int, int], np.dtype[np.bool_]],
+    np.ndarray[tuple[int], np.dtype[np.float64]],
+    np.ndarray[tuple[int], np.dtype[np.intp]],
+]:
+    """Read the outcomes of all counts at once.
+
+    Args:
+        shots (int):
+            The number of shots.
+        counts (list[dict[str, int]]):
+            The list of the counts.
+
+    Returns:
+        tuple[
+            np.ndarray[tuple[int, int], np.dtype[np.bool_]],
+            np.ndarray[tuple[int], np.dtype[np.float64]],
+            np.ndarray[tuple[int], np.dtype[np.intp]],
+        ]:
+            The outcomes in the same order as the bitstrings,
+            the ratio of each outcome, and the index of the counts of each outcome.
+    """
+    num_classical_register = len(next(iter(counts[0])))
+    cell_index = np.repeat(
+        np.arange(len(counts)), np.fromiter((len(single_counts) for single_counts in counts), int)
+    )
+    num_counts = np.fromiter(
+        (num for single_counts in counts for num in single_counts.values()), dtype=np.float64
+    )
+    sum_counts = np.bincount(cell_index, weights=num_counts, minlength=len(counts))
+    mismatched = np.flatnonzero(sum_counts != shots)
+    assert len(mismatched) == 0, (
+        f"Shots: {shots} must be equal to the sum of counts: "
+        + f"{sum_counts[mismatched].tolist()} at the counts {mismatched.tolist()}."
+    )
+    outcomes = np.frombuffer(
+        "".join("".join(single_counts) for single_counts in counts).encode(), dtype=np.uint8
+    ).reshape(-1, num_classical_register) == ord("1")
+
+    return outcomes, num_counts / shots, cell_index
+
+
+def dense_preferred(num_selected: int, num_outcomes: int, num_cells: int) -> bool:
+    """Whether the dense distributions are preferred over the observed outcomes,
+    which is when `2**k` is not larger than the number of pairs of the observed outcomes
+    per snapshot and the dense distributions have at most
+    :const:`DENSE_DISTRIBUTIONS_MAX_ELEMENTS` elements.
+
+    Args:
+        num_selected (int):
+            The number of the selected qubits.
+        num_outcomes (int):
+            The number of the observed outcomes of all snapshots.
+        num_cells (int):
+            The number of snapshots.
+
+    Returns:
+        bool: Whether the dense distributions are preferred.
+    """
+    return (
+        2**num_selected <= (num_outcomes / max(num_cells, 1)) ** 2
+        and num_cells * 2**num_selected <= DENSE_DISTRIBUTIONS_MAX_ELEMENTS
+    )
+
+
+class ShadowDistributions(NamedTuple):
+    """The distributions of the outcomes of the selected qubits of all snapshots.
+
+    Only the observed outcomes are kept and grouped by the snapshots,
+    the dense distributions with the shape `(N_U, 2**k)` are also kept
+    if they are smaller than the pairs of the observed outcomes.
+    """
+
+    outcomes: np.ndarray[tuple[int, int], np.dtype[np.bool_]]
+    """The observed outcomes of the selected qubits with the shape `(K, k)`,
+    the outcomes of the `n`-th snapshot are in the rows from `offsets[n]` to `offsets[n + 1]`."""
+    ratios: np.ndarray[tuple[int], np.dtype[np.float64]]
+    """The ratio of each observed outcome."""
+    offsets: np.ndarray[tuple[int], np.dtype[np.intp]]
+    """The offsets of the observed outcomes of each snapshot with the length `N_U + 1`."""
+    num_selected: int
+    """The number of the selected qubits."""
+    dense: Optional[np.ndarray[tuple[int, int], np.dtype[np.float64]]] = None
+    """The dense distributions with the shape `(N_U, 2**k)` or None."""
+
+
+def marginal_distributions(
+    outcomes: np.ndarray[tuple[int, int], np.dtype[np.bool_]],
+    ratios: np.ndarray[tuple[int], np.dtype[np.float64]],
+    cell_index: np.ndarray[tuple[int], np.dtype[np.intp]],
+    num_cells: int,
+    selected_classical_registers_sorted: list[int],
+    dense: Optional[bool] = None,
+) -> ShadowDistributions:
+    """The distributions of the outcomes of the selected qubits from :func:`snapshot_outcomes`.
+
+    The same outcomes of the selected qubits in a snapshot are merged.
+
+    Args:
+        outcomes (np.ndarray[tuple[int, int], np.dtype[np.bool_]]):
+            The outcomes in the same order as the bitstrings.
+        ratios (np.ndarray[tuple[int], np.dtype[np.float64]]):
+            The ratio of each outcome.
+        cell_index (np.ndarray[tuple[int], np.dtype[np.intp]]):
+            The index of the counts of each outcome.
+        num_cells (int):
+            The number of counts.
+        selected_classical_registers_sorted (list[int]):
+            The selected classical registers in the descending order,
+            the first one is the most significant bit of the distributions.
+        dense (Optional[bool], optional):
+            Whether to build the dense distributions,
+            decided by :func:`dense_preferred` if None.
+            Defaults to None.
+
+    Returns:
+        ShadowDistributions: The distributions of the outcomes of the selected qubits.
+    """
+    num_classical_register = outcomes.shape[1]
+    num_selected = len(selected_classical_registers_sorted)
+    positions = [num_classical_register - ci - 1 for ci in selected_classical_registers_sorted]
+    keys = np.concatenate(
+        [
+            cell_index.astype(">u8").view(np.uint8).reshape(len(cell_index), 8),
+            outcomes[:, positions].view(np.uint8),
+        ],
+        axis=1,
+    )
+    unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    merged_ratios = np.bincount(inverse, weights=ratios, minlength=len(unique_keys))
+    merged_cells = unique_keys[:, :8].copy().view(">u8").reshape(-1).astype(np.intp)
+    offsets = np.zeros(num_cells + 1, dtype=np.intp)
+    np.cumsum(np.bincount(merged_cells, minlength=num_cells), out=offsets[1:])
+    distributions = ShadowDistributions(
+        outcomes=unique_keys[:, 8:].astype(np.bool_),
+        ratios=merged_ratios,
+        offsets=offsets,
+        num_selected=num_selected,
+    )
+
+    if dense is None:
+        dense = dense_preferred(num_selected, len(unique_keys), num_cells)
+    if not dense:
+        return distributions
+
+    outcome_index = distributions.outcomes.astype(np.intp) @ (
+        1 << np.arange(num_selected, dtype=np.intp)[::-1]
+    )
+    dense_distributions = np.zeros((num_cells, 2**num_selected), dtype=np.float64)
+    np.add.at(dense_distributions, (merged_cells, outcome_index), merged_ratios)
+    return distributions._replace(dense=dense_distributions)
+
+
+def snapshot_distributions(
+    shots: int,
+    counts: list[dict[str, int]],
+    random_unitary_um: dict[int, dict[int, Union[Literal[0, 1, 2], int]]],
+    selected_classical_registers_sorted: list[int],
+) -> tuple[ShadowDistributions, np.ndarray[tuple[int, int], np.dtype[np.intp]]]:
+    """The distributions of the outcomes and the shadow directions of the selected qubits.
+
+    Args:
+        shots (int):
+            The number of shots.
+        counts (list[dict[str, int]]):
+            The list of the counts.
+        random_unitary_um (dict[int, dict[int, Union[Literal[0, 1, 2], int]]]):
+            The shadow direction of the unitary operators.
+        selected_classical_registers_sorted (list[int]):
+            The selected classical registers in the descending order,
+            the first one is the most significant bit of the distributions.
+
+    Returns:
+        tuple[ShadowDistributions, np.ndarray[tuple[int, int], np.dtype[np.intp]]]:
+            The distributions from :func:`marginal_distributions`
+            and the directions with the shape `(N_U, k)`.
+    """
+    distributions = marginal_distributions(
+        *snapshot_outcomes(shots, counts), len(counts), selected_classical_registers_sorted
+    )
+    directions = np.array(
+        [
+            [random_unitary_um[idx][ci] for ci in selected_classical_registers_sorted]
+            for idx in range(len(counts))
+        ],
+        dtype=np.intp,
+    ).reshape(len(counts), len(selected_classical_registers_sorted))
+
+    return distributions, directions
+
+
+def dense_snapshot_overlaps(
+    distributions: np.ndarray[tuple[int, int], np.dtype[np.float64]],
+    directions: np.ndarray[tuple[int, int], np.dtype[np.intp]],
+    first: np.ndarray[tuple[int], np.dtype[np.intp]],
+    second: np.ndarray[tuple[int], np.dtype[np.intp]],
+) -> np.ndarray[tuple[int], np.dtype[np.float64]]:
+    """The overlaps of the pairs of snapshots
+    by contracting the dense distributions with :data:`SNAPSHOT_OVERLAP` qubit by qubit.
+
+    Args:
+        distributions (np.ndarray[tuple[int, int], np.dtype[np.float64]]):
+            The dense distributions with the shape `(N_U, 2**k)`.
+        directions (np.ndarray[tuple[int, int], np.dtype[np.intp]]):
+            The shadow directions from :func:`snapshot_distributions`.
+        first (np.ndarray[tuple[int], np.dtype[np.intp]]):
+            The index :math:`n` of each pair.
+        second (np.ndarray[tuple[int], np.dtype[np.intp]]):
+            The index :math:`m` of each pair.
+
+    Returns:
+        np.ndarray[tuple[int], np.dtype[np.float64]]: The overlap of each pair.
+    """
+    num_selected = directions.shape[1]
+    dim = distributions.shape[1]
+    chunk_size = max(1, OVERLAP_CHUNK_ELEMENTS // dim)
+
+    overlaps = np.zeros(len(first), dtype=np.float64)
+    for begin in range(0, len(first), chunk_size):
+        chunk_first = first[begin : begin + chunk_size]
+        chunk_second = second[begin : begin + chunk_size]
+        contracted = distributions[chunk_first]
+        for i in range(num_selected):
+            kernel = SNAPSHOT_OVERLAP[directions[chunk_first, i], directions[chunk_second, i]]
+            contracted = np.einsum(
+                "pxby,pba->pxay",
+                contracted.reshape(len(chunk_first), 2**i, 2, 2 ** (num_selected - i - 1)),
+                kernel,
+            )
+        overlaps[begin : begin + chunk_size] = np.einsum(
+            "px,px->p", contracted.reshape(len(chunk_first), dim), distributions[chunk_second]
+        )
+    return overlaps
+
+
+def sparse_snapshot_overlaps(
+    distributions: ShadowDistributions,
+    directions: np.ndarray[tuple[int, int], np.dtype[np.intp]],
+    first: np.ndarray[tuple[int], np.dtype[np.intp]],
+    second: np.ndarray[tuple[int], np.dtype[np.intp]],
+    selected: Optional[np.ndarray[tuple[int], np.dtype[np.bool_]]] = None,
+) -> np.ndarray[tuple[int], np.dtype[np.float64]]:
+    """The overlaps of the pairs of snapshots by summing over the observed outcomes only.
+
+    The single-qubit overlap is 1/2 for the different directions whatever the outcomes,
+    and 5 or -4 for the same direction and the same or different outcomes.
+    So the overlap of a pair of outcomes is
+
+    .. math::
+        5^{|M|} 2^{-(k - |M|)} \\left(-\\frac{4}{5}\\right)^{|(s \\oplus s') \\wedge M|}
+
+    where :math:`M` is the set of the qubits measured in the same direction.
+    The number of the flipped qubits in :math:`M` is counted by the matrix products
+    of the outcomes and the masked outcomes, which costs :math:`O(K_n K_m k)`
+    for :math:`K_n` and :math:`K_m` observed outcomes instead of :math:`O(k 2^k)`.
+    The qubits out of `selected` are traced out, so the overlaps of the subsystems
+    are given by the same observed outcomes of the whole system.
+
+    Args:
+        distributions (ShadowDistributions):
+            The distributions of the outcomes from :func:`marginal_distributions`.
+        directions (np.ndarray[tuple[int, int], np.dtype[np.intp]]):
+            The shadow directions from :func:`snapshot_distributions`.
+        first (np.ndarray[tuple[int], np.dtype[np.intp]]):
+            The index :math:`n` of each pair.
+        second (np.ndarray[tuple[int], np.dtype[np.intp]]):
+            The index :math:`m` of each pair.
+        selected (Optional[np.ndarray[tuple[int], np.dtype[np.bool_]]], optional):
+            The mask of the qubits of the subsystem over the columns of the outcomes,
+            all qubits are selected if None.
+            Defaults to None.
+
+    Returns:
+        np.ndarray[tuple[int], np.dtype[np.float64]]: The overlap of each pair.
+    """
+    outcomes, ratios, offsets = distributions.outcomes, distributions.ratios, distributions.offsets
+    if selected is None:
+        selected = np.ones(distributions.num_selected, dtype=np.bool_)
+    num_selected = int(selected.sum())
+
+    same = (directions[first] == directions[second]) & selected
+    num_same = same.sum(axis=1)
+    prefactors = 5.0**num_same * 0.5 ** (num_selected - num_same)
+    ratio_powers = (-0.8) ** np.arange(num_selected + 1)
+
+    overlaps = np.zeros(len(first), dtype=np.float64)
+    order = np.argsort(first, kind="stable")
+    firsts, starts = np.unique(first[order], return_index=True)
+    for n, pairs in zip(firsts, np.split(order, starts[1:])):
+        outcomes_n = outcomes[offsets[n] : offsets[n + 1]].astype(np.float64)
+        ratios_n = ratios[offsets[n] : offsets[n + 1]]
+        # The observed outcomes of all the partners of the n-th snapshot in a row.
+        num_rows = offsets[second[pairs] + 1] - offsets[second[pairs]]
+        row_begins = np.cumsum(num_rows) - num_rows
+        rows = np.repeat(offsets[second[pairs]] - row_begins, num_rows) + np.arange(
+            num_rows.sum()
+        )
+        owners = np.repeat(np.arange(len(pairs)), num_rows)
+
+        chunk_size = max(1, OVERLAP_CHUNK_ELEMENTS // (len(outcomes_n) + 2 * num_selected))
+        columns = np.empty(len(rows), dtype=np.float64)
+        for begin in range(0, len(rows), chunk_size):
+            chunk_rows = rows[begin : begin + chunk_size]
+            masks = same[pairs[owners[begin : begin + chunk_size]]].astype(np.float64)
+            masked = outcomes[chunk_rows] * masks
+            # |(s xor s') and M| = |s and M| + |s' and M| - 2 |s and s' and M|
+            num_flipped = np.rint(
+                outcomes_n @ masks.T + masked.sum(axis=1) - 2 * outcomes_n @ masked.T
+            ).astype(np.intp)
+            columns[begin : begin + chunk_size] = ratios_n @ ratio_powers[num_flipped]
+        overlaps[pairs] = prefactors[pairs] * np.bincount(
+            owners, weights=columns * ratios[rows], minlength=len(pairs)
+        )
+    return overlaps
+
+
+def snapshot_overlaps(
+    distributions: ShadowDistributions,
+    directions: np.ndarray[tuple[int, int], np.dtype[np.intp]],
+    first: np.ndarray[tuple[int], np.dtype[np.intp]],
+    second: np.ndarray[tuple[int], np.dtype[np.intp]],
+    selected: Optional[np.ndarray[tuple[int], np.dtype[np.bool_]]] = None,
+) -> np.ndarray[tuple[int], np.dtype[np.float64]]:
+    """The overlaps :math:`\\text{tr}(\\hat{\\rho}_n \\hat{\\rho}_m)` of the pairs of snapshots
+    by :func:`dense_snapshot_overlaps` if the dense distributions are built
+    and all qubits are selected, otherwise by :func:`sparse_snapshot_overlaps`.
+
+    Args:
+        distributions (ShadowDistributions):
+            The distributions of the outcomes from :func:`snapshot_distributions`.
+        directions (np.ndarray[tuple[int, int], np.dtype[np.intp]]):
+            The shadow directions from :func:`snapshot_distributions`.
+        first (np.ndarray[tuple[int], np.dtype[np.intp]]):
+            The index :math:`n` of each pair.
+        second (np.ndarray[tuple[int], np.dtype[np.intp]]):
+            The index :math:`m` of each pair.
+        selected (Optional[np.ndarray[tuple[int], np.dtype[np.bool_]]], optional):
+            The mask of the qubits of the subsystem over the columns of the outcomes,
+            all qubits are selected if None.
+            Defaults to None.
+
+    Returns:
+        np.ndarray[tuple[int], np.dtype[np.float64]]: The overlap of each pair.
+    """
+    if distributions.dense is not None and selected is None:
+        return dense_snapshot_overlaps(distributions.dense, directions, first, second)
+    return sparse_snapshot_overlaps(distributions, directions, first, second, selected)
+
+
+def trace_rho_square_groups(
+    distributions: ShadowDistributions,
+    directions: np.ndarray[tuple[int, int], np.dtype[np.intp]],
+    num_groups: int = 1,
+    selected: Optional[np.ndarray[tuple[int], np.dtype[np.bool_]]] = None,
+) -> tuple[float, Optional[float], int]:
+    """The purity by the U-statistics of the snapshots,
+    and the median of means of the U-statistics within groups if `num_groups` is larger than 1.
+
+    The snapshots are split into `num_groups` consecutive groups,
+    only the pairs in the same group are evaluated,
+    so the cost is reduced by the number of groups.
+    The error is the standard error of the U-statistics of the groups.
+
+    Args:
+        distributions (ShadowDistributions):
+            The distributions of the outcomes from :func:`snapshot_distributions`.
+        directions (np.ndarray[tuple[int, int], np.dtype[np.intp]]):
+            The shadow directions from :func:`snapshot_distributions`.
+        num_groups (int, optional):
+            The number of groups, which is clipped to keep at least 2 snapshots in each group.
+            Defaults to 1.
+        selected (Optional[np.ndarray[tuple[int], np.dtype[np.bool_]]], optional):
+            The mask of the qubits of the subsystem for :func:`snapshot_overlaps`.
+            Defaults to None.
+
+    Returns:
+        tuple[float, Optional[float], int]:
+            The purity, the error which is None for a single group, and the number of groups.
+    """
+    num_n_u = len(directions)
+    assert num_n_u > 1, f"At least 2 snapshots are required, but get {num_n_u}."
+    num_groups = max(1, min(num_groups, num_n_u // 2))
+
+    groups = np.array_split(np.arange(num_n_u), num_groups)
+    first_list, second_list, group_list = [], [], []
+    for group_idx, group in enumerate(groups):
+        first, second = np.triu_indices(len(group), k=1)
+        first_list.append(group[first])
+        second_list.append(group[second])
+        group_list.append(np.full(len(first), group_idx))
+    group_of_pairs = np.concatenate(group_list)
+
+    overlaps = snapshot_overlaps(
+        distributions,
+        directions,
+        np.concatenate(first_list),
+        np.concatenate(second_list),
+        selected,
+    )
+    group_purities = np.bincount(group_of_pairs, weights=overlaps, minlength=num_groups) / (
+        np.bincount(group_of_pairs, minlength=num_groups)
+    )
+
+    if num_groups == 1:
+        return float(group_purities[0]), None, num_groups
+    return (
+        float(np.median(group_purities)),
+        float(group_purities.std(ddof=1) / np.sqrt(num_groups)),
+        num_groups,
+    )
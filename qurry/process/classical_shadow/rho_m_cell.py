@@ -6,10 +6,10 @@ Postprocessing - Classical Shadow - Rho M Cell
 
 """
 
-from typing import Literal, Union
+from typing import Literal, Union, Optional
 import numpy as np
 
-from .unitary_set import U_M_MATRIX, OUTER_PRODUCT, IDENTITY
+from .unitary_set import SNAPSHOT_LOOKUP
 from ..availability import (
     availablility,
     default_postprocessing_backend,
@@ -53,14 +53,50 @@ BACKEND_AVAILABLE = availablility(
 DEFAULT_PROCESS_BACKEND = default_postprocessing_backend(RUST_AVAILABLE, False)
 
 
+def rho_m_dense_py(
+    outcomes: np.ndarray[tuple[int, int], np.dtype[np.bool_]],
+    weights: np.ndarray[tuple[int], np.dtype[np.float64]],
+    directions: list[Union[Literal[0, 1, 2], int]],
+) -> np.ndarray[tuple[int, int], np.dtype[np.complex128]]:
+    """Build the dense snapshot from the outcomes of the selected qubits.
+
+    The distribution of the outcomes is contracted with the single-qubit snapshots
+    one qubit at a time, so the intermediate tensors never exceed the size of the result.
+
+    Args:
+        outcomes (np.ndarray[tuple[int, int], np.dtype[np.bool_]]):
+            The outcomes of the selected qubits, the column `i` is the `i`-th factor.
+        weights (np.ndarray[tuple[int], np.dtype[np.float64]]):
+            The ratio of each outcome.
+        directions (list[Union[Literal[0, 1, 2], int]]):
+            The shadow direction of each factor.
+
+    Returns:
+        np.ndarray[tuple[int, int], np.dtype[np.complex128]]: The dense snapshot.
+    """
+    num_factors = len(directions)
+    distribution = np.zeros(2**num_factors, dtype=np.complex128)
+    np.add.at(
+        distribution, outcomes.astype(np.intp) @ (1 << np.arange(num_factors)[::-1]), weights
+    )
+
+    rho_m = distribution.reshape((2,) * num_factors)
+    for direction in directions:
+        rho_m = np.tensordot(rho_m, SNAPSHOT_LOOKUP[direction], axes=([0], [0]))
+    return rho_m.transpose(
+        list(range(0, 2 * num_factors, 2)) + list(range(1, 2 * num_factors, 2))
+    ).reshape(2**num_factors, 2**num_factors)
+
+
 def rho_m_cell_py(
     idx: int,
     single_counts: dict[str, int],
     nu_shadow_direction: dict[int, Union[Literal[0, 1, 2], int]],
     selected_classical_registers: list[int],
+    dense: bool = True,
 ) -> tuple[
     int,
-    np.ndarray[tuple[int, int], np.dtype[np.complex128]],
+    Optional[np.ndarray[tuple[int, int], np.dtype[np.complex128]]],
     dict[int, np.ndarray[tuple[Literal[2], Literal[2]], np.dtype[np.complex128]]],
     list[int],
 ]:
@@ -71,9 +107,14 @@ def rho_m_cell_py(
         \rho_{m_i} = \sum_{s} \frac{3}{\text{shots}} U_M^{(s) \dagger}
         \otimes \mathbb{1} U_M^{(s)} - \mathbb{1}
 
-    The matrix :math:`\rho_m` is calculated by the following equation,
+    The matrix :math:`\rho_m` is the snapshot averaged over the outcomes,
     .. math::
-        \rho_m = \bigotimes_{i=0}^{n-1} \rho_{m_i}
+        \rho_m = \sum_{s} \frac{N_s}{\text{shots}} \bigotimes_{i=0}^{n-1}
+        \left( 3 U_{M_i}^{\dagger} |s_i\rangle\langle s_i| U_{M_i} - \mathbb{1} \right)
+
+    which keeps the correlations between qubits lost in
+    :math:`\bigotimes_{i} \rho_{m_i}`.
+    It takes :math:`4^n` elements, so it is only built when `dense` is True.
 
     Args:
         idx (int):
@@ -84,15 +125,18 @@ def rho_m_cell_py(
             The shadow direction of the unitary operators.
         selected_classical_registers (list[int]):
             The list of **the index of the selected_classical_registers**.
+        dense (bool, optional):
+            Whether to build the dense matrix rho_m. Defaults to True.
 
     Returns:
         tuple[
             int,
-            np.ndarray[tuple[int, int], np.dtype[np.complex128]],
+            Optional[np.ndarray[tuple[int, int], np.dtype[np.complex128]]],
             dict[int, np.ndarray[tuple[Literal[2], Literal[2]], np.dtype[np.complex128]]],
             list[int]
         ]:
-            Index, rho_m, the set of rho_m_i, the sorted list of the selected qubits
+            Index, rho_m or None if `dense` is False,
+            the set of rho_m_i, the sorted list of the selected qubits
     """
 
     num_classical_register = len(list(single_counts.keys())[0])
@@ -101,39 +145,26 @@ def rho_m_cell_py(
         nu_shadow_direction
     ), "The number of qubits and the number of shadow directions should be the same."
 
-    # subsystem making
+    # The snapshot of each qubit only depends on its outcome,
+    # so rho_m_i is the marginal frequencies of the outcomes combined with the snapshots.
     selected_classical_registers_sorted = sorted(selected_classical_registers, reverse=True)
-    single_counts_under_degree = {}
-    for bitstring_all, num_counts_all in single_counts.items():
-        bitstring = "".join(
-            bitstring_all[num_classical_register - q_i - 1]
-            for q_i in selected_classical_registers_sorted
-        )
-        if bitstring in single_counts_under_degree:
-            single_counts_under_degree[bitstring] += num_counts_all
-        else:
-            single_counts_under_degree[bitstring] = num_counts_all
-
-    # core calculation
-    rho_m_i_k = {q_i: {} for q_i in selected_classical_registers_sorted}
-    for bitstring in single_counts_under_degree:
-        for q_i, s_q in zip(selected_classical_registers_sorted, bitstring):
-            rho_m_i_k[q_i][bitstring] = (
-                3
-                * U_M_MATRIX[nu_shadow_direction[q_i]].conj().T
-                @ OUTER_PRODUCT[s_q]
-                @ U_M_MATRIX[nu_shadow_direction[q_i]]
-            ) - IDENTITY
-    rho_m_i = {
-        q_i: np.zeros((2, 2), dtype=np.complex128) for q_i in selected_classical_registers_sorted
-    }
-    for q_i in selected_classical_registers_sorted:
-        for bitstring, num_counts in single_counts_under_degree.items():
-            rho_m_i[q_i] += rho_m_i_k[q_i][bitstring] * num_counts
-        rho_m_i[q_i] /= shots
-
-    rho_m = rho_m_i[selected_classical_registers_sorted[0]]
-    for q_i in selected_classical_registers_sorted[1:]:
-        rho_m = np.kron(rho_m, rho_m_i[q_i])
+    bits = np.frombuffer("".join(single_counts).encode(), dtype=np.uint8).reshape(
+        -1, num_classical_register
+    )
+    positions = [num_classical_register - q_i - 1 for q_i in selected_classical_registers_sorted]
+    num_counts = np.fromiter(single_counts.values(), dtype=np.float64, count=len(single_counts))
+    outcomes = bits[:, positions] == ord("1")
+    frequency_one = num_counts @ outcomes / shots
+
+    directions = [nu_shadow_direction[q_i] for q_i in selected_classical_registers_sorted]
+    rho_m_i_array = (
+        (1 - frequency_one)[:, None, None] * SNAPSHOT_LOOKUP[directions, 0]
+        + frequency_one[:, None, None] * SNAPSHOT_LOOKUP[directions, 1]
+    )
+    rho_m_i = dict(zip(selected_classical_registers_sorted, rho_m_i_array))
+    if not dense:
+        return idx, None, rho_m_i, selected_classical_registers_sorted
+
+    rho_m = rho_m_dense_py(outcomes, num_counts / shots, directions)
 
     return idx, rho_m, rho_m_i, selected_classical_registers_sorted
@@ -17,6 +17,7 @@ from ..availability import (
     default_postprocessing_backend,
     # PostProcessingBackendLabel,
 )
+from ..utils import counts_starmap
 from ...tools import ParallelManager, workers_distribution
 
 
@@ -31,12 +32,20 @@ BACKEND_AVAILABLE = availablility(
 )
 DEFAULT_PROCESS_BACKEND = default_postprocessing_backend(RUST_AVAILABLE, False)
 
+SHADOW_DENSE_MAX_QUBITS = 8
+"""The maximum number of qubits for building the dense matrices of classical shadow.
+
+A dense matrix on :math:`n` qubits takes :math:`4^n` complex numbers for each snapshot,
+so the snapshots are kept in the factorized form of single-qubit matrices by default.
+"""
+
 
 def rho_m_core_py(
     shots: int,
     counts: list[dict[str, int]],
     random_unitary_um: dict[int, dict[int, Union[Literal[0, 1, 2], int]]],
     selected_classical_registers: list[int],
+    dense: bool = False,
 ) -> tuple[
     dict[int, np.ndarray[tuple[int, int], np.dtype[np.complex128]]],
     dict[int, dict[int, np.ndarray[tuple[Literal[2], Literal[2]], np.dtype[np.complex128]]]],
@@ -55,6 +64,13 @@ def rho_m_core_py(
             The shadow direction of the unitary operators.
         selected_classical_registers (list[int]):
             The list of **the index of the selected_classical_registers**.
+        dense (bool, optional):
+            Whether to build the dense matrix rho_m of each snapshot,
+            only available for at most :const:`SHADOW_DENSE_MAX_QUBITS` qubits.
+            Defaults to False.
+
+    Raises:
+        ValueError: The dense matrices are requested for too many qubits.
 
     Returns:
         tuple[
@@ -66,7 +82,7 @@ def rho_m_core_py(
             str,
             float
         ]:
-            The rho_m, the set of rho_m_i,
+            The rho_m which is empty if `dense` is False, the set of rho_m_i,
             the sorted list of the selected qubits,
             the message, the taken time.
     """
@@ -89,16 +105,23 @@ def rho_m_core_py(
     assert all(
         0 <= q_i < measured_system_size for q_i in selected_classical_registers
     ), f"Invalid selected classical registers: {selected_classical_registers}"
+    if dense and len(selected_classical_registers) > SHADOW_DENSE_MAX_QUBITS:
+        raise ValueError(
+            f"The dense matrices of {len(selected_classical_registers)} qubits are too large, "
+            + f"they are only available for at most {SHADOW_DENSE_MAX_QUBITS} qubits."
+        )
     msg = f"| Selected classical registers: {selected_classical_registers}"
 
     begin = time.time()
 
     pool = ParallelManager(launch_worker)
-    rho_m_py_result_list = pool.starmap(
+    rho_m_py_result_list = counts_starmap(
+        pool,
         rho_m_cell_py,
+        counts,
         [
-            (idx, single_counts, random_unitary_um[idx], selected_classical_registers)
-            for idx, single_counts in enumerate(counts)
+            (random_unitary_um[idx], selected_classical_registers, dense)
+            for idx in range(len(counts))
         ],
     )
 
@@ -112,7 +135,8 @@ def rho_m_core_py(
     ] = {}
     selected_qubits_checked: dict[int, bool] = {}
     for idx, rho_m, rho_m_i, selected_classical_registers_sorted_result in rho_m_py_result_list:
-        rho_m_dict[idx] = rho_m
+        if rho_m is not None:
+            rho_m_dict[idx] = rho_m
         rho_m_i_dict[idx] = rho_m_i
         if selected_classical_registers_sorted_result != selected_classical_registers_sorted:
             selected_qubits_checked[idx] = False
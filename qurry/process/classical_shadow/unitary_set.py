@@ -128,3 +128,45 @@ It's just :math:`\mathbb{I} = \begin{pmatrix} 1 & 0 \\ 0 & 1 \end{pmatrix}`.
 
 What a simple matrix!
 """
+
+SNAPSHOT_LOOKUP: np.ndarray[
+    tuple[Literal[3], Literal[2], Literal[2], Literal[2]], np.dtype[np.complex128]
+] = np.array(
+    [
+        [
+            3 * U_M_MATRIX[um].conj().T @ OUTER_PRODUCT[s] @ U_M_MATRIX[um] - IDENTITY
+            for s in ("0", "1")
+        ]
+        for um in range(len(U_M_MATRIX))
+    ],
+    dtype=np.complex128,
+)
+r"""The single-qubit snapshots for each unitary operator and outcome,
+the entry `[um, s]` is
+
+.. math::
+    3 U_M^{\dagger} |s\rangle\langle s| U_M - \mathbb{I}
+
+which only depends on the index of :math:`U_M` and the outcome :math:`s`,
+so there are only 6 different snapshots.
+"""
+
+PAULI_MATRIX: dict[
+    Union[Literal["I", "X", "Y", "Z"], str],
+    np.ndarray[tuple[Literal[2], Literal[2]], np.dtype[np.complex128]],
+] = {
+    "I": np.array([[1, 0], [0, 1]], dtype=np.complex128),
+    "X": np.array([[0, 1], [1, 0]], dtype=np.complex128),
+    "Y": np.array([[0, -1j], [1j, 0]], dtype=np.complex128),
+    "Z": np.array([[1, 0], [0, -1]], dtype=np.complex128),
+}
+r"""The :class:`numpy.ndarray` objects for the Pauli matrices,
+which are used as the single-qubit operators of the observables.
+
+{
+    "I": :math:`\mathbb{I}`,
+    "X": :math:`\sigma_x`,
+    "Y": :math:`\sigma_y`,
+    "Z": :math:`\sigma_z`
+}
+"""
@@ -52,3 +52,8 @@ class PostProcessingRustUnavailableWarning(QurryPostProcessingWarning):
 
 class PostProcessingBackendDeprecatedWarning(QurryPostProcessingWarning):
     """Post-processing backend is deprecated."""
+
+
+class PostProcessingCacheInvalidWarning(QurryPostProcessingWarning):
+    """Post-processing cache entry invalid warning,
+    the entry will be removed and calculated again."""
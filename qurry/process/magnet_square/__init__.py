@@ -8,5 +8,6 @@ Postprocessing - Magnet Square
 
 from .magsq_core import BACKEND_AVAILABLE as magnet_square_availability
 from .magsq_cell import BACKEND_AVAILABLE as magsq_cell_availability
+from .zz_correlator import BACKEND_AVAILABLE as zz_correlator_availability
 
-from .magnet_square import magnet_square
+from .magnet_square import magnet_square, magnet_square_full_register
@@ -6,12 +6,14 @@ Postprocessing - Magnet Square - Magnet Square
 
 """
 
+import time
 from typing import Union, Optional, TypedDict
 import numpy as np
 import tqdm
 
 from ..availability import PostProcessingBackendLabel
 from .magsq_core import magnetic_square_core, DEFAULT_PROCESS_BACKEND
+from .zz_correlator import zz_correlator, DEFAULT_PROCESS_BACKEND as ZZ_DEFAULT_PROCESS_BACKEND
 
 
 class MagnetSquare(TypedDict):
@@ -65,3 +67,60 @@ def magnet_square(
         "countsNum": counts_num,
         "takingTime": taking_time,
     }
+
+
+class MagnetSquareFullRegister(TypedDict):
+    """Magnet Square from the counts measured on the whole register."""
+
+    magnet_square: Union[float, np.float64]
+    """Magnet Square."""
+    zz_correlators: np.ndarray[tuple[int, int], np.dtype[np.float64]]
+    """The ZZ correlators of all pairs of qubits,
+    the element `[i, j]` is the correlator of qubit i and qubit j."""
+    countsNum: int
+    """Number of counts."""
+    takingTime: float
+    """Taking time."""
+
+
+def magnet_square_full_register(
+    shots: int,
+    counts: list[dict[str, int]],
+    backend: PostProcessingBackendLabel = ZZ_DEFAULT_PROCESS_BACKEND,
+    pbar: Optional[tqdm.tqdm] = None,
+) -> MagnetSquareFullRegister:
+    """Calculate the magnet square from the counts measured on the whole register,
+    all pairwise ZZ correlators are computed from the same bitstrings at once.
+
+    Args:
+        shots (int): Number of shots.
+        counts (list[dict[str, int]]): List of counts, only one counts is expected.
+        backend (PostProcessingBackendLabel, optional):
+            Backend to use. Defaults to ZZ_DEFAULT_PROCESS_BACKEND.
+        pbar (Optional[tqdm.tqdm], optional): Progress bar. Defaults to None.
+
+    Raises:
+        ValueError: If the number of counts is not 1.
+
+    Returns:
+        MagnetSquareFullRegister: Magnet Square and the ZZ correlators.
+    """
+    if len(counts) != 1:
+        raise ValueError(f"Only one counts is expected, but get {len(counts)}.")
+    if isinstance(pbar, tqdm.tqdm):
+        pbar.set_description("Magnet Square being calculated.")
+
+    begin = time.time()
+    zz_correlators = zz_correlator(counts[0], shots, backend)
+    num_qubits = zz_correlators.shape[0]
+    magsq = zz_correlators.sum() / (num_qubits**2) if num_qubits > 0 else np.float64(0)
+    taking_time = round(time.time() - begin, 3)
+
+    if isinstance(pbar, tqdm.tqdm):
+        pbar.set_description(f"Magnet Square calculated in {taking_time} seconds.")
+    return {
+        "magnet_square": magsq,
+        "zz_correlators": zz_correlators,
+        "countsNum": len(counts),
+        "takingTime": taking_time,
+    }
@@ -11,57 +11,152 @@ import warnings
 from typing import Union, Optional
 import numpy as np
 
-from .magsq_cell import magsq_cell_py  # , magsq_cell_rust
+from .magsq_cell import magsq_cell_py, magsq_cell_rust
 from ..availability import (
     availablility,
     default_postprocessing_backend,
     PostProcessingBackendLabel,
 )
 from ..exceptions import (
-    # PostProcessingRustImportError,
+    PostProcessingRustImportError,
     PostProcessingRustUnavailableWarning,
 )
+from ..utils import counts_starmap
 from ...tools import ParallelManager, workers_distribution
 
 
-# try:
-#     from ...boorust import magsq  # type: ignore
+try:
+    from ...boorust import magsq  # type: ignore
 
-#     magnetic_square_core_rust_source = magsq.magnetic_square_core_rust
+    magnetic_square_core_rust_source = magsq.magnetic_square_core_rust
 
-#     RUST_AVAILABLE = True
-#     FAILED_RUST_IMPORT = None
-# except ImportError as err:
-#     RUST_AVAILABLE = False
-#     FAILED_RUST_IMPORT = err
+    RUST_AVAILABLE = True
+    FAILED_RUST_IMPORT = None
+except ImportError as err:
+    RUST_AVAILABLE = False
+    FAILED_RUST_IMPORT = err
 
-#     def magnetic_square_core_rust_source(*args, **kwargs):
-#         """Dummy function for magnetic_square_core_rust."""
-#         raise PostProcessingRustImportError(
-#             "Rust is not available, using python to calculate magnetic square."
-#         ) from FAILED_RUST_IMPORT
+    def magnetic_square_core_rust_source(*args, **kwargs):
+        """Dummy function for magnetic_square_core_rust."""
+        raise PostProcessingRustImportError(
+            "Rust is not available, using python to calculate magnetic square."
+        ) from FAILED_RUST_IMPORT
 
 
 BACKEND_AVAILABLE = availablility(
     "magnet_square.magnsq_core",
     [
-        # ("Rust", RUST_AVAILABLE, FAILED_RUST_IMPORT),
+        ("Rust", RUST_AVAILABLE, FAILED_RUST_IMPORT),
     ],
 )
 DEFAULT_PROCESS_BACKEND = default_postprocessing_backend(
-    # RUST_AVAILABLE, False
-    False,
+    RUST_AVAILABLE,
     False,
 )
 
+TWO_BIT_PARITY = np.array([1, -1, -1, 1], dtype=np.float64)
+"""The parity of the 2-bit outcomes encoded as integers,
+`00` and `11` are +1, `01` and `10` are -1."""
 
-# def magnetic_square_core_allrust(
-#     shots: int,
-#     counts: list[dict[str, int]],
-#     num_qubits: int,
-# ) -> tuple[Union[float, np.float64], dict[int, Union[float, np.float64]], int, float]:
-#     """The core function of magnet square by Rust."""
-#     return magnetic_square_core_rust_source(counts, shots, num_qubits)
+
+def magnetic_square_core_allrust(
+    counts: list[dict[str, int]],
+    shots: int,
+    num_qubits: int,
+) -> tuple[Union[float, np.float64], dict[int, Union[float, np.float64]], int, float, str]:
+    """The core function of magnet square by Rust.
+
+    Args:
+        counts (list[dict[str, int]]):
+            Counts of the experiment on quantum machine.
+        shots (int):
+            Shots of the experiment on quantum machine.
+        num_qubits (int):
+            Number of qubits.
+
+    Returns:
+        tuple[
+            Union[float, np.float64],
+            dict[int, Union[float, np.float64]],
+            int,
+            float,
+            str
+        ]:
+            Magnitudes square, Magnitudes square cell,
+            Length of counts, Time taken, Message.
+    """
+    magnetsq, magnetsq_cell_dict, length, taken, msg = magnetic_square_core_rust_source(
+        counts, shots, num_qubits
+    )
+    return magnetsq, magnetsq_cell_dict, length, round(taken, 3), msg
+
+
+def magnetic_square_core_py(
+    counts: list[dict[str, int]],
+    shots: int,
+    num_qubits: int,
+) -> tuple[Union[float, np.float64], dict[int, Union[float, np.float64]], int, float, str]:
+    """The core function of magnet square by NumPy.
+
+    All counts are handled in one pass,
+    the outcomes are encoded as integers and their parities are looked up from
+    :const:`TWO_BIT_PARITY`, then summed to each cell by :func:`numpy.bincount`.
+
+    Args:
+        counts (list[dict[str, int]]):
+            Counts of the experiment on quantum machine.
+        shots (int):
+            Shots of the experiment on quantum machine.
+        num_qubits (int):
+            Number of qubits.
+
+    Returns:
+        tuple[
+            Union[float, np.float64],
+            dict[int, Union[float, np.float64]],
+            int,
+            float,
+            str
+        ]:
+            Magnitudes square, Magnitudes square cell,
+            Length of counts, Time taken, Message.
+    """
+    length = len(counts)
+    begin = time.time()
+
+    bit_lengths = {len(bits) for single_counts in counts for bits in single_counts}
+    assert bit_lengths <= {2}, f"Bits must be 2 bit, but get the lengths {bit_lengths}."
+
+    cell_index = np.repeat(
+        np.arange(length), np.fromiter((len(single_counts) for single_counts in counts), int)
+    )
+    num_counts = np.fromiter(
+        (num for single_counts in counts for num in single_counts.values()), dtype=np.float64
+    )
+    outcomes = (
+        np.frombuffer("".join("".join(single_counts) for single_counts in counts).encode(), "u1")
+        .reshape(-1, 2)
+        .astype(np.intp)
+        - ord("0")
+    )
+    encoded = (outcomes[:, 0] << 1) | outcomes[:, 1]
+
+    sum_counts = np.bincount(cell_index, weights=num_counts, minlength=length)
+    mismatched = np.flatnonzero(sum_counts != shots)
+    assert len(mismatched) == 0, (
+        f"Shots: {shots} must be equal to the sum of counts: "
+        + f"{sum_counts[mismatched].tolist()} at the counts {mismatched.tolist()}."
+    )
+    magnetsq_cells = (
+        np.bincount(cell_index, weights=TWO_BIT_PARITY[encoded] * num_counts, minlength=length)
+        / shots
+    )
+
+    taken = round(time.time() - begin, 3)
+    magnetsq_cell_dict = dict(enumerate(magnetsq_cells))
+    magnetsq = (magnetsq_cells.sum() + num_qubits) / (num_qubits**2)
+
+    return magnetsq, magnetsq_cell_dict, length, taken, f", numpy, {length} counts."
 
 
 def magnetic_square_core_pyrust(
@@ -71,7 +166,8 @@ def magnetic_square_core_pyrust(
     multiprocess_pool_size: Optional[int] = None,
     backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
 ) -> tuple[Union[float, np.float64], dict[int, Union[float, np.float64]], int, float, str]:
-    """The core function of magnet square by Python and Rust.
+    """The core function of magnet square by Python and Rust,
+    each cell is calculated in the process pool.
 
     Args:
         counts (list[dict[str, int]]):
@@ -104,13 +200,14 @@ def magnetic_square_core_pyrust(
     length = len(counts)
     begin = time.time()
 
-    if backend == "Rust":
+    if backend == "Rust" and not RUST_AVAILABLE:
         warnings.warn(
             PostProcessingRustUnavailableWarning(
-                "Rust is not ready, using python to calculate magnetic square."
+                "Rust is not available, using python to calculate magnetic square."
             )
         )
-    cell_calculations = magsq_cell_py  # if backend == "Python" else magsq_cell_rust
+        backend = "Python"
+    cell_calculations = magsq_cell_rust if backend == "Rust" else magsq_cell_py
 
     if launch_worker == 1:
         magnetsq_cell_items: list[tuple[int, Union[float, np.float64]]] = []
@@ -122,8 +219,8 @@ def magnetic_square_core_pyrust(
     else:
         msg += f", {launch_worker} workers, {length} counts."
         pool = ParallelManager(launch_worker)
-        magnetsq_cell_items = pool.starmap(
-            cell_calculations, [(i, c, shots) for i, c in enumerate(counts)]
+        magnetsq_cell_items = counts_starmap(
+            pool, cell_calculations, counts, [(shots,) for _ in counts]
         )
 
     taken = round(time.time() - begin, 3)
@@ -140,7 +237,11 @@ def magnetic_square_core(
     multiprocess_pool_size: Optional[int] = None,
     backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
 ) -> tuple[Union[float, np.float64], dict[int, Union[float, np.float64]], int, float, str]:
-    """The core function of magnet square by Python.
+    """The core function of magnet square.
+
+    The counts are handled in one pass by Rust or NumPy without the process pool,
+    unless the number of workers is specified,
+    then each cell is calculated in the process pool by :func:`magnetic_square_core_pyrust`.
 
     Args:
         counts (list[dict[str, int]]):
@@ -165,21 +266,18 @@ def magnetic_square_core(
             Magnitudes square, Magnitudes square cell,
             Length of counts, Time taken, Message.
     """
+    if multiprocess_pool_size is not None:
+        return magnetic_square_core_pyrust(
+            counts, shots, num_qubits, multiprocess_pool_size, backend
+        )
 
-    # if backend == "Rust":
-    #     if RUST_AVAILABLE:
-    #         return magnetic_square_core_rust_source(counts, shots, num_qubits)
-
-    #     warnings.warn(
-    #         PostProcessingRustUnavailableWarning(
-    #             "Rust is not available, using python to calculate magnetic square."
-    #         )
-    #     )
     if backend == "Rust":
+        if RUST_AVAILABLE:
+            return magnetic_square_core_allrust(counts, shots, num_qubits)
         warnings.warn(
             PostProcessingRustUnavailableWarning(
-                "Rust is not ready, using python to calculate magnetic square."
+                "Rust is not available, using python to calculate magnetic square."
             )
         )
 
-    return magnetic_square_core_pyrust(counts, shots, num_qubits, multiprocess_pool_size, backend)
+    return magnetic_square_core_py(counts, shots, num_qubits)
@@ -0,0 +1,133 @@
+"""
+================================================================
+Postprocessing - Magnet Square - ZZ Correlator
+(:mod:`qurry.process.magnet_square.zz_correlator`)
+================================================================
+
+The pairwise ZZ correlators from the counts measured on the whole register.
+
+Each bitstring is turned into the spins :math:`z_i = 1 - 2 b_i` with the qubit :math:`i`
+on the column :math:`i`, which is the reversed order of the bitstring,
+and all correlators are given by one matrix product
+
+.. math::
+    C_{ij} = \\langle Z_i Z_j \\rangle = \\frac{1}{N} \\sum_{s} n_s z_i^{(s)} z_j^{(s)}
+
+where :math:`n_s` is the number of the outcome :math:`s` and :math:`N` is the number of shots.
+The magnetization square is the mean of all correlators,
+:math:`\\langle M^2 \\rangle = \\frac{1}{n^2} \\sum_{i,j} C_{ij}`.
+
+"""
+
+import warnings
+import numpy as np
+
+from ..availability import (
+    availablility,
+    default_postprocessing_backend,
+    PostProcessingBackendLabel,
+)
+from ..exceptions import (
+    PostProcessingRustImportError,
+    PostProcessingRustUnavailableWarning,
+)
+
+try:
+    from ...boorust import magsq  # type: ignore
+
+    zz_correlator_rust_source = magsq.zz_correlator_rust
+
+    RUST_AVAILABLE = True
+    FAILED_RUST_IMPORT = None
+except ImportError as err:
+    RUST_AVAILABLE = False
+    FAILED_RUST_IMPORT = err
+
+    def zz_correlator_rust_source(*args, **kwargs):
+        """Dummy function for zz_correlator_rust."""
+        raise PostProcessingRustImportError(
+            "Rust is not available, using python to calculate ZZ correlators."
+        ) from FAILED_RUST_IMPORT
+
+
+BACKEND_AVAILABLE = availablility(
+    "magnet_square.zz_correlator",
+    [
+        ("Rust", RUST_AVAILABLE, FAILED_RUST_IMPORT),
+    ],
+)
+DEFAULT_PROCESS_BACKEND = default_postprocessing_backend(
+    RUST_AVAILABLE,
+    False,
+)
+
+
+def zz_correlator_rust(
+    single_counts: dict[str, int],
+    shots: int,
+) -> np.ndarray[tuple[int, int], np.dtype[np.float64]]:
+    """Calculate the ZZ correlators by Rust.
+
+    Args:
+        single_counts (dict[str, int]): Counts measured on the whole register.
+        shots (int): Shots of the experiment on quantum machine.
+
+    Returns:
+        np.ndarray[tuple[int, int], np.dtype[np.float64]]:
+            The ZZ correlators, the element `[i, j]` is the correlator of qubit i and qubit j.
+    """
+    return np.array(zz_correlator_rust_source(single_counts, shots), dtype=np.float64)
+
+
+def zz_correlator_py(
+    single_counts: dict[str, int],
+    shots: int,
+) -> np.ndarray[tuple[int, int], np.dtype[np.float64]]:
+    """Calculate the ZZ correlators by NumPy.
+
+    Args:
+        single_counts (dict[str, int]): Counts measured on the whole register.
+        shots (int): Shots of the experiment on quantum machine.
+
+    Returns:
+        np.ndarray[tuple[int, int], np.dtype[np.float64]]:
+            The ZZ correlators, the element `[i, j]` is the correlator of qubit i and qubit j.
+    """
+    sum_counts = sum(single_counts.values())
+    assert shots == sum_counts, f"Shots: {shots} must be equal to the sum of counts: {sum_counts}."
+    if len(single_counts) == 0:
+        return np.zeros((0, 0), dtype=np.float64)
+
+    num_qubits = len(next(iter(single_counts)))
+    bits = np.frombuffer("".join(single_counts).encode(), dtype=np.uint8).reshape(-1, num_qubits)
+    spins = 1.0 - 2.0 * (bits[:, ::-1] == ord("1"))
+    weights = np.fromiter(single_counts.values(), dtype=np.float64, count=len(single_counts))
+    return (spins.T * (weights / shots)) @ spins
+
+
+def zz_correlator(
+    single_counts: dict[str, int],
+    shots: int,
+    backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
+) -> np.ndarray[tuple[int, int], np.dtype[np.float64]]:
+    """Calculate the ZZ correlators of all pairs of qubits.
+
+    Args:
+        single_counts (dict[str, int]): Counts measured on the whole register.
+        shots (int): Shots of the experiment on quantum machine.
+        backend (PostProcessingBackendLabel, optional):
+            Postprocessing backend. Defaults to DEFAULT_PROCESS_BACKEND.
+
+    Returns:
+        np.ndarray[tuple[int, int], np.dtype[np.float64]]:
+            The ZZ correlators, the element `[i, j]` is the correlator of qubit i and qubit j.
+    """
+    if backend == "Rust":
+        if RUST_AVAILABLE:
+            return zz_correlator_rust(single_counts, shots)
+        warnings.warn(
+            PostProcessingRustUnavailableWarning(
+                "Rust is not available, using python to calculate ZZ correlators."
+            )
+        )
+    return zz_correlator_py(single_counts, shots)
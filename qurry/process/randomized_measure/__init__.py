@@ -20,8 +20,18 @@ from .entangled_entropy import (
     randomized_entangled_entropy_mitigated,
     EntangledEntropyResult,
     EntangledEntropyResultMitigated,
+    EntangledEntropyResultMitigatedBootstrap,
+    PurityBootstrapResult,
+    PurityConvergenceResult,
     ExistedAllSystemInfo,
     ExistedAllSystemInfoInput,
+    purity_bootstrap,
+    IncrementalPurity,
+    purity_convergence,
+    PurityCache,
+    DEFAULT_PURITY_CACHE,
+    PURITY_CACHE_FOLDER,
+    purity_cache_key,
 )
 from .entangled_entropy_v1 import (
     randomized_entangled_entropy_v1,
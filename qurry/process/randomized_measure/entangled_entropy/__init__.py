@@ -15,6 +15,18 @@ from .entangled_entropy_2 import (
 from .container import (
     EntangledEntropyResult,
     EntangledEntropyResultMitigated,
+    EntangledEntropyResultMitigatedBootstrap,
+    PurityBootstrapResult,
+    PurityConvergenceResult,
     ExistedAllSystemInfo,
     ExistedAllSystemInfoInput,
 )
+from .bootstrap import purity_bootstrap
+from .streaming import IncrementalPurity
+from .convergence import purity_convergence
+from .purity_cache import (
+    PurityCache,
+    DEFAULT_PURITY_CACHE,
+    PURITY_CACHE_FOLDER,
+    purity_cache_key,
+)
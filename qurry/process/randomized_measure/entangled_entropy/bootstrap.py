@@ -0,0 +1,267 @@
+"""
+=========================================================================================
+Postprocessing - Randomized Measure - Entangled Entropy - Bootstrap
+(:mod:`qurry.process.randomized_measure.entangled_entropy.bootstrap`)
+=========================================================================================
+
+The bootstrap confidence intervals of purity and entropy,
+which resample the random unitaries and optionally the shots of each counts.
+
+Each purity cell is the quadratic form
+
+.. math::
+
+    X = 2^{N_A} \\sum_{s, s'} (-2)^{-D(s, s')} P(s) P(s')
+
+of the probabilities of the outcomes,
+so a resample of shots only changes the probabilities
+and all replicates are computed at once as matrix products
+instead of calling :func:`entangled_entropy_core_2` again.
+
+"""
+
+from typing import Union, Optional, Iterable
+import numpy as np
+
+from .container import PurityBootstrapResult
+from .error_mitigation import depolarizing_error_mitgation
+
+
+def outcomes_and_frequencies(
+    single_counts: dict[str, int],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Convert the counts into the bits of each outcome and their frequencies.
+
+    Args:
+        single_counts (dict[str, int]): Counts measured from the single quantum circuit.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]:
+            The bits of outcomes with shape `(outcomes, classical_registers)`
+            where the column `c_i` is the classical register `c_i`,
+            and the frequencies with shape `(outcomes,)`.
+    """
+    bitstrings = list(single_counts.keys())
+    chars = np.array([list(b[::-1]) for b in bitstrings], dtype="U1")
+    return (chars == "1").astype(np.int64), np.array(list(single_counts.values()), dtype=np.int64)
+
+
+def overlap_weights(bits: np.ndarray) -> np.ndarray:
+    """The weights :math:`2^{N_A} (-2)^{-D(s, s')}` between every two outcomes.
+
+    Args:
+        bits (np.ndarray): The bits of outcomes with shape `(outcomes, subsystem_size)`.
+
+    Returns:
+        np.ndarray: The weights with shape `(outcomes, outcomes)`.
+    """
+    subsystem_size = bits.shape[1]
+    same = bits @ bits.T + (1 - bits) @ (1 - bits).T
+    return np.float_power(2, subsystem_size) * np.float_power(-2, same - subsystem_size)
+
+
+def marginal_projector(
+    bits: np.ndarray,
+    selected_classical_registers: list[int],
+) -> tuple[np.ndarray, np.ndarray]:
+    """The projector from outcomes of all classical registers to the outcomes of subsystem.
+
+    Args:
+        bits (np.ndarray): The bits of outcomes with shape `(outcomes, classical_registers)`.
+        selected_classical_registers (list[int]): The selected classical registers.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]:
+            The one-hot projector with shape `(outcomes, subsystem_outcomes)`
+            and the bits of subsystem outcomes with shape
+            `(subsystem_outcomes, subsystem_size)`.
+    """
+    sub_bits, inverse = np.unique(
+        bits[:, selected_classical_registers], axis=0, return_inverse=True
+    )
+    projector = np.zeros((bits.shape[0], sub_bits.shape[0]), dtype=np.float64)
+    projector[np.arange(bits.shape[0]), inverse.reshape(-1)] = 1
+    return projector, sub_bits
+
+
+def purity_cells_resampled(
+    counts: list[dict[str, int]],
+    selected_classical_registers_list: list[Optional[list[int]]],
+    num_resamples: int,
+    rng: np.random.Generator,
+) -> list[np.ndarray]:
+    """Resample the shots of each counts and calculate the purity cells of every replicate.
+    All subsystems are calculated from the same resampled shots.
+
+    Args:
+        counts (list[dict[str, int]]): Counts of the experiment on quantum machine.
+        selected_classical_registers_list (list[Optional[list[int]]]):
+            The list of **the index of the selected_classical_registers** for each subsystem,
+            all classical registers are selected if it is None.
+        num_resamples (int): The number of replicates.
+        rng (np.random.Generator): The random number generator.
+
+    Returns:
+        list[np.ndarray]:
+            The purity cells with shape `(num_resamples, len(counts))` for each subsystem.
+    """
+    cells_list = [
+        np.zeros((num_resamples, len(counts)), dtype=np.float64)
+        for _ in selected_classical_registers_list
+    ]
+    for ci, single_counts in enumerate(counts):
+        bits, freqs = outcomes_and_frequencies(single_counts)
+        shots = int(freqs.sum())
+        probs = rng.multinomial(shots, freqs / shots, size=num_resamples) / shots
+        for cells, selected in zip(cells_list, selected_classical_registers_list):
+            if selected is None:
+                sub_probs, sub_bits = probs, bits
+            else:
+                projector, sub_bits = marginal_projector(bits, selected)
+                sub_probs = probs @ projector
+            weights = overlap_weights(sub_bits)
+            cells[:, ci] = np.einsum("bi,bi->b", sub_probs @ weights, sub_probs)
+    return cells_list
+
+
+def _percentile_interval(
+    values: np.ndarray,
+    confidence_level: float,
+) -> tuple[np.float64, np.float64]:
+    """The percentile interval of the replicates."""
+    alpha = (1 - confidence_level) / 2
+    low, high = np.nanquantile(values, [alpha, 1 - alpha])
+    return np.float64(low), np.float64(high)
+
+
+def purity_bootstrap(
+    purity_cells: Union[dict[int, np.float64], dict[int, float], Iterable[float]],
+    counts: Optional[list[dict[str, int]]] = None,
+    selected_classical_registers: Optional[Iterable[int]] = None,
+    purity_cells_all_sys: Optional[
+        Union[dict[int, np.float64], dict[int, float], Iterable[float]]
+    ] = None,
+    num_resamples: int = 1000,
+    shot_resampling: bool = False,
+    confidence_level: float = 0.95,
+    seed: Optional[int] = None,
+) -> PurityBootstrapResult:
+    """Bootstrap the confidence intervals of purity and entropy.
+
+    The random unitaries are always resampled with replacement.
+    When `shot_resampling` is True, the shots of each counts are also resampled
+    from the multinomial distribution of the counts,
+    which requires the `counts` and `selected_classical_registers`.
+    When `purity_cells_all_sys` and `counts` are given, the all system is resampled jointly
+    for the interval of the mitigated purity.
+
+    Args:
+        purity_cells (Union[dict[int, np.float64], dict[int, float], Iterable[float]]):
+            The purity of each cell from :func:`entangled_entropy_core_2`.
+        counts (Optional[list[dict[str, int]]], optional):
+            Counts of the experiment on quantum machine,
+            which is required for `shot_resampling`. Defaults to None.
+        selected_classical_registers (Optional[Iterable[int]], optional):
+            The list of **the index of the selected_classical_registers**,
+            which is required for `shot_resampling`. Defaults to None.
+        purity_cells_all_sys (
+            Optional[Union[dict[int, np.float64], dict[int, float], Iterable[float]]],
+            optional
+        ):
+            The purity of each cell of the all system. Defaults to None.
+        num_resamples (int, optional): The number of replicates. Defaults to 1000.
+        shot_resampling (bool, optional): Whether to resample the shots. Defaults to False.
+        confidence_level (float, optional): The confidence level. Defaults to 0.95.
+        seed (Optional[int], optional): The seed of random number generator. Defaults to None.
+
+    Returns:
+        PurityBootstrapResult: The bootstrap standard deviation and confidence intervals.
+    """
+    if not 0 < confidence_level < 1:
+        raise ValueError(f"confidence_level should be in (0, 1), but get {confidence_level}.")
+    if num_resamples < 1:
+        raise ValueError(f"num_resamples should be positive, but get {num_resamples}.")
+
+    cells = np.array(
+        list(purity_cells.values()) if isinstance(purity_cells, dict) else list(purity_cells),
+        dtype=np.float64,
+    )
+    cells_all_sys = (
+        None
+        if purity_cells_all_sys is None
+        else np.array(
+            (
+                list(purity_cells_all_sys.values())
+                if isinstance(purity_cells_all_sys, dict)
+                else list(purity_cells_all_sys)
+            ),
+            dtype=np.float64,
+        )
+    )
+    selected = (
+        None if selected_classical_registers is None else list(selected_classical_registers)
+    )
+    rng = np.random.default_rng(seed)
+    num_cells = len(cells)
+    unitary_idx = rng.integers(0, num_cells, size=(num_resamples, num_cells))
+
+    if shot_resampling:
+        if counts is None or selected is None:
+            raise ValueError(
+                "counts and selected_classical_registers are required for shot_resampling."
+            )
+        if len(counts) != num_cells:
+            raise ValueError(
+                f"The number of counts {len(counts)} does not match "
+                + f"the number of purity cells {num_cells}."
+            )
+        cells_resampled = purity_cells_resampled(
+            counts,
+            [selected] + ([None] if cells_all_sys is not None else []),
+            num_resamples,
+            rng,
+        )
+        replicates = [
+            np.take_along_axis(c, unitary_idx, axis=1).mean(axis=1) for c in cells_resampled
+        ]
+        purity_replicates = replicates[0]
+        all_sys_replicates = replicates[1] if cells_all_sys is not None else None
+    else:
+        purity_replicates = cells[unitary_idx].mean(axis=1)
+        all_sys_replicates = (
+            None if cells_all_sys is None else cells_all_sys[unitary_idx].mean(axis=1)
+        )
+
+    purity_ci = _percentile_interval(purity_replicates, confidence_level)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        entropy_ci = (-np.log2(purity_ci[1]), -np.log2(purity_ci[0]))
+
+    result: PurityBootstrapResult = {
+        "purityBootstrapSD": np.std(purity_replicates, dtype=np.float64),
+        "purityCILow": purity_ci[0],
+        "purityCIHigh": purity_ci[1],
+        "entropyCILow": np.float64(entropy_ci[0]),
+        "entropyCIHigh": np.float64(entropy_ci[1]),
+        "mitigatedPurityCILow": np.nan,
+        "mitigatedPurityCIHigh": np.nan,
+        "bootstrap_resamples": num_resamples,
+        "bootstrap_shot_resampling": shot_resampling,
+        "confidence_level": confidence_level,
+    }
+
+    if all_sys_replicates is not None and counts is not None:
+        num_qubits = len(next(iter(counts[0])))
+        n_a = num_qubits if selected is None else len(selected)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mitigated = depolarizing_error_mitgation(
+                meas_system=purity_replicates,
+                all_system=all_sys_replicates,
+                n_a=n_a,
+                system_size=num_qubits,
+            )["mitigatedPurity"]
+        (
+            result["mitigatedPurityCILow"],
+            result["mitigatedPurityCIHigh"],
+        ) = _percentile_interval(mitigated, confidence_level)
+
+    return result
@@ -84,6 +84,65 @@ class EntangledEntropyResultMitigated(EntangledEntropyResult):
     """The calculation time of the all system."""
 
 
+class PurityBootstrapResult(TypedDict, total=False):
+    """The return type of the bootstrap of purity."""
+
+    purityBootstrapSD: GenericFloatType
+    """The standard deviation of the purity over the bootstrap replicates."""
+    purityCILow: GenericFloatType
+    """The lower bound of the confidence interval of the purity."""
+    purityCIHigh: GenericFloatType
+    """The upper bound of the confidence interval of the purity."""
+    entropyCILow: GenericFloatType
+    """The lower bound of the confidence interval of the entropy."""
+    entropyCIHigh: GenericFloatType
+    """The upper bound of the confidence interval of the entropy."""
+    mitigatedPurityCILow: GenericFloatType
+    """The lower bound of the confidence interval of the mitigated purity."""
+    mitigatedPurityCIHigh: GenericFloatType
+    """The upper bound of the confidence interval of the mitigated purity."""
+    bootstrap_resamples: int
+    """The number of bootstrap replicates."""
+    bootstrap_shot_resampling: bool
+    """Whether the shots are resampled in the bootstrap."""
+    confidence_level: float
+    """The confidence level of the intervals."""
+
+
+class EntangledEntropyResultMitigatedBootstrap(
+    EntangledEntropyResultMitigated, PurityBootstrapResult, total=False
+):
+    """The return type of the post-processing for entangled entropy
+    with error mitigation and bootstrap confidence intervals."""
+
+
+class PurityConvergenceResult(TypedDict, total=False):
+    """The return type of the convergence curves of purity."""
+
+    times_grid: list[int]
+    """The numbers of random unitaries of the curve over random unitaries."""
+    purity_by_times: np.ndarray
+    """The purity by the first numbers of random unitaries in `times_grid`."""
+    entropy_by_times: np.ndarray
+    """The entropy by the first numbers of random unitaries in `times_grid`."""
+    puritySD_by_times: np.ndarray
+    """The standard deviation of the purity cells by the numbers in `times_grid`."""
+    shots_grid: list[int]
+    """The numbers of shots of the curve over shots."""
+    purity_by_shots: np.ndarray
+    """The purity by the subsampled shots in `shots_grid`."""
+    entropy_by_shots: np.ndarray
+    """The entropy by the subsampled shots in `shots_grid`."""
+    puritySD_by_shots: np.ndarray
+    """The standard deviation of the purity cells by the subsampled shots in `shots_grid`."""
+    shots_repeats: int
+    """The number of multinomial subsamples of each counts for each number of shots."""
+    purityCells: Union[dict[int, np.float64], dict[int, float]]
+    """The purity of each single count with all shots."""
+    classical_registers: list[int]
+    """The list of the index of the selected classical registers."""
+
+
 class ExistedAllSystemInfo(NamedTuple):
     """Existed all system information"""
 
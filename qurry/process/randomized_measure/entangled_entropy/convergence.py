@@ -0,0 +1,129 @@
+"""
+=========================================================================================
+Postprocessing - Randomized Measure - Entangled Entropy - Convergence
+(:mod:`qurry.process.randomized_measure.entangled_entropy.convergence`)
+=========================================================================================
+
+The convergence curves of purity and entropy
+over the number of random unitaries and the number of shots per unitary.
+
+The curve over the number of random unitaries is the prefix mean of the purity cells
+calculated once.
+The curve over the number of shots is calculated from the multinomial subsamples of
+the counts of each cell, which are evaluated all at once by the quadratic form of
+:mod:`qurry.process.randomized_measure.entangled_entropy.bootstrap`.
+
+"""
+
+from typing import Optional, Iterable
+import numpy as np
+
+from .bootstrap import outcomes_and_frequencies, marginal_projector, overlap_weights
+from .container import PurityConvergenceResult
+from .entropy_core_2 import entangled_entropy_core_2, DEFAULT_PROCESS_BACKEND
+from ...availability import PostProcessingBackendLabel
+
+
+def _default_grid(maximum: int, num_points: int = 10) -> list[int]:
+    """The logarithmic grid from 1 to maximum."""
+    return sorted({int(v) for v in np.geomspace(1, maximum, num=num_points).round()} | {maximum})
+
+
+def purity_convergence(
+    shots: int,
+    counts: list[dict[str, int]],
+    selected_classical_registers: Optional[Iterable[int]] = None,
+    times_grid: Optional[Iterable[int]] = None,
+    shots_grid: Optional[Iterable[int]] = None,
+    shots_repeats: int = 10,
+    seed: Optional[int] = None,
+    backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
+) -> PurityConvergenceResult:
+    """Calculate the convergence curves of purity and entropy.
+
+    Args:
+        shots (int):
+            Shots of the experiment on quantum machine.
+        counts (list[dict[str, int]]):
+            Counts of the experiment on quantum machine.
+        selected_classical_registers (Optional[Iterable[int]], optional):
+            The list of **the index of the selected_classical_registers**,
+            all classical registers are selected if it is None. Defaults to None.
+        times_grid (Optional[Iterable[int]], optional):
+            The numbers of random unitaries for the curve over random unitaries,
+            a logarithmic grid up to `len(counts)` is used if it is None. Defaults to None.
+        shots_grid (Optional[Iterable[int]], optional):
+            The numbers of shots for the curve over shots,
+            a logarithmic grid up to `shots` is used if it is None. Defaults to None.
+        shots_repeats (int, optional):
+            The number of multinomial subsamples of each counts for each number of shots.
+            Defaults to 10.
+        seed (Optional[int], optional):
+            The seed of the multinomial subsamples. Defaults to None.
+        backend (PostProcessingBackendLabel, optional):
+            Backend for the purity cells. Defaults to DEFAULT_PROCESS_BACKEND.
+
+    Returns:
+        PurityConvergenceResult: The convergence curves.
+    """
+    if len(counts) == 0:
+        raise ValueError("counts should not be empty.")
+    if shots_repeats < 1:
+        raise ValueError(f"shots_repeats should be positive, but get {shots_repeats}.")
+
+    num_classical_registers = len(next(iter(counts[0])))
+    selected = (
+        list(range(num_classical_registers))
+        if selected_classical_registers is None
+        else list(selected_classical_registers)
+    )
+    times_grid = _default_grid(len(counts)) if times_grid is None else list(times_grid)
+    shots_grid = _default_grid(shots) if shots_grid is None else list(shots_grid)
+    if any(t < 1 or t > len(counts) for t in times_grid):
+        raise ValueError(f"times_grid should be in [1, {len(counts)}], but get {times_grid}.")
+    if any(s < 1 for s in shots_grid):
+        raise ValueError(f"shots_grid should be positive, but get {shots_grid}.")
+
+    purity_cell_dict, _, _, _ = entangled_entropy_core_2(
+        shots=shots,
+        counts=counts,
+        selected_classical_registers=selected,
+        backend=backend,
+    )
+    purity_cells = np.array(list(purity_cell_dict.values()), dtype=np.float64)
+    prefix_index = np.array(times_grid) - 1
+    prefix_mean = (np.cumsum(purity_cells) / np.arange(1, len(purity_cells) + 1))[prefix_index]
+    prefix_sq_mean = (
+        np.cumsum(np.square(purity_cells)) / np.arange(1, len(purity_cells) + 1)
+    )[prefix_index]
+    prefix_sd = np.sqrt(np.maximum(prefix_sq_mean - np.square(prefix_mean), 0))
+
+    rng = np.random.default_rng(seed)
+    shots_cells = np.zeros((len(shots_grid), len(counts), shots_repeats), dtype=np.float64)
+    for ci, single_counts in enumerate(counts):
+        bits, freqs = outcomes_and_frequencies(single_counts)
+        projector, sub_bits = marginal_projector(bits, selected)
+        weights = overlap_weights(sub_bits)
+        for si, sample_shots in enumerate(shots_grid):
+            probs = (
+                rng.multinomial(sample_shots, freqs / freqs.sum(), size=shots_repeats)
+                / sample_shots
+            ) @ projector
+            shots_cells[si, ci] = np.einsum("bi,bi->b", probs @ weights, probs)
+    purity_by_shots = shots_cells.mean(axis=(1, 2))
+    purity_sd_by_shots = shots_cells.mean(axis=2).std(axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return {
+            "times_grid": times_grid,
+            "purity_by_times": prefix_mean,
+            "entropy_by_times": -np.log2(prefix_mean),
+            "puritySD_by_times": prefix_sd,
+            "shots_grid": shots_grid,
+            "purity_by_shots": purity_by_shots,
+            "entropy_by_shots": -np.log2(purity_by_shots),
+            "puritySD_by_shots": purity_sd_by_shots,
+            "shots_repeats": shots_repeats,
+            "purityCells": purity_cell_dict,
+            "classical_registers": selected,
+        }
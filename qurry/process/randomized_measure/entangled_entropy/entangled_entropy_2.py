@@ -20,6 +20,7 @@ from .container import (
     ExistedAllSystemInfo,
 )
 from .error_mitigation import depolarizing_error_mitgation
+from .purity_cache import PurityCache
 from ...availability import PostProcessingBackendLabel
 
 
@@ -29,6 +30,7 @@ def randomized_entangled_entropy(
     selected_classical_registers: Optional[Iterable[int]] = None,
     backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
     pbar: Optional[tqdm.tqdm] = None,
+    purity_cache: Optional[PurityCache] = None,
 ) -> EntangledEntropyResult:
     """Calculate entangled entropy.
     The entropy we compute is the Second Order Rényi Entropy.
@@ -94,6 +96,9 @@ def randomized_entangled_entropy(
             The progress bar API, you can use put a :cls:`tqdm` object here.
             This function will update the progress bar description.
             Defaults to None.
+        purity_cache (Optional[PurityCache], optional):
+            The cache of purity cells,
+            the purity cells are always calculated if it is None. Defaults to None.
 
     Returns:
         EntangledEntropyReturn:
@@ -111,7 +116,9 @@ def randomized_entangled_entropy(
         selected_classical_registers_actual,
         _msg,
         taken,
-    ) = entangled_entropy_core_2(
+    ) = (
+        entangled_entropy_core_2 if purity_cache is None else purity_cache.entangled_entropy_core_2
+    )(
         shots=shots,
         counts=counts,
         selected_classical_registers=selected_classical_registers,
@@ -155,6 +162,7 @@ def preparing_all_system(
     counts: list[dict[str, int]],
     backend: PostProcessingBackendLabel,
     pbar: Optional[tqdm.tqdm] = None,
+    purity_cache: Optional[PurityCache] = None,
 ) -> ExistedAllSystemInfo:
     """Prepare all system for the entangled entropy calculation.
 
@@ -177,6 +185,9 @@ def preparing_all_system(
             The progress bar API, you can use put a :cls:`tqdm` object here.
             This function will update the progress bar description.
             Defaults to None.
+        purity_cache (Optional[PurityCache], optional):
+            The cache of purity cells,
+            the purity cells are always calculated if it is None. Defaults to None.
 
     Returns:
         ExistedAllSystemInfo:
@@ -202,7 +213,9 @@ def preparing_all_system(
         selected_qubits_sorted_allsys,
         _msg_allsys,
         taken_allsys,
-    ) = entangled_entropy_core_2(
+    ) = (
+        entangled_entropy_core_2 if purity_cache is None else purity_cache.entangled_entropy_core_2
+    )(
         shots=shots,
         counts=counts,
         selected_classical_registers=None,
@@ -237,6 +250,8 @@ def randomized_entangled_entropy_mitigated(
     backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
     existed_all_system: Optional[ExistedAllSystemInfo] = None,
     pbar: Optional[tqdm.tqdm] = None,
+    purity_cache: Optional[PurityCache] = None,
+    marginal_counts: Optional[list[dict[str, int]]] = None,
 ) -> EntangledEntropyResultMitigated:
     """Calculate entangled entropy with depolarizing error mitigation.
     The entropy we compute is the Second Order Rényi Entropy.
@@ -331,6 +346,14 @@ def randomized_entangled_entropy_mitigated(
             The progress bar API, you can use put a :cls:`tqdm` object here.
             This function will update the progress bar description.
             Defaults to None.
+        purity_cache (Optional[PurityCache], optional):
+            The cache of purity cells,
+            the purity cells are always calculated if it is None. Defaults to None.
+        marginal_counts (Optional[list[dict[str, int]]], optional):
+            The counts already marginalized to the selected classical registers,
+            like :meth:`qurry.qurrium.experiment.afterwards.After.marginal_counts`,
+            then the purity cells of the subsystem are calculated from them
+            instead of marginalizing the counts again. Defaults to None.
 
     Returns:
         EntangledEntropyResultMitigated: A dictionary contains
@@ -385,17 +408,34 @@ def randomized_entangled_entropy_mitigated(
             f"Calculate selected classical registers: {selected_classical_registers}."
         )
 
+    use_marginal = marginal_counts is not None and selected_classical_registers is not None
+    if use_marginal:
+        assert marginal_counts is not None and selected_classical_registers is not None
+        selected_classical_registers = list(selected_classical_registers)
+        assert len(marginal_counts) == len(counts), (
+            "The number of marginal counts is not matched with counts: "
+            + f"{len(marginal_counts)} != {len(counts)}"
+        )
+
     (
         purity_cell_dict,
         selected_qubits_sorted,
         _msg,
         taken,
-    ) = entangled_entropy_core_2(
+    ) = (
+        entangled_entropy_core_2 if purity_cache is None else purity_cache.entangled_entropy_core_2
+    )(
         shots=shots,
-        counts=counts,
-        selected_classical_registers=selected_classical_registers,
+        counts=marginal_counts if use_marginal else counts,
+        selected_classical_registers=(
+            list(range(len(set(selected_classical_registers))))
+            if use_marginal
+            else selected_classical_registers
+        ),
         backend=backend,
     )
+    if use_marginal:
+        selected_qubits_sorted = sorted(set(selected_classical_registers), reverse=True)
     purity_cell_list: list[Union[float, np.float64]] = list(purity_cell_dict.values())
 
     all_system = preparing_all_system(
@@ -404,6 +444,7 @@ def randomized_entangled_entropy_mitigated(
         counts=counts,
         backend=backend,
         pbar=pbar,
+        purity_cache=purity_cache,
     )
     num_classical_registers = len(list(counts[0].keys())[0])
 
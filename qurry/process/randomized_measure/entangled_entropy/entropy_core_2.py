@@ -24,6 +24,7 @@ from ...exceptions import (
     PostProcessingRustUnavailableWarning,
     PostProcessingBackendDeprecatedWarning,
 )
+from ...utils import counts_starmap
 from ....tools import ParallelManager, workers_distribution
 
 
@@ -126,9 +127,11 @@ def entangled_entropy_core_2_pyrust(
     cell_calculation = purity_cell_2_rust if backend == "Rust" else purity_cell_2_py
 
     pool = ParallelManager(launch_worker)
-    purity_cell_result_list = pool.starmap(
+    purity_cell_result_list = counts_starmap(
+        pool,
         cell_calculation,
-        [(i, c, selected_classical_registers) for i, c in enumerate(counts)],
+        counts,
+        [(selected_classical_registers,) for _ in counts],
     )
     taken = round(time.time() - begin, 3)
 
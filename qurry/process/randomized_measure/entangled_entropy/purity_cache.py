@@ -0,0 +1,247 @@
+"""
+=========================================================================================
+Postprocessing - Randomized Measure - Entangled Entropy - Purity Cache
+(:mod:`qurry.process.randomized_measure.entangled_entropy.purity_cache`)
+=========================================================================================
+
+A content-addressed cache of purity cells.
+The key is the hash of the counts, the selected classical registers and the backend label,
+and the value is the purity of each cell with the selected classical registers actually used.
+The cache is kept in memory with the least recently used eviction
+and optionally on disk as JSON files, so it can be reused across sessions.
+
+"""
+
+import os
+import json
+import hashlib
+import warnings
+from collections import OrderedDict
+from pathlib import Path
+from typing import Union, Optional, Iterable
+
+import numpy as np
+
+from .entropy_core_2 import entangled_entropy_core_2, DEFAULT_PROCESS_BACKEND
+from ...availability import PostProcessingBackendLabel
+from ...exceptions import PostProcessingCacheInvalidWarning
+
+PURITY_CACHE_FOLDER = "purity_cache"
+"""The name of the folder of the purity cache alongside the multimanager."""
+PURITY_CACHE_SUFFIX = ".purity.json"
+"""The suffix of the cache entries."""
+DEFAULT_PURITY_CACHE_MEMORY_ENTRIES = 256
+"""The default limit of the number of entries in memory."""
+
+PurityCellsEntry = tuple[dict[int, np.float64], list[int], str, float]
+"""The entry of the cache, the same as the return of :func:`entangled_entropy_core_2`."""
+
+
+def purity_cache_key(
+    counts: list[dict[str, int]],
+    selected_classical_registers: Optional[Iterable[int]],
+    backend: PostProcessingBackendLabel,
+) -> str:
+    """Compute the key of the purity cells.
+
+    Args:
+        counts (list[dict[str, int]]): The counts.
+        selected_classical_registers (Optional[Iterable[int]]):
+            The list of **the index of the selected_classical_registers**.
+        backend (PostProcessingBackendLabel): The backend label.
+
+    Returns:
+        str: The key of the cache entry.
+    """
+    registers = (
+        None if selected_classical_registers is None else sorted(selected_classical_registers)
+    )
+    hasher = hashlib.sha256()
+    hasher.update(f"registers:{registers}|backend:{backend}|num:{len(counts)}".encode())
+    for single_counts in counts:
+        hasher.update(b"|")
+        hasher.update(",".join(f"{k}:{v}" for k, v in sorted(single_counts.items())).encode())
+    return hasher.hexdigest()
+
+
+class PurityCache:
+    """The content-addressed cache of purity cells in memory and optionally on disk.
+
+    .. code-block:: python
+
+        from qurry.process.randomized_measure import PurityCache
+
+        purity_cache = PurityCache("./exps/purity_cache")
+        analysis = exp.analyze([0, 1], purity_cache=purity_cache)
+
+    """
+
+    __name__ = "PurityCache"
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_memory_entries: int = DEFAULT_PURITY_CACHE_MEMORY_ENTRIES,
+    ):
+        """Initialize the purity cache.
+
+        Args:
+            cache_dir (Optional[Union[str, Path]], optional):
+                The directory of the cache on disk,
+                the cache is only kept in memory if it is None. Defaults to None.
+            max_memory_entries (int, optional):
+                The limit of the number of entries in memory.
+                Defaults to DEFAULT_PURITY_CACHE_MEMORY_ENTRIES.
+
+        Raises:
+            ValueError: If the limit is not positive.
+        """
+        if max_memory_entries <= 0:
+            raise ValueError(
+                f"max_memory_entries should be positive, but get {max_memory_entries}."
+            )
+        self.cache_dir = None if cache_dir is None else Path(cache_dir)
+        """The directory of the cache on disk."""
+        self.max_memory_entries = max_memory_entries
+        """The limit of the number of entries in memory."""
+        self.hits = 0
+        """The number of cache hits."""
+        self.misses = 0
+        """The number of cache misses."""
+        self._memory: OrderedDict[str, PurityCellsEntry] = OrderedDict()
+
+    def _path(self, key: str) -> Path:
+        assert self.cache_dir is not None, "The cache is not on disk."
+        return self.cache_dir / f"{key}{PURITY_CACHE_SUFFIX}"
+
+    def _remember(self, key: str, entry: PurityCellsEntry) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[PurityCellsEntry]:
+        """Get the purity cells from the cache.
+
+        Args:
+            key (str): The key of the cache entry.
+
+        Returns:
+            Optional[PurityCellsEntry]: The purity cells or None if it is not cached.
+        """
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+        if self.cache_dir is None:
+            return None
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                content = json.load(f)
+            entry: PurityCellsEntry = (
+                {int(k): np.float64(v) for k, v in content["purityCells"].items()},
+                list(content["classical_registers_actually"]),
+                str(content["msg"]),
+                float(content["taking_time"]),
+            )
+        # pylint: disable=broad-except
+        except Exception as err:
+            # pylint: enable=broad-except
+            warnings.warn(
+                f"Purity cache entry '{path}' is invalid and removed, due to: {err}",
+                category=PostProcessingCacheInvalidWarning,
+            )
+            path.unlink(missing_ok=True)
+            return None
+        self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, entry: PurityCellsEntry) -> None:
+        """Put the purity cells into the cache.
+
+        Args:
+            key (str): The key of the cache entry.
+            entry (PurityCellsEntry): The purity cells.
+        """
+        self._remember(key, entry)
+        if self.cache_dir is None:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        purity_cells, classical_registers_actually, msg, taken = entry
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "purityCells": {str(k): float(v) for k, v in purity_cells.items()},
+                    "classical_registers_actually": [int(c) for c in classical_registers_actually],
+                    "msg": msg,
+                    "taking_time": taken,
+                },
+                f,
+            )
+        os.replace(tmp_path, path)
+
+    def clear(self) -> None:
+        """Remove all entries of the cache in memory and on disk."""
+        self._memory.clear()
+        if self.cache_dir is not None and self.cache_dir.exists():
+            for path in self.cache_dir.glob(f"*{PURITY_CACHE_SUFFIX}"):
+                path.unlink(missing_ok=True)
+
+    def entangled_entropy_core_2(
+        self,
+        shots: int,
+        counts: list[dict[str, int]],
+        selected_classical_registers: Optional[Iterable[int]] = None,
+        backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
+    ) -> PurityCellsEntry:
+        """The cached :func:`entangled_entropy_core_2`.
+
+        Args:
+            shots (int):
+                Shots of the experiment on quantum machine.
+            counts (list[dict[str, int]]):
+                Counts of the experiment on quantum machine.
+            selected_classical_registers (Optional[Iterable[int]], optional):
+                The list of **the index of the selected_classical_registers**.
+            backend (PostProcessingBackendLabel, optional):
+                Backend for the process. Defaults to DEFAULT_PROCESS_BACKEND.
+
+        Returns:
+            PurityCellsEntry:
+                Purity of each cell, Selected classical registers, Message, Time to calculate.
+        """
+        if selected_classical_registers is not None:
+            selected_classical_registers = list(selected_classical_registers)
+        key = purity_cache_key(counts, selected_classical_registers, backend)
+        entry = self.get(key)
+        if entry is not None:
+            self.hits += 1
+            return dict(entry[0]), list(entry[1]), entry[2], entry[3]
+
+        self.misses += 1
+        entry = entangled_entropy_core_2(
+            shots=shots,
+            counts=counts,
+            selected_classical_registers=selected_classical_registers,
+            backend=backend,
+        )
+        self.put(key, entry)
+        return entry
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def __repr__(self):
+        return (
+            f"<{self.__name__}(cache_dir={self.cache_dir}, "
+            + f"max_memory_entries={self.max_memory_entries}, "
+            + f"hits={self.hits}, misses={self.misses})>"
+        )
+
+
+DEFAULT_PURITY_CACHE = PurityCache()
+"""The purity cache in memory shared by all experiments in the session."""
@@ -0,0 +1,194 @@
+"""
+=========================================================================================
+Postprocessing - Randomized Measure - Entangled Entropy - Streaming
+(:mod:`qurry.process.randomized_measure.entangled_entropy.streaming`)
+=========================================================================================
+
+The incremental estimator of purity and entropy,
+which consumes the counts as they arrive from the runner or the simulator.
+
+"""
+
+import time
+from typing import Union, Optional, Iterable, Literal
+import numpy as np
+
+from .purity_cell_2 import purity_cell_2
+from .entropy_core_2 import DEFAULT_PROCESS_BACKEND
+from .container import EntangledEntropyResult
+from ...availability import PostProcessingBackendLabel
+
+
+class IncrementalPurity:
+    """The incremental estimator of purity and entropy from randomized measurement.
+
+    The running mean and variance of the purity cells are updated by Welford's algorithm,
+    so the counts can be consumed one by one without keeping them.
+
+    .. code-block:: python
+
+        estimator = IncrementalPurity([0, 1], target_precision=0.01)
+        for single_counts in arriving_counts:
+            estimator.update(single_counts)
+            if estimator.converged:
+                break
+        print(estimator.purity, estimator.purity_sem)
+    """
+
+    __name__ = "IncrementalPurity"
+
+    def __init__(
+        self,
+        selected_classical_registers: Optional[Iterable[int]] = None,
+        target_precision: Optional[float] = None,
+        precision_on: Literal["purity", "entropy"] = "purity",
+        min_cells: int = 10,
+        backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
+    ):
+        """Initialize the estimator.
+
+        Args:
+            selected_classical_registers (Optional[Iterable[int]], optional):
+                The list of **the index of the selected_classical_registers**,
+                all classical registers are selected if it is None. Defaults to None.
+            target_precision (Optional[float], optional):
+                The target standard error of the mean for the convergence criterion,
+                the estimator never converges if it is None. Defaults to None.
+            precision_on (Literal["purity", "entropy"], optional):
+                The quantity that the target precision is applied on. Defaults to "purity".
+            min_cells (int, optional):
+                The minimum number of purity cells before checking the convergence.
+                Defaults to 10.
+            backend (PostProcessingBackendLabel, optional):
+                Backend for the purity cell. Defaults to DEFAULT_PROCESS_BACKEND.
+        """
+        if precision_on not in ("purity", "entropy"):
+            raise ValueError(f"precision_on should be 'purity' or 'entropy', not {precision_on}.")
+        if min_cells < 2:
+            raise ValueError(f"min_cells should be at least 2, but get {min_cells}.")
+        self.selected_classical_registers = (
+            None if selected_classical_registers is None else list(selected_classical_registers)
+        )
+        self.target_precision = target_precision
+        self.precision_on = precision_on
+        self.min_cells = min_cells
+        self.backend = backend
+
+        self.purity_cells: dict[int, np.float64] = {}
+        """The purity of each cell by the order of arrival."""
+        self.num_classical_registers: Optional[int] = None
+        """The number of classical registers."""
+        self.classical_registers_actually: Optional[list[int]] = None
+        """The selected classical registers which are actually used."""
+        self.taking_time: float = 0.0
+        """The accumulated calculation time."""
+        self._mean = np.float64(0)
+        self._m2 = np.float64(0)
+
+    def __len__(self) -> int:
+        return len(self.purity_cells)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__name__}(cells={len(self)}, purity={self.purity}, "
+            + f"purity_sem={self.purity_sem}, converged={self.converged})>"
+        )
+
+    def update(
+        self,
+        counts: Union[dict[str, int], Iterable[dict[str, int]]],
+    ) -> dict[int, np.float64]:
+        """Consume the counts and update the running purity.
+
+        Args:
+            counts (Union[dict[str, int], Iterable[dict[str, int]]]):
+                A single counts or the counts which arrived.
+
+        Returns:
+            dict[int, np.float64]: The purity cells of the consumed counts.
+        """
+        counts_list = [counts] if isinstance(counts, dict) else list(counts)
+        begin = time.time()
+        new_cells: dict[int, np.float64] = {}
+        for single_counts in counts_list:
+            if self.num_classical_registers is None:
+                self.num_classical_registers = len(next(iter(single_counts)))
+                if self.selected_classical_registers is None:
+                    self.selected_classical_registers = list(
+                        range(self.num_classical_registers)
+                    )
+            idx = len(self.purity_cells)
+            _, value, self.classical_registers_actually = purity_cell_2(
+                idx, single_counts, self.selected_classical_registers, self.backend
+            )
+            value = np.float64(value)
+            self.purity_cells[idx] = value
+            new_cells[idx] = value
+
+            delta = value - self._mean
+            self._mean += delta / len(self.purity_cells)
+            self._m2 += delta * (value - self._mean)
+        self.taking_time += round(time.time() - begin, 3)
+
+        return new_cells
+
+    @property
+    def purity(self) -> np.float64:
+        """The running mean of the purity."""
+        return self._mean if len(self) > 0 else np.float64(np.nan)
+
+    @property
+    def puritySD(self) -> np.float64:  # pylint: disable=invalid-name
+        """The standard deviation of the purity cells,
+        the same as `puritySD` of :func:`randomized_entangled_entropy`."""
+        return np.sqrt(self._m2 / len(self)) if len(self) > 0 else np.float64(np.nan)
+
+    @property
+    def purity_sem(self) -> np.float64:
+        """The standard error of the mean of the purity."""
+        if len(self) < 2:
+            return np.float64(np.inf)
+        return np.sqrt(self._m2 / (len(self) - 1) / len(self))
+
+    @property
+    def entropy(self) -> np.float64:
+        """The entropy from the running purity."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return -np.log2(self.purity, dtype=np.float64)
+
+    @property
+    def entropySD(self) -> np.float64:  # pylint: disable=invalid-name
+        """The standard deviation of the entropy by error propagation."""
+        return self.puritySD / np.log(2) / self.purity
+
+    @property
+    def entropy_sem(self) -> np.float64:
+        """The standard error of the mean of the entropy by error propagation."""
+        return self.purity_sem / np.log(2) / np.abs(self.purity)
+
+    @property
+    def converged(self) -> bool:
+        """Whether the standard error of the mean reaches the target precision."""
+        if self.target_precision is None or len(self) < self.min_cells:
+            return False
+        sem = self.purity_sem if self.precision_on == "purity" else self.entropy_sem
+        return bool(sem <= self.target_precision)
+
+    def result(self) -> EntangledEntropyResult:
+        """Export the running estimation in the form of :func:`randomized_entangled_entropy`.
+
+        Returns:
+            EntangledEntropyResult: The result of the consumed counts.
+        """
+        return {
+            "purity": self.purity,
+            "entropy": self.entropy,
+            "puritySD": self.puritySD,
+            "entropySD": self.entropySD,
+            "purityCells": dict(self.purity_cells),
+            "num_classical_registers": self.num_classical_registers,
+            "classical_registers": self.selected_classical_registers,
+            "classical_registers_actually": self.classical_registers_actually,
+            "counts_num": len(self),
+            "taking_time": self.taking_time,
+        }
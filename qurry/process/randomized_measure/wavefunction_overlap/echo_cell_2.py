@@ -4,12 +4,23 @@ Postprocessing - Randomized Measure - Wavefunction Overlap - Echo Cell 2
 (:mod:`qurry.process.randomized_measure.wavefunction_overlap.echo_cell_2`)
 =========================================================================================
 
+The echo cell is the overlap
+
+.. math::
+
+    X = 2^{N_A} \\sum_{s, s'} (-2)^{-D(s, s')} P_1(s) P_2(s')
+
+of the probabilities of the outcomes from the first and second quantum circuits.
+The backend `"Dense"` builds the probability tensors with shape `(2,) * N_A` and
+contracts them through the kernel :math:`[[2, -1], [-1, 2]]` on each classical register,
+which costs :math:`O(N_A 2^{N_A})` instead of the pairwise loop over the outcomes.
+
 """
 
 import warnings
 import numpy as np
 
-from ...utils import ensemble_cell as ensemble_cell_py
+from ...utils import ensemble_cell as ensemble_cell_py, single_counts_marginal
 from ...availability import (
     availablility,
     default_postprocessing_backend,
@@ -44,12 +55,18 @@ BACKEND_AVAILABLE = availablility(
     [
         ("Rust", RUST_AVAILABLE, FAILED_RUST_IMPORT),
         ("Cython", "Depr.", None),
+        ("Dense", True, None),
     ],
 )
 DEFAULT_PROCESS_BACKEND = default_postprocessing_backend(
     RUST_AVAILABLE,
     False,
 )
+DENSE_MAX_SUBSYSTEM_SIZE = 26
+"""The largest subsystem for the backend `"Dense"`,
+the probability tensor of which takes :math:`8 \\cdot 2^{N_A}` bytes."""
+OVERLAP_KERNEL = np.array([[2, -1], [-1, 2]], dtype=np.float64)
+"""The kernel :math:`2 (-2)^{-D(s_i, s'_i)}` on a single classical register."""
 
 
 def echo_cell_2_py(
@@ -123,6 +140,93 @@ def echo_cell_2_py(
     return idx, echo_cell_value, selected_classical_registers_sorted
 
 
+def dense_probability(
+    single_counts: dict[str, int],
+    selected_classical_registers: list[int],
+) -> np.ndarray:
+    """Build the probability vector of the outcomes on the selected classical registers.
+
+    The reduced bitstring follows the order of `selected_classical_registers`,
+    and a duplicated classical register is kept as a repeated bit
+    like :func:`echo_cell_2_py` does.
+
+    Args:
+        single_counts (dict[str, int]):
+            Counts measured from the single quantum circuit.
+        selected_classical_registers (list[int]):
+            The list of **the index of the selected_classical_registers**.
+
+    Returns:
+        np.ndarray:
+            The probabilities with shape `(2 ** N_A,)`,
+            the index of which is the reduced bitstring as a binary number.
+    """
+    unique_registers = sorted(set(selected_classical_registers), reverse=True)
+    marginal = single_counts_marginal(single_counts, unique_registers)
+    subsystem_size = len(selected_classical_registers)
+    if subsystem_size == 0:
+        return np.ones(1, dtype=np.float64)
+    if list(selected_classical_registers) != unique_registers:
+        positions = [unique_registers.index(c_i) for c_i in selected_classical_registers]
+        marginal = {
+            "".join(bitstring[p] for p in positions): num_counts
+            for bitstring, num_counts in marginal.items()
+        }
+    outcomes = np.fromiter((int(b, 2) for b in marginal), dtype=np.int64, count=len(marginal))
+    num_counts = np.fromiter(marginal.values(), dtype=np.float64, count=len(marginal))
+    return np.bincount(outcomes, weights=num_counts, minlength=2**subsystem_size) / np.sum(
+        num_counts
+    )
+
+
+def echo_cell_2_dense(
+    idx: int,
+    first_counts: dict[str, int],
+    second_counts: dict[str, int],
+    selected_classical_registers: list[int],
+) -> tuple[int, np.float64, list[int]]:
+    """Calculate the echo cell, one of overlap, of a subsystem
+    by contracting the dense probability tensors.
+
+    Args:
+        idx (int):
+            Index of the cell (counts).
+        first_counts (dict[str, int]):
+            Counts measured from the first quantum circuit.
+        second_counts (dict[str, int]):
+            Counts measured from the second quantum circuit.
+        selected_classical_registers (list[int]):
+            The list of **the index of the selected_classical_registers**.
+
+    Raises:
+        ValueError: If the subsystem is larger than DENSE_MAX_SUBSYSTEM_SIZE.
+
+    Returns:
+        tuple[int, float, list[int]]:
+            Index, one of overlap purity,
+            The list of **the index of the selected classical registers**.
+    """
+    selected_classical_registers_sorted = sorted(selected_classical_registers, reverse=True)
+    subsystem_size = len(selected_classical_registers_sorted)
+    if subsystem_size > DENSE_MAX_SUBSYSTEM_SIZE:
+        raise ValueError(
+            f"The subsystem size {subsystem_size} is too large for the backend 'Dense', "
+            + f"which supports at most {DENSE_MAX_SUBSYSTEM_SIZE} classical registers."
+        )
+
+    first_probs = dense_probability(first_counts, selected_classical_registers_sorted)
+    second_probs = dense_probability(second_counts, selected_classical_registers_sorted)
+    for q_i in range(subsystem_size):
+        second_probs = np.einsum(
+            "ab,xbi->xai",
+            OVERLAP_KERNEL,
+            second_probs.reshape(-1, 2, 2**q_i),
+        ).reshape(-1)
+    echo_cell_value = np.float64(np.dot(first_probs, second_probs))
+
+    return idx, echo_cell_value, selected_classical_registers_sorted
+
+
 def echo_cell_2_rust(
     idx: int,
     first_counts: dict[str, int],
@@ -182,4 +286,6 @@ def echo_cell_2(
 
     if backend == "Rust":
         return echo_cell_2_rust(idx, first_counts, second_counts, selected_classical_registers)
+    if backend == "Dense":
+        return echo_cell_2_dense(idx, first_counts, second_counts, selected_classical_registers)
     return echo_cell_2_py(idx, first_counts, second_counts, selected_classical_registers)
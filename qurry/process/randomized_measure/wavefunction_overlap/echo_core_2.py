@@ -11,7 +11,7 @@ import warnings
 from typing import Optional, Iterable
 import numpy as np
 
-from .echo_cell_2 import echo_cell_2_py, echo_cell_2_rust
+from .echo_cell_2 import echo_cell_2_py, echo_cell_2_rust, echo_cell_2_dense
 from ...availability import (
     availablility,
     default_postprocessing_backend,
@@ -47,6 +47,7 @@ BACKEND_AVAILABLE = availablility(
     [
         ("Rust", RUST_AVAILABLE, FAILED_RUST_IMPORT),
         ("Cython", "Depr.", None),
+        ("Dense", True, None),
     ],
 )
 DEFAULT_PROCESS_BACKEND = default_postprocessing_backend(
@@ -150,7 +151,11 @@ def overlap_echo_core_2_pyrust(
             PostProcessingBackendDeprecatedWarning,
         )
         backend = DEFAULT_PROCESS_BACKEND
-    cell_calculation = echo_cell_2_rust if backend == "Rust" else echo_cell_2_py
+    cell_calculation = (
+        echo_cell_2_rust
+        if backend == "Rust"
+        else echo_cell_2_dense if backend == "Dense" else echo_cell_2_py
+    )
 
     pool = ParallelManager(launch_worker)
     echo_cell_result_list = pool.starmap(
@@ -248,6 +253,8 @@ def overlap_echo_core_2(
             The list of **the index of the selected_classical_registers**.
         backend (ExistingProcessBackendLabel, optional):
             Backend for the process. Defaults to DEFAULT_PROCESS_BACKEND.
+            The backend `"Dense"` contracts the dense probability tensors,
+            which is faster for the counts with many distinct outcomes.
 
     Returns:
         tuple[dict[int, np.float64], list[int], str, float]:
@@ -46,6 +46,8 @@ def randomized_overlap_echo(
     selected_classical_registers: Optional[Iterable[int]] = None,
     backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
     pbar: Optional[tqdm.tqdm] = None,
+    first_marginal_counts: Optional[list[dict[str, int]]] = None,
+    second_marginal_counts: Optional[list[dict[str, int]]] = None,
 ) -> WaveFuctionOverlapResult:
     """Calculate wavefunction overlap
     a.k.a. loschmidt echo when processes time evolution system.
@@ -92,7 +94,14 @@ def randomized_overlap_echo(
             The progress bar API, you can use put a :cls:`tqdm` object here.
             This function will update the progress bar description.
             Defaults to None.
-
+        first_marginal_counts (Optional[list[dict[str, int]]], optional):
+            The first counts already marginalized to the selected classical registers,
+            like :meth:`qurry.qurrium.experiment.afterwards.After.marginal_counts`.
+            Defaults to None.
+        second_marginal_counts (Optional[list[dict[str, int]]], optional):
+            The second counts already marginalized to the selected classical registers.
+            The echo cells are calculated from the marginal counts
+            when both of them are given. Defaults to None.
 
     Returns:
         WaveFuctionOverlapResult: A dictionary contains purity, entropy,
@@ -103,6 +112,16 @@ def randomized_overlap_echo(
         pbar.set_description_str(
             f"Calculate selected classical registers: {selected_classical_registers}."
         )
+    use_marginal = (
+        first_marginal_counts is not None
+        and second_marginal_counts is not None
+        and selected_classical_registers is not None
+    )
+    if use_marginal:
+        assert first_marginal_counts is not None and second_marginal_counts is not None
+        assert selected_classical_registers is not None
+        selected_classical_registers = list(selected_classical_registers)
+
     (
         echo_cell_dict,
         selected_classical_registers_actual,
@@ -110,11 +129,19 @@ def randomized_overlap_echo(
         taken,
     ) = overlap_echo_core_2(
         shots=shots,
-        first_counts=first_counts,
-        second_counts=second_counts,
-        selected_classical_registers=selected_classical_registers,
+        first_counts=first_marginal_counts if use_marginal else first_counts,
+        second_counts=second_marginal_counts if use_marginal else second_counts,
+        selected_classical_registers=(
+            list(range(len(set(selected_classical_registers))))
+            if use_marginal
+            else selected_classical_registers
+        ),
         backend=backend,
     )
+    if use_marginal:
+        selected_classical_registers_actual = sorted(
+            set(selected_classical_registers), reverse=True
+        )
     echo_cell_list: list[Union[float, np.float64]] = list(echo_cell_dict.values())  # type: ignore
 
     echo: np.float64 = np.mean(echo_cell_list, dtype=np.float64)  # type: ignore
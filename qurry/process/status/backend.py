@@ -14,7 +14,8 @@ from ..randomized_measure import (
     echo_cell_availability,
 )
 from ..hadamard_test import purity_echo_core_availability
-from ..magnet_square import magnet_square_availability
+from ..magnet_square import magnet_square_availability, zz_correlator_availability
+from ..string_operator import string_operator_availability
 
 from ..utils import (
     construct_availability,
@@ -54,6 +55,8 @@ def availability_status_print() -> tuple[
         test_availability,
         purity_echo_core_availability,
         magnet_square_availability,
+        zz_correlator_availability,
+        string_operator_availability,
     ]
     pre_hoshi = [
         ("txt", f"| Qurry version: {__version__}"),
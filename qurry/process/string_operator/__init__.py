@@ -0,0 +1,14 @@
+"""
+================================================================
+Postprocessing - String Operator
+(:mod:`qurry.process.string_operator`)
+================================================================
+
+"""
+
+from .string_operator import BACKEND_AVAILABLE as string_operator_availability
+from .string_operator import (
+    string_operator_order,
+    string_parity_expectation,
+    StringOperatorOrder,
+)
@@ -0,0 +1,153 @@
+"""
+================================================================
+Postprocessing - String Operator - String Operator
+(:mod:`qurry.process.string_operator.string_operator`)
+================================================================
+
+The string order parameters from the counts measured on the whole chain.
+
+After rotating each qubit into the basis of its Pauli operator,
+the expectation of a string operator is the parity of the outcomes on its qubits,
+
+.. math::
+    \\langle O \\rangle = \\frac{1}{N} \\sum_{s} n_s (-1)^{\\sum_{q \\in O} b_q^{(s)}}
+
+All strings measured in the same basis configuration are evaluated in one pass,
+the outcomes and the qubits of each string are packed into bytes,
+so the parity is given by the AND of them reduced by XOR
+and looked up from the parity table of bytes.
+
+"""
+
+import time
+from typing import Optional, Sequence, TypedDict
+import numpy as np
+import tqdm
+
+from ..availability import availablility
+
+BACKEND_AVAILABLE = availablility(
+    "string_operator.string_operator",
+    [],
+)
+
+BYTE_PARITY = np.array([bin(byte).count("1") & 1 for byte in range(256)], dtype=np.int8)
+"""The parity of each byte."""
+PARITY_CHUNK_SIZE = 4096
+"""The number of outcomes evaluated at once, which limits the memory of the parity pass."""
+
+
+def string_parity_expectation(
+    single_counts: dict[str, int],
+    shots: int,
+    qubits_of_strings: Sequence[Sequence[int]],
+) -> np.ndarray[tuple[int], np.dtype[np.float64]]:
+    """Calculate the parity expectation of each string from the same counts.
+
+    Args:
+        single_counts (dict[str, int]):
+            Counts measured on the whole chain,
+            the classical register i is the measurement of qubit i.
+        shots (int): Shots of the experiment on quantum machine.
+        qubits_of_strings (Sequence[Sequence[int]]): The qubits of each string.
+
+    Returns:
+        np.ndarray[tuple[int], np.dtype[np.float64]]: The expectation of each string.
+    """
+    sum_counts = sum(single_counts.values())
+    assert shots == sum_counts, f"Shots: {shots} must be equal to the sum of counts: {sum_counts}."
+    if len(qubits_of_strings) == 0:
+        return np.zeros(0, dtype=np.float64)
+
+    num_qubits = len(next(iter(single_counts)))
+    bits = np.frombuffer("".join(single_counts).encode(), dtype=np.uint8).reshape(-1, num_qubits)
+    packed_outcomes = np.packbits(bits[:, ::-1] == ord("1"), axis=1)
+    weights = np.fromiter(single_counts.values(), dtype=np.float64, count=len(single_counts))
+
+    masks = np.zeros((len(qubits_of_strings), num_qubits), dtype=bool)
+    for string_idx, qubits in enumerate(qubits_of_strings):
+        masks[string_idx, list(qubits)] = True
+    packed_masks = np.packbits(masks, axis=1)
+
+    expectation = np.zeros(len(qubits_of_strings), dtype=np.float64)
+    for begin in range(0, len(packed_outcomes), PARITY_CHUNK_SIZE):
+        chunk = packed_outcomes[begin : begin + PARITY_CHUNK_SIZE]
+        parity = BYTE_PARITY[
+            np.bitwise_xor.reduce(chunk[:, None, :] & packed_masks[None, :, :], axis=2)
+        ]
+        expectation += weights[begin : begin + PARITY_CHUNK_SIZE] @ (1 - 2 * parity)
+    return expectation / shots
+
+
+class StringOperatorOrder(TypedDict):
+    """String order parameters."""
+
+    orders: list[float]
+    """The string order parameter of each string."""
+    countsNum: int
+    """Number of counts."""
+    takingTime: float
+    """Taking time."""
+
+
+def string_operator_order(
+    shots: int,
+    counts: list[dict[str, int]],
+    qubits_of_strings: Sequence[Sequence[int]],
+    configuration_of_strings: Sequence[int],
+    pbar: Optional[tqdm.tqdm] = None,
+) -> StringOperatorOrder:
+    """Calculate the string order parameters,
+    the strings measured in the same basis configuration are evaluated in one pass.
+
+    Args:
+        shots (int): Number of shots.
+        counts (list[dict[str, int]]): The counts of each basis configuration.
+        qubits_of_strings (Sequence[Sequence[int]]): The qubits of each string.
+        configuration_of_strings (Sequence[int]):
+            The index of the basis configuration, which is also the index of counts,
+            where each string is measured.
+        pbar (Optional[tqdm.tqdm], optional): Progress bar. Defaults to None.
+
+    Raises:
+        ValueError: If the numbers of strings and their configurations are different.
+        ValueError: If the configuration of a string is out of the counts.
+
+    Returns:
+        StringOperatorOrder: The string order parameters.
+    """
+    if len(qubits_of_strings) != len(configuration_of_strings):
+        raise ValueError(
+            f"The number of strings {len(qubits_of_strings)} is different from "
+            + f"the number of their configurations {len(configuration_of_strings)}."
+        )
+    if any(not 0 <= config < len(counts) for config in configuration_of_strings):
+        raise ValueError(
+            f"The configurations {list(configuration_of_strings)} are out of "
+            + f"the {len(counts)} counts."
+        )
+    if isinstance(pbar, tqdm.tqdm):
+        pbar.set_description("String order parameters being calculated.")
+
+    begin = time.time()
+    orders = np.zeros(len(qubits_of_strings), dtype=np.float64)
+    for config, single_counts in enumerate(counts):
+        string_indices = [
+            string_idx
+            for string_idx, string_config in enumerate(configuration_of_strings)
+            if string_config == config
+        ]
+        if len(string_indices) == 0:
+            continue
+        orders[string_indices] = string_parity_expectation(
+            single_counts, shots, [qubits_of_strings[string_idx] for string_idx in string_indices]
+        )
+    taking_time = round(time.time() - begin, 3)
+
+    if isinstance(pbar, tqdm.tqdm):
+        pbar.set_description(f"String order parameters calculated in {taking_time} seconds.")
+    return {
+        "orders": orders.tolist(),
+        "countsNum": len(counts),
+        "takingTime": taking_time,
+    }
@@ -18,5 +18,13 @@ from .randomized import (
     ensemble_cell,
     BACKEND_AVAILABLE as randomized_availability,
 )
+from .marginal import single_counts_marginal, counts_marginal
+from .shared_counts import (
+    SharedCounts,
+    SharedCountsHandle,
+    read_shared_counts,
+    call_with_shared_counts,
+    counts_starmap,
+)
 from .dummy import BACKEND_AVAILABLE as dummy_availability
 from .test import BACKEND_AVAILABLE as test_availability, test_construct
@@ -0,0 +1,75 @@
+"""
+================================================================
+Post-processing - Utils - Marginal
+(:mod:`qurry.process.utils.marginal`)
+================================================================
+
+The marginal counts of the selected classical registers.
+
+The bitstring of the marginal counts keeps the order of Qiskit,
+the classical register with larger index is on the left,
+which is the same as the reduced bitstring in the purity cell and the echo cell.
+
+"""
+
+from operator import itemgetter
+from typing import Iterable, Sequence
+
+
+def single_counts_marginal(
+    single_counts: dict[str, int],
+    selected_classical_registers: Iterable[int],
+    num_classical_registers: int = -1,
+) -> dict[str, int]:
+    """Marginalize the counts to the selected classical registers.
+
+    Args:
+        single_counts (dict[str, int]):
+            Counts measured from the single quantum circuit.
+        selected_classical_registers (Iterable[int]):
+            The list of **the index of the selected_classical_registers**.
+        num_classical_registers (int, optional):
+            The number of classical registers of the counts,
+            it will be read from the counts if it is negative. Defaults to -1.
+
+    Returns:
+        dict[str, int]: The marginal counts.
+    """
+    if len(single_counts) == 0:
+        return {}
+    if num_classical_registers < 0:
+        num_classical_registers = len(next(iter(single_counts)))
+    positions = [
+        num_classical_registers - c_i - 1
+        for c_i in sorted(set(selected_classical_registers), reverse=True)
+    ]
+    if len(positions) == 0:
+        return {"": sum(single_counts.values())}
+    if len(positions) == num_classical_registers:
+        return dict(single_counts)
+
+    getter = itemgetter(*positions)
+    marginal: dict[str, int] = {}
+    for bitstring, num_counts in single_counts.items():
+        reduced = "".join(getter(bitstring))
+        marginal[reduced] = marginal.get(reduced, 0) + num_counts
+    return marginal
+
+
+def counts_marginal(
+    counts: Sequence[dict[str, int]],
+    selected_classical_registers: Iterable[int],
+) -> list[dict[str, int]]:
+    """Marginalize each counts to the selected classical registers.
+
+    Args:
+        counts (Sequence[dict[str, int]]):
+            Counts of the experiment on quantum machine.
+        selected_classical_registers (Iterable[int]):
+            The list of **the index of the selected_classical_registers**.
+
+    Returns:
+        list[dict[str, int]]: The marginal counts.
+    """
+    selected = list(selected_classical_registers)
+    return [single_counts_marginal(single_counts, selected) for single_counts in counts]
@@ -0,0 +1,209 @@
+"""
+================================================================
+Post-processing - Utils - Shared Counts
+(:mod:`qurry.process.utils.shared_counts`)
+================================================================
+
+The shared-memory transport of counts for the workers of process pools.
+
+The counts are packed once into a :class:`multiprocessing.shared_memory.SharedMemory` block
+as the arrays of offsets, numbers of counts and bitstrings,
+and each task only carries a small :class:`SharedCountsHandle` and the index of the counts,
+instead of pickling the whole counts into the worker.
+
+"""
+
+from multiprocessing import shared_memory
+from typing import Any, Callable, Iterable, NamedTuple, Optional, Sequence, TypeVar
+
+import numpy as np
+
+from ...tools import ParallelManager
+
+
+class SharedCountsHandle(NamedTuple):
+    """The handle of the counts in shared memory, which is sent to the workers."""
+
+    name: str
+    """The name of the shared memory block."""
+    num_counts: int
+    """The number of counts."""
+    num_outcomes: int
+    """The total number of outcomes of all counts."""
+    bitstring_width: int
+    """The width of the bitstrings."""
+
+
+def _layout(handle: SharedCountsHandle) -> tuple[int, int, int]:
+    """The sizes of offsets, numbers of counts and bitstrings in the block."""
+    return (
+        8 * (handle.num_counts + 1),
+        8 * handle.num_outcomes,
+        handle.bitstring_width * handle.num_outcomes,
+    )
+
+
+def _views(
+    buffer: memoryview,
+    handle: SharedCountsHandle,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """The arrays of offsets, numbers of counts and bitstrings on the block."""
+    offsets_size, values_size, _ = _layout(handle)
+    offsets = np.ndarray((handle.num_counts + 1,), dtype=np.int64, buffer=buffer)
+    values = np.ndarray(
+        (handle.num_outcomes,), dtype=np.int64, buffer=buffer, offset=offsets_size
+    )
+    bitstrings = np.ndarray(
+        (handle.num_outcomes,),
+        dtype=f"S{max(handle.bitstring_width, 1)}",
+        buffer=buffer,
+        offset=offsets_size + values_size,
+    )
+    return offsets, values, bitstrings
+
+
+class SharedCounts:
+    """The counts packed into shared memory,
+    the block is released when leaving the context.
+
+    .. code-block:: python
+
+        with SharedCounts(counts) as shared:
+            results = pool.starmap(
+                call_with_shared_counts,
+                [(purity_cell_2_py, shared.handle, i, selected) for i in range(len(counts))],
+            )
+
+    """
+
+    def __init__(self, counts: Sequence[dict[str, int]]):
+        """Pack the counts into shared memory.
+
+        Args:
+            counts (Sequence[dict[str, int]]): The counts.
+        """
+        num_outcomes = sum(len(single_counts) for single_counts in counts)
+        bitstring_width = max(
+            (len(bitstring) for single_counts in counts for bitstring in single_counts),
+            default=0,
+        )
+        sizes = _layout(SharedCountsHandle("", len(counts), num_outcomes, bitstring_width))
+        self.shm = shared_memory.SharedMemory(create=True, size=max(sum(sizes), 1))
+        """The shared memory block."""
+        self.handle = SharedCountsHandle(
+            self.shm.name, len(counts), num_outcomes, bitstring_width
+        )
+        """The handle of the counts in shared memory."""
+
+        offsets, values, bitstrings = _views(self.shm.buf, self.handle)
+        offsets[0] = 0
+        offsets[1:] = np.cumsum([len(single_counts) for single_counts in counts])
+        for idx, single_counts in enumerate(counts):
+            begin, end = offsets[idx], offsets[idx + 1]
+            values[begin:end] = list(single_counts.values())
+            bitstrings[begin:end] = [bitstring.encode() for bitstring in single_counts]
+        del offsets, values, bitstrings
+
+    def close(self) -> None:
+        """Release the shared memory block."""
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self) -> "SharedCounts":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+_attached: dict[str, shared_memory.SharedMemory] = {}
+"""The shared memory blocks attached by this worker."""
+
+
+def read_shared_counts(handle: SharedCountsHandle, idx: int) -> dict[str, int]:
+    """Read a single counts from shared memory.
+
+    Args:
+        handle (SharedCountsHandle): The handle of the counts in shared memory.
+        idx (int): The index of the counts.
+
+    Returns:
+        dict[str, int]: The single counts.
+    """
+    shm = _attached.get(handle.name)
+    if shm is None:
+        # The workers share the resource tracker of the process which creates the block,
+        # so attaching it here does not register it again.
+        shm = shared_memory.SharedMemory(name=handle.name)
+        for stale in _attached.values():
+            stale.close()
+        _attached.clear()
+        _attached[handle.name] = shm
+    offsets, values, bitstrings = _views(shm.buf, handle)
+    begin, end = offsets[idx], offsets[idx + 1]
+    return dict(
+        zip(
+            (bitstring.decode() for bitstring in bitstrings[begin:end].tolist()),
+            values[begin:end].tolist(),
+        )
+    )
+
+
+# pylint: disable=invalid-name
+T_cell = TypeVar("T_cell")
+# pylint: enable=invalid-name
+
+
+def call_with_shared_counts(
+    func: Callable[..., T_cell],
+    handle: SharedCountsHandle,
+    idx: int,
+    *args: Any,
+) -> T_cell:
+    """Call the cell function with the counts read from shared memory.
+
+    Args:
+        func (Callable[..., T_cell]):
+            The cell function with the signature `func(idx, single_counts, *args)`.
+        handle (SharedCountsHandle): The handle of the counts in shared memory.
+        idx (int): The index of the counts.
+        *args (Any): The other arguments of the cell function.
+
+    Returns:
+        T_cell: The result of the cell function.
+    """
+    return func(idx, read_shared_counts(handle, idx), *args)
+
+
+def counts_starmap(
+    pool: ParallelManager,
+    func: Callable[..., T_cell],
+    counts: Sequence[dict[str, int]],
+    args_list: Optional[Iterable[tuple]] = None,
+) -> list[T_cell]:
+    """Map the cell function over the counts,
+    through shared memory if the pool has more than one worker.
+
+    Args:
+        pool (ParallelManager): The process pool.
+        func (Callable[..., T_cell]):
+            The cell function with the signature `func(idx, single_counts, *args)`.
+        counts (Sequence[dict[str, int]]): The counts.
+        args_list (Optional[Iterable[tuple]], optional):
+            The other arguments of each counts, no other arguments if it is None.
+            Defaults to None.
+
+    Returns:
+        list[T_cell]: The results of the cell function.
+    """
+    args_list = [() for _ in counts] if args_list is None else list(args_list)
+    if pool.workers_num == 1:
+        return pool.starmap(
+            func,
+            [(idx, counts[idx], *args) for idx, args in enumerate(args_list)],
+        )
+    with SharedCounts(counts) as shared:
+        return pool.starmap(
+            call_with_shared_counts,
+            [(func, shared.handle, idx, *args) for idx, args in enumerate(args_list)],
+        )
@@ -1,15 +1,9 @@
-# from typing import Literal
+"""
+================================================================
+Qurmagsq - The Magnetization Square
+(:mod:`qurry.qurmagsq`)
+================================================================
 
-# from .qurmagsq import MagnetSquare as MagnetSquareOrigin
+"""
 
-
-# def MagnetSquare(
-#     *args,
-#     **kwargs,
-# ) -> MagnetSquareOrigin:
-#     """Call `MagnetSquare` methods.
-
-#     Returns:
-#         MagnetSquareOrigin: method.
-#     """
-#     return MagnetSquareOrigin(*args, **kwargs)
+from .magnet_square import MagnetSquare
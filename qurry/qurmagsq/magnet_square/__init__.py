@@ -0,0 +1,12 @@
+"""
+================================================================
+MagnetSquare - The Magnetization Square
+by Measuring the Whole Register
+(:mod:`qurry.qurmagsq.magnet_square`)
+================================================================
+
+"""
+
+from .analysis import MagnetSquareAnalysis
+from .experiment import MagnetSquareExperiment
+from .qurry import MagnetSquare
@@ -0,0 +1,70 @@
+"""
+================================================================
+MagnetSquare - Analysis
+(:mod:`qurry.qurmagsq.magnet_square.analysis`)
+================================================================
+
+"""
+
+from typing import NamedTuple, Iterable, Union, Any
+import numpy as np
+
+from ...qurrium.analysis import AnalysisPrototype
+
+
+class MagnetSquareAnalysis(AnalysisPrototype):
+    """The instance for the analysis of :cls:`MagnetSquareExperiment`."""
+
+    __name__ = "MagnetSquareAnalysis"
+
+    class AnalysisInput(NamedTuple):
+        """To set the analysis."""
+
+        num_qubits: int
+        """The number of qubits."""
+        shots: int
+        """The number of shots."""
+
+    input: AnalysisInput
+
+    class AnalysisContent(NamedTuple):
+        """The content of the analysis."""
+
+        magnet_square: Union[float, np.float64]
+        """The magnetization square."""
+        zz_correlators: np.ndarray[tuple[int, int], np.dtype[np.float64]]
+        """The ZZ correlators of all pairs of qubits,
+        the element `[i, j]` is the correlator of qubit i and qubit j."""
+        countsNum: int
+        """The number of counts."""
+        takingTime: float
+        """The time taken for the calculation."""
+
+        def __repr__(self):
+            return f"AnalysisContent(magnet_square={self.magnet_square}, and others)"
+
+    content: AnalysisContent
+
+    @property
+    def side_product_fields(self) -> Iterable[str]:
+        """The fields that will be stored as side product."""
+        return ["zz_correlators"]
+
+    @classmethod
+    def load(cls, main: dict[str, Any], side: dict[str, Any]) -> "MagnetSquareAnalysis":
+        """Read the analysis from main and side product dict,
+        the ZZ correlators exported as nested lists are turned back into an array.
+
+        Args:
+            main (dict[str, Any]): The main product dict.
+            side (dict[str, Any]): The side product dict.
+
+        Returns:
+            MagnetSquareAnalysis: The analysis instance.
+        """
+        if "zz_correlators" in side:
+            side = {
+                **side,
+                "zz_correlators": np.asarray(side["zz_correlators"], dtype=np.float64),
+            }
+        return super().load(main, side)  # type: ignore
@@ -0,0 +1,203 @@
+"""
+================================================================
+MagnetSquare - Experiment
+(:mod:`qurry.qurmagsq.magnet_square.experiment`)
+================================================================
+
+"""
+
+from typing import Optional, Type, Any
+from collections.abc import Hashable
+import tqdm
+
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
+
+from .analysis import MagnetSquareAnalysis
+from .arguments import MagnetSquareArguments, SHORT_NAME
+from ...qurrium.experiment import ExperimentPrototype, Commonparams
+from ...process.magnet_square.magnet_square import (
+    magnet_square_full_register,
+    MagnetSquareFullRegister,
+)
+from ...process.magnet_square.zz_correlator import (
+    PostProcessingBackendLabel,
+    DEFAULT_PROCESS_BACKEND,
+)
+
+
+class MagnetSquareExperiment(ExperimentPrototype):
+    """The instance of experiment."""
+
+    __name__ = "MagnetSquareExperiment"
+
+    @property
+    def arguments_instance(self) -> Type[MagnetSquareArguments]:
+        """The arguments instance for this experiment."""
+        return MagnetSquareArguments
+
+    args: MagnetSquareArguments
+
+    @property
+    def analysis_instance(self) -> Type[MagnetSquareAnalysis]:
+        """The analysis instance for this experiment."""
+        return MagnetSquareAnalysis
+
+    @classmethod
+    def params_control(
+        cls,
+        targets: list[tuple[Hashable, QuantumCircuit]],
+        exp_name: str = "exps",
+        **custom_kwargs: Any,
+    ) -> tuple[MagnetSquareArguments, Commonparams, dict[str, Any]]:
+        """Handling all arguments and initializing a single experiment.
+
+        Args:
+            targets (list[tuple[Hashable, QuantumCircuit]]):
+                The circuits of the experiment.
+            exp_name (str, optional):
+                The name of the experiment.
+                Naming this experiment to recognize it when the jobs are pending to IBMQ Service.
+                This name is also used for creating a folder to store the exports.
+                Defaults to `'exps'`.
+            custom_kwargs (Any):
+                The custom parameters.
+
+        Raises:
+            ValueError: The number of target circuits should be 1.
+
+        Returns:
+            tuple[MagnetSquareArguments, Commonparams, dict[str, Any]]:
+                The arguments of the experiment, the common parameters, and the custom parameters.
+        """
+        if len(targets) != 1:
+            raise ValueError("The number of target circuits should be 1.")
+
+        target_key, target_circuit = targets[0]
+        num_qubits = target_circuit.num_qubits
+
+        exp_name = f"{exp_name}.N_q-{num_qubits}.{SHORT_NAME}"
+
+        # pylint: disable=protected-access
+        return MagnetSquareArguments._filter(
+            exp_name=exp_name,
+            target_keys=[target_key],
+            num_qubits=num_qubits,
+            **custom_kwargs,
+        )
+        # pylint: enable=protected-access
+
+    @classmethod
+    def method(
+        cls,
+        targets: list[tuple[Hashable, QuantumCircuit]],
+        arguments: MagnetSquareArguments,
+        pbar: Optional[tqdm.tqdm] = None,
+    ) -> tuple[list[QuantumCircuit], dict[str, Any]]:
+        """The method to construct circuit.
+
+        The whole register is measured once per shot,
+        so all pairwise ZZ correlators are taken from the same circuit
+        instead of one circuit for each pair of qubits.
+
+        Args:
+            targets (list[tuple[Hashable, QuantumCircuit]]):
+                The circuits of the experiment.
+            arguments (MagnetSquareArguments):
+                The arguments of the experiment.
+            pbar (Optional[tqdm.tqdm], optional):
+                The progress bar. Defaults to None.
+
+        Returns:
+            tuple[list[QuantumCircuit], dict[str, Any]]:
+                The circuits of the experiment and the side products.
+        """
+        target_key, target_circuit = targets[0]
+        target_key = "" if isinstance(target_key, int) else str(target_key)
+        num_qubits = arguments.num_qubits
+
+        q_func = QuantumRegister(num_qubits, "q1")
+        c_meas = ClassicalRegister(num_qubits, "c1")
+        qc_exp = QuantumCircuit(q_func, c_meas)
+        qc_exp.name = (
+            arguments.exp_name if len(target_key) < 1 else f"{arguments.exp_name}.{target_key}"
+        )
+
+        qc_exp.compose(
+            target_circuit,
+            [q_func[i] for i in range(num_qubits)],
+            inplace=True,
+        )
+        qc_exp.barrier()
+        qc_exp.measure(q_func, c_meas)
+
+        return [qc_exp], {}
+
+    def analyze(
+        self,
+        backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
+        pbar: Optional[tqdm.tqdm] = None,
+    ) -> MagnetSquareAnalysis:
+        """Calculate the magnetization square.
+
+        Args:
+            backend (PostProcessingBackendLabel, optional):
+                The backend for the process. Defaults to DEFAULT_PROCESS_BACKEND.
+            pbar (Optional[tqdm.tqdm], optional):
+                The progress bar. Defaults to None.
+
+        Returns:
+            MagnetSquareAnalysis: The result of the analysis.
+        """
+
+        shots = self.commons.shots
+        counts = self.afterwards.counts
+
+        qs = self.quantities(
+            shots=shots,
+            counts=counts,
+            backend=backend,
+            pbar=pbar,
+        )
+
+        serial = len(self.reports)
+        analysis = self.analysis_instance(
+            serial=serial,
+            num_qubits=self.args.num_qubits,
+            shots=shots,
+            **qs,  # type: ignore
+        )
+
+        self.reports[serial] = analysis
+        return analysis
+
+    @classmethod
+    def quantities(
+        cls,
+        shots: Optional[int] = None,
+        counts: Optional[list[dict[str, int]]] = None,
+        backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
+        pbar: Optional[tqdm.tqdm] = None,
+    ) -> MagnetSquareFullRegister:
+        """Calculate the magnetization square.
+
+        Args:
+            shots (int): Shots of the experiment on quantum machine.
+            counts (list[dict[str, int]]): Counts of the experiment on quantum machine.
+            backend (PostProcessingBackendLabel, optional):
+                The backend for the process. Defaults to DEFAULT_PROCESS_BACKEND.
+            pbar (Optional[tqdm.tqdm], optional):
+                The progress bar. Defaults to None.
+
+        Returns:
+            MagnetSquareFullRegister: The magnetization square and the ZZ correlators.
+        """
+
+        if shots is None or counts is None:
+            raise ValueError("shots and counts should be specified.")
+
+        return magnet_square_full_register(
+            shots=shots,
+            counts=counts,
+            backend=backend,
+            pbar=pbar,
+        )
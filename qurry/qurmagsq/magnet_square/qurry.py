@@ -0,0 +1,322 @@
+"""
+================================================================
+MagnetSquare - Qurry
+(:mod:`qurry.qurmagsq.magnet_square.qurry`)
+================================================================
+
+"""
+
+from pathlib import Path
+from typing import Union, Optional, Any, Type, Literal
+from collections.abc import Hashable
+import tqdm
+
+from qiskit import QuantumCircuit
+from qiskit.providers import Backend
+from qiskit.transpiler.passmanager import PassManager
+
+from .arguments import (
+    SHORT_NAME,
+    MagnetSquareOutputArgs,
+    MagnetSquareMeasureArgs,
+    MagnetSquareAnalyzeArgs,
+)
+from .experiment import MagnetSquareExperiment
+from ...qurrium.qurrium import QurriumPrototype
+from ...qurrium.container import ExperimentContainer
+from ...tools.backend import GeneralSimulator
+from ...declare import BaseRunArgs, TranspileArgs
+
+
+class MagnetSquare(QurriumPrototype):
+    """The magnetization square by measuring the whole register.
+
+    All pairwise ZZ correlators are computed from the bitstrings of one circuit,
+    instead of one circuit for each pair of qubits.
+
+    """
+
+    __name__ = "MagnetSquare"
+    short_name = SHORT_NAME
+
+    @property
+    def experiment_instance(self) -> Type[MagnetSquareExperiment]:
+        """The container class responding to this Qurrium class."""
+        return MagnetSquareExperiment
+
+    exps: ExperimentContainer[MagnetSquareExperiment]
+
+    def measure_to_output(
+        self,
+        wave: Optional[Union[QuantumCircuit, Hashable]] = None,
+        shots: int = 1024,
+        backend: Optional[Backend] = None,
+        exp_name: str = "experiment",
+        run_args: Optional[Union[BaseRunArgs, dict[str, Any]]] = None,
+        transpile_args: Optional[TranspileArgs] = None,
+        passmanager: Optional[Union[str, PassManager, tuple[str, PassManager]]] = None,
+        tags: Optional[tuple[str, ...]] = None,
+        # process tool
+        qasm_version: Literal["qasm2", "qasm3"] = "qasm3",
+        export: bool = False,
+        save_location: Optional[Union[Path, str]] = None,
+        mode: str = "w+",
+        indent: int = 2,
+        encoding: str = "utf-8",
+        jsonable: bool = False,
+        pbar: Optional[tqdm.tqdm] = None,
+    ) -> MagnetSquareOutputArgs:
+        """Trasnform :meth:`measure` arguments form into :meth:`output` form.
+
+        Args:
+            wave (Union[QuantumCircuit, Hashable]):
+                The key or the circuit to execute.
+            shots (int, optional):
+                Shots of the job. Defaults to `1024`.
+            backend (Optional[Backend], optional):
+                The quantum backend. Defaults to None.
+            exp_name (str, optional):
+                The name of the experiment.
+                Naming this experiment to recognize it when the jobs are pending to IBMQ Service.
+                This name is also used for creating a folder to store the exports.
+                Defaults to `'exps'`.
+            run_args (Optional[Union[BaseRunArgs, dict[str, Any]]], optional):
+                Arguments for :func:`qiskit.execute`. Defaults to `{}`.
+            transpile_args (Optional[TranspileArgs], optional):
+                Arguments for :func:`qiskit.transpile`. Defaults to `{}`.
+            passmanager (Optional[Union[str, PassManager, tuple[str, PassManager]], optional):
+                The passmanager. Defaults to None.
+            tags (Optional[tuple[str, ...]], optional):
+                The tags of the experiment. Defaults to None.
+
+            qasm_version (Literal["qasm2", "qasm3"], optional):
+                The version of OpenQASM. Defaults to "qasm3".
+            export (bool, optional):
+                Whether to export the experiment. Defaults to False.
+            save_location (Optional[Union[Path, str]], optional):
+                The location to save the experiment. Defaults to None.
+            mode (str, optional):
+                The mode to open the file. Defaults to 'w+'.
+            indent (int, optional):
+                The indent of json file. Defaults to 2.
+            encoding (str, optional):
+                The encoding of json file. Defaults to 'utf-8'.
+            jsonable (bool, optional):
+                Whether to jsonablize the experiment output. Defaults to False.
+            pbar (Optional[tqdm.tqdm], optional):
+                The progress bar for showing the progress of the experiment.
+                Defaults to None.
+
+        Returns:
+            MagnetSquareOutputArgs: The output arguments.
+        """
+        if wave is None:
+            raise ValueError("The `wave` must be provided.")
+
+        return {
+            "circuits": [wave],
+            "shots": shots,
+            "backend": backend,
+            "exp_name": exp_name,
+            "run_args": run_args,
+            "transpile_args": transpile_args,
+            "passmanager": passmanager,
+            "tags": tags,
+            # process tool
+            "qasm_version": qasm_version,
+            "export": export,
+            "save_location": save_location,
+            "mode": mode,
+            "indent": indent,
+            "encoding": encoding,
+            "jsonable": jsonable,
+            "pbar": pbar,
+        }
+
+    def measure(
+        self,
+        wave: Optional[Union[QuantumCircuit, Hashable]] = None,
+        shots: int = 1024,
+        backend: Optional[Backend] = None,
+        exp_name: str = "experiment",
+        run_args: Optional[Union[BaseRunArgs, dict[str, Any]]] = None,
+        transpile_args: Optional[TranspileArgs] = None,
+        passmanager: Optional[Union[str, PassManager, tuple[str, PassManager]]] = None,
+        tags: Optional[tuple[str, ...]] = None,
+        # process tool
+        qasm_version: Literal["qasm2", "qasm3"] = "qasm3",
+        export: bool = False,
+        save_location: Optional[Union[Path, str]] = None,
+        mode: str = "w+",
+        indent: int = 2,
+        encoding: str = "utf-8",
+        jsonable: bool = False,
+        pbar: Optional[tqdm.tqdm] = None,
+    ):
+        """Execute the experiment.
+
+        Args:
+            wave (Union[QuantumCircuit, Hashable]):
+                The key or the circuit to execute.
+            shots (int, optional):
+                Shots of the job. Defaults to `1024`.
+            backend (Optional[Backend], optional):
+                The quantum backend. Defaults to None.
+            exp_name (str, optional):
+                The name of the experiment.
+                Naming this experiment to recognize it when the jobs are pending to IBMQ Service.
+                This name is also used for creating a folder to store the exports.
+                Defaults to `'exps'`.
+            run_args (Optional[Union[BaseRunArgs, dict[str, Any]]], optional):
+                Arguments for :func:`qiskit.execute`. Defaults to `{}`.
+            transpile_args (Optional[TranspileArgs], optional):
+                Arguments for :func:`qiskit.transpile`. Defaults to `{}`.
+            passmanager (Optional[Union[str, PassManager, tuple[str, PassManager]], optional):
+                The passmanager. Defaults to None.
+            tags (Optional[tuple[str, ...]], optional):
+                The tags of the experiment. Defaults to None.
+
+            qasm_version (Literal["qasm2", "qasm3"], optional):
+                The version of OpenQASM. Defaults to "qasm3".
+            export (bool, optional):
+                Whether to export the experiment. Defaults to False.
+            save_location (Optional[Union[Path, str]], optional):
+                The location to save the experiment. Defaults to None.
+            mode (str, optional):
+                The mode to open the file. Defaults to 'w+'.
+            indent (int, optional):
+                The indent of json file. Defaults to 2.
+            encoding (str, optional):
+                The encoding of json file. Defaults to 'utf-8'.
+            jsonable (bool, optional):
+                Whether to jsonablize the experiment output. Defaults to False.
+            pbar (Optional[tqdm.tqdm], optional):
+                The progress bar for showing the progress of the experiment.
+                Defaults to None.
+
+        Returns:
+            str: The ID of the experiment
+        """
+
+        output_args = self.measure_to_output(
+            wave=wave,
+            shots=shots,
+            backend=backend,
+            exp_name=exp_name,
+            run_args=run_args,
+            transpile_args=transpile_args,
+            passmanager=passmanager,
+            tags=tags,
+            # process tool
+            qasm_version=qasm_version,
+            export=export,
+            save_location=save_location,
+            mode=mode,
+            indent=indent,
+            encoding=encoding,
+            jsonable=jsonable,
+            pbar=pbar,
+        )
+
+        return self.output(**output_args)
+
+    def multiOutput(
+        self,
+        config_list: list[Union[dict[str, Any], MagnetSquareMeasureArgs]],
+        summoner_name: str = "exps",
+        summoner_id: Optional[str] = None,
+        shots: int = 1024,
+        backend: Backend = GeneralSimulator(),
+        tags: Optional[tuple[str, ...]] = None,
+        manager_run_args: Optional[Union[BaseRunArgs, dict[str, Any]]] = None,
+        save_location: Union[Path, str] = Path("./"),
+        compress: bool = False,
+    ) -> str:
+        """Output the multiple experiments.
+
+        Args:
+            config_list (list[Union[dict[str, Any], MagnetSquareMeasureArgs]]):
+                The list of default configurations of multiple experiment. Defaults to [].
+            summoner_name (str, optional):
+                Name for multimanager. Defaults to 'exps'.
+            summoner_id (Optional[str], optional):
+                Name for multimanager. Defaults to None.
+            shots (int, optional):
+                Shots of the job. Defaults to `1024`.
+            backend (Backend, optional):
+                The quantum backend.
+                Defaults to AerSimulator().
+            tags (Optional[tuple[str, ...]], optional):
+                Tags of experiment of the MultiManager. Defaults to None.
+            manager_run_args (Optional[Union[BaseRunArgs, dict[str, Any]]], optional):
+                The extra arguments for running the job,
+                but for all experiments in the multimanager.
+                For :meth:`backend.run()` from :cls:`qiskit.providers.backend`. Defaults to `{}`.
+            save_location (Union[Path, str], optional):
+                Where to save the export content as `json` file.
+                If `save_location == None`, then cancelled the file to be exported.
+                Defaults to Path('./').
+            compress (bool, optional):
+                Whether to compress the export file. Defaults to False.
+
+        Returns:
+            str: The summoner_id of multimanager.
+        """
+
+        return super().multiOutput(
+            config_list=config_list,
+            summoner_name=summoner_name,
+            summoner_id=summoner_id,
+            shots=shots,
+            backend=backend,
+            tags=tags,
+            manager_run_args=manager_run_args,
+            save_location=save_location,
+            compress=compress,
+        )
+
+    def multiAnalysis(
+        self,
+        summoner_id: str,
+        analysis_name: str = "report",
+        no_serialize: bool = False,
+        specific_analysis_args: Optional[
+            dict[Hashable, Union[dict[str, Any], MagnetSquareAnalyzeArgs, bool]]
+        ] = None,
+        compress: bool = False,
+        write: bool = True,
+        # analysis arguments
+        **analysis_args,
+    ) -> str:
+        """Run the analysis for multiple experiments.
+
+        Args:
+            summoner_id (str): The summoner_id of multimanager.
+            analysis_name (str, optional):
+                The name of analysis. Defaults to 'report'.
+            no_serialize (bool, optional):
+                Whether to serialize the analysis. Defaults to False.
+            specific_analysis_args
+                Optional[dict[Hashable, Union[
+                    dict[str, Any], MagnetSquareAnalyzeArgs, bool
+                ]]], optional
+            ):
+                The specific arguments for analysis. Defaults to None.
+            compress (bool, optional):
+                Whether to compress the export file. Defaults to False.
+            write (bool, optional):
+                Whether to write the export file. Defaults to True.
+
+        Returns:
+            str: The summoner_id of multimanager.
+        """
+
+        return super().multiAnalysis(
+            summoner_id=summoner_id,
+            analysis_name=analysis_name,
+            no_serialize=no_serialize,
+            specific_analysis_args=specific_analysis_args,
+            compress=compress,
+            write=write,
+            **analysis_args,
+        )
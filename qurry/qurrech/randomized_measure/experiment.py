@@ -17,15 +17,17 @@ from qiskit.providers import Backend, JobV1 as Job
 
 from .analysis import EchoListenRandomizedAnalysis
 from .arguments import EchoListenRandomizedArguments, SHORT_NAME
-from ...qurrent.randomized_measure.utils import circuit_method_core
+from ...qurrent.randomized_measure.utils import circuit_naming, circuit_method_template
 from ...qurrium.experiment import ExperimentPrototype, Commonparams
-from ...qurrium.utils import get_counts_and_exceptions
+from ...qurrium.utils import get_counts_and_exceptions, TemplateBoundCircuits
 from ...qurrium.utils.randomized import (
-    random_unitary,
-    local_unitary_op_to_list,
-    local_unitary_op_to_pauli_coeff,
+    unitary_array_to_pauli_coeff,
+    unitary_array_to_u_angles,
+)
+from ...qurrium.utils.random_unitary import (
+    check_input_for_experiment,
+    generate_random_unitary_array,
 )
-from ...qurrium.utils.random_unitary import check_input_for_experiment
 from ...process.utils import qubit_mapper
 from ...process.availability import PostProcessingBackendLabel
 from ...process.randomized_measure.wavefunction_overlap import (
@@ -33,7 +35,7 @@ from ...process.randomized_measure.wavefunction_overlap import (
     DEFAULT_PROCESS_BACKEND,
     WaveFuctionOverlapResult,
 )
-from ...tools import qurry_progressbar, ParallelManager, set_pbar_description, backend_name_getter
+from ...tools import qurry_progressbar, set_pbar_description, backend_name_getter
 from ...exceptions import (
     RandomizedMeasureUnitaryOperatorNotFullCovering,
     SeperatedExecutingOverlapResult,
@@ -245,9 +247,20 @@ class EchoListenRandomizedExperiment(ExperimentPrototype):
         targets: list[tuple[Hashable, QuantumCircuit]],
         arguments: EchoListenRandomizedArguments,
         pbar: Optional[tqdm.tqdm] = None,
-    ) -> tuple[list[QuantumCircuit], dict[str, Any]]:
+    ) -> tuple[TemplateBoundCircuits, dict[str, Any]]:
         """The method to construct circuit.
 
+        The side products `unitaryOP` and `randomized` are the random unitary operators
+        with shape `(times, len(unitary_located_mapping_1), 2, 2)` and their Pauli coefficients
+        with shape `(times, len(unitary_located_mapping_1), 3)`,
+        whose second axis is the mapped index in `unitary_located_mapping_1`,
+        and the same operators are applied on the second circuit by `unitary_located_mapping_2`.
+        They are exported as `.npy` files instead of JSON.
+        The experiments exported before keep them as the dictionaries
+        keyed by the index of random unitary and then the mapped index,
+        see :func:`local_unitary_array_to_list` and :func:`local_unitary_array_to_pauli_coeff`
+        for converting the arrays to that format.
+
         Args:
             targets (list[tuple[Hashable, QuantumCircuit]]):
                 The circuits of the experiment.
@@ -258,12 +271,11 @@ class EchoListenRandomizedExperiment(ExperimentPrototype):
                 Defaults to None.
 
         Returns:
-            tuple[list[QuantumCircuit], dict[str, Any]]:
+            tuple[TemplateBoundCircuits, dict[str, Any]]:
                 The circuits of the experiment and the side products.
         """
         side_product = {}
 
-        pool = ParallelManager()
         set_pbar_description(pbar, f"Preparing {arguments.times} random unitary.")
 
         target_key_1, target_circuit_1 = targets[0]
@@ -285,69 +297,62 @@ class EchoListenRandomizedExperiment(ExperimentPrototype):
             + f"but got {len(arguments.unitary_located_mapping_1)} "
             + f"and {len(arguments.unitary_located_mapping_2)}."
         )
-        unitary_dicts_source = {
-            n_u_i: {
-                ui: (
-                    random_unitary(2)
-                    if arguments.random_unitary_seeds is None
-                    else random_unitary(2, arguments.random_unitary_seeds[n_u_i][ui])
-                )
-                for ui in range(len(arguments.unitary_located_mapping_1))
-            }
-            for n_u_i in range(arguments.times)
-        }
-        unitary_dict = {}
-        for n_u_i in range(arguments.times):
-            unitary_dict[n_u_i] = {
-                qi: unitary_dicts_source[n_u_i][ui]
-                for qi, ui in arguments.unitary_located_mapping_1.items()
-            }
-            unitary_dict[n_u_i + arguments.times] = {
-                qi: unitary_dicts_source[n_u_i][ui]
-                for qi, ui in arguments.unitary_located_mapping_2.items()
-            }
+        unitary_array = generate_random_unitary_array(
+            arguments.times,
+            len(arguments.unitary_located_mapping_1),
+            arguments.random_unitary_seeds,
+        )
 
         set_pbar_description(pbar, f"Building {arguments.times * 2} circuits.")
-        circ_list = pool.starmap(
-            circuit_method_core,
-            [
-                (
-                    n_u_i,
-                    target_circuit_1,
-                    target_key_1,
-                    arguments.exp_name,
-                    arguments.registers_mapping_1,
-                    unitary_dict[n_u_i],
-                )
+        templates = []
+        template_parameters = []
+        for target_circuit, registers_mapping, unitary_located_mapping in [
+            (
+                target_circuit_1,
+                arguments.registers_mapping_1,
+                arguments.unitary_located_mapping_1,
+            ),
+            (
+                target_circuit_2,
+                arguments.registers_mapping_2,
+                arguments.unitary_located_mapping_2,
+            ),
+        ]:
+            template, parameters = circuit_method_template(
+                target_circuit,
+                arguments.exp_name,
+                registers_mapping,
+                sorted(unitary_located_mapping, key=unitary_located_mapping.__getitem__),
+            )
+            templates.append(template)
+            template_parameters.append(parameters)
+
+        u_angles = unitary_array_to_u_angles(unitary_array).reshape(arguments.times, -1)
+        circ_list = TemplateBoundCircuits(
+            templates=templates,
+            template_parameters=template_parameters,
+            bindings=[(0, u_angles[n_u_i]) for n_u_i in range(arguments.times)]
+            + [(1, u_angles[n_u_i]) for n_u_i in range(arguments.times)],
+            names=[
+                circuit_naming(n_u_i, target_circuit_1, target_key_1, arguments.exp_name)
                 for n_u_i in range(arguments.times)
             ]
             + [
-                (
-                    n_u_i + arguments.times,
-                    target_circuit_2,
-                    target_key_2,
-                    arguments.exp_name,
-                    arguments.registers_mapping_2,
-                    unitary_dict[n_u_i + arguments.times],
+                circuit_naming(
+                    n_u_i + arguments.times, target_circuit_2, target_key_2, arguments.exp_name
                 )
                 for n_u_i in range(arguments.times)
             ],
         )
-        assert len(circ_list) == 2 * arguments.times, "The number of circuits is not correct."
+        assert (
+            len(circ_list.bindings) == 2 * arguments.times
+        ), "The number of circuits is not correct."
 
         set_pbar_description(pbar, "Writing 'unitaryOP'.")
-        unitary_operator_list = pool.starmap(
-            local_unitary_op_to_list,
-            [(unitary_dicts_source[n_u_i],) for n_u_i in range(arguments.times)],
-        )
-        side_product["unitaryOP"] = dict(enumerate(unitary_operator_list))
+        side_product["unitaryOP"] = unitary_array
 
         set_pbar_description(pbar, "Writing 'randomized'.")
-        randomized_list = pool.starmap(
-            local_unitary_op_to_pauli_coeff,
-            [(unitary_operator_list[n_u_i],) for n_u_i in range(arguments.times)],
-        )
-        side_product["randomized"] = dict(enumerate(randomized_list))
+        side_product["randomized"] = unitary_array_to_pauli_coeff(unitary_array)
 
         return circ_list, side_product
 
@@ -614,6 +619,9 @@ class EchoListenRandomizedExperiment(ExperimentPrototype):
             + f"from counts with length {len(self.afterwards.counts)}, "
             + f"times: {self.args.times}."
         )
+        marginal_counts = self.afterwards.marginal_counts(selected_classical_registers)
+        first_marginal_counts = marginal_counts[: self.args.times]
+        second_marginal_counts = marginal_counts[self.args.times :]
 
         if isinstance(pbar, tqdm.tqdm):
             qs = self.quantities(
@@ -623,6 +631,8 @@ class EchoListenRandomizedExperiment(ExperimentPrototype):
                 selected_classical_registers=selected_classical_registers,
                 backend=backend,
                 pbar=pbar,
+                first_marginal_counts=first_marginal_counts,
+                second_marginal_counts=second_marginal_counts,
             )
 
         else:
@@ -639,6 +649,8 @@ class EchoListenRandomizedExperiment(ExperimentPrototype):
                     selected_classical_registers=selected_classical_registers,
                     backend=backend,
                     pbar=pb_self,
+                    first_marginal_counts=first_marginal_counts,
+                    second_marginal_counts=second_marginal_counts,
                 )
                 pb_self.update()
 
@@ -666,6 +678,8 @@ class EchoListenRandomizedExperiment(ExperimentPrototype):
         selected_classical_registers: Optional[Iterable[int]] = None,
         backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
         pbar: Optional[tqdm.tqdm] = None,
+        first_marginal_counts: Optional[list[dict[str, int]]] = None,
+        second_marginal_counts: Optional[list[dict[str, int]]] = None,
     ) -> WaveFuctionOverlapResult:
         """Calculate entangled entropy with more information combined.
 
@@ -684,7 +698,12 @@ class EchoListenRandomizedExperiment(ExperimentPrototype):
                 The progress bar API, you can use put a :cls:`tqdm` object here.
                 This function will update the progress bar description.
                 Defaults to None.
-
+            first_marginal_counts (Optional[list[dict[str, int]]], optional):
+                The first counts marginalized to the selected classical registers.
+                Defaults to None.
+            second_marginal_counts (Optional[list[dict[str, int]]], optional):
+                The second counts marginalized to the selected classical registers.
+                Defaults to None.
 
         Returns:
             WaveFuctionOverlapResult: A dictionary contains purity, entropy,
@@ -700,4 +719,6 @@ class EchoListenRandomizedExperiment(ExperimentPrototype):
             selected_classical_registers=selected_classical_registers,
             backend=backend,
             pbar=pbar,
+            first_marginal_counts=first_marginal_counts,
+            second_marginal_counts=second_marginal_counts,
         )
@@ -178,7 +178,7 @@ class EchoListenRandomizedV1Experiment(ExperimentPrototype):
         pool = ParallelManager(arguments.workers_num)
         if isinstance(pbar, tqdm.tqdm):
             pbar.set_description_str(
-                f"Preparing {arguments.times} random unitary with {arguments.workers_num} workers."
+                f"Preparing {arguments.times} random unitary with {pool.workers_num} workers."
             )
 
         target_key_01, target_circuit_01 = targets[0]
@@ -215,7 +215,7 @@ class EchoListenRandomizedV1Experiment(ExperimentPrototype):
 
         if isinstance(pbar, tqdm.tqdm):
             pbar.set_description_str(
-                f"Building {2 * arguments.times} circuits with {arguments.workers_num} workers."
+                f"Building {2 * arguments.times} circuits with {pool.workers_num} workers."
             )
         circ_list = pool.starmap(
             circuit_method_core_v1,
@@ -247,7 +247,7 @@ class EchoListenRandomizedV1Experiment(ExperimentPrototype):
         assert len(circ_list) == 2 * arguments.times, "The number of circuits is not correct."
 
         if isinstance(pbar, tqdm.tqdm):
-            pbar.set_description_str(f"Writing 'unitaryOP' with {arguments.workers_num} workers.")
+            pbar.set_description_str(f"Writing 'unitaryOP' with {pool.workers_num} workers.")
         # side_product["unitaryOP"] = {
         #     k: {i: np.array(v[i]).tolist() for i in range(*arguments.unitary_loc)}
         #     for k, v in unitary_dict.items()
@@ -259,7 +259,7 @@ class EchoListenRandomizedV1Experiment(ExperimentPrototype):
         side_product["unitaryOP"] = dict(enumerate(unitary_operator_list))
 
         if isinstance(pbar, tqdm.tqdm):
-            pbar.set_description_str(f"Writing 'randomized' with {arguments.workers_num} workers.")
+            pbar.set_description_str(f"Writing 'randomized' with {pool.workers_num} workers.")
         # side_product["randomized"] = {
         #     i: {j: qubitOpToPauliCoeff(unitary_dict[i][j]) for j in range(*arguments.unitary_loc)}
         #     for i in range(arguments.times)
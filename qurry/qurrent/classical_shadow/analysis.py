@@ -48,15 +48,16 @@ class ShadowUnveilAnalysis(AnalysisPrototype):
     class AnalysisContent(NamedTuple):
         """The content of the analysis."""
 
-        expect_rho: np.ndarray[tuple[int, int], np.dtype[np.complex128]]
-        """The expectation value of Rho."""
+        expect_rho: Optional[np.ndarray[tuple[int, int], np.dtype[np.complex128]]]
+        """The expectation value of Rho,
+        which is None unless the dense matrices are requested."""
         purity: float
         """The purity calculated by classical shadow."""
         entropy: float
         """The entropy calculated by classical shadow."""
 
         rho_m_dict: dict[int, np.ndarray[tuple[int, int], np.dtype[np.complex128]]]
-        """The dictionary of Rho M."""
+        """The dictionary of Rho M, which is empty unless the dense matrices are requested."""
         rho_m_i_dict: dict[
             int, dict[int, np.ndarray[tuple[Literal[2], Literal[2]], np.dtype[np.complex128]]]
         ]
@@ -65,6 +66,10 @@ class ShadowUnveilAnalysis(AnalysisPrototype):
         """The list of the selected_classical_registers."""
         taking_time: float
         """The time taken for the calculation."""
+        purity_error: Optional[float] = None
+        """The error of the purity by the median of means, None for a single group."""
+        num_groups: int = 1
+        """The number of groups of the median of means."""
 
         def __repr__(self):
             return f"AnalysisContent(purity={self.purity}, entropy={self.entropy}, and others)"
@@ -155,6 +155,10 @@ class ShadowUnveilAnalyzeArgs(AnalyzeArgs, total=False):
     """The backend for the process."""
     counts_used: Optional[Iterable[int]]
     """The index of the counts used."""
+    dense: bool
+    """Whether to build the dense matrices of the snapshots and the expectation of Rho."""
+    num_groups: int
+    """The number of groups of the median of means for the purity."""
 
 
 SHORT_NAME = "qurshady_entropy"
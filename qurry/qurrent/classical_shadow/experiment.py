@@ -7,26 +7,38 @@ ShadowUnveil - Experiment
 """
 
 from typing import Union, Optional, Type, Any, Literal
-from collections.abc import Iterable, Hashable
+from collections.abc import Iterable, Hashable, Sequence
 import tqdm
 import numpy as np
 from numpy.random import default_rng
 
 from qiskit import QuantumCircuit
+from qiskit.quantum_info import SparsePauliOp
 
 from .analysis import ShadowUnveilAnalysis
 from .arguments import ShadowUnveilArguments, SHORT_NAME
-from .utils import circuit_method_core
+from .utils import U_M_ANGLES
+from ..randomized_measure.utils import circuit_naming, circuit_method_template
 from ...qurrium.experiment import ExperimentPrototype, Commonparams
+from ...qurrium.utils import TemplateBoundCircuits
 from ...qurrium.utils.random_unitary import check_input_for_experiment
 from ...process.utils import qubit_mapper
+from ...process.classical_shadow.observable import (
+    shadow_observables,
+    pauli_observables,
+    ShadowObservables,
+)
 from ...process.classical_shadow.classical_shadow import (
     classical_shadow_complex,
+    classical_shadow_subsystems,
+    ClassicalShadowSubsystems,
+    reduced_density_matrix,
+    expectation_product,
     ClassicalShadowComplex,
     PostProcessingBackendLabel,
     DEFAULT_PROCESS_BACKEND,
 )
-from ...tools import qurry_progressbar, ParallelManager, set_pbar_description
+from ...tools import qurry_progressbar, set_pbar_description
 from ...exceptions import RandomizedMeasureUnitaryOperatorNotFullCovering
 
 
@@ -161,7 +173,7 @@ class ShadowUnveilExperiment(ExperimentPrototype):
         targets: list[tuple[Hashable, QuantumCircuit]],
         arguments: ShadowUnveilArguments,
         pbar: Optional[tqdm.tqdm] = None,
-    ) -> tuple[list[QuantumCircuit], dict[str, Any]]:
+    ) -> tuple[TemplateBoundCircuits, dict[str, Any]]:
         """The method to construct circuit.
 
         Args:
@@ -174,12 +186,11 @@ class ShadowUnveilExperiment(ExperimentPrototype):
                 Defaults to None.
 
         Returns:
-            tuple[list[QuantumCircuit], dict[str, Any]]:
+            tuple[TemplateBoundCircuits, dict[str, Any]]:
                 The circuits of the experiment and the side products.
         """
         side_product = {}
 
-        pool = ParallelManager()
         set_pbar_description(pbar, f"Preparing {arguments.times} random unitary.")
 
         target_key, target_circuit = targets[0]
@@ -202,20 +213,28 @@ class ShadowUnveilExperiment(ExperimentPrototype):
         }
 
         set_pbar_description(pbar, f"Building {arguments.times} circuits.")
-        circ_list = []
-        circ_list = pool.starmap(
-            circuit_method_core,
-            [
+        template, template_parameters = circuit_method_template(
+            target_circuit,
+            arguments.exp_name,
+            arguments.registers_mapping,
+            list(arguments.unitary_located),
+        )
+        circ_list = TemplateBoundCircuits(
+            templates=[template],
+            template_parameters=[template_parameters],
+            bindings=[
                 (
-                    n_u_i,
-                    target_circuit,
-                    target_key,
-                    arguments.exp_name,
-                    arguments.registers_mapping,
-                    random_unitary_ids[n_u_i],
+                    0,
+                    U_M_ANGLES[
+                        [random_unitary_ids[n_u_i][n_u_qi] for n_u_qi in arguments.unitary_located]
+                    ].reshape(-1),
                 )
                 for n_u_i in range(arguments.times)
             ],
+            names=[
+                circuit_naming(n_u_i, target_circuit, target_key, arguments.exp_name)
+                for n_u_i in range(arguments.times)
+            ],
         )
 
         set_pbar_description(pbar, "Writing 'random_unitary_ids'.")
@@ -223,32 +242,35 @@ class ShadowUnveilExperiment(ExperimentPrototype):
 
         return circ_list, side_product
 
-    def analyze(
+    def _shadow_inputs(
         self,
-        selected_qubits: Optional[Iterable[int]] = None,
-        backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
+        selected_qubits: Iterable[int],
         counts_used: Optional[Iterable[int]] = None,
-        pbar: Optional[tqdm.tqdm] = None,
-    ) -> ShadowUnveilAnalysis:
-        """Calculate entangled entropy with more information combined.
+    ) -> tuple[
+        list[int],
+        list[int],
+        list[dict[str, int]],
+        dict[int, dict[int, Union[Literal[0, 1, 2], int]]],
+    ]:
+        """Prepare the inputs of classical shadow on the classical registers.
 
         Args:
-            selected_qubits (Optional[Iterable[int]], optional):
-                The selected qubits. Defaults to None.
-            backend (PostProcessingBackendLabel, optional):
-                The backend for the process. Defaults to DEFAULT_PROCESS_BACKEND.
+            selected_qubits (Iterable[int]):
+                The selected qubits.
             counts_used (Optional[Iterable[int]], optional):
                 The index of the counts used. Defaults to None.
-            pbar (Optional[tqdm.tqdm], optional):
-                The progress bar. Defaults to None.
 
         Returns:
-            EntropyMeasureRandomizedAnalysis: The result of the analysis.
+            tuple[
+                list[int],
+                list[int],
+                list[dict[str, int]],
+                dict[int, dict[int, Union[Literal[0, 1, 2], int]]],
+            ]:
+                The selected qubits, the selected classical registers,
+                the counts used, and the random unitary ids on the classical registers
+                indexed as the counts used.
         """
-
-        if selected_qubits is None:
-            raise ValueError("selected_qubits should be specified.")
-
         self.args: ShadowUnveilArguments
         self.reports: dict[int, ShadowUnveilAnalysis]
         assert (
@@ -265,11 +287,12 @@ class ShadowUnveilExperiment(ExperimentPrototype):
                     "counts_used should be less than "
                     f"{len(self.afterwards.counts)}, but get {max(counts_used)}."
                 )
-            counts = [self.afterwards.counts[i] for i in counts_used]
+            counts_indices = list(counts_used)
         elif counts_used is not None:
             raise ValueError(f"counts_used should be Iterable, but get {type(counts_used)}.")
         else:
-            counts = self.afterwards.counts
+            counts_indices = list(range(len(self.afterwards.counts)))
+        counts = [self.afterwards.counts[i] for i in counts_indices]
 
         selected_qubits = [qi % self.args.actual_num_qubits for qi in selected_qubits]
         assert len(set(selected_qubits)) == len(
@@ -277,20 +300,256 @@ class ShadowUnveilExperiment(ExperimentPrototype):
         ), f"selected_qubits should not have duplicated elements, but got {selected_qubits}."
         selected_classical_registers = [self.args.registers_mapping[qi] for qi in selected_qubits]
         random_unitary_ids_classical_registers = {
-            n_u_i: {
-                ci: random_unitary_id[n_u_qi]
+            idx: {
+                ci: random_unitary_ids[n_u_i][n_u_qi]
                 for n_u_qi, ci in self.args.registers_mapping.items()
             }
-            for n_u_i, random_unitary_id in random_unitary_ids.items()
+            for idx, n_u_i in enumerate(counts_indices)
         }
 
+        return (
+            selected_qubits,
+            selected_classical_registers,
+            counts,
+            random_unitary_ids_classical_registers,
+        )
+
+    def reduced_density_matrix(
+        self,
+        selected_qubits: Iterable[int],
+        counts_used: Optional[Iterable[int]] = None,
+    ) -> np.ndarray[tuple[int, int], np.dtype[np.complex128]]:
+        """Calculate the reduced density matrix of a small subsystem on demand.
+
+        Args:
+            selected_qubits (Iterable[int]):
+                The qubits of the subsystem, at most
+                :const:`qurry.process.classical_shadow.SHADOW_DENSE_MAX_QUBITS` qubits.
+            counts_used (Optional[Iterable[int]], optional):
+                The index of the counts used. Defaults to None.
+
+        Returns:
+            np.ndarray[tuple[int, int], np.dtype[np.complex128]]:
+                The reduced density matrix of the subsystem.
+        """
+        _, selected_classical_registers, counts, random_unitary_ids = self._shadow_inputs(
+            selected_qubits, counts_used
+        )
+        return reduced_density_matrix(
+            shots=self.commons.shots,
+            counts=counts,
+            random_unitary_um=random_unitary_ids,
+            selected_classical_registers=selected_classical_registers,
+        )
+
+    def expectation(
+        self,
+        operators: dict[
+            int,
+            Union[
+                Literal["I", "X", "Y", "Z"],
+                str,
+                np.ndarray[tuple[Literal[2], Literal[2]], np.dtype[np.complex128]],
+            ],
+        ],
+        counts_used: Optional[Iterable[int]] = None,
+    ) -> complex:
+        """Calculate the expectation value of a product of single-qubit operators on demand.
+
+        Args:
+            operators (dict[int, Union[str, np.ndarray]]):
+                The single-qubit operator on each qubit,
+                either the label of Pauli operator or a 2x2 matrix.
+            counts_used (Optional[Iterable[int]], optional):
+                The index of the counts used. Defaults to None.
+
+        Returns:
+            complex: The expectation value of the operator.
+        """
+        _, selected_classical_registers, counts, random_unitary_ids = self._shadow_inputs(
+            operators, counts_used
+        )
+        return expectation_product(
+            shots=self.commons.shots,
+            counts=counts,
+            random_unitary_um=random_unitary_ids,
+            operators=dict(zip(selected_classical_registers, operators.values())),
+        )
+
+    def estimate_observables(
+        self,
+        observables: Union[Sequence[str], SparsePauliOp],
+        num_groups: int = 10,
+        counts_used: Optional[Iterable[int]] = None,
+        pbar: Optional[tqdm.tqdm] = None,
+    ) -> ShadowObservables:
+        """Estimate the expectation values of Pauli observables on demand,
+        all Pauli strings are evaluated in one pass and combined by the median of means.
+
+        Args:
+            observables (Union[Sequence[str], SparsePauliOp]):
+                The Pauli strings or the :class:`qiskit.quantum_info.SparsePauliOp`
+                on all qubits of the target circuit, the rightmost label is the qubit 0.
+            num_groups (int, optional):
+                The number of groups of the median of means. Defaults to 10.
+            counts_used (Optional[Iterable[int]], optional):
+                The index of the counts used. Defaults to None.
+            pbar (Optional[tqdm.tqdm], optional):
+                The progress bar. Defaults to None.
+
+        Raises:
+            ValueError: The Pauli strings do not match the number of qubits.
+            ValueError: The Pauli strings act on the qubits which are not measured.
+
+        Returns:
+            ShadowObservables: The expectation values of the Pauli observables.
+        """
+        labels, coefficients = pauli_observables(observables)
+        num_qubits = self.args.actual_num_qubits
+        if any(len(label) != num_qubits for label in labels):
+            raise ValueError(f"The Pauli strings should act on {num_qubits} qubits.")
+
+        _, classical_registers, counts, random_unitary_ids = self._shadow_inputs(
+            list(self.args.registers_mapping), counts_used
+        )
+        num_classical_registers = len(classical_registers)
+        classical_labels = []
+        for label in labels:
+            classical_label = ["I"] * num_classical_registers
+            for qi in range(num_qubits):
+                pauli = label[num_qubits - qi - 1]
+                if pauli == "I":
+                    continue
+                if qi not in self.args.registers_mapping:
+                    raise ValueError(
+                        f"The Pauli string {label} acts on the qubit {qi} which is not measured."
+                    )
+                ci = self.args.registers_mapping[qi]
+                classical_label[num_classical_registers - ci - 1] = pauli
+            classical_labels.append("".join(classical_label))
+
+        result = shadow_observables(
+            shots=self.commons.shots,
+            counts=counts,
+            random_unitary_um=random_unitary_ids,
+            observables=(
+                classical_labels
+                if coefficients is None
+                else SparsePauliOp(classical_labels, coefficients)
+            ),
+            num_groups=num_groups,
+            pbar=pbar,
+        )
+        result["observables"] = labels
+        return result
+
+    def subsystem_entropies(
+        self,
+        subsystems: Iterable[Iterable[int]],
+        num_groups: int = 1,
+        counts_used: Optional[Iterable[int]] = None,
+        pbar: Optional[tqdm.tqdm] = None,
+    ) -> ClassicalShadowSubsystems:
+        """Calculate the purity and the second Renyi entropy of many subsystems in one pass,
+        the counts are read only once for all subsystems.
+
+        Args:
+            subsystems (Iterable[Iterable[int]]):
+                The qubits of each subsystem.
+            num_groups (int, optional):
+                The number of groups of the median of means for the purity,
+                the plain U-statistics over all pairs of snapshots is used if it is 1.
+                Defaults to 1.
+            counts_used (Optional[Iterable[int]], optional):
+                The index of the counts used. Defaults to None.
+            pbar (Optional[tqdm.tqdm], optional):
+                The progress bar. Defaults to None.
+
+        Raises:
+            ValueError: The qubits of a subsystem are not measured.
+
+        Returns:
+            ClassicalShadowSubsystems:
+                The purity and the entropy of each subsystem,
+                where the subsystems are given by the qubits in the ascending order.
+        """
+        _, _, counts, random_unitary_ids = self._shadow_inputs(
+            list(self.args.registers_mapping), counts_used
+        )
+        subsystems_qubits = [
+            sorted({qi % self.args.actual_num_qubits for qi in subsystem})
+            for subsystem in subsystems
+        ]
+        for subsystem in subsystems_qubits:
+            not_measured = [qi for qi in subsystem if qi not in self.args.registers_mapping]
+            if len(not_measured) > 0:
+                raise ValueError(f"The qubits {not_measured} of {subsystem} are not measured.")
+
+        result = classical_shadow_subsystems(
+            shots=self.commons.shots,
+            counts=counts,
+            random_unitary_um=random_unitary_ids,
+            subsystems=[
+                [self.args.registers_mapping[qi] for qi in subsystem]
+                for subsystem in subsystems_qubits
+            ],
+            num_groups=num_groups,
+            pbar=pbar,
+        )
+        result["subsystems"] = subsystems_qubits
+        return result
+
+    def analyze(
+        self,
+        selected_qubits: Optional[Iterable[int]] = None,
+        backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
+        counts_used: Optional[Iterable[int]] = None,
+        dense: bool = False,
+        num_groups: int = 1,
+        pbar: Optional[tqdm.tqdm] = None,
+    ) -> ShadowUnveilAnalysis:
+        """Calculate entangled entropy with more information combined.
+
+        Args:
+            selected_qubits (Optional[Iterable[int]], optional):
+                The selected qubits. Defaults to None.
+            backend (PostProcessingBackendLabel, optional):
+                The backend for the process. Defaults to DEFAULT_PROCESS_BACKEND.
+            counts_used (Optional[Iterable[int]], optional):
+                The index of the counts used. Defaults to None.
+            dense (bool, optional):
+                Whether to build the dense matrices of the snapshots and the expectation of Rho.
+                The snapshots are kept in the factorized form if it is False,
+                then use :meth:`reduced_density_matrix` for the small subsystems
+                and :meth:`expectation` for the expectation values on demand.
+                Defaults to False.
+            num_groups (int, optional):
+                The number of groups of the median of means for the purity,
+                the plain U-statistics over all pairs of snapshots is used if it is 1.
+                Defaults to 1.
+            pbar (Optional[tqdm.tqdm], optional):
+                The progress bar. Defaults to None.
+
+        Returns:
+            EntropyMeasureRandomizedAnalysis: The result of the analysis.
+        """
+
+        if selected_qubits is None:
+            raise ValueError("selected_qubits should be specified.")
+
+        selected_qubits, selected_classical_registers, counts, random_unitary_ids = (
+            self._shadow_inputs(selected_qubits, counts_used)
+        )
+
         if isinstance(pbar, tqdm.tqdm):
             qs = self.quantities(
                 shots=self.commons.shots,
                 counts=counts,
-                random_unitary_ids=random_unitary_ids_classical_registers,
+                random_unitary_ids=random_unitary_ids,
                 selected_classical_registers=selected_classical_registers,
                 backend=backend,
+                dense=dense,
+                num_groups=num_groups,
                 pbar=pbar,
             )
 
@@ -307,6 +566,8 @@ class ShadowUnveilExperiment(ExperimentPrototype):
                     random_unitary_ids=random_unitary_ids,
                     selected_classical_registers=selected_classical_registers,
                     backend=backend,
+                    dense=dense,
+                    num_groups=num_groups,
                     pbar=pbar,
                 )
                 pb_self.update()
@@ -334,6 +595,8 @@ class ShadowUnveilExperiment(ExperimentPrototype):
         random_unitary_ids: Optional[dict[int, dict[int, Union[Literal[0, 1, 2], int]]]] = None,
         selected_classical_registers: Optional[Iterable[int]] = None,
         backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
+        dense: bool = False,
+        num_groups: int = 1,
         pbar: Optional[tqdm.tqdm] = None,
     ) -> ClassicalShadowComplex:
         """Randomized entangled entropy with complex.
@@ -349,6 +612,10 @@ class ShadowUnveilExperiment(ExperimentPrototype):
                 The source of all system. Defaults to None.
             backend (PostProcessingBackendLabel, optional):
                 The backend label. Defaults to DEFAULT_PROCESS_BACKEND.
+            dense (bool, optional):
+                Whether to build the dense matrices. Defaults to False.
+            num_groups (int, optional):
+                The number of groups of the median of means for the purity. Defaults to 1.
             pbar (Optional[tqdm.tqdm], optional):
                 The progress bar. Defaults to None.
 
@@ -369,5 +636,7 @@ class ShadowUnveilExperiment(ExperimentPrototype):
             random_unitary_um=random_unitary_ids,
             selected_classical_registers=selected_classical_registers,
             backend=backend,
+            dense=dense,
+            num_groups=num_groups,
             pbar=pbar,
         )
@@ -463,6 +463,8 @@ class ShadowUnveil(QurriumPrototype):
         selected_qubits: Optional[list[int]] = None,
         backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
         counts_used: Optional[Iterable[int]] = None,
+        dense: bool = False,
+        num_groups: int = 1,
         **analysis_args,
     ) -> str:
         """Run the analysis for multiple experiments.
@@ -490,6 +492,11 @@ class ShadowUnveil(QurriumPrototype):
                 The backend for the postprocessing. Defaults to DEFAULT_PROCESS_BACKEND.
             counts_used (Optional[Iterable[int]], optional):
                 The counts used for the analysis. Defaults to None.
+            dense (bool, optional):
+                Whether to build the dense matrices of the snapshots and the expectation of Rho.
+                Defaults to False.
+            num_groups (int, optional):
+                The number of groups of the median of means for the purity. Defaults to 1.
 
         Returns:
             str: The summoner_id of multimanager.
@@ -505,5 +512,7 @@ class ShadowUnveil(QurriumPrototype):
             selected_qubits=selected_qubits,
             backend=backend,
             counts_used=counts_used,
+            dense=dense,
+            num_groups=num_groups,
             **analysis_args,
         )
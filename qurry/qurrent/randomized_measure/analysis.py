@@ -97,6 +97,27 @@ class EntropyMeasureRandomizedAnalysis(AnalysisPrototype):
         mitigatedEntropy: Optional[float] = None
         """The mitigated entanglement entropy of the subsystem."""
 
+        purityBootstrapSD: Optional[float] = None
+        """The standard deviation of the purity over the bootstrap replicates."""
+        purityCILow: Optional[float] = None
+        """The lower bound of the confidence interval of the purity."""
+        purityCIHigh: Optional[float] = None
+        """The upper bound of the confidence interval of the purity."""
+        entropyCILow: Optional[float] = None
+        """The lower bound of the confidence interval of the entropy."""
+        entropyCIHigh: Optional[float] = None
+        """The upper bound of the confidence interval of the entropy."""
+        mitigatedPurityCILow: Optional[float] = None
+        """The lower bound of the confidence interval of the mitigated purity."""
+        mitigatedPurityCIHigh: Optional[float] = None
+        """The upper bound of the confidence interval of the mitigated purity."""
+        bootstrap_resamples: Optional[int] = None
+        """The number of bootstrap replicates."""
+        bootstrap_shot_resampling: Optional[bool] = None
+        """Whether the shots are resampled in the bootstrap."""
+        confidence_level: Optional[float] = None
+        """The confidence level of the intervals."""
+
         # refactored
         counts_num: Optional[int] = None
         """The number of counts."""
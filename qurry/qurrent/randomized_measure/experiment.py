@@ -14,21 +14,33 @@ from qiskit import QuantumCircuit
 
 from .analysis import EntropyMeasureRandomizedAnalysis
 from .arguments import EntropyMeasureRandomizedArguments, SHORT_NAME
-from .utils import circuit_method_core, randomized_entangled_entropy_complex
+from .utils import (
+    circuit_naming,
+    circuit_method_template,
+    randomized_entangled_entropy_complex,
+)
 from ...qurrium.experiment import ExperimentPrototype, Commonparams
+from ...qurrium.utils import TemplateBoundCircuits
 from ...qurrium.utils.randomized import (
-    random_unitary,
-    local_unitary_op_to_list,
-    local_unitary_op_to_pauli_coeff,
+    unitary_array_to_pauli_coeff,
+    unitary_array_to_u_angles,
+)
+from ...qurrium.utils.random_unitary import (
+    check_input_for_experiment,
+    generate_random_unitary_array,
 )
-from ...qurrium.utils.random_unitary import check_input_for_experiment
 from ...process.utils import qubit_mapper
 from ...process.randomized_measure.entangled_entropy import (
     EntangledEntropyResultMitigated,
+    EntangledEntropyResultMitigatedBootstrap,
+    PurityConvergenceResult,
     PostProcessingBackendLabel,
     DEFAULT_PROCESS_BACKEND,
+    PurityCache,
+    DEFAULT_PURITY_CACHE,
+    purity_convergence,
 )
-from ...tools import qurry_progressbar, ParallelManager, set_pbar_description
+from ...tools import qurry_progressbar, set_pbar_description
 from ...exceptions import RandomizedMeasureUnitaryOperatorNotFullCovering
 
 
@@ -163,9 +175,18 @@ class EntropyMeasureRandomizedExperiment(ExperimentPrototype):
         targets: list[tuple[Hashable, QuantumCircuit]],
         arguments: EntropyMeasureRandomizedArguments,
         pbar: Optional[tqdm.tqdm] = None,
-    ) -> tuple[list[QuantumCircuit], dict[str, Any]]:
+    ) -> tuple[TemplateBoundCircuits, dict[str, Any]]:
         """The method to construct circuit.
 
+        The side products `unitaryOP` and `randomized` are the random unitary operators
+        with shape `(times, len(unitary_located), 2, 2)` and their Pauli coefficients
+        with shape `(times, len(unitary_located), 3)`, whose second axis follows
+        `unitary_located`. They are exported as `.npy` files instead of JSON.
+        The experiments exported before keep them as the dictionaries
+        keyed by the index of random unitary and then the qubit index in `unitary_located`,
+        see :func:`local_unitary_array_to_list` and :func:`local_unitary_array_to_pauli_coeff`
+        for converting the arrays to that format.
+
         Args:
             targets (list[tuple[Hashable, QuantumCircuit]]):
                 The circuits of the experiment.
@@ -176,67 +197,44 @@ class EntropyMeasureRandomizedExperiment(ExperimentPrototype):
                 Defaults to None.
 
         Returns:
-            tuple[list[QuantumCircuit], dict[str, Any]]:
+            tuple[TemplateBoundCircuits, dict[str, Any]]:
                 The circuits of the experiment and the side products.
         """
         side_product = {}
 
-        pool = ParallelManager()
         set_pbar_description(pbar, f"Preparing {arguments.times} random unitary.")
 
         target_key, target_circuit = targets[0]
         target_key = "" if isinstance(target_key, int) else str(target_key)
 
         assert arguments.unitary_located is not None, "unitary_located should be specified."
-        unitary_dicts = {
-            n_u_i: {
-                n_u_qi: (
-                    random_unitary(2)
-                    if arguments.random_unitary_seeds is None
-                    else random_unitary(2, arguments.random_unitary_seeds[n_u_i][seed_i])
-                )
-                for seed_i, n_u_qi in enumerate(arguments.unitary_located)
-            }
-            for n_u_i in range(arguments.times)
-        }
+        unitary_array = generate_random_unitary_array(
+            arguments.times, len(arguments.unitary_located), arguments.random_unitary_seeds
+        )
 
         set_pbar_description(pbar, f"Building {arguments.times} circuits.")
-        circ_list = pool.starmap(
-            circuit_method_core,
-            [
-                (
-                    n_u_i,
-                    target_circuit,
-                    target_key,
-                    arguments.exp_name,
-                    arguments.registers_mapping,
-                    unitary_dicts[n_u_i],
-                )
+        template, template_parameters = circuit_method_template(
+            target_circuit,
+            arguments.exp_name,
+            arguments.registers_mapping,
+            list(arguments.unitary_located),
+        )
+        u_angles = unitary_array_to_u_angles(unitary_array).reshape(arguments.times, -1)
+        circ_list = TemplateBoundCircuits(
+            templates=[template],
+            template_parameters=[template_parameters],
+            bindings=[(0, u_angles[n_u_i]) for n_u_i in range(arguments.times)],
+            names=[
+                circuit_naming(n_u_i, target_circuit, target_key, arguments.exp_name)
                 for n_u_i in range(arguments.times)
             ],
         )
 
         set_pbar_description(pbar, "Writing 'unitaryOP'.")
-        # side_product["unitaryOP"] = {
-        #     k: {i: np.array(v[i]).tolist() for i in range(*arguments.unitary_loc)}
-        #     for k, v in unitary_dict.items()
-        # }
-        unitary_operator_list = pool.starmap(
-            local_unitary_op_to_list,
-            [(unitary_dicts[n_u_i],) for n_u_i in range(arguments.times)],
-        )
-        side_product["unitaryOP"] = dict(enumerate(unitary_operator_list))
+        side_product["unitaryOP"] = unitary_array
 
         set_pbar_description(pbar, "Writing 'randomized'.")
-        # side_product["randomized"] = {
-        #     i: {j: qubitOpToPauliCoeff(unitary_dict[i][j]) for j in range(*arguments.unitary_loc)}
-        #     for i in range(arguments.times)
-        # }
-        randomized_list = pool.starmap(
-            local_unitary_op_to_pauli_coeff,
-            [(unitary_operator_list[n_u_i],) for n_u_i in range(arguments.times)],
-        )
-        side_product["randomized"] = dict(enumerate(randomized_list))
+        side_product["randomized"] = unitary_array_to_pauli_coeff(unitary_array)
 
         return circ_list, side_product
 
@@ -247,6 +245,11 @@ class EntropyMeasureRandomizedExperiment(ExperimentPrototype):
         backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
         counts_used: Optional[Iterable[int]] = None,
         pbar: Optional[tqdm.tqdm] = None,
+        bootstrap_resamples: int = 0,
+        bootstrap_shots: bool = False,
+        confidence_level: float = 0.95,
+        bootstrap_seed: Optional[int] = None,
+        purity_cache: Optional[PurityCache] = None,
     ) -> EntropyMeasureRandomizedAnalysis:
         """Calculate entangled entropy with more information combined.
 
@@ -261,6 +264,19 @@ class EntropyMeasureRandomizedExperiment(ExperimentPrototype):
                 The index of the counts used. Defaults to None.
             pbar (Optional[tqdm.tqdm], optional):
                 The progress bar. Defaults to None.
+            bootstrap_resamples (int, optional):
+                The number of bootstrap replicates for the confidence intervals,
+                the bootstrap is skipped when it is 0. Defaults to 0.
+            bootstrap_shots (bool, optional):
+                Whether to resample the shots in the bootstrap. Defaults to False.
+            confidence_level (float, optional):
+                The confidence level of the intervals. Defaults to 0.95.
+            bootstrap_seed (Optional[int], optional):
+                The seed of the bootstrap. Defaults to None.
+            purity_cache (Optional[PurityCache], optional):
+                The cache of purity cells shared across experiments and sessions,
+                :data:`DEFAULT_PURITY_CACHE` in memory is used if it is None.
+                Defaults to None.
 
         Returns:
             EntropyMeasureRandomizedAnalysis: The result of the analysis.
@@ -306,6 +322,11 @@ class EntropyMeasureRandomizedExperiment(ExperimentPrototype):
             selected_qubits
         ), f"selected_qubits should not have duplicated elements, but got {selected_qubits}."
         selected_classical_registers = [registers_mapping[qi] for qi in selected_qubits]
+        if purity_cache is None:
+            purity_cache = DEFAULT_PURITY_CACHE
+        marginal_counts = self.afterwards.marginal_counts(selected_classical_registers)
+        if counts_used is not None:
+            marginal_counts = [marginal_counts[i] for i in counts_used]
 
         if isinstance(pbar, tqdm.tqdm):
             qs = self.quantities(
@@ -315,6 +336,12 @@ class EntropyMeasureRandomizedExperiment(ExperimentPrototype):
                 all_system_source=all_system_source,
                 backend=backend,
                 pbar=pbar,
+                bootstrap_resamples=bootstrap_resamples,
+                bootstrap_shots=bootstrap_shots,
+                confidence_level=confidence_level,
+                bootstrap_seed=bootstrap_seed,
+                purity_cache=purity_cache,
+                marginal_counts=marginal_counts,
             )
 
         else:
@@ -331,6 +358,12 @@ class EntropyMeasureRandomizedExperiment(ExperimentPrototype):
                     all_system_source=all_system_source,
                     backend=backend,
                     pbar=pb_self,
+                    bootstrap_resamples=bootstrap_resamples,
+                    bootstrap_shots=bootstrap_shots,
+                    confidence_level=confidence_level,
+                    bootstrap_seed=bootstrap_seed,
+                    purity_cache=purity_cache,
+                    marginal_counts=marginal_counts,
                 )
                 pb_self.update()
 
@@ -349,6 +382,73 @@ class EntropyMeasureRandomizedExperiment(ExperimentPrototype):
         self.reports[serial] = analysis
         return analysis
 
+    def analyze_convergence(
+        self,
+        selected_qubits: Optional[Iterable[int]] = None,
+        times_grid: Optional[Iterable[int]] = None,
+        shots_grid: Optional[Iterable[int]] = None,
+        shots_repeats: int = 10,
+        seed: Optional[int] = None,
+        backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
+        counts_used: Optional[Iterable[int]] = None,
+    ) -> PurityConvergenceResult:
+        """Calculate the purity and entropy as functions of
+        the number of random unitaries and the number of shots per unitary.
+
+        The purity cells are calculated only once for all numbers of random unitaries,
+        and the curve over shots is from the vectorized multinomial subsamples of the counts,
+        so the whole sweep costs about a single :meth:`analyze`.
+
+        Args:
+            selected_qubits (Optional[Iterable[int]], optional):
+                The selected qubits. Defaults to None.
+            times_grid (Optional[Iterable[int]], optional):
+                The numbers of random unitaries. Defaults to None.
+            shots_grid (Optional[Iterable[int]], optional):
+                The numbers of shots per unitary. Defaults to None.
+            shots_repeats (int, optional):
+                The number of subsamples of each counts for each number of shots.
+                Defaults to 10.
+            seed (Optional[int], optional):
+                The seed of the subsamples. Defaults to None.
+            backend (PostProcessingBackendLabel, optional):
+                The backend for the process. Defaults to DEFAULT_PROCESS_BACKEND.
+            counts_used (Optional[Iterable[int]], optional):
+                The index of the counts used. Defaults to None.
+
+        Returns:
+            PurityConvergenceResult: The convergence curves.
+        """
+        if selected_qubits is None:
+            raise ValueError("selected_qubits should be specified.")
+
+        self.args: EntropyMeasureRandomizedArguments
+        registers_mapping = self.args.registers_mapping
+        assert isinstance(
+            registers_mapping, dict
+        ), f"registers_mapping {registers_mapping} is not dict."
+
+        counts = (
+            self.afterwards.counts
+            if counts_used is None
+            else [self.afterwards.counts[i] for i in counts_used]
+        )
+        selected_qubits = [qi % self.args.actual_num_qubits for qi in selected_qubits]
+        assert len(set(selected_qubits)) == len(
+            selected_qubits
+        ), f"selected_qubits should not have duplicated elements, but got {selected_qubits}."
+
+        return purity_convergence(
+            shots=self.commons.shots,
+            counts=counts,
+            selected_classical_registers=[registers_mapping[qi] for qi in selected_qubits],
+            times_grid=times_grid,
+            shots_grid=shots_grid,
+            shots_repeats=shots_repeats,
+            seed=seed,
+            backend=backend,
+        )
+
     @classmethod
     def quantities(
         cls,
@@ -358,7 +458,13 @@ class EntropyMeasureRandomizedExperiment(ExperimentPrototype):
         all_system_source: Optional[EntropyMeasureRandomizedAnalysis] = None,
         backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
         pbar: Optional[tqdm.tqdm] = None,
-    ) -> EntangledEntropyResultMitigated:
+        bootstrap_resamples: int = 0,
+        bootstrap_shots: bool = False,
+        confidence_level: float = 0.95,
+        bootstrap_seed: Optional[int] = None,
+        purity_cache: Optional[PurityCache] = None,
+        marginal_counts: Optional[list[dict[str, int]]] = None,
+    ) -> Union[EntangledEntropyResultMitigated, EntangledEntropyResultMitigatedBootstrap]:
         """Randomized entangled entropy with complex.
 
         Args:
@@ -374,9 +480,24 @@ class EntropyMeasureRandomizedExperiment(ExperimentPrototype):
                 The backend label. Defaults to DEFAULT_PROCESS_BACKEND.
             pbar (Optional[tqdm.tqdm], optional):
                 The progress bar. Defaults to None.
+            bootstrap_resamples (int, optional):
+                The number of bootstrap replicates for the confidence intervals,
+                the bootstrap is skipped when it is 0. Defaults to 0.
+            bootstrap_shots (bool, optional):
+                Whether to resample the shots in the bootstrap. Defaults to False.
+            confidence_level (float, optional):
+                The confidence level of the intervals. Defaults to 0.95.
+            bootstrap_seed (Optional[int], optional):
+                The seed of the bootstrap. Defaults to None.
+            purity_cache (Optional[PurityCache], optional):
+                The cache of purity cells. Defaults to None.
+            marginal_counts (Optional[list[dict[str, int]]], optional):
+                The counts marginalized to the selected classical registers.
+                Defaults to None.
 
         Returns:
-            EntangledEntropyResultMitigated: The result of the entangled entropy.
+            Union[EntangledEntropyResultMitigated, EntangledEntropyResultMitigatedBootstrap]:
+                The result of the entangled entropy.
         """
 
         if shots is None or counts is None:
@@ -389,4 +510,10 @@ class EntropyMeasureRandomizedExperiment(ExperimentPrototype):
             all_system_source=all_system_source,
             backend=backend,
             pbar=pbar,
+            bootstrap_resamples=bootstrap_resamples,
+            bootstrap_shots=bootstrap_shots,
+            confidence_level=confidence_level,
+            bootstrap_seed=bootstrap_seed,
+            purity_cache=purity_cache,
+            marginal_counts=marginal_counts,
         )
@@ -26,8 +26,15 @@ from .experiment import (
     PostProcessingBackendLabel,
     DEFAULT_PROCESS_BACKEND,
 )
+from ...process.randomized_measure.entangled_entropy import (
+    IncrementalPurity,
+    PurityCache,
+    PURITY_CACHE_FOLDER,
+)
+from ...process.utils import qubit_mapper
 from ...qurrium.qurrium import QurriumPrototype
 from ...qurrium.container import ExperimentContainer
+from ...qurrium.utils.random_unitary import check_input_for_experiment
 from ...tools.backend import GeneralSimulator
 from ...declare import BaseRunArgs, TranspileArgs
 
@@ -374,6 +381,186 @@ class EntropyMeasureRandomized(QurriumPrototype):
 
         return self.output(**output_args)
 
+    def measure_until_converged(
+        self,
+        wave: Optional[Union[QuantumCircuit, Hashable]] = None,
+        selected_qubits: Optional[Iterable[int]] = None,
+        target_precision: float = 0.01,
+        precision_on: Literal["purity", "entropy"] = "purity",
+        batch_times: int = 10,
+        max_times: int = 100,
+        min_times: int = 10,
+        measure: Union[int, tuple[int, int], None] = None,
+        unitary_loc: Union[int, tuple[int, int], None] = None,
+        unitary_loc_not_cover_measure: bool = False,
+        random_unitary_seeds: Optional[dict[int, dict[int, int]]] = None,
+        # basic inputs
+        shots: int = 1024,
+        backend: Optional[Backend] = None,
+        exp_name: str = "experiment",
+        run_args: Optional[Union[BaseRunArgs, dict[str, Any]]] = None,
+        transpile_args: Optional[TranspileArgs] = None,
+        passmanager: Optional[Union[str, PassManager, tuple[str, PassManager]]] = None,
+        tags: Optional[tuple[str, ...]] = None,
+        # process tool
+        process_backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
+        pbar: Optional[tqdm.tqdm] = None,
+    ) -> tuple[list[str], IncrementalPurity]:
+        """Execute the experiment by batches of random unitary operators
+        until the purity reaches the target precision.
+
+        Each batch is an experiment with `batch_times` random unitary operators,
+        and its counts are consumed by :cls:`IncrementalPurity` as soon as it finished.
+        No more batch is submitted once the standard error of the mean of the purity,
+        or the entropy, is not larger than `target_precision`.
+
+        Args:
+            wave (Union[QuantumCircuit, Hashable]):
+                The key or the circuit to execute.
+            selected_qubits (Optional[Iterable[int]], optional):
+                The selected qubits for the convergence criterion,
+                all measured qubits are selected if it is None. Defaults to None.
+            target_precision (float, optional):
+                The target standard error of the mean. Defaults to 0.01.
+            precision_on (Literal["purity", "entropy"], optional):
+                The quantity that the target precision is applied on. Defaults to "purity".
+            batch_times (int, optional):
+                The number of random unitary operator of each batch. Defaults to 10.
+            max_times (int, optional):
+                The maximum number of random unitary operator. Defaults to 100.
+            min_times (int, optional):
+                The minimum number of random unitary operator before checking the convergence.
+                Defaults to 10.
+            measure (Union[int, tuple[int, int], None], optional):
+                The measure range. Defaults to `None`.
+            unitary_loc (Union[int, tuple[int, int], None], optional):
+                The range of the unitary operator. Defaults to `None`.
+            unitary_loc_not_cover_measure (bool, optional):
+                Whether the range of the unitary operator is not cover the measure range.
+                Defaults to `False`.
+            random_unitary_seeds (Optional[dict[int, dict[int, int]]], optional):
+                The seeds for all random unitary operator up to `max_times`,
+                which are split into the batches. Defaults to None.
+            shots (int, optional):
+                Shots of the job. Defaults to `1024`.
+            backend (Optional[Backend], optional):
+                The quantum backend. Defaults to None.
+            exp_name (str, optional):
+                The name of the experiment. Defaults to `'experiment'`.
+            run_args (Optional[Union[BaseRunArgs, dict[str, Any]]], optional):
+                Arguments for :func:`qiskit.execute`. Defaults to `{}`.
+            transpile_args (Optional[TranspileArgs], optional):
+                Arguments for :func:`qiskit.transpile`. Defaults to `{}`.
+            passmanager (Optional[Union[str, PassManager, tuple[str, PassManager]], optional):
+                The passmanager. Defaults to None.
+            tags (Optional[tuple[str, ...]], optional):
+                The tags of the experiment. Defaults to None.
+
+            process_backend (PostProcessingBackendLabel, optional):
+                The backend for the purity cell. Defaults to DEFAULT_PROCESS_BACKEND.
+            pbar (Optional[tqdm.tqdm], optional):
+                The progress bar for showing the progress of the experiment.
+                Defaults to None.
+
+        Raises:
+            ValueError: If `batch_times`, `max_times` or `min_times` is invalid.
+            ValueError: If `random_unitary_seeds` does not cover all `max_times` operators.
+            ValueError: If `selected_qubits` is duplicated or not measured.
+
+        Returns:
+            tuple[list[str], IncrementalPurity]:
+                The experiment IDs of the batches and the estimator.
+        """
+        if batch_times < 1 or max_times < 1:
+            raise ValueError(
+                f"batch_times {batch_times} and max_times {max_times} should be positive."
+            )
+        if max_times < min_times:
+            raise ValueError(
+                f"max_times {max_times} should not be less than min_times {min_times}."
+            )
+
+        if random_unitary_seeds is not None:
+            missing_seeds = [i for i in range(max_times) if i not in random_unitary_seeds]
+            if len(missing_seeds) > 0:
+                raise ValueError(
+                    f"random_unitary_seeds should have the seeds for all {max_times} "
+                    + f"random unitary operators, but {len(missing_seeds)} of them are missing, "
+                    + f"the first missing one is {missing_seeds[0]}."
+                )
+            random_unitary_seeds = {i: random_unitary_seeds[i] for i in range(max_times)}
+
+        # The wave is resolved once, so a given circuit is added to `.waves` only once.
+        wave, target_circuit = self.waves.process([wave])[0]
+        actual_num_qubits = target_circuit.num_qubits
+        registers_mapping = qubit_mapper(actual_num_qubits, measure)
+        check_input_for_experiment(
+            max_times, len(qubit_mapper(actual_num_qubits, unitary_loc)), random_unitary_seeds
+        )
+        selected_classical_registers = None
+        if selected_qubits is not None:
+            selected_qubits = [qi % actual_num_qubits for qi in selected_qubits]
+            if len(set(selected_qubits)) != len(selected_qubits):
+                raise ValueError(
+                    "selected_qubits should not have duplicated elements, "
+                    + f"but got {selected_qubits}."
+                )
+            unmeasured = [qi for qi in selected_qubits if qi not in registers_mapping]
+            if len(unmeasured) > 0:
+                raise ValueError(
+                    f"selected_qubits {unmeasured} are not measured, "
+                    + f"the measured qubits are {list(registers_mapping)}."
+                )
+            selected_classical_registers = [registers_mapping[qi] for qi in selected_qubits]
+        estimator = IncrementalPurity(
+            selected_classical_registers=selected_classical_registers,
+            target_precision=target_precision,
+            precision_on=precision_on,
+            min_cells=max(min_times, 2),
+            backend=process_backend,
+        )
+
+        exp_ids: list[str] = []
+        done_times = 0
+        while done_times < max_times:
+            current_times = min(batch_times, max_times - done_times)
+            exp_id = self.measure(
+                wave=wave,
+                times=current_times,
+                measure=measure,
+                unitary_loc=unitary_loc,
+                unitary_loc_not_cover_measure=unitary_loc_not_cover_measure,
+                random_unitary_seeds=(
+                    None
+                    if random_unitary_seeds is None
+                    else {
+                        i: random_unitary_seeds[done_times + i] for i in range(current_times)
+                    }
+                ),
+                shots=shots,
+                backend=backend,
+                exp_name=exp_name,
+                run_args=run_args,
+                transpile_args=transpile_args,
+                passmanager=passmanager,
+                tags=tags,
+                pbar=pbar,
+            )
+            exp_ids.append(exp_id)
+            done_times += current_times
+            current_exp = self.exps[exp_id]
+
+            estimator.update(current_exp.afterwards.counts)
+            if isinstance(pbar, tqdm.tqdm):
+                sem = estimator.purity_sem if precision_on == "purity" else estimator.entropy_sem
+                pbar.set_description_str(
+                    f"{done_times}/{max_times} random unitaries, {precision_on} sem: {sem:.4g}"
+                )
+            if estimator.converged:
+                break
+
+        return exp_ids, estimator
+
     def multiOutput(
         self,
         config_list: list[Union[dict[str, Any], EntropyMeasureRandomizedMeasureArgs]],
@@ -444,6 +631,7 @@ class EntropyMeasureRandomized(QurriumPrototype):
         independent_all_system: bool = False,
         backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
         counts_used: Optional[Iterable[int]] = None,
+        purity_cache: Optional[PurityCache] = None,
         **analysis_args,
     ) -> str:
         """Run the analysis for multiple experiments.
@@ -473,10 +661,20 @@ class EntropyMeasureRandomized(QurriumPrototype):
                 The backend for the postprocessing. Defaults to DEFAULT_PROCESS_BACKEND.
             counts_used (Optional[Iterable[int]], optional):
                 The counts used for the analysis. Defaults to None.
+            purity_cache (Optional[PurityCache], optional):
+                The cache of purity cells,
+                a cache in the folder `purity_cache` alongside the multimanager is used
+                if it is None, so the purity is reused when the multimanager is read again.
+                Defaults to None.
 
         Returns:
             str: The summoner_id of multimanager.
         """
+        if purity_cache is None and summoner_id in self.multimanagers:
+            purity_cache = PurityCache(
+                Path(self.multimanagers[summoner_id].multicommons.export_location)
+                / PURITY_CACHE_FOLDER
+            )
 
         return super().multiAnalysis(
             summoner_id=summoner_id,
@@ -489,5 +687,6 @@ class EntropyMeasureRandomized(QurriumPrototype):
             independent_all_system=independent_all_system,
             backend=backend,
             counts_used=counts_used,
+            purity_cache=purity_cache,
             **analysis_args,
         )
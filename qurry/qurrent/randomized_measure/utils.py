@@ -6,22 +6,26 @@ EntropyMeasureRandomized - Utility
 
 """
 
-from typing import Optional
+from typing import Optional, Union
 from collections.abc import Hashable, Iterable
 import tqdm
 
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
-from qiskit.quantum_info import Operator
+from qiskit.circuit import Parameter, ParameterVector
+from qiskit.circuit.library import UGate
 
 
 from .analysis import EntropyMeasureRandomizedAnalysis
 from ...process.randomized_measure.entangled_entropy import (
     randomized_entangled_entropy_mitigated,
     EntangledEntropyResultMitigated,
+    EntangledEntropyResultMitigatedBootstrap,
     ExistedAllSystemInfo,
     ExistedAllSystemInfoInput,
     PostProcessingBackendLabel,
     DEFAULT_PROCESS_BACKEND,
+    PurityCache,
+    purity_bootstrap,
 )
 
 
@@ -32,7 +36,13 @@ def randomized_entangled_entropy_complex(
     all_system_source: Optional[EntropyMeasureRandomizedAnalysis] = None,
     backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
     pbar: Optional[tqdm.tqdm] = None,
-) -> EntangledEntropyResultMitigated:
+    bootstrap_resamples: int = 0,
+    bootstrap_shots: bool = False,
+    confidence_level: float = 0.95,
+    bootstrap_seed: Optional[int] = None,
+    purity_cache: Optional[PurityCache] = None,
+    marginal_counts: Optional[list[dict[str, int]]] = None,
+) -> Union[EntangledEntropyResultMitigated, EntangledEntropyResultMitigatedBootstrap]:
     """Randomized entangled entropy with complex.
 
     Args:
@@ -48,9 +58,23 @@ def randomized_entangled_entropy_complex(
             The backend label. Defaults to DEFAULT_PROCESS_BACKEND.
         pbar (Optional[tqdm.tqdm], optional):
             The progress bar. Defaults to None.
+        bootstrap_resamples (int, optional):
+            The number of bootstrap replicates for the confidence intervals,
+            the bootstrap is skipped when it is 0. Defaults to 0.
+        bootstrap_shots (bool, optional):
+            Whether to resample the shots in the bootstrap. Defaults to False.
+        confidence_level (float, optional):
+            The confidence level of the intervals. Defaults to 0.95.
+        bootstrap_seed (Optional[int], optional):
+            The seed of the bootstrap. Defaults to None.
+        purity_cache (Optional[PurityCache], optional):
+            The cache of purity cells. Defaults to None.
+        marginal_counts (Optional[list[dict[str, int]]], optional):
+            The counts marginalized to the selected classical registers. Defaults to None.
 
     Returns:
-        EntangledEntropyResultMitigated: The result of the entangled entropy.
+        Union[EntangledEntropyResultMitigated, EntangledEntropyResultMitigatedBootstrap]:
+            The result of the entangled entropy.
     """
 
     if all_system_source is None:
@@ -71,25 +95,47 @@ def randomized_entangled_entropy_complex(
             + f"but get {type(all_system_source)}."
         )
 
-    return randomized_entangled_entropy_mitigated(
+    if selected_classical_registers is not None:
+        selected_classical_registers = list(selected_classical_registers)
+
+    result = randomized_entangled_entropy_mitigated(
         shots=shots,
         counts=counts,
         selected_classical_registers=selected_classical_registers,
         backend=backend,
         existed_all_system=existed_all_system,
         pbar=pbar,
+        purity_cache=purity_cache,
+        marginal_counts=marginal_counts,
     )
-
-
-def circuit_method_core(
+    if bootstrap_resamples < 1 or len(result["purityCells"]) == 0:
+        return result
+
+    if isinstance(pbar, tqdm.tqdm):
+        pbar.set_description(f"Bootstrap with {bootstrap_resamples} resamples.")
+    bootstrapped: EntangledEntropyResultMitigatedBootstrap = {
+        **result,
+        **purity_bootstrap(
+            purity_cells=result["purityCells"],
+            counts=counts,
+            selected_classical_registers=selected_classical_registers,
+            purity_cells_all_sys=result["purityCellsAllSys"] or None,
+            num_resamples=bootstrap_resamples,
+            shot_resampling=bootstrap_shots,
+            confidence_level=confidence_level,
+            seed=bootstrap_seed,
+        ),
+    }
+    return bootstrapped
+
+
+def circuit_naming(
     idx: int,
     target_circuit: QuantumCircuit,
     target_key: Hashable,
     exp_name: str,
-    registers_mapping: dict[int, int],
-    single_unitary_dict: dict[int, Operator],
-) -> QuantumCircuit:
-    """Build the circuit for the experiment.
+) -> str:
+    """Name the circuit for the experiment.
 
     Args:
         idx (int):
@@ -100,37 +146,65 @@ def circuit_method_core(
             Target key.
         exp_name (str):
             Experiment name.
+
+    Returns:
+        str: The name of the circuit.
+    """
+    old_name = "" if isinstance(target_circuit.name, str) else target_circuit.name
+    return (
+        f"{exp_name}_{idx}" + ""
+        if len(str(target_key)) < 1
+        else f".{target_key}" + "" if len(old_name) < 1 else f".{old_name}"
+    )
+
+
+def circuit_method_template(
+    target_circuit: QuantumCircuit,
+    exp_name: str,
+    registers_mapping: dict[int, int],
+    unitary_located: list[int],
+) -> tuple[QuantumCircuit, list[Parameter]]:
+    """Build the parameterized template for the experiment,
+    which has a :class:`qiskit.circuit.library.UGate` on each qubit of `unitary_located`.
+    Each circuit of the experiment is this template bound with the Euler angles
+    of its random unitary operators,
+    see :func:`qurry.qurrium.utils.randomized.unitary_array_to_u_angles`.
+
+    Args:
+        target_circuit (QuantumCircuit):
+            Target circuit.
+        exp_name (str):
+            Experiment name.
         registers_mapping (dict[int, int]):
             The mapping of the index of selected qubits to the index of the classical register.
-        single_unitary_dict (dict[int, Operator]):
-            The dictionary of the unitary operator.
+        unitary_located (list[int]):
+            The qubits to apply the random unitary operators in order.
 
     Returns:
-        QuantumCircuit: The circuit for the experiment.
+        tuple[QuantumCircuit, list[Parameter]]:
+            The template and its parameters ordered as
+            :math:`(\\theta, \\phi, \\lambda)` of each qubit in `unitary_located`.
     """
 
     num_qubits = target_circuit.num_qubits
-    old_name = "" if isinstance(target_circuit.name, str) else target_circuit.name
+    theta = ParameterVector("theta", len(unitary_located))
+    phi = ParameterVector("phi", len(unitary_located))
+    lam = ParameterVector("lam", len(unitary_located))
 
     q_func1 = QuantumRegister(num_qubits, "q1")
     c_meas1 = ClassicalRegister(len(registers_mapping), "c1")
     qc_exp1 = QuantumCircuit(q_func1, c_meas1)
-    qc_exp1.name = (
-        f"{exp_name}_{idx}" + ""
-        if len(str(target_key)) < 1
-        else f".{target_key}" + "" if len(old_name) < 1 else f".{old_name}"
-    )
+    qc_exp1.name = f"{exp_name}_template"
 
-    # TODO: When tatget has more clbits or qubits than dest, it will raise an error.
-    # See qiskit/circuit/quantumcircuit.py:1961
-    # if other.num_qubits > dest.num_qubits or other.num_clbits > dest.num_clbits:
     qc_exp1.compose(target_circuit, [q_func1[i] for i in range(num_qubits)], inplace=True)
 
     qc_exp1.barrier()
-    for qi, opertor in single_unitary_dict.items():
-        qc_exp1.append(opertor.to_instruction(), [qi])
+    template_parameters = []
+    for ui, qi in enumerate(unitary_located):
+        qc_exp1.append(UGate(theta[ui], phi[ui], lam[ui]), [qi])
+        template_parameters += [theta[ui], phi[ui], lam[ui]]
 
     for qi, ci in registers_mapping.items():
         qc_exp1.measure(q_func1[qi], c_meas1[ci])
 
-    return qc_exp1
+    return qc_exp1, template_parameters
@@ -19,7 +19,6 @@ from ...process.randomized_measure.entangled_entropy_v1 import (
     PostProcessingBackendLabel,
 )
 from ...declare import BasicArgs, OutputArgs, AnalyzeArgs
-from ...tools import DEFAULT_POOL_SIZE
 
 
 @dataclass(frozen=True)
@@ -59,8 +58,9 @@ class EntropyMeasureRandomizedV1Arguments(ArgumentsPrototype):
         from qurry.qurrium.utils.random_unitary import generate_random_unitary_seeds
         random_unitary_seeds = generate_random_unitary_seeds(100, 2)
     """
-    workers_num: int = DEFAULT_POOL_SIZE
-    """The number of workers for multiprocessing."""
+    workers_num: Optional[int] = None
+    """The number of workers for multiprocessing,
+    the workers number of the concurrency budget is used if it is None."""
 
 
 class EntropyMeasureRandomizedV1MeasureArgs(BasicArgs, total=False):
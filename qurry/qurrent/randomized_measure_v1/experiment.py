@@ -179,7 +179,7 @@ class EntropyMeasureRandomizedV1Experiment(ExperimentPrototype):
         pool = ParallelManager(arguments.workers_num)
         if isinstance(pbar, tqdm.tqdm):
             pbar.set_description_str(
-                f"Preparing {arguments.times} random unitary with {arguments.workers_num} workers."
+                f"Preparing {arguments.times} random unitary with {pool.workers_num} workers."
             )
 
         target_key, target_circuit = targets[0]
@@ -209,7 +209,7 @@ class EntropyMeasureRandomizedV1Experiment(ExperimentPrototype):
 
         if isinstance(pbar, tqdm.tqdm):
             pbar.set_description_str(
-                f"Building {arguments.times} circuits with {arguments.workers_num} workers."
+                f"Building {arguments.times} circuits with {pool.workers_num} workers."
             )
         circ_list = pool.starmap(
             circuit_method_core_v1,
@@ -228,7 +228,7 @@ class EntropyMeasureRandomizedV1Experiment(ExperimentPrototype):
         )
 
         if isinstance(pbar, tqdm.tqdm):
-            pbar.set_description_str(f"Writing 'unitaryOP' with {arguments.workers_num} workers.")
+            pbar.set_description_str(f"Writing 'unitaryOP' with {pool.workers_num} workers.")
         # side_product["unitaryOP"] = {
         #     k: {i: np.array(v[i]).tolist() for i in range(*arguments.unitary_loc)}
         #     for k, v in unitary_dict.items()
@@ -240,7 +240,7 @@ class EntropyMeasureRandomizedV1Experiment(ExperimentPrototype):
         side_product["unitaryOP"] = dict(enumerate(unitary_operator_list))
 
         if isinstance(pbar, tqdm.tqdm):
-            pbar.set_description_str(f"Writing 'randomized' with {arguments.workers_num} workers.")
+            pbar.set_description_str(f"Writing 'randomized' with {pool.workers_num} workers.")
         # side_product["randomized"] = {
         #     i: {j: qubitOpToPauliCoeff(unitary_dict[i][j]) for j in range(*arguments.unitary_loc)}
         #     for i in range(arguments.times)
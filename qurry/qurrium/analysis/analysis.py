@@ -11,6 +11,7 @@ from abc import abstractmethod
 from pathlib import Path
 import json
 import gc
+import numpy as np
 
 from ...capsule import jsonablize
 from ...capsule.hoshi import Hoshi
@@ -232,12 +233,14 @@ class AnalysisPrototype:
 
         Returns:
             tuple[dict[str, Any], dict[str, Any]]: `main` and `side` product dict.
-
+                The :class:`numpy.ndarray` in the content is exported as nested lists.
         """
 
         tales = {}
         main = {}
         for k, v in self.content._asdict().items():
+            if isinstance(v, np.ndarray):
+                v = v.tolist()
             if k in self.side_product_fields:
                 tales[k] = v
             else:
@@ -6,12 +6,16 @@ The experiment container - afterwards
 
 """
 
+import os
 import json
-from typing import NamedTuple, Any
+from typing import NamedTuple, Any, Iterable
 from pathlib import Path
 
+import numpy as np
 from qiskit.result import Result
 
+from ...process.utils.marginal import single_counts_marginal
+
 
 class After(NamedTuple):
     """The data of experiment will be independently exported in the folder 'legacy',
@@ -22,6 +26,15 @@ class After(NamedTuple):
     """Results of experiment."""
     counts: list[dict[str, int]]
     """Counts of experiment."""
+    memory: list[np.ndarray]
+    """Per-shot memory of experiment as packed integer arrays,
+    which is only available when the job is executed with `memory=True`.
+    See :func:`qurry.qurrium.utils.construct.get_memory_and_exceptions` for the format.
+    It will be exported as `.npz` file in the folder `memory` instead of json."""
+    marginals: dict[tuple[int, ...], tuple[list[dict[str, int]], list[dict[str, int]]]]
+    """The cache of marginal counts by the sorted selected classical registers,
+    with each counts they come from. It will not be exported.
+    Use :meth:`marginal_counts` to get the marginal counts."""
 
     @staticmethod
     def default_value():
@@ -29,8 +42,63 @@ class After(NamedTuple):
         return {
             "result": [],
             "counts": [],
+            "memory": [],
+            "marginals": {},
         }
 
+    def marginal_counts(
+        self,
+        selected_classical_registers: Iterable[int],
+    ) -> list[dict[str, int]]:
+        """The counts marginalized to the selected classical registers with memoization.
+
+        The marginal counts are cached by the sorted selected classical registers,
+        and a new subsystem will be marginalized from the smallest cached subsystem
+        containing it instead of the full counts.
+        The cache entry of a counts is renewed when the counts is replaced or appended,
+        which is checked by the identity of the counts kept in the cache,
+        so a new counts can not be mistaken for a freed one with the same id.
+
+        Args:
+            selected_classical_registers (Iterable[int]):
+                The list of **the index of the selected_classical_registers**.
+
+        Returns:
+            list[dict[str, int]]: The marginal counts of each counts.
+        """
+        key = tuple(sorted(set(selected_classical_registers)))
+        sources = list(self.counts)
+        cached, cached_sources = self.marginals.get(key, ([], []))
+        valid = 0
+        for cached_source, source in zip(cached_sources, sources):
+            if cached_source is not source:
+                break
+            valid += 1
+        if valid == len(sources) == len(cached):
+            return cached
+
+        supersets = sorted(
+            (k for k in self.marginals if k != key and set(key).issubset(k)), key=len
+        )
+        renewed = cached[:valid]
+        for idx in range(valid, len(sources)):
+            for superset in supersets:
+                superset_marginals, superset_sources = self.marginals[superset]
+                if idx < len(superset_sources) and superset_sources[idx] is sources[idx]:
+                    renewed.append(
+                        single_counts_marginal(
+                            superset_marginals[idx],
+                            [superset.index(c_i) for c_i in key],
+                            len(superset),
+                        )
+                    )
+                    break
+            else:
+                renewed.append(single_counts_marginal(self.counts[idx], key))
+
+        self.marginals[key] = (renewed, sources)
+        return renewed
+
     @classmethod
     def read(
         cls,
@@ -59,6 +127,10 @@ class After(NamedTuple):
             if k not in legacy:
                 legacy[k] = dv
 
+        if "memory" in file_index and os.path.exists(save_location / file_index["memory"]):
+            with np.load(save_location / file_index["memory"]) as memory_file:
+                legacy["memory"] = [memory_file[f"arr_{i}"] for i in range(len(memory_file.files))]
+
         return cls(**legacy)
 
     def export(
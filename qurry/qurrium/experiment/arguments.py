@@ -21,6 +21,12 @@ from ...capsule import jsonablize
 
 REQUIRED_FOLDER = ["args", "advent", "legacy", "tales", "reports"]
 """The required folder for exporting experiment."""
+QPY_FOLDER = "qpy"
+"""The optional folder for exporting circuits as QPY files."""
+QASM_FOLDER = "qasm"
+"""The optional folder for the OpenQASM files shared by experiments with the same target."""
+MEMORY_FOLDER = "memory"
+"""The optional folder for exporting the per-shot memory as `.npz` files."""
 
 V5_TO_V7_FIELD = {
     "expName": "exp_name",
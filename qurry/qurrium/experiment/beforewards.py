@@ -10,10 +10,12 @@ import json
 from typing import Optional, NamedTuple, Any, Union
 from collections.abc import Hashable
 from pathlib import Path
+import numpy as np
 
 from qiskit import QuantumCircuit
 
 from ..utils.qasm import qasm_loads
+from ..utils.qpy import qpy_loads_from_file
 
 V5_TO_V7_FIELD = {
     "jobID": "job_id",
@@ -81,6 +83,11 @@ class Before(NamedTuple):
     ) -> "Before":
         """Read the exported experiment file.
 
+        If the QPY files are exported, the target circuits and the transpiled circuits
+        will be loaded from them in bulk instead of the strings in `advent`.
+        The OpenQASM strings of target circuits exported as shared files will be read back.
+        The side products exported as `.npy` files will be loaded as :class:`numpy.ndarray`.
+
         Args:
             file_index (dict[str, str]): The index of exported experiment file.
             save_location (Path): The location of exported experiment file.
@@ -107,8 +114,32 @@ class Before(NamedTuple):
         for filekey, filename in file_index.items():
             filekeydiv = filekey.split(".")
             if filekeydiv[0] == "tales":
+                if filename.endswith(".npy"):
+                    advent["side_product"][filekeydiv[1]] = np.load(save_location / filename)
+                    continue
                 with open(save_location / filename, "r", encoding=encoding) as f:
                     advent["side_product"][filekeydiv[1]] = json.load(f)
+            elif filekeydiv[0] == "qpy":
+                if not (save_location / filename).exists():
+                    continue
+                loaded_circuits = qpy_loads_from_file(save_location / filename)
+                if filekeydiv[1] == "circuit":
+                    advent["circuit"] = loaded_circuits
+                elif filekeydiv[1] == "target":
+                    target_keys = (
+                        [k for k, _ in advent["target"]]
+                        if len(advent["target"]) == len(loaded_circuits)
+                        else [k for k, _ in advent["target_qasm"]]
+                    )
+                    advent["target"] = list(zip(target_keys, loaded_circuits))
+
+        shared_qasm = {}
+        for i, (tk, qasm_str) in enumerate(advent["target_qasm"]):
+            if qasm_str.startswith("qasm.") and qasm_str in file_index:
+                if qasm_str not in shared_qasm:
+                    with open(save_location / file_index[qasm_str], "r", encoding=encoding) as f:
+                        shared_qasm[qasm_str] = f.read()
+                advent["target_qasm"][i] = (tk, shared_qasm[qasm_str])
 
         return cls(**advent)
 
@@ -16,12 +16,19 @@ from typing import Union, Optional, Any, Type, Literal
 from collections.abc import Hashable
 from pathlib import Path
 import tqdm
+import numpy as np
 
 from qiskit import transpile, QuantumCircuit
 from qiskit.providers import Backend, JobV1 as Job
 from qiskit.transpiler.passmanager import PassManager
 
-from .arguments import ArgumentsPrototype, Commonparams
+from .arguments import (
+    ArgumentsPrototype,
+    Commonparams,
+    QPY_FOLDER,
+    QASM_FOLDER,
+    MEMORY_FOLDER,
+)
 from .beforewards import Before
 from .afterwards import After
 from .analyses import AnalysesContainer
@@ -32,12 +39,17 @@ from .utils import (
     DEPRECATED_PROPERTIES,
     EXPERIMENT_UNEXPORTS,
 )
-from ..utils import get_counts_and_exceptions
-from ..utils.qasm import qasm_dumps
+from ..utils import (
+    get_counts_and_exceptions,
+    get_memory_and_exceptions,
+    TemplateBoundCircuits,
+)
+from ..utils.qasm import qasm_dumps_batch, qasm_content_hash
+from ..utils.transpile_cache import TranspileCache
 from ..utils.iocontrol import RJUST_LEN
 from ..utils.inputfixer import outfields_check, outfields_hint
 from ..analysis import AnalysisPrototype
-from ...tools import ParallelManager, DEFAULT_POOL_SIZE
+from ...tools import ParallelManager
 from ...tools.datetime import DatetimeDict
 from ...tools.progressbar import set_pbar_description
 from ...tools.backend import GeneralSimulator
@@ -163,6 +175,8 @@ class ExperimentPrototype(ABC):
             else After(
                 result=[],
                 counts=[],
+                memory=[],
+                marginals={},
             )
         )
         self.reports = reports if isinstance(reports, AnalysesContainer) else AnalysesContainer()
@@ -195,6 +209,9 @@ class ExperimentPrototype(ABC):
         """
         self.mute_auto_lock = False
         """Whether mute the auto-lock message."""
+        self.qasm_pending: Optional[Literal["qasm2", "qasm3"]] = None
+        """The OpenQASM version of the circuits waiting to be drawn by :meth:`dump_qasm`.
+        It's None when there is nothing to draw."""
 
     @classmethod
     @abstractmethod
@@ -369,7 +386,7 @@ class ExperimentPrototype(ABC):
         targets: list[tuple[Hashable, QuantumCircuit]],
         arguments: ArgumentsPrototype,
         pbar: Optional[tqdm.tqdm] = None,
-    ) -> tuple[list[QuantumCircuit], dict[str, Any]]:
+    ) -> tuple[Union[list[QuantumCircuit], TemplateBoundCircuits], dict[str, Any]]:
         """The method to construct circuit.
         Where should be overwritten by each construction of new measurement.
 
@@ -383,8 +400,11 @@ class ExperimentPrototype(ABC):
                 Defaults to None.
 
         Returns:
-            tuple[list[QuantumCircuit], dict[str, Any]]:
+            tuple[Union[list[QuantumCircuit], TemplateBoundCircuits], dict[str, Any]]:
                 The circuits of the experiment and the outfields.
+                If the circuits are :class:`TemplateBoundCircuits`,
+                only their templates will be transpiled and then bound
+                by :meth:`TemplateBoundCircuits.bind_transpiled`.
         """
         raise NotImplementedError("This method should be implemented.")
 
@@ -398,6 +418,7 @@ class ExperimentPrototype(ABC):
         run_args: Optional[Union[BaseRunArgs, dict[str, Any]]] = None,
         transpile_args: Optional[TranspileArgs] = None,
         passmanager_pair: Optional[tuple[str, PassManager]] = None,
+        transpile_cache: Optional[TranspileCache] = None,
         tags: Optional[tuple[str, ...]] = None,
         # multimanager
         default_analysis: Optional[list[dict[str, Any]]] = None,
@@ -405,8 +426,9 @@ class ExperimentPrototype(ABC):
         summoner_id: Optional[Hashable] = None,
         summoner_name: Optional[str] = None,
         # process tool
-        qasm_version: Literal["qasm2", "qasm3"] = "qasm3",
+        qasm_version: Optional[Literal["qasm2", "qasm3"]] = "qasm3",
         export: bool = False,
+        export_qpy: bool = False,
         save_location: Optional[Union[Path, str]] = None,
         mode: str = "w+",
         indent: int = 2,
@@ -435,6 +457,11 @@ class ExperimentPrototype(ABC):
                 Arguments for :func:`qiskit.transpile`. Defaults to `{}`.
             passmanager_pair (Optional[tuple[str, PassManager]], optional):
                 The passmanager pair for transpile. Defaults to None.
+            transpile_cache (Optional[TranspileCache], optional):
+                The cache of transpiled circuits on disk.
+                If it is given, the circuits transpiled before with the same backend,
+                transpile arguments and passmanager will be loaded from the cache.
+                Defaults to None.
             tags (Optional[tuple[str, ...]], optional):
                 Given the experiment multiple tags to make a dictionary for recongnizing it.
                 Defaults to None.
@@ -455,10 +482,18 @@ class ExperimentPrototype(ABC):
                 **!!ATTENTION, this should only be used by `Multimanager`!!**
                 _description_. Defaults to None.
 
-            qasm_version (Literal["qasm2", "qasm3"], optional):
+            qasm_version (Optional[Literal["qasm2", "qasm3"]], optional):
                 The export version of OpenQASM. Defaults to 'qasm3'.
+                The OpenQASM strings are drawn lazily by :meth:`dump_qasm`
+                when the experiment is exported or they are accessed at the first time
+                by :attr:`circuit_qasm`, :attr:`target_qasm` or `exp[key]`.
+                If it is None, the OpenQASM strings will not be generated,
+                then `export_qpy` should be used to keep the circuits in the export.
             export (bool, optional):
                 Whether to export the experiment. Defaults to False.
+            export_qpy (bool, optional):
+                Whether to export the target circuits and the transpiled circuits as QPY files.
+                Defaults to False.
             save_location (Optional[Union[Path, str]], optional):
                 The location to save the experiment. Defaults to None.
             mode (str, optional):
@@ -524,22 +559,9 @@ class ExperimentPrototype(ABC):
         current_exp.beforewards.side_product.update(side_prodict)
 
         # qasm
-        pool = ParallelManager()
-        set_pbar_description(pbar, "Exporting OpenQASM string...")
-
-        tmp_qasm = pool.starmap(qasm_dumps, [(q, qasm_version) for q in cirqs])
-        for qasm_str in tmp_qasm:
-            current_exp.beforewards.circuit_qasm.append(qasm_str)
-
-        targets_keys, targets_values = zip(*targets)
-        targets_keys: tuple[Hashable, ...]
-        targets_values: tuple[QuantumCircuit, ...]
-
-        tmp_target_qasm_items = zip(
-            targets_keys, pool.starmap(qasm_dumps, [(q, qasm_version) for q in targets_values])
-        )
-        for tk, qasm_str in tmp_target_qasm_items:
-            current_exp.beforewards.target_qasm.append((str(tk), qasm_str))
+        # The OpenQASM strings are deferred until export or the first access
+        # by `exp.circuit_qasm`, `exp.target_qasm` or `exp[key]`.
+        current_exp.qasm_pending = qasm_version
 
         # transpile
         if passmanager_pair is not None:
@@ -547,7 +569,10 @@ class ExperimentPrototype(ABC):
             set_pbar_description(
                 pbar, f"Circuit transpiling by passmanager '{passmanager_name}'..."
             )
-            transpiled_circs = passmanager.run(circuits=cirqs)  # type: ignore
+
+            def transpile_func(circs: list[QuantumCircuit]) -> list[QuantumCircuit]:
+                return passmanager.run(circuits=circs)  # type: ignore
+
             if len(current_exp.commons.transpile_args) > 0:
                 warnings.warn(
                     f"Passmanager '{passmanager_name}' is given, "
@@ -556,11 +581,30 @@ class ExperimentPrototype(ABC):
                 )
         else:
             set_pbar_description(pbar, "Circuit transpiling...")
-            transpiled_circs: list[QuantumCircuit] = transpile(
-                cirqs,
-                backend=current_exp.commons.backend,
-                **current_exp.commons.transpile_args,
-            )
+
+            def transpile_func(circs: list[QuantumCircuit]) -> list[QuantumCircuit]:
+                return transpile(
+                    circs,
+                    backend=current_exp.commons.backend,
+                    **current_exp.commons.transpile_args,
+                )
+
+        if transpile_cache is not None:
+            transpile_func_raw = transpile_func
+
+            def transpile_func(circs: list[QuantumCircuit]) -> list[QuantumCircuit]:
+                return transpile_cache.transpile(
+                    circs,
+                    transpile_func_raw,
+                    backend=current_exp.commons.backend,
+                    transpile_args=current_exp.commons.transpile_args,
+                    passmanager_pair=passmanager_pair,
+                )
+
+        if isinstance(cirqs, TemplateBoundCircuits):
+            transpiled_circs = cirqs.bind_transpiled(transpile_func)
+        else:
+            transpiled_circs = transpile_func(cirqs)
 
         set_pbar_description(pbar, "Circuit loading...")
         for _w in transpiled_circs:
@@ -580,6 +624,7 @@ class ExperimentPrototype(ABC):
                     indent=indent,
                     encoding=encoding,
                     jsonable=jsonable,
+                    export_qpy=export_qpy,
                 )
 
         return current_exp
@@ -682,6 +727,11 @@ class ExperimentPrototype(ABC):
         for _c in counts:
             self.afterwards.counts.append(_c)
 
+        memory, _ = get_memory_and_exceptions(result=self.afterwards.result[-1], num=num)
+        if any(len(_m) > 0 for _m in memory):
+            set_pbar_description(pbar, "Memory loading...")
+            self.afterwards.memory.extend(memory)
+
         if len(self.commons.default_analysis) > 0:
             for i, _analysis in enumerate(self.commons.default_analysis):
                 set_pbar_description(
@@ -710,6 +760,7 @@ class ExperimentPrototype(ABC):
         summoner_id: str,
         idx_circs: list[int],
         retrieve_times_name: str,
+        memory_tmp_container: Optional[dict[int, np.ndarray]] = None,
     ) -> list[dict[str, int]]:
         """Take the result from remote execution.
 
@@ -722,8 +773,10 @@ class ExperimentPrototype(ABC):
                 The index of circuits.
             retrieve_times_name (str):
                 The retrieve times name.
-            current (str):
-                The current time.
+            memory_tmp_container (Optional[dict[int, np.ndarray]], optional):
+                The per-shot memory temporary container,
+                the memory is only kept when it is recorded by the backend.
+                Defaults to None.
 
         Returns:
             list[dict[str, int]]: The counts.
@@ -732,6 +785,10 @@ class ExperimentPrototype(ABC):
         self.reset_counts(summoner_id=summoner_id)
         for idx in idx_circs:
             self.afterwards.counts.append(counts_tmp_container[idx])
+        if memory_tmp_container is not None:
+            memory = [memory_tmp_container[idx] for idx in idx_circs]
+            if any(len(_m) > 0 for _m in memory):
+                self.afterwards.memory.extend(memory)
         self.commons.datetimes.add_only(retrieve_times_name)
         return self.afterwards.counts
 
@@ -739,7 +796,7 @@ class ExperimentPrototype(ABC):
     def reset_counts(self, summoner_id: str) -> None:
         """Reset the counts of the experiment."""
         if summoner_id == self.commons.summoner_id:
-            self.afterwards = self.afterwards._replace(counts=[])
+            self.afterwards = self.afterwards._replace(counts=[], memory=[], marginals={})
             gc.collect()
         else:
             warnings.warn(
@@ -808,7 +865,49 @@ class ExperimentPrototype(ABC):
                 )
             self.mute_auto_lock = False
 
+    def dump_qasm(self, workers_num: Optional[int] = None) -> None:
+        """Draw the OpenQASM strings of the target circuits and the transpiled circuits,
+        which are deferred by :meth:`build` until they are needed.
+
+        Args:
+            workers_num (Optional[int], optional):
+                The number of workers for drawing the circuits. Defaults to None.
+        """
+        if self.qasm_pending is None:
+            return
+        qasm_version = self.qasm_pending
+        self.qasm_pending = None
+
+        if len(self.beforewards.circuit_qasm) == 0 and len(self.beforewards.circuit) > 0:
+            self.beforewards.circuit_qasm.extend(
+                qasm_dumps_batch(self.beforewards.circuit, qasm_version, workers_num)
+            )
+        if len(self.beforewards.target_qasm) == 0 and len(self.beforewards.target) > 0:
+            targets_keys, targets_values = zip(*self.beforewards.target)
+            self.beforewards.target_qasm.extend(
+                (str(tk), qasm_str)
+                for tk, qasm_str in zip(
+                    targets_keys, qasm_dumps_batch(list(targets_values), qasm_version, workers_num)
+                )
+            )
+
+    @property
+    def circuit_qasm(self) -> list[str]:
+        """The OpenQASM strings of the transpiled circuits,
+        which are drawn by :meth:`dump_qasm` on the first access."""
+        self.dump_qasm()
+        return self.beforewards.circuit_qasm
+
+    @property
+    def target_qasm(self) -> list[tuple[str, str]]:
+        """The OpenQASM strings of the target circuits,
+        which are drawn by :meth:`dump_qasm` on the first access."""
+        self.dump_qasm()
+        return self.beforewards.target_qasm
+
     def __getitem__(self, key) -> Any:
+        if key in ("circuit_qasm", "target_qasm"):
+            self.dump_qasm()
         if key in self.beforewards._fields:
             return getattr(self.beforewards, key)
         if key in self.afterwards._fields:
@@ -1019,6 +1118,8 @@ class ExperimentPrototype(ABC):
         self,
         save_location: Optional[Union[Path, str]] = None,
         export_transpiled_circuit: bool = False,
+        export_qpy: bool = False,
+        share_target_qasm: bool = False,
     ) -> Export:
         """Export the data of experiment.
 
@@ -1077,6 +1178,48 @@ class ExperimentPrototype(ABC):
         stored at :prop:`commonparams.`.
         At this senerio, the `exp_name` will never apply as filename.
 
+        When `export_qpy` is True, the target circuits and the transpiled circuits
+        will also be exported as QPY files in the folder `qpy` like:
+
+        ```python
+        files = {
+            ...
+            'qpy.target': './blabla_experiment/qpy/blabla_experiment.id={exp_id}.target.qpy',
+            'qpy.circuit': './blabla_experiment/qpy/blabla_experiment.id={exp_id}.circuit.qpy',
+        }
+        ```
+
+        When `share_target_qasm` is True, the OpenQASM strings of target circuits
+        will be exported in the folder `qasm` named by their content hash like:
+
+        ```python
+        files = {
+            ...
+            'qasm.{qasm_hash}': './blabla_experiment/qasm/{qasm_hash}.qasm',
+        }
+        ```
+
+        and the `target_qasm` in `advent` will record the file key `qasm.{qasm_hash}` instead.
+
+        When the per-shot memory is recorded, it will be exported in the folder `memory` like:
+
+        ```python
+        files = {
+            ...
+            'memory': './blabla_experiment/memory/blabla_experiment.id={exp_id}.memory.npz',
+        }
+        ```
+
+        The side products in :class:`numpy.ndarray` are exported as `.npy` files
+        in the folder `tales` instead of the JSON files like:
+
+        ```python
+        files = {
+            ...
+            'tales.dummyx1': './blabla_experiment/tales/blabla_experiment.id={exp_id}.dummyx1.npy',
+        }
+        ```
+
         - reports formats.
 
         ```
@@ -1114,6 +1257,23 @@ class ExperimentPrototype(ABC):
         }
         ```
 
+        Args:
+            save_location (Optional[Union[Path, str]], optional):
+                Where to save the export content as `json` file.
+                If `save_location == None`, then use the value in `self.commons` to be exported,
+                if it's None too, then raise error.
+                Defaults to `None`.
+            export_transpiled_circuit (bool, optional):
+                Whether to export the transpiled circuit as txt. Defaults to False.
+            export_qpy (bool, optional):
+                Whether to export the target circuits and the transpiled circuits as QPY files,
+                which will be loaded in bulk when reading the experiment. Defaults to False.
+            share_target_qasm (bool, optional):
+                Whether to export the OpenQASM strings of target circuits
+                as the files named by their content hash in the folder `qasm`,
+                which can be shared by the experiments with the same target circuits.
+                Defaults to False.
+
         Returns:
             Export: A namedtuple containing the data of experiment
                 which can be more easily to export as json file.
@@ -1132,6 +1292,7 @@ class ExperimentPrototype(ABC):
         if self.commons.save_location != save_location:
             self.commons = self.commons._replace(save_location=save_location)
 
+        self.dump_qasm()
         adventures, tales = self.beforewards.export(
             unexports=EXPERIMENT_UNEXPORTS,
             export_transpiled_circuit=export_transpiled_circuit,
@@ -1180,12 +1341,43 @@ class ExperimentPrototype(ABC):
             "advent": folder + f"advent/{filename}.advent.json",
             "legacy": folder + f"legacy/{filename}.legacy.json",
         }
+        tales_arrays = {k: v for k, v in tales.items() if isinstance(v, np.ndarray)}
+        tales = {k: v for k, v in tales.items() if k not in tales_arrays}
         for k in tales:
             files[f"tales.{k}"] = folder + f"tales/{filename}.{k}.json"
+        for k in tales_arrays:
+            files[f"tales.{k}"] = folder + f"tales/{filename}.{k}.npy"
         files["reports"] = folder + f"reports/{filename}.reports.json"
         for k in tales_reports:
             files[f"reports.tales.{k}"] = folder + f"tales/{filename}.{k}.reports.json"
 
+        qpy_circuits = None
+        if export_qpy:
+            qpy_circuits = {
+                "target": [
+                    circ for _, circ in self.beforewards.target if isinstance(circ, QuantumCircuit)
+                ],
+                "circuit": self.beforewards.circuit,
+            }
+            for k in qpy_circuits:
+                files[f"qpy.{k}"] = folder + f"{QPY_FOLDER}/{filename}.{k}.qpy"
+
+        qasm_blobs = None
+        if share_target_qasm and "target_qasm" in adventures:
+            qasm_blobs = {}
+            shared_target_qasm = []
+            for tk, qasm_str in adventures["target_qasm"]:
+                qasm_hash = qasm_content_hash(qasm_str)
+                qasm_blobs[f"qasm.{qasm_hash}"] = qasm_str
+                files[f"qasm.{qasm_hash}"] = folder + f"{QASM_FOLDER}/{qasm_hash}.qasm"
+                shared_target_qasm.append((tk, f"qasm.{qasm_hash}"))
+            adventures["target_qasm"] = shared_target_qasm
+
+        memory = None
+        if len(self.afterwards.memory) > 0:
+            memory = self.afterwards.memory
+            files["memory"] = folder + f"{MEMORY_FOLDER}/{filename}.memory.npz"
+
         return Export(
             exp_id=str(self.commons.exp_id),
             exp_name=str(self.beforewards.exp_name),
@@ -1202,6 +1394,10 @@ class ExperimentPrototype(ABC):
             tales=jsonablize(tales),
             reports=reports,
             tales_reports=tales_reports,
+            qpy_circuits=qpy_circuits,
+            qasm_blobs=qasm_blobs,
+            memory=memory,
+            tales_arrays=tales_arrays if len(tales_arrays) > 0 else None,
         )
 
     def write(
@@ -1212,6 +1408,8 @@ class ExperimentPrototype(ABC):
         encoding: str = "utf-8",
         jsonable: bool = False,
         export_transpiled_circuit: bool = False,
+        export_qpy: bool = False,
+        share_target_qasm: bool = False,
         _pbar: Optional[tqdm.tqdm] = None,
         _qurryinfo_hold_access: Optional[str] = None,
     ) -> tuple[str, dict[str, str]]:
@@ -1260,6 +1458,14 @@ class ExperimentPrototype(ABC):
                 for :func:`mori.quickJSON`. Defaults to False.
             mute (bool, optional):
                 Whether to mute the output, for :func:`mori.quickJSON`. Defaults to False.
+            export_transpiled_circuit (bool, optional):
+                Whether to export the transpiled circuit as txt. Defaults to False.
+            export_qpy (bool, optional):
+                Whether to export the target circuits and the transpiled circuits as QPY files.
+                Defaults to False.
+            share_target_qasm (bool, optional):
+                Whether to export the OpenQASM strings of target circuits as shared files
+                named by their content hash. Defaults to False.
             _qurryinfo_hold_access (str, optional):
                 Whether to hold the I/O of `qurryinfo`, then export by :cls:`multimanager`,
                 it should be control by :cls:`multimanager`.
@@ -1274,6 +1480,8 @@ class ExperimentPrototype(ABC):
         export_material = self.export(
             save_location=save_location,
             export_transpiled_circuit=export_transpiled_circuit,
+            export_qpy=export_qpy,
+            share_target_qasm=share_target_qasm,
         )
         exp_id, files = export_material.write(
             mode=mode,
@@ -1463,8 +1671,6 @@ class ExperimentPrototype(ABC):
             qurryinfo_found: dict[str, dict[str, str]] = json.load(f)
             qurryinfo = {**qurryinfo_found, **qurryinfo}
 
-        if workers_num is None:
-            workers_num = DEFAULT_POOL_SIZE
         pool = ParallelManager(workers_num)
 
         quene = pool.process_map(
@@ -1473,7 +1679,7 @@ class ExperimentPrototype(ABC):
                 (exp_id, file_index, save_location, encoding)
                 for exp_id, file_index in qurryinfo.items()
             ],
-            desc=f"{len(qurryinfo)} experiments found, loading by {workers_num} workers.",
+            desc=f"{len(qurryinfo)} experiments found, loading by {pool.workers_num} workers.",
         )
 
         return quene
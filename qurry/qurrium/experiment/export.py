@@ -14,7 +14,11 @@ import warnings
 import gc
 import tqdm
 
-from .arguments import CommonparamsDict, REQUIRED_FOLDER
+import numpy as np
+from qiskit import QuantumCircuit
+
+from .arguments import CommonparamsDict, REQUIRED_FOLDER, QPY_FOLDER, QASM_FOLDER, MEMORY_FOLDER
+from ..utils.qpy import qpy_dumps_to_file
 from ...tools import ParallelManager
 from ...capsule import quickJSON
 
@@ -126,6 +130,18 @@ class Export(NamedTuple):
     """Recording the data of 'side_product' in 'reports' for API, 
     which will be packed into `.*.reprts.json`. 
     ~Tales of braves circulate~"""
+    qpy_circuits: Optional[dict[str, list[QuantumCircuit]]] = None
+    """The circuits will be packed into `.*.qpy` in the folder `qpy` if it's not None,
+    the keys are `target` for target circuits and `circuit` for transpiled circuits."""
+    qasm_blobs: Optional[dict[str, str]] = None
+    """The OpenQASM strings shared by experiments, the keys are the file keys in `files`.
+    They will be packed into `.qasm` in the folder `qasm` if the file does not exist."""
+    memory: Optional[list[np.ndarray]] = None
+    """The per-shot memory of each circuit,
+    which will be packed into `.memory.npz` in the folder `memory` if it's not None."""
+    tales_arrays: Optional[dict[str, np.ndarray]] = None
+    """The side products in :class:`numpy.ndarray` from 'beforewards',
+    which will be packed into `.npy` in the folder `tales` if it's not None."""
 
     def write(
         self,
@@ -297,6 +313,41 @@ class Export(NamedTuple):
                     mute=mute,
                 )
 
+        if self.qpy_circuits is not None:
+            if not os.path.exists(folder / QPY_FOLDER):
+                os.mkdir(folder / QPY_FOLDER)
+            for qk, qv in self.qpy_circuits.items():
+                qpy_dumps_to_file(
+                    qv,
+                    Path(self.commons["save_location"]) / self.files[f"qpy.{qk}"],  # type: ignore
+                )
+
+        if self.qasm_blobs is not None:
+            if not os.path.exists(folder / QASM_FOLDER):
+                os.mkdir(folder / QASM_FOLDER)
+            for qk, qv in self.qasm_blobs.items():
+                qasm_file = Path(self.commons["save_location"]) / self.files[qk]  # type: ignore
+                if os.path.exists(qasm_file):
+                    continue
+                with open(qasm_file, "w", encoding=encoding) as f:
+                    f.write(qv)
+
+        if self.memory is not None:
+            if not os.path.exists(folder / MEMORY_FOLDER):
+                os.mkdir(folder / MEMORY_FOLDER)
+            np.savez_compressed(
+                Path(self.commons["save_location"]) / self.files["memory"],  # type: ignore
+                *self.memory,
+            )
+
+        if self.tales_arrays is not None:
+            for tk, tv in self.tales_arrays.items():
+                np.save(
+                    Path(self.commons["save_location"]) / self.files[f"tales.{tk}"],  # type: ignore
+                    tv,
+                    allow_pickle=False,
+                )
+
         del export_set
         gc.collect()
         return self.exp_id, self.files
@@ -15,7 +15,7 @@ from ...tools.datetime import current_time, DatetimeDict
 from ...exceptions import QurryHashIDInvalid
 
 
-EXPERIMENT_UNEXPORTS = ["side_product", "result", "circuits"]
+EXPERIMENT_UNEXPORTS = ["side_product", "result", "circuits", "memory", "marginals"]
 """Unexports properties."""
 DEPRECATED_PROPERTIES = ["figTranspiled", "fig_original"]
 """Deprecated properties.
@@ -25,6 +25,7 @@ from .process import multiprocess_exporter_and_writer, datetimedict_process
 from ..experiment import ExperimentPrototype
 from ..container import ExperimentContainer, QuantityContainer, _ExpInst
 from ..utils.iocontrol import naming, RJUST_LEN, IOComplex
+from ..utils.transpile_cache import TranspileCache
 from ...tools import qurry_progressbar
 from ...tools.backend import GeneralSimulator
 from ...tools.datetime import DatetimeDict
@@ -293,6 +294,7 @@ class MultiManager:
         pending_strategy: PendingStrategyLiteral = "tags",
         # save parameters
         save_location: Union[Path, str] = Path("./"),
+        transpile_cache: Optional[TranspileCache] = None,
     ) -> tuple[ExperimentContainer[_ExpInst], "MultiManager"]:
         """Build the multi-experiment.
 
@@ -312,6 +314,9 @@ class MultiManager:
                 The pending strategy of experiments. Defaults to "tags".
             save_location (Union[Path, str], optional):
                 Location of saving experiment. Defaults to Path("./").
+            transpile_cache (Optional[TranspileCache], optional):
+                The cache of transpiled circuits on disk shared by all experiments.
+                Defaults to None.
 
         Returns:
             tuple[ExperimentContainer[_ExpInst], MultiManager]:
@@ -398,6 +403,7 @@ class MultiManager:
             config.pop("pbar", None)
             new_exps = experiment_instance.build(
                 **config,
+                transpile_cache=transpile_cache,
                 export=False,  # export later for it's not efficient for one by one
                 pbar=initial_config_list_progress,
             )
@@ -645,6 +651,7 @@ class MultiManager:
         indent: int = 2,
         encoding: str = "utf-8",
         export_transpiled_circuit: bool = False,
+        export_qpy: bool = False,
         _only_quantity: bool = False,
     ) -> dict[str, Any]:
         """Export the multi-experiment.
@@ -658,6 +665,9 @@ class MultiManager:
             encoding (str, optional): The encoding of json file. Defaults to "utf-8".
             export_transpiled_circuit (bool, optional):
                 Export the transpiled circuit. Defaults to False.
+            export_qpy (bool, optional):
+                Export the target circuits and the transpiled circuits as QPY files.
+                Defaults to False.
             _only_quantity (bool, optional): Whether only export quantity. Defaults to False.
 
         Returns:
@@ -671,6 +681,10 @@ class MultiManager:
             self.update_save_location(save_location=save_location, without_serial=True)
 
         self.gitignore.ignore("*.json")
+        self.gitignore.ignore("*.qasm")
+        self.gitignore.ignore("*.npz")
+        if export_qpy:
+            self.gitignore.ignore("*.qpy")
         self.gitignore.sync("qurryinfo.json")
         if not os.path.exists(save_location):
             os.makedirs(save_location)
@@ -775,6 +789,8 @@ class MultiManager:
                     jsonable=True,
                     mute=True,
                     export_transpiled_circuit=export_transpiled_circuit,
+                    export_qpy=export_qpy,
+                    share_target_qasm=True,
                     _pbar=None,
                 )
                 assert id_exec == tmp_id, "ID is not consistent."
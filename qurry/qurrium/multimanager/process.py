@@ -113,6 +113,8 @@ def multiprocess_exporter_and_writer(
     jsonable: bool = False,
     mute: bool = True,
     export_transpiled_circuit: bool = False,
+    export_qpy: bool = False,
+    share_target_qasm: bool = False,
     _pbar: Optional[tqdm.tqdm] = None,
 ) -> tuple[str, dict[str, str]]:
     """Multiprocess exporter and writer for experiment.
@@ -128,6 +130,12 @@ def multiprocess_exporter_and_writer(
         mute (bool, optional): The mute of writing. Defaults to True.
         export_transpiled_circuit (bool, optional):
             Export the transpiled circuit. Defaults to False.
+        export_qpy (bool, optional):
+            Export the target circuits and the transpiled circuits as QPY files.
+            Defaults to False.
+        share_target_qasm (bool, optional):
+            Export the OpenQASM of target circuits as shared files named by content hash.
+            Defaults to False.
         _pbar (Optional[tqdm.tqdm], optional): The progress bar. Defaults to None.
 
     Returns:
@@ -136,6 +144,8 @@ def multiprocess_exporter_and_writer(
     exps_export = exps.export(
         save_location=save_location,
         export_transpiled_circuit=export_transpiled_circuit,
+        export_qpy=export_qpy,
+        share_target_qasm=share_target_qasm,
     )
     qurryinfo_exp_id, qurryinfo_files = exps_export.write(
         mode=mode,
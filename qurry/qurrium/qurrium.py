@@ -19,6 +19,7 @@ from qiskit.transpiler.passmanager import PassManager
 
 from .runner import RemoteAccessor, retrieve_counter
 from .utils import passmanager_processor
+from .utils.transpile_cache import TranspileCache
 from .experiment import ExperimentPrototype
 from .container import (
     WaveContainer,
@@ -118,6 +119,11 @@ class QurriumPrototype(ABC):
         self.passmanagers: PassManagerContainer = PassManagerContainer()
         """The collection of pass managers."""
 
+        self.transpile_cache: Optional[TranspileCache] = None
+        """The cache of transpiled circuits on disk.
+        It will be None if no cache is used, then all circuits will be transpiled.
+        """
+
     def build(
         self,
         circuits: list[Union[QuantumCircuit, Hashable]],
@@ -199,6 +205,7 @@ class QurriumPrototype(ABC):
             run_args=run_args,
             transpile_args=transpile_args,
             passmanager_pair=passmanager_pair,
+            transpile_cache=self.transpile_cache,
             tags=tags,
             # process tool
             qasm_version=qasm_version,
@@ -424,6 +431,7 @@ class QurriumPrototype(ABC):
             jobstype=jobstype,
             pending_strategy=pending_strategy,
             save_location=save_location,
+            transpile_cache=self.transpile_cache,
         )
         self.multimanagers[current_multimanager.summoner_id] = current_multimanager
         self.exps.update(tmp_exps_container)
@@ -695,6 +703,7 @@ class QurriumPrototype(ABC):
         remain_only_compressed: bool = False,
         only_quantity: bool = False,
         export_transpiled_circuit: bool = False,
+        export_qpy: bool = False,
     ) -> str:
         """Write the multimanager to the file.
 
@@ -719,6 +728,9 @@ class QurriumPrototype(ABC):
             export_transpiled_circuit (bool, optional):
                 Whether to export the transpiled circuit.
                 Defaults to False.
+            export_qpy (bool, optional):
+                Whether to export the target circuits and the transpiled circuits as QPY files.
+                Defaults to False.
 
         Raises:
             ValueError: summoner_id not in multimanagers.
@@ -744,6 +756,7 @@ class QurriumPrototype(ABC):
             save_location=save_location,
             exps_container=tmp_exps_container,
             export_transpiled_circuit=export_transpiled_circuit,
+            export_qpy=export_qpy,
             _only_quantity=only_quantity,
         )
 
@@ -9,6 +9,7 @@ Runner for qiskit-ibm-provider
 import warnings
 from typing import Union, Optional
 from collections.abc import Hashable
+import numpy as np
 from qiskit import QuantumCircuit
 
 from .utils import retrieve_exceptions_loader
@@ -68,7 +69,7 @@ from ..multimanager import MultiManager
 from ..multimanager.beforewards import TagListKeyable
 from ..multimanager.arguments import PendingStrategyLiteral
 from ..container import ExperimentContainer
-from ..utils import get_counts_and_exceptions
+from ..utils import get_counts_and_exceptions, get_memory_and_exceptions
 from ...tools import qurry_progressbar, current_time
 
 
@@ -230,6 +231,7 @@ class IBMProviderRunner(Runner):
 
         pending_map: dict[Hashable, Union[IBMCircuitJob, "IBMJob", None]] = {}
         counts_tmp_container: dict[int, dict[str, int]] = {}
+        memory_tmp_container: dict[int, np.ndarray] = {}
 
         retrieve_times = retrieve_counter(self.current_multimanager.multicommons.datetimes)
         retrieve_times_name = retrieve_times_namer(retrieve_times + 1)
@@ -321,12 +323,18 @@ class IBMProviderRunner(Runner):
                     "type": "retrieve",
                 }
                 try:
+                    result = tmp_pending_map.result()
                     counts, exceptions = get_counts_and_exceptions(
-                        result=tmp_pending_map.result(),
+                        result=result,
+                        result_idx_list=[rk - pcircs[0] for rk in pcircs],
+                    )
+                    memory, _ = get_memory_and_exceptions(
+                        result=result,
                         result_idx_list=[rk - pcircs[0] for rk in pcircs],
                     )
                 except IBMError as e:
                     counts, exceptions = [{} for _ in pcircs], {tmp_pending_map.job_id(): e}
+                    memory = [np.zeros((0,), dtype=np.uint64) for _ in pcircs]
             else:
                 pendingpool_progressbar.set_description_str(
                     f"{pending_tags} failed - No available tags", refresh=True
@@ -334,6 +342,7 @@ class IBMProviderRunner(Runner):
                 counts, exceptions = get_counts_and_exceptions(
                     result=None, result_idx_list=[rk - pcircs[0] for rk in pcircs]
                 )
+                memory = [np.zeros((0,), dtype=np.uint64) for _ in pcircs]
                 pendingpool_progressbar.set_description_str(
                     f"{pending_tags} failed - No available tags - {len(counts)}",
                     refresh=True,
@@ -344,6 +353,7 @@ class IBMProviderRunner(Runner):
             )
             for rk in pcircs:
                 counts_tmp_container[rk] = counts[rk - pcircs[0]]
+                memory_tmp_container[rk] = memory[rk - pcircs[0]]
                 pendingpool_progressbar.set_description_str(
                     f"{pending_tags} - Packing: {rk} with len {len(counts[rk - pcircs[0]])}",
                     refresh=True,
@@ -355,6 +365,7 @@ class IBMProviderRunner(Runner):
             experiment_container=self.experiment_container,
             counts_tmp_container=counts_tmp_container,
             retrieve_times_name=retrieve_times_name,
+            memory_tmp_container=memory_tmp_container,
         )
 
         return self.current_multimanager.beforewards.job_id
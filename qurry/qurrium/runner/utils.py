@@ -7,8 +7,9 @@ Runner Utils
 """
 
 import warnings
-from typing import Union, Literal, Any, overload
+from typing import Union, Literal, Any, Optional, overload
 from collections.abc import Iterable, Hashable
+import numpy as np
 from qiskit import QuantumCircuit
 
 from ..multimanager import MultiManager
@@ -206,6 +207,7 @@ def circuits_map_distributer(
     experiment_container: ExperimentContainer[ExperimentPrototype],
     counts_tmp_container: dict[int, dict[str, int]],
     retrieve_times_name: str,
+    memory_tmp_container: Optional[dict[int, np.ndarray]] = None,
 ):
     """Distribute the circuits map.
 
@@ -214,7 +216,8 @@ def circuits_map_distributer(
         experiment_container (ExperimentContainer): The experiment container.
         counts_tmp_container (dict[int, dict[str, int]]): The counts temporary container.
         retrieve_times_name (str): The retrieve times name.
-        current (str): The current time.
+        memory_tmp_container (Optional[dict[int, np.ndarray]], optional):
+            The per-shot memory temporary container. Defaults to None.
     """
     distributing_progressbar = qurry_progressbar(
         current_multimanager.beforewards.circuits_map.items(),
@@ -224,13 +227,15 @@ def circuits_map_distributer(
         distributing_progressbar.set_description_str(
             f"{current_id} with {len(idx_circs)} circuits", refresh=True
         )
-        experiment_container[current_id].reset_counts(summoner_id=current_multimanager.summoner_id)
-        for idx in idx_circs:
-            experiment_container[current_id].afterwards.counts.append(counts_tmp_container[idx])
-        experiment_container[current_id].commons.datetimes.add_only(retrieve_times_name)
         current_multimanager.afterwards.allCounts[current_id] = experiment_container[
             current_id
-        ].afterwards.counts
+        ]._remote_result_taking(  # pylint: disable=protected-access
+            counts_tmp_container=counts_tmp_container,
+            summoner_id=current_multimanager.summoner_id,
+            idx_circs=idx_circs,
+            retrieve_times_name=retrieve_times_name,
+            memory_tmp_container=memory_tmp_container,
+        )
 
 
 def retrieve_exceptions_loader(
@@ -5,8 +5,15 @@ Utility functions for qurry
 ================================================================
 """
 
-from .construct import decomposer, get_counts_and_exceptions
-from .qasm import qasm_dumps, qasm_version_detect, qasm_loads
+from .construct import (
+    decomposer,
+    get_counts_and_exceptions,
+    get_int_counts_and_exceptions,
+    get_memory_and_exceptions,
+    memory_to_counts,
+)
+from .qasm import qasm_dumps, qasm_dumps_batch, qasm_content_hash, qasm_version_detect, qasm_loads
+from .qpy import qpy_dumps_to_file, qpy_loads_from_file
 from .inputfixer import damerau_levenshtein_distance, outfields_check
 from .iocontrol import (
     naming,
@@ -14,4 +21,4 @@ from .iocontrol import (
     FULL_SUFFIX_OF_COMPRESS_FORMAT,
     STAND_COMPRESS_FORMAT,
 )
-from .build import passmanager_processor
+from .build import passmanager_processor, TemplateBoundCircuits
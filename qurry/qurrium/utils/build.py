@@ -5,7 +5,10 @@ Build Tools
 ===========================================================
 """
 
-from typing import Union, Optional
+from typing import Union, Optional, Callable
+from collections.abc import Sequence
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
 from qiskit.transpiler.passmanager import PassManager
 
 
@@ -43,3 +46,132 @@ def passmanager_processor(
     else:
         raise ValueError(f"Invalid passmanager: {passmanager}")
     return passmanager_pair
+
+
+class TemplateBoundCircuits:
+    """The circuits which are bound from a few parameterized templates.
+
+    It keeps the templates and the parameter values of each circuit,
+    and can be returned by :meth:`ExperimentPrototype.method` instead of the list of circuits.
+    Then the experiment transpiles each template only once
+    and binds the parameters after transpiling by :meth:`bind_transpiled`.
+    The circuits before transpiling are only bound when :meth:`circuits` is called.
+    """
+
+    templates: list[QuantumCircuit]
+    """The parameterized templates."""
+    template_parameters: list[list[Parameter]]
+    """The parameters of each template in the order of the values."""
+    bindings: list[tuple[int, Sequence[float]]]
+    """The index of template and the parameter values for each circuit."""
+    names: Optional[list[str]]
+    """The names of each circuit."""
+
+    def __init__(
+        self,
+        templates: list[QuantumCircuit],
+        template_parameters: list[list[Parameter]],
+        bindings: list[tuple[int, Sequence[float]]],
+        names: Optional[list[str]] = None,
+    ):
+        """Keep the templates and the parameter values for each circuit.
+
+        Args:
+            templates (list[QuantumCircuit]): The parameterized templates.
+            template_parameters (list[list[Parameter]]):
+                The parameters of each template in the order of the values.
+            bindings (list[tuple[int, Sequence[float]]]):
+                The index of template and the parameter values for each circuit.
+            names (Optional[list[str]], optional):
+                The names of each circuit. Defaults to None.
+        """
+        if len(templates) != len(template_parameters):
+            raise ValueError(
+                "The number of templates and template_parameters should be the same, "
+                + f"but got {len(templates)} and {len(template_parameters)}."
+            )
+        if names is not None and len(names) != len(bindings):
+            raise ValueError(
+                "The number of names and bindings should be the same, "
+                + f"but got {len(names)} and {len(bindings)}."
+            )
+        self.templates = templates
+        self.template_parameters = template_parameters
+        self.bindings = bindings
+        self.names = names
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}(templates_num={len(self.templates)}, "
+            + f"circuits_num={len(self.bindings)})>"
+        )
+
+    def _bind(self, templates: list[QuantumCircuit]) -> list[QuantumCircuit]:
+        """Bind the parameter values into the given templates.
+
+        Args:
+            templates (list[QuantumCircuit]):
+                The templates or the transpiled templates in the same order.
+
+        Raises:
+            ValueError: If a template lacks any of its template parameters.
+
+        Returns:
+            list[QuantumCircuit]: The bound circuits.
+        """
+        # The parameters are matched by name,
+        # since the templates may be loaded from somewhere else like transpile cache.
+        parameters_by_name = [{p.name: p for p in template.parameters} for template in templates]
+        for template_idx, current_parameters in enumerate(parameters_by_name):
+            missing = [
+                p.name
+                for p in self.template_parameters[template_idx]
+                if p.name not in current_parameters
+            ]
+            if len(missing) > 0:
+                raise ValueError(
+                    f"The template {template_idx} '{templates[template_idx].name}' "
+                    + f"lacks the parameters {missing}, "
+                    + "which may be optimized out by transpiling or missing in the cache."
+                )
+
+        bound_circuits = []
+        for idx, (template_idx, values) in enumerate(self.bindings):
+            current_parameters = parameters_by_name[template_idx]
+            bound = templates[template_idx].assign_parameters(
+                {
+                    current_parameters[p.name]: v
+                    for p, v in zip(self.template_parameters[template_idx], values)
+                },
+                inplace=False,
+            )
+            if self.names is not None:
+                bound.name = self.names[idx]
+            bound_circuits.append(bound)
+        return bound_circuits
+
+    def circuits(self) -> list[QuantumCircuit]:
+        """Bind the parameters into the templates for each circuit before transpiling.
+
+        Returns:
+            list[QuantumCircuit]: The bound circuits.
+        """
+        return self._bind(self.templates)
+
+    def bind_transpiled(
+        self,
+        transpile_func: Callable[[list[QuantumCircuit]], list[QuantumCircuit]],
+    ) -> list[QuantumCircuit]:
+        """Transpile the templates only once, then bind the parameters for each circuit.
+
+        Args:
+            transpile_func (Callable[[list[QuantumCircuit]], list[QuantumCircuit]]):
+                The function to transpile a list of circuits.
+
+        Returns:
+            list[QuantumCircuit]: The transpiled circuits.
+        """
+        transpiled_templates = transpile_func(self.templates)
+        if isinstance(transpiled_templates, QuantumCircuit):
+            transpiled_templates = [transpiled_templates]
+        return self._bind(transpiled_templates)
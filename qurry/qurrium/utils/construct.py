@@ -6,8 +6,9 @@ Construct (:mod:`qurry.qurrium.utils.construct`)
 """
 
 import warnings
-from typing import Union, Optional
+from typing import Union, Optional, Any
 
+import numpy as np
 from qiskit import QuantumCircuit
 from qiskit.result import Result
 from qiskit.exceptions import QiskitError
@@ -33,6 +34,197 @@ def decomposer(
     return qc.decompose(reps=reps)
 
 
+def _raw_hex_counts(result: Result, idx: int) -> tuple[dict[str, int], Any]:
+    """Read the counts of one experiment in the result with hexadecimal keys
+    directly from its raw data, skipping the bitstring formatting of :meth:`Result.get_counts`.
+
+    Args:
+        result (Result): The result of job.
+        idx (int): The index of experiment.
+
+    Raises:
+        QiskitError: If the experiment is not found, not successful, or has no counts.
+        ValueError: If the keys of counts are not hexadecimal.
+
+    Returns:
+        tuple[dict[str, int], Any]: The counts with hexadecimal keys and the experiment header.
+    """
+    try:
+        exp = result.results[idx]
+    except IndexError as err:
+        raise QiskitError(f'Result for experiment "{idx}" could not be found.') from err
+    if not getattr(exp, "success", False):
+        raise QiskitError(
+            getattr(result, "status", "Result was not successful"),
+            ", ",
+            getattr(exp, "status", "Experiment was not successful"),
+        )
+
+    raw_counts = getattr(exp.data, "counts", None)
+    if raw_counts is None:
+        raw_memory = getattr(exp.data, "memory", None)
+        if raw_memory is None or len(raw_memory) == 0 or not isinstance(raw_memory[0], str):
+            raise QiskitError(f'No counts for experiment "{repr(idx)}"')
+        outcomes, freqs = np.unique(raw_memory, return_counts=True)
+        raw_counts = dict(zip(outcomes.tolist(), freqs.tolist()))
+    if len(raw_counts) > 0 and not str(next(iter(raw_counts))).startswith("0x"):
+        raise ValueError(f"The counts of experiment {idx} are not in hexadecimal.")
+
+    return raw_counts, getattr(exp, "header", None)
+
+
+def _int_keys_to_bitstrings(
+    int_keys: list[int],
+    memory_slots: Optional[int],
+    creg_sizes: Optional[list[list[Union[str, int]]]],
+) -> list[str]:
+    """Format the integer keys as bitstrings separated by classical registers in one batch,
+    which is the same format as :meth:`Result.get_counts`.
+
+    Args:
+        int_keys (list[int]): The integer keys.
+        memory_slots (Optional[int]): The number of memory slots.
+        creg_sizes (Optional[list[list[Union[str, int]]]]): The name and size of registers.
+
+    Returns:
+        list[str]: The bitstrings.
+    """
+    if not memory_slots:
+        return [bin(k)[2:] for k in int_keys]
+    width = max(memory_slots, max(int_keys).bit_length())
+    if width > 63:
+        bitstrings = [format(k, f"0{width}b") for k in int_keys]
+        if creg_sizes:
+            bounds = np.cumsum([0] + [int(size) for _, size in reversed(creg_sizes)])
+            bitstrings = [
+                " ".join(b[start:end] for start, end in zip(bounds[:-1], bounds[1:]))
+                for b in bitstrings
+            ]
+        return bitstrings
+
+    shifts = np.arange(width - 1, -1, -1, dtype=np.uint64)
+    bits = (np.array(int_keys, dtype=np.uint64)[:, None] >> shifts) & np.uint64(1)
+    chars = bits.astype(np.uint8) + np.uint8(ord("0"))
+    if creg_sizes:
+        positions = np.cumsum([int(size) for _, size in reversed(creg_sizes)])[:-1]
+        chars = np.insert(chars, positions[positions < width], np.uint8(ord(" ")), axis=1)
+    return np.ascontiguousarray(chars).view(f"S{chars.shape[1]}")[:, 0].astype(str).tolist()
+
+
+def _bulk_counts_and_exceptions(
+    result: Result,
+    idx_list: list[int],
+    int_keys: bool = False,
+) -> tuple[list[dict], dict[str, Exception]]:
+    """Extract the counts of the given indexes from the raw data of result in one pass.
+
+    Args:
+        result (Result): The result of job.
+        idx_list (list[int]): The index of counts wanted to be extracted.
+        int_keys (bool, optional):
+            Whether to keep the keys as integers instead of bitstrings. Defaults to False.
+
+    Returns:
+        tuple[list[dict], dict[str, Exception]]: Counts and exceptions.
+    """
+    counts: list[dict] = []
+    exceptions: dict[str, Exception] = {}
+    # The counts waiting to be formatted, grouped by the header for formatting in one batch.
+    pending: dict[tuple[Any, ...], list[tuple[int, dict[str, int]]]] = {}
+    for i in idx_list:
+        try:
+            hex_counts, header = _raw_hex_counts(result, i)
+        except ValueError:
+            # The keys are not hexadecimal, leave it to qiskit.
+            try:
+                all_meas = result.get_counts(i)
+                assert isinstance(all_meas, dict), "The counts is not a dict."
+                counts.append(
+                    {int(k.replace(" ", ""), 2): v for k, v in all_meas.items()}
+                    if int_keys
+                    else all_meas
+                )
+            except QiskitError as err_2:
+                exceptions[f"{result.job_id}.{i}"] = err_2
+                counts.append({})
+            continue
+        except QiskitError as err_2:
+            exceptions[f"{result.job_id}.{i}"] = err_2
+            counts.append({})
+            continue
+
+        counts.append({})
+        if len(hex_counts) > 0:
+            creg_sizes = getattr(header, "creg_sizes", None)
+            header_key = (
+                (None, None)
+                if int_keys
+                else (
+                    getattr(header, "memory_slots", None),
+                    None if creg_sizes is None else tuple((str(n), int(s)) for n, s in creg_sizes),
+                )
+            )
+            pending.setdefault(header_key, []).append((len(counts) - 1, hex_counts))
+
+    for (memory_slots, creg_sizes), group in pending.items():
+        # The outcomes repeat across experiments, so each of them is only converted once.
+        unique_hex = list(set().union(*(hex_counts for _, hex_counts in group)))
+        unique_int = [int(k, 16) for k in unique_hex]
+        translation: dict[str, Union[int, str]] = dict(
+            zip(
+                unique_hex,
+                (
+                    unique_int
+                    if int_keys
+                    else _int_keys_to_bitstrings(
+                        unique_int,
+                        memory_slots,
+                        None if creg_sizes is None else [list(c) for c in creg_sizes],
+                    )
+                ),
+            )
+        )
+        for position, hex_counts in group:
+            counts[position] = {translation[k]: v for k, v in hex_counts.items()}
+
+    for k, err in exceptions.items():
+        print("| Failed Job result skip, Job ID/which counts:", *k.rsplit(".", 1), err)
+    return counts, exceptions
+
+
+def _resolve_idx_list(
+    num: Optional[int] = None,
+    result_idx_list: Optional[list[int]] = None,
+) -> list[int]:
+    """Resolve the index of counts wanted to be extracted.
+
+    Args:
+        num (Optional[int], optional): The number of counts wanted to be extracted.
+            Defaults to None.
+        result_idx_list (Optional[list[int]], optional): The index of counts wanted to be extracted.
+            Defaults to None.
+
+    Returns:
+        list[int]: The index of counts wanted to be extracted.
+    """
+    if num is None:
+        return [] if result_idx_list is None else result_idx_list
+    if result_idx_list is None:
+        return list(range(num))
+    warnings.warn(
+        (
+            "The number of result is not equal to the length of "
+            + "'result_idx_list', use length of 'result_idx_list'."
+        )
+        if num != len(result_idx_list)
+        else (
+            "The 'num' is not None, but 'result_idx_list' is not None, "
+            + "use 'result_idx_list'."
+        )
+    )
+    return result_idx_list
+
+
 def get_counts_and_exceptions(
     result: Optional[Result],
     num: Optional[int] = None,
@@ -40,6 +232,9 @@ def get_counts_and_exceptions(
 ) -> tuple[list[dict[str, int]], dict[str, Exception]]:
     """Get counts and exceptions from result.
 
+    The counts are read from the raw data of result in one pass,
+    instead of calling :meth:`Result.get_counts` for each index.
+
     Args:
         result (Optional[Result]): The result of job.
         num (Optional[int], optional): The number of counts wanted to be extracted.
@@ -53,24 +248,7 @@ def get_counts_and_exceptions(
     """
     counts: list[dict[str, int]] = []
     exceptions: dict[str, Exception] = {}
-    if num is None:
-        idx_list = [] if result_idx_list is None else result_idx_list
-    else:
-        if result_idx_list is None:
-            idx_list = list(range(num))
-        else:
-            warnings.warn(
-                (
-                    "The number of result is not equal to the length of "
-                    + "'result_idx_list', use length of 'result_idx_list'."
-                )
-                if num != len(result_idx_list)
-                else (
-                    "The 'num' is not None, but 'result_idx_list' is not None, "
-                    + "use 'result_idx_list'."
-                )
-            )
-            idx_list = result_idx_list
+    idx_list = _resolve_idx_list(num, result_idx_list)
 
     if result is None:
         exceptions["None"] = QurryCountLost("Result is None")
@@ -80,30 +258,159 @@ def get_counts_and_exceptions(
         return counts, exceptions
 
     if len(idx_list) == 0:
-        try:
-            get: Union[list[dict[str, int]], dict[str, int]] = result.get_counts()
-            if isinstance(get, list):
-                counts: list[dict[str, int]] = get
-            else:
-                counts.append(get)
-        except QiskitError as err_1:
+        all_counts, all_exceptions = _bulk_counts_and_exceptions(
+            result, list(range(len(result.results)))
+        )
+        if len(all_exceptions) > 0:
+            err_1 = next(iter(all_exceptions.values()))
             exceptions[result.job_id] = err_1
             print("| Failed Job result skip, Job ID:", result.job_id, err_1)
+        else:
+            counts = all_counts
         return counts, exceptions
 
+    return _bulk_counts_and_exceptions(result, idx_list)
+
+
+def get_int_counts_and_exceptions(
+    result: Optional[Result],
+    num: Optional[int] = None,
+    result_idx_list: Optional[list[int]] = None,
+) -> tuple[list[dict[int, int]], dict[str, Exception]]:
+    """Get counts with integer keys and exceptions from result,
+    which skips the formatting of bitstrings entirely.
+
+    Args:
+        result (Optional[Result]): The result of job.
+        num (Optional[int], optional): The number of counts wanted to be extracted.
+            Defaults to None.
+        result_idx_list (Optional[list[int]], optional): The index of counts wanted to be extracted.
+            Defaults to None.
+
+    Returns:
+        tuple[list[dict[int, int]], dict[str, Exception]]:
+            Counts with integer keys and exceptions.
+    """
+    idx_list = _resolve_idx_list(num, result_idx_list)
+    if result is None:
+        print("| Failed Job result skip.")
+        return [{} for _ in idx_list], {"None": QurryCountLost("Result is None")}
+    if len(idx_list) == 0:
+        idx_list = list(range(len(result.results)))
+    return _bulk_counts_and_exceptions(result, idx_list, int_keys=True)
+
+
+def _pack_memory(raw_memory: list[str], memory_slots: Optional[int]) -> np.ndarray:
+    """Pack the hexadecimal memory of one experiment as an integer array.
+
+    Args:
+        raw_memory (list[str]): The hexadecimal outcome of each shot.
+        memory_slots (Optional[int]): The number of memory slots.
+
+    Returns:
+        np.ndarray:
+            The outcome of each shot as `uint64` with shape `(shots,)`
+            if there are at most 64 memory slots,
+            otherwise as `uint64` words with shape `(shots, words)`
+            where the first word holds the lowest 64 bits.
+    """
+    if len(raw_memory) == 0:
+        return np.zeros((0,), dtype=np.uint64)
+    unique_hex, inverse = np.unique(np.asarray(raw_memory), return_inverse=True)
+    unique_int = [int(k, 16) for k in unique_hex.tolist()]
+    width = max(memory_slots or 0, max(unique_int).bit_length(), 1)
+    if width <= 64:
+        return np.array(unique_int, dtype=np.uint64)[inverse]
+
+    num_words = (width + 63) // 64
+    mask = (1 << 64) - 1
+    unique_words = np.array(
+        [[(k >> (64 * w)) & mask for w in range(num_words)] for k in unique_int],
+        dtype=np.uint64,
+    )
+    return unique_words[inverse]
+
+
+def get_memory_and_exceptions(
+    result: Optional[Result],
+    num: Optional[int] = None,
+    result_idx_list: Optional[list[int]] = None,
+) -> tuple[list[np.ndarray], dict[str, Exception]]:
+    """Get the per-shot memory as packed integer arrays and exceptions from result.
+
+    The memory is only available when the job is executed with `memory=True`
+    and the backend supports it, otherwise the arrays will be empty.
+
+    Args:
+        result (Optional[Result]): The result of job.
+        num (Optional[int], optional): The number of memory wanted to be extracted.
+            Defaults to None.
+        result_idx_list (Optional[list[int]], optional):
+            The index of memory wanted to be extracted.
+            Defaults to None.
+
+    Returns:
+        tuple[list[np.ndarray], dict[str, Exception]]:
+            Memory and exceptions, the format of memory is described in :func:`_pack_memory`.
+    """
+    idx_list = _resolve_idx_list(num, result_idx_list)
+    if result is None:
+        return [np.zeros((0,), dtype=np.uint64) for _ in idx_list], {
+            "None": QurryCountLost("Result is None")
+        }
+    if len(idx_list) == 0:
+        idx_list = list(range(len(result.results)))
+
+    memory: list[np.ndarray] = []
+    exceptions: dict[str, Exception] = {}
     for i in idx_list:
         try:
-            all_meas = result.get_counts(i)
-            assert isinstance(all_meas, dict), "The counts is not a dict."
-        except QiskitError as err_2:
-            exceptions[f"{result.job_id}.{i}"] = err_2
-            print(
-                "| Failed Job result skip, Job ID/which counts:",
-                result.job_id,
-                i,
-                err_2,
+            exp = result.results[i]
+        except IndexError:
+            exceptions[f"{result.job_id}.{i}"] = QiskitError(
+                f'Result for experiment "{i}" could not be found.'
             )
-            all_meas = {}
-        counts.append(all_meas)
+            memory.append(np.zeros((0,), dtype=np.uint64))
+            continue
+        raw_memory = getattr(exp.data, "memory", None) if getattr(exp, "success", False) else None
+        if raw_memory is None or len(raw_memory) == 0 or not isinstance(raw_memory[0], str):
+            memory.append(np.zeros((0,), dtype=np.uint64))
+            continue
+        memory.append(_pack_memory(raw_memory, getattr(exp.header, "memory_slots", None)))
 
-    return counts, exceptions
+    return memory, exceptions
+
+
+def memory_to_counts(
+    memory: np.ndarray,
+    memory_slots: int,
+    creg_sizes: Optional[list[list[Union[str, int]]]] = None,
+) -> dict[str, int]:
+    """Aggregate the packed per-shot memory into counts,
+    which can be used on a resampled subset of shots for bootstrap or jackknife.
+
+    Args:
+        memory (np.ndarray): The packed memory from :func:`get_memory_and_exceptions`.
+        memory_slots (int): The number of memory slots.
+        creg_sizes (Optional[list[list[Union[str, int]]]], optional):
+            The name and size of registers for separating the bitstrings.
+            Defaults to None.
+
+    Returns:
+        dict[str, int]: The counts.
+    """
+    if len(memory) == 0:
+        return {}
+    outcomes, freqs = np.unique(memory, axis=0, return_counts=True)
+    if outcomes.ndim == 1:
+        int_keys = outcomes.tolist()
+    else:
+        int_keys = [
+            sum(int(word) << (64 * w) for w, word in enumerate(row)) for row in outcomes.tolist()
+        ]
+    return dict(
+        zip(
+            _int_keys_to_bitstrings(int_keys, memory_slots, creg_sizes),
+            freqs.tolist(),
+        )
+    )
@@ -6,12 +6,21 @@ OpenQASM Processor
 
 """
 
+import hashlib
 from typing import Literal, Optional
+from collections import OrderedDict
 
 from qiskit import QuantumCircuit
 from qiskit.qasm3 import dumps as dumps_qasm3, QASM3Error, loads as loads_qasm3
 from qiskit.qasm2 import dumps as dumps_qasm2, QASM2Error, loads as loads_qasm2
 
+from .transpile_cache import circuit_structure_hash
+from ...tools import ParallelManager
+
+QASM_DUMPS_CACHE_MAX_ENTRIES = 4096
+"""The maximum number of OpenQASM strings kept in memory by :func:`qasm_dumps_batch`."""
+_qasm_dumps_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+
 
 def qasm_dumps(
     qc: QuantumCircuit,
@@ -64,6 +73,69 @@ def qasm_dumps(
     return txt
 
 
+def qasm_dumps_batch(
+    circuits: list[QuantumCircuit],
+    qasm_version: Literal["qasm2", "qasm3"] = "qasm2",
+    workers_num: Optional[int] = None,
+) -> list[str]:
+    """Draw the circuits in OpenQASM string in one batch,
+    the circuits with the same structure will only be drawn once.
+
+    The drawn strings are memorized by the structure hash of circuit,
+    so the same target circuit used by multiple experiments will not be drawn again.
+
+    Args:
+        circuits (list[QuantumCircuit]):
+            The circuits wanted to be drawn.
+        qasm_version (Literal["qasm2", "qasm3"], optional):
+            The export version of OpenQASM. Defaults to 'qasm2'.
+        workers_num (Optional[int], optional):
+            The number of workers for drawing the missing circuits. Defaults to None.
+
+    Returns:
+        list[str]: The drawing of circuits in OpenQASM string.
+    """
+    keys = [(circuit_structure_hash(qc), qasm_version) for qc in circuits]
+    missing: dict[tuple[str, str], QuantumCircuit] = {}
+    for key, qc in zip(keys, circuits):
+        if key in _qasm_dumps_cache:
+            _qasm_dumps_cache.move_to_end(key)
+        elif key not in missing:
+            missing[key] = qc
+
+    drawn: dict[tuple[str, str], str] = {}
+    if len(missing) == 1:
+        ((key, qc),) = missing.items()
+        drawn[key] = qasm_dumps(qc, qasm_version)
+    elif len(missing) > 1:
+        pool = ParallelManager(workers_num)
+        drawn = dict(
+            zip(
+                missing.keys(),
+                pool.starmap(qasm_dumps, [(qc, qasm_version) for qc in missing.values()]),
+            )
+        )
+
+    result = [drawn[key] if key in drawn else _qasm_dumps_cache[key] for key in keys]
+    for key, txt in drawn.items():
+        _qasm_dumps_cache[key] = txt
+    while len(_qasm_dumps_cache) > QASM_DUMPS_CACHE_MAX_ENTRIES:
+        _qasm_dumps_cache.popitem(last=False)
+    return result
+
+
+def qasm_content_hash(qasm_str: str) -> str:
+    """Hash the OpenQASM string, which is used as the name of shared OpenQASM file.
+
+    Args:
+        qasm_str (str): The OpenQASM string.
+
+    Returns:
+        str: The hash of the OpenQASM string in hex.
+    """
+    return hashlib.sha256(qasm_str.encode("utf-8")).hexdigest()
+
+
 def qasm_version_detect(qam_str: str) -> Literal["qasm2", "qasm3"]:
     """Detect the OpenQASM version from the string.
 
@@ -0,0 +1,45 @@
+"""
+================================================================
+QPY Processor
+(:mod:`qurry.qurrium.utils.qpy`)
+================================================================
+
+The binary circuit store by :mod:`qiskit.qpy`,
+which is faster and more faithful than OpenQASM for dumping and reviving circuits.
+
+"""
+
+from typing import Union
+from pathlib import Path
+
+from qiskit import QuantumCircuit, qpy
+
+
+def qpy_dumps_to_file(
+    circuits: list[QuantumCircuit],
+    filename: Union[str, Path],
+) -> None:
+    """Dump the circuits into a QPY file in one batch.
+
+    Args:
+        circuits (list[QuantumCircuit]): The circuits wanted to be dumped.
+        filename (Union[str, Path]): The QPY file.
+    """
+    with open(filename, "wb") as f:
+        qpy.dump(circuits, f)
+
+
+def qpy_loads_from_file(
+    filename: Union[str, Path],
+) -> list[QuantumCircuit]:
+    """Load all circuits from a QPY file in one batch.
+
+    Args:
+        filename (Union[str, Path]): The QPY file.
+
+    Returns:
+        list[QuantumCircuit]: The loaded circuits.
+    """
+    with open(filename, "rb") as f:
+        loaded = qpy.load(f)
+    return [circ for circ in loaded if isinstance(circ, QuantumCircuit)]
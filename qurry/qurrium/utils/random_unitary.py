@@ -6,7 +6,7 @@ Kit for Random Unitary Operator
 
 """
 
-from typing import Union, Optional
+from typing import Union, Optional, Literal
 from collections.abc import Sequence
 import numpy as np
 
@@ -240,3 +240,51 @@ def check_input_for_experiment(
                     + f"not {type(random_unitary_seeds[i][j])} in {i}, {j}."
                 )
     return None
+
+
+def generate_random_unitary_array(
+    times: int,
+    num_qubits: int,
+    random_unitary_seeds: Optional[dict[int, dict[int, int]]] = None,
+) -> np.ndarray[tuple[int, int, Literal[2], Literal[2]], np.dtype[np.complex128]]:
+    """Generate all the Haar random single-qubit unitary operators in one batch.
+
+    For the same seed, the unitary operator is identical to the one from
+    :func:`qiskit.quantum_info.random_unitary` with `dims=2`,
+    which samples by :meth:`scipy.stats.unitary_group.rvs`.
+    But the QR decomposition and the phase correction are done
+    on the whole stack of matrices at once instead of one by one.
+
+    Args:
+        times (int): The number of random unitary operator.
+        num_qubits (int): The number of qubits.
+        random_unitary_seeds (Optional[dict[int, dict[int, int]]], optional):
+            The seeds for all random unitary operator,
+            which is the same as the one in :func:`check_input_for_experiment`.
+            The first key is the index for the random unitary operator.
+            The second key is the index for the qubit.
+            If it is None, then all operators are sampled from one unseeded generator.
+            Defaults to None.
+
+    Returns:
+        np.ndarray[tuple[int, int, Literal[2], Literal[2]], np.dtype[np.complex128]]:
+            The random unitary operators with shape `(times, num_qubits, 2, 2)`.
+    """
+    if random_unitary_seeds is None:
+        rng = np.random.default_rng()
+        real_part = rng.normal(size=(times, num_qubits, 2, 2))
+        imag_part = rng.normal(size=(times, num_qubits, 2, 2))
+    else:
+        real_part = np.empty((times, num_qubits, 2, 2), dtype=np.float64)
+        imag_part = np.empty((times, num_qubits, 2, 2), dtype=np.float64)
+        for i in range(times):
+            for j in range(num_qubits):
+                rng = np.random.default_rng(random_unitary_seeds[i][j])
+                real_part[i, j] = rng.normal(size=(2, 2))
+                imag_part[i, j] = rng.normal(size=(2, 2))
+
+    z = (real_part + 1j * imag_part) / np.sqrt(2)
+    q, r = np.linalg.qr(z)
+    d = r.diagonal(offset=0, axis1=-2, axis2=-1)
+    q *= (d / np.abs(d))[..., np.newaxis, :]
+    return q
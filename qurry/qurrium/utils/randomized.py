@@ -137,3 +137,124 @@ def local_unitary_op_to_pauli_coeff(
         i: qubit_operator_to_pauli_coeff(np.array(op))
         for i, op in single_unitary_op_list_dict.items()
     }
+
+
+PAULI_MATRICES: np.ndarray[tuple[Literal[3], Literal[2], Literal[2]], np.dtype[np.complex128]] = (
+    np.array([RXmatrix, RYmatrix, RZmatrix], dtype=np.complex128)
+)
+"""Pauli-X, Pauli-Y and Pauli-Z matrices stacked in order."""
+
+
+def unitary_array_to_pauli_coeff(
+    unitary_array: np.ndarray,
+) -> np.ndarray:
+    """Convert a batch of single-qubit operators to their Pauli coefficients,
+    which is the vectorized version of :func:`qubit_operator_to_pauli_coeff`.
+
+    Args:
+        unitary_array (np.ndarray):
+            The operators with shape `(..., 2, 2)`.
+
+    Returns:
+        np.ndarray: The complex Pauli coefficients with shape `(..., 3)`.
+    """
+    return np.einsum("...ij,kji->...k", unitary_array, PAULI_MATRICES) / 2
+
+
+def local_unitary_array_to_list(
+    unitary_array: np.ndarray,
+    unitary_located: list[int],
+) -> dict[int, dict[int, list[list[complex]]]]:
+    """Transform the array of random unitary operators with shape `(times, num_qubits, 2, 2)`
+    to the dictionary of unitary operators in :cls:`list[list[complex]]`,
+    which is the legacy format of side product `unitaryOP`.
+
+    The side product `unitaryOP` is now kept as the array itself,
+    whose second axis is indexed by the position in `unitary_located`,
+    but the experiments exported before keep this dictionary keyed by the qubit index.
+
+    Args:
+        unitary_array (np.ndarray): The array of random unitary operators.
+        unitary_located (list[int]):
+            The qubit index for each operator along the second axis.
+
+    Returns:
+        dict[int, dict[int, list[list[complex]]]]:
+            The dictionary of unitary operators in :cls:`list[list[complex]]`.
+    """
+    unitary_list = unitary_array.tolist()
+    return {
+        n_u_i: {qi: single_list[ui] for ui, qi in enumerate(unitary_located)}
+        for n_u_i, single_list in enumerate(unitary_list)
+    }
+
+
+def local_unitary_array_to_pauli_coeff(
+    unitary_array: np.ndarray,
+    unitary_located: list[int],
+) -> dict[int, dict[int, list[tuple[float, float]]]]:
+    """Transform the array of random unitary operators with shape `(times, num_qubits, 2, 2)`
+    to the dictionary of pauli coefficients,
+    which is the legacy format of side product `randomized`.
+
+    The side product `randomized` is now kept as the array from
+    :func:`unitary_array_to_pauli_coeff`, whose second axis is indexed by
+    the position in `unitary_located`,
+    but the experiments exported before keep this dictionary keyed by the qubit index.
+
+    Args:
+        unitary_array (np.ndarray): The array of random unitary operators.
+        unitary_located (list[int]):
+            The qubit index for each operator along the second axis.
+
+    Returns:
+        dict[int, dict[int, list[tuple[float, float]]]]: The dictionary of pauli coefficients.
+    """
+    coeff_list = unitary_array_to_pauli_coeff(unitary_array).tolist()
+    return {
+        n_u_i: {
+            qi: [(a.real, a.imag) for a in single_coeff[ui]]
+            for ui, qi in enumerate(unitary_located)
+        }
+        for n_u_i, single_coeff in enumerate(coeff_list)
+    }
+
+
+def unitary_array_to_u_angles(
+    unitary_array: np.ndarray,
+) -> np.ndarray:
+    """Convert a batch of single-qubit unitary operators
+    to the Euler angles :math:`(\\theta, \\phi, \\lambda)` of :class:`qiskit.circuit.library.UGate`,
+    which are the same operators up to a global phase.
+
+    .. math::
+        U(\\theta, \\phi, \\lambda) = \\begin{pmatrix}
+            \\cos(\\theta/2) & -e^{i\\lambda}\\sin(\\theta/2) \\\\
+            e^{i\\phi}\\sin(\\theta/2) & e^{i(\\phi+\\lambda)}\\cos(\\theta/2)
+        \\end{pmatrix}
+
+    Args:
+        unitary_array (np.ndarray):
+            The unitary operators with shape `(..., 2, 2)`.
+
+    Returns:
+        np.ndarray: The Euler angles with shape `(..., 3)`.
+    """
+    u00 = unitary_array[..., 0, 0]
+    u01 = unitary_array[..., 0, 1]
+    u10 = unitary_array[..., 1, 0]
+    u11 = unitary_array[..., 1, 1]
+
+    theta = 2 * np.arctan2(np.abs(u10), np.abs(u00))
+    # The global phase is taken from the top-left entry unless the cosine vanishes,
+    # and lambda is taken from the larger one of the second column,
+    # so the angles are still well-defined when either cosine or sine vanishes.
+    cos_vanish = np.isclose(np.abs(u00), 0)
+    global_phase = np.where(cos_vanish, np.angle(u10), np.angle(u00))
+    phi = np.angle(u10) - global_phase
+    lam = np.where(
+        np.abs(u01) > np.abs(u11),
+        np.angle(-u01) - global_phase,
+        np.angle(u11) - global_phase - phi,
+    )
+    return np.stack([theta, phi, lam], axis=-1)
@@ -0,0 +1,583 @@
+"""
+================================================================
+Transpile Cache
+(:mod:`qurry.qurrium.utils.transpile_cache`)
+================================================================
+
+A content-addressed cache for transpiled circuits on disk.
+The key is the hash of the circuit structure, the backend,
+the transpile arguments and the passmanager,
+and the value is the transpiled circuit serialized by :mod:`qiskit.qpy`.
+
+"""
+
+import os
+import re
+import hashlib
+import inspect
+import warnings
+import functools
+from enum import Enum
+from pathlib import Path
+from typing import Union, Optional, Any, Callable
+
+import numpy as np
+import qiskit
+from qiskit import QuantumCircuit, qpy
+from qiskit.circuit import Instruction, ParameterExpression, ControlFlowOp
+from qiskit.circuit.library import get_standard_gate_name_mapping
+from qiskit.passmanager import GenericPass, BaseController
+from qiskit.providers import Backend
+from qiskit.transpiler import CouplingMap, Target
+from qiskit.transpiler.passmanager import PassManager
+
+from ...tools.backend.utils import backend_name_getter
+from ...exceptions import QurryTranspileCacheInvalid
+
+DEFAULT_TRANSPILE_CACHE_DIR = Path.home() / ".cache" / "qurry" / "transpile"
+"""The default directory of the transpile cache."""
+DEFAULT_TRANSPILE_CACHE_MAX_SIZE = 2 * 1024**3
+"""The default size limit of the transpile cache in bytes, which is 2 GiB."""
+TRANSPILE_CACHE_SUFFIX = ".qpy"
+"""The suffix of the cache entries."""
+
+STANDARD_GATE_NAMES = set(get_standard_gate_name_mapping())
+"""The name of standard gates, which definitions are not needed to be hashed."""
+ADDRESS_PATTERN = re.compile(r" at 0x[0-9a-fA-F]+")
+"""The memory address in the representation of objects, which is removed for fingerprinting."""
+UNORDERED_OPTIONS = {"basis_gates", "target_basis"}
+"""The options of passes and transpile arguments whose order does not matter."""
+
+
+def _param_repr(param: Any) -> str:
+    """Represent the parameter of an instruction for hashing.
+
+    Args:
+        param (Any): The parameter.
+
+    Returns:
+        str: The representation.
+    """
+    if isinstance(param, ParameterExpression):
+        return f"expr:{param}"
+    if isinstance(param, np.ndarray):
+        return f"array:{param.dtype}:{param.shape}:{hashlib.sha256(param.tobytes()).hexdigest()}"
+    if isinstance(param, QuantumCircuit):
+        return f"circuit:{circuit_structure_hash(param)}"
+    return f"{type(param).__name__}:{param!r}"
+
+
+def _update_circuit_hash(hasher: "hashlib._Hash", circuit: QuantumCircuit) -> None:
+    """Feed the structure of the circuit into the hasher.
+
+    Args:
+        hasher (hashlib._Hash): The hasher.
+        circuit (QuantumCircuit): The circuit.
+    """
+    hasher.update(
+        (
+            f"|nq:{circuit.num_qubits}|nc:{circuit.num_clbits}"
+            + f"|qregs:{[(r.name, r.size) for r in circuit.qregs]}"
+            + f"|cregs:{[(r.name, r.size) for r in circuit.cregs]}"
+            + f"|phase:{_param_repr(circuit.global_phase)}"
+        ).encode()
+    )
+    for instruction in circuit.data:
+        operation = instruction.operation
+        hasher.update(
+            (
+                f"|{operation.name}:{operation.num_qubits}:{operation.num_clbits}"
+                + f":{[_param_repr(p) for p in operation.params]}"
+                + f":{[circuit.find_bit(q).index for q in instruction.qubits]}"
+                + f":{[circuit.find_bit(c).index for c in instruction.clbits]}"
+            ).encode()
+        )
+        if isinstance(operation, ControlFlowOp):
+            for block in operation.blocks:
+                _update_circuit_hash(hasher, block)
+        elif operation.name not in STANDARD_GATE_NAMES:
+            definition = getattr(operation, "definition", None)
+            if isinstance(definition, QuantumCircuit):
+                _update_circuit_hash(hasher, definition)
+
+
+def circuit_structure_hash(circuit: QuantumCircuit) -> str:
+    """Hash the structure of the circuit,
+    which includes the registers, the instructions with their parameters and operands,
+    and the definitions of non-standard gates.
+    The circuit name and metadata are not included.
+
+    Args:
+        circuit (QuantumCircuit): The circuit.
+
+    Returns:
+        str: The hash of the circuit in hex.
+    """
+    hasher = hashlib.sha256()
+    _update_circuit_hash(hasher, circuit)
+    return hasher.hexdigest()
+
+
+def _stable_repr(obj: Any, _seen: frozenset[int] = frozenset()) -> str:
+    """Represent the object for fingerprinting by its content only,
+    which is the same across processes and sessions.
+
+    The containers are represented recursively with the dictionaries and sets sorted,
+    the passes and flow controllers by :func:`task_fingerprint`,
+    the targets by :func:`target_fingerprint`, the coupling maps by their sorted edges,
+    and the callables by their qualified names.
+    Other objects are represented by their attributes if their representation
+    contains the memory address.
+
+    Args:
+        obj (Any): The object.
+        _seen (frozenset[int], optional):
+            The id of objects being represented, which avoids the infinite recursion.
+
+    Returns:
+        str: The representation.
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str, bytes)):
+        return repr(obj)
+    if isinstance(obj, np.generic):
+        return repr(obj.item())
+    if isinstance(obj, Enum):
+        return f"{type(obj).__qualname__}.{obj.name}"
+    if isinstance(obj, np.ndarray):
+        return _param_repr(obj)
+    if id(obj) in _seen:
+        return f"{type(obj).__qualname__}:<recursive>"
+    _seen = _seen | {id(obj)}
+    if isinstance(obj, (list, tuple)):
+        return f"[{','.join(_stable_repr(item, _seen) for item in obj)}]"
+    if isinstance(obj, (set, frozenset)):
+        return f"{{{','.join(sorted(_stable_repr(item, _seen) for item in obj))}}}"
+    if isinstance(obj, dict):
+        items = sorted(
+            f"{_stable_repr(k, _seen)}:{_stable_repr(unordered_option(k, v), _seen)}"
+            for k, v in obj.items()
+        )
+        return f"{{{','.join(items)}}}"
+    if isinstance(obj, CouplingMap):
+        return f"CouplingMap:{sorted(obj.get_edges())}"
+    if isinstance(obj, Target):
+        return f"Target:{target_fingerprint(obj)}"
+    if isinstance(obj, (GenericPass, BaseController)):
+        return task_fingerprint(obj)
+    if isinstance(obj, Instruction):
+        return f"{obj.name}:{obj.num_qubits}:{obj.num_clbits}:{_stable_repr(obj.params, _seen)}"
+    if isinstance(obj, (ParameterExpression, QuantumCircuit)):
+        return _param_repr(obj)
+    if isinstance(obj, functools.partial):
+        return (
+            f"partial:{_stable_repr(obj.func, _seen)}:{_stable_repr(obj.args, _seen)}"
+            + f":{_stable_repr(obj.keywords, _seen)}"
+        )
+    if callable(obj) and hasattr(obj, "__qualname__"):
+        return f"{getattr(obj, '__module__', '')}.{obj.__qualname__}"
+    obj_repr = repr(obj)
+    if ADDRESS_PATTERN.search(obj_repr) is None:
+        return f"{type(obj).__qualname__}:{obj_repr}"
+    if hasattr(obj, "__dict__"):
+        return f"{type(obj).__qualname__}:{_stable_repr(vars(obj), _seen)}"
+    return f"{type(obj).__qualname__}:{ADDRESS_PATTERN.sub('', obj_repr)}"
+
+
+def unordered_option(name: Any, value: Any) -> Any:
+    """Turn the option into a set if its order does not matter,
+    like `basis_gates` which is often built from a set in a random order.
+
+    Args:
+        name (Any): The name of the option.
+        value (Any): The value of the option.
+
+    Returns:
+        Any: The value or the set of its items.
+    """
+    if name in UNORDERED_OPTIONS and isinstance(value, (list, tuple)):
+        return set(value)
+    return value
+
+
+def target_fingerprint(target: Target) -> str:
+    """Fingerprint the target by the sorted instructions with their qubits and properties.
+
+    Args:
+        target (Target): The target.
+
+    Returns:
+        str: The fingerprint of the target.
+    """
+    entries = sorted(
+        (
+            name,
+            str(qargs),
+            repr(None if props is None else props.error),
+            repr(None if props is None else props.duration),
+        )
+        for name, qargs_props in target.items()
+        for qargs, props in qargs_props.items()
+    )
+    return hashlib.sha256(f"{target.num_qubits}|{target.dt}|{entries}".encode()).hexdigest()
+
+
+def task_fingerprint(task: Any) -> str:
+    """Fingerprint the pass or the flow controller of a passmanager.
+
+    A pass is represented by its class and the options in the signature of its constructor,
+    which are read from the attributes with the same name or with a leading underscore,
+    and the options not stored in either way are skipped.
+    A flow controller is represented by its class, its options and the passes it contains.
+
+    Args:
+        task (Any): The pass or the flow controller.
+
+    Returns:
+        str: The fingerprint of the task.
+    """
+    task_type = type(task)
+    options = []
+    for name in inspect.signature(task_type.__init__).parameters:
+        if name in ("self", "args", "kwargs", "tasks"):
+            continue
+        if hasattr(task, name):
+            value = getattr(task, name)
+        elif hasattr(task, f"_{name}"):
+            value = getattr(task, f"_{name}")
+        else:
+            continue
+        options.append(f"{name}={_stable_repr(unordered_option(name, value))}")
+    content = f"{task_type.__module__}.{task_type.__qualname__}({','.join(options)})"
+    if isinstance(task, BaseController):
+        content += f"[{','.join(task_fingerprint(subtask) for subtask in task.tasks)}]"
+    return content
+
+
+def backend_fingerprint(backend: Backend) -> str:
+    """Fingerprint the backend by its name, target or configuration and properties.
+    The calibration data of the backend is also included,
+    so the fingerprint changes when the backend is recalibrated.
+
+    Args:
+        backend (Backend): The backend.
+
+    Returns:
+        str: The fingerprint of the backend.
+    """
+    content = [
+        f"name:{backend_name_getter(backend)}",
+        f"type:{type(backend).__module__}.{type(backend).__qualname__}",
+    ]
+    target = getattr(backend, "target", None)
+    if target is not None:
+        content.append(f"target:{target_fingerprint(target)}")
+    else:
+        configuration = getattr(backend, "configuration", None)
+        if callable(configuration):
+            content.append(f"configuration:{_stable_repr(configuration().to_dict())}")
+        properties = getattr(backend, "properties", None)
+        if callable(properties):
+            current_properties = properties()
+            if current_properties is not None:
+                content.append(f"properties:{_stable_repr(current_properties.to_dict())}")
+    return hashlib.sha256("|".join(content).encode()).hexdigest()
+
+
+def transpile_args_fingerprint(transpile_args: Optional[dict[str, Any]]) -> str:
+    """Fingerprint the arguments for :func:`qiskit.transpile`.
+
+    Args:
+        transpile_args (Optional[dict[str, Any]]): The transpile arguments.
+
+    Returns:
+        str: The fingerprint of the transpile arguments.
+    """
+    return hashlib.sha256(_stable_repr(transpile_args or {}).encode()).hexdigest()
+
+
+def passmanager_fingerprint(passmanager_pair: Optional[tuple[str, PassManager]]) -> str:
+    """Fingerprint the passmanager by its name and the passes it contains.
+
+    Args:
+        passmanager_pair (Optional[tuple[str, PassManager]]): The passmanager pair.
+
+    Returns:
+        str: The fingerprint of the passmanager.
+    """
+    if passmanager_pair is None:
+        return "None"
+    passmanager_name, passmanager = passmanager_pair
+    return hashlib.sha256(
+        "|".join(
+            [
+                passmanager_name,
+                f"{type(passmanager).__module__}.{type(passmanager).__qualname__}",
+                task_fingerprint(passmanager.to_flow_controller()),
+            ]
+        ).encode()
+    ).hexdigest()
+
+
+class TranspileCache:
+    """The content-addressed cache of transpiled circuits on disk.
+
+    Each entry is a single transpiled circuit serialized by :mod:`qiskit.qpy`
+    and named by the hash of the circuit structure, the backend,
+    the transpile arguments and the passmanager.
+    When the total size or the number of entries exceeds the limits,
+    the least recently used entries will be removed.
+
+    .. code-block:: python
+
+        from qurry import EntropyMeasure
+        from qurry.qurrium.utils.transpile_cache import TranspileCache
+
+        exp_method = EntropyMeasure()
+        exp_method.transpile_cache = TranspileCache("./.transpile_cache")
+
+    """
+
+    __name__ = "TranspileCache"
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path] = DEFAULT_TRANSPILE_CACHE_DIR,
+        max_size: int = DEFAULT_TRANSPILE_CACHE_MAX_SIZE,
+        max_entries: Optional[int] = None,
+    ):
+        """Initialize the transpile cache.
+
+        Args:
+            cache_dir (Union[str, Path], optional):
+                The directory of the cache. Defaults to DEFAULT_TRANSPILE_CACHE_DIR.
+            max_size (int, optional):
+                The size limit of the cache in bytes. Defaults to 2 GiB.
+            max_entries (Optional[int], optional):
+                The limit of number of entries. Defaults to None for no limit.
+
+        Raises:
+            ValueError: If the limits are not positive.
+        """
+        if max_size <= 0:
+            raise ValueError(f"max_size should be positive, but get {max_size}.")
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError(f"max_entries should be positive, but get {max_entries}.")
+
+        self.cache_dir = Path(cache_dir)
+        """The directory of the cache."""
+        self.max_size = max_size
+        """The size limit of the cache in bytes."""
+        self.max_entries = max_entries
+        """The limit of number of entries."""
+        self.hits = 0
+        """The number of cache hits."""
+        self.misses = 0
+        """The number of cache misses."""
+
+    def key(
+        self,
+        circuit: QuantumCircuit,
+        backend: Backend,
+        transpile_args: Optional[dict[str, Any]] = None,
+        passmanager_pair: Optional[tuple[str, PassManager]] = None,
+    ) -> str:
+        """Compute the key of the circuit for the given transpile configuration.
+
+        Args:
+            circuit (QuantumCircuit): The circuit before transpiling.
+            backend (Backend): The backend.
+            transpile_args (Optional[dict[str, Any]], optional):
+                The arguments for :func:`qiskit.transpile`. Defaults to None.
+            passmanager_pair (Optional[tuple[str, PassManager]], optional):
+                The passmanager pair. Defaults to None.
+
+        Returns:
+            str: The key of the cache entry.
+        """
+        return self.key_from_fingerprints(
+            circuit,
+            backend_fingerprint(backend),
+            transpile_args_fingerprint(transpile_args),
+            passmanager_fingerprint(passmanager_pair),
+        )
+
+    @staticmethod
+    def key_from_fingerprints(
+        circuit: QuantumCircuit,
+        backend_print: str,
+        transpile_args_print: str,
+        passmanager_print: str,
+    ) -> str:
+        """Compute the key of the circuit with the fingerprints of the transpile configuration,
+        so the fingerprints can be reused for multiple circuits.
+        The version of Qiskit is also included, since the transpiler may change between versions.
+
+        Args:
+            circuit (QuantumCircuit): The circuit before transpiling.
+            backend_print (str): The fingerprint of the backend.
+            transpile_args_print (str): The fingerprint of the transpile arguments.
+            passmanager_print (str): The fingerprint of the passmanager.
+
+        Returns:
+            str: The key of the cache entry.
+        """
+        return hashlib.sha256(
+            "|".join(
+                [
+                    qiskit.__version__,
+                    circuit_structure_hash(circuit),
+                    backend_print,
+                    transpile_args_print,
+                    passmanager_print,
+                ]
+            ).encode()
+        ).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{TRANSPILE_CACHE_SUFFIX}"
+
+    def get(self, key: str) -> Optional[QuantumCircuit]:
+        """Get the transpiled circuit from the cache.
+
+        Args:
+            key (str): The key of the cache entry.
+
+        Returns:
+            Optional[QuantumCircuit]: The transpiled circuit or None if it is not cached.
+        """
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                loaded = qpy.load(f)
+        # pylint: disable=broad-except
+        except Exception as err:
+            # pylint: enable=broad-except
+            warnings.warn(
+                f"Transpile cache entry '{path}' is invalid and removed, due to: {err}",
+                category=QurryTranspileCacheInvalid,
+            )
+            path.unlink(missing_ok=True)
+            return None
+        # Touch the entry for least recently used eviction.
+        os.utime(path)
+        return loaded[0]
+
+    def put(self, key: str, circuit: QuantumCircuit) -> None:
+        """Put the transpiled circuit into the cache.
+
+        Args:
+            key (str): The key of the cache entry.
+            circuit (QuantumCircuit): The transpiled circuit.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            qpy.dump(circuit, f)
+        os.replace(tmp_path, path)
+
+    def entries(self) -> list[Path]:
+        """The entries of the cache from the least recently used one.
+
+        Returns:
+            list[Path]: The paths of entries.
+        """
+        if not self.cache_dir.exists():
+            return []
+        return sorted(
+            self.cache_dir.glob(f"*{TRANSPILE_CACHE_SUFFIX}"), key=lambda p: p.stat().st_mtime
+        )
+
+    def size(self) -> int:
+        """The total size of the cache in bytes.
+
+        Returns:
+            int: The total size.
+        """
+        return sum(p.stat().st_size for p in self.entries())
+
+    def prune(self) -> int:
+        """Remove the least recently used entries until the cache is under the limits.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        entries = self.entries()
+        sizes = [p.stat().st_size for p in entries]
+        total_size = sum(sizes)
+        removed = 0
+        for path, entry_size in zip(entries, sizes):
+            if total_size <= self.max_size and (
+                self.max_entries is None or len(entries) - removed <= self.max_entries
+            ):
+                break
+            path.unlink(missing_ok=True)
+            total_size -= entry_size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries of the cache."""
+        for path in self.entries():
+            path.unlink(missing_ok=True)
+
+    def transpile(
+        self,
+        circuits: list[QuantumCircuit],
+        transpile_func: Callable[[list[QuantumCircuit]], list[QuantumCircuit]],
+        backend: Backend,
+        transpile_args: Optional[dict[str, Any]] = None,
+        passmanager_pair: Optional[tuple[str, PassManager]] = None,
+    ) -> list[QuantumCircuit]:
+        """Transpile the circuits with the cache,
+        only the circuits missing in the cache will be transpiled in one batch.
+
+        Args:
+            circuits (list[QuantumCircuit]): The circuits before transpiling.
+            transpile_func (Callable[[list[QuantumCircuit]], list[QuantumCircuit]]):
+                The function to transpile a list of circuits.
+            backend (Backend): The backend.
+            transpile_args (Optional[dict[str, Any]], optional):
+                The arguments for :func:`qiskit.transpile`. Defaults to None.
+            passmanager_pair (Optional[tuple[str, PassManager]], optional):
+                The passmanager pair. Defaults to None.
+
+        Returns:
+            list[QuantumCircuit]: The transpiled circuits.
+        """
+        backend_print = backend_fingerprint(backend)
+        transpile_args_print = transpile_args_fingerprint(transpile_args)
+        passmanager_print = passmanager_fingerprint(passmanager_pair)
+
+        keys = [
+            self.key_from_fingerprints(circ, backend_print, transpile_args_print, passmanager_print)
+            for circ in circuits
+        ]
+        transpiled: list[Optional[QuantumCircuit]] = [self.get(k) for k in keys]
+        missing_idx = [i for i, circ in enumerate(transpiled) if circ is None]
+        self.hits += len(circuits) - len(missing_idx)
+        self.misses += len(missing_idx)
+
+        if missing_idx:
+            new_transpiled = transpile_func([circuits[i] for i in missing_idx])
+            if isinstance(new_transpiled, QuantumCircuit):
+                new_transpiled = [new_transpiled]
+            for i, circ in zip(missing_idx, new_transpiled):
+                self.put(keys[i], circ)
+                transpiled[i] = circ
+            self.prune()
+
+        result = []
+        for circ, transpiled_circ in zip(circuits, transpiled):
+            assert transpiled_circ is not None, "Transpiled circuit should not be None."
+            transpiled_circ.name = circ.name
+            result.append(transpiled_circ)
+        return result
+
+    def __repr__(self):
+        return (
+            f"<{self.__name__}(cache_dir={self.cache_dir}, max_size={self.max_size}, "
+            + f"max_entries={self.max_entries}, hits={self.hits}, misses={self.misses})>"
+        )
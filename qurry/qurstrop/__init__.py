@@ -1,25 +1,9 @@
-# from typing import Literal
+"""
+================================================================
+Qurstrop - The String Operators
+(:mod:`qurry.qurstrop`)
+================================================================
 
-# from .qurstrop import StringOperatorV3 as StringOperatorOrigin
+"""
 
-
-# def StringOperator(
-#     *args,
-#     method: Literal['original'] = 'original',
-#     **kwargs,
-# ) -> StringOperatorOrigin:
-#     """Call `StringOperator` methods.
-
-#     Args:
-#         method (Literal[&#39;original&#39;], optional):
-
-#             - original: the original `StringOperator`.
-#             Defaults to 'original'.
-
-#     Returns:
-#         StringOperatorOrigin: method.
-#     """
-#     if method == 'original':
-#         return StringOperatorOrigin(*args, **kwargs)
-#     else:
-#         return StringOperatorOrigin(*args, **kwargs)
+from .string_operator import StringOperator
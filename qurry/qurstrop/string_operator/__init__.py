@@ -0,0 +1,13 @@
+"""
+================================================================
+StringOperator - The String Order Parameters
+by Measuring the Chain in Basis Configurations
+(:mod:`qurry.qurstrop.string_operator`)
+================================================================
+
+"""
+
+from .analysis import StringOperatorAnalysis
+from .experiment import StringOperatorExperiment
+from .qurry import StringOperator
+from .utils import STRING_OPERATOR_LIB
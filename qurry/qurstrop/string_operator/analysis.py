@@ -0,0 +1,49 @@
+"""
+================================================================
+StringOperator - Analysis
+(:mod:`qurry.qurstrop.string_operator.analysis`)
+================================================================
+
+"""
+
+from typing import NamedTuple, Iterable
+
+from ...qurrium.analysis import AnalysisPrototype
+
+
+class StringOperatorAnalysis(AnalysisPrototype):
+    """The instance for the analysis of :cls:`StringOperatorExperiment`."""
+
+    __name__ = "StringOperatorAnalysis"
+
+    class AnalysisInput(NamedTuple):
+        """To set the analysis."""
+
+        string: str
+        """The name of the string operator."""
+        strings: list[tuple[int, int]]
+        """The position and the length of each string."""
+        shots: int
+        """The number of shots."""
+
+    input: AnalysisInput
+
+    class AnalysisContent(NamedTuple):
+        """The content of the analysis."""
+
+        orders: list[float]
+        """The string order parameter of each string."""
+        countsNum: int
+        """The number of counts."""
+        takingTime: float
+        """The time taken for the calculation."""
+
+        def __repr__(self):
+            return f"AnalysisContent(orders={self.orders}, and others)"
+
+    content: AnalysisContent
+
+    @property
+    def side_product_fields(self) -> Iterable[str]:
+        """The fields that will be stored as side product."""
+        return []
@@ -0,0 +1,69 @@
+"""
+===========================================================
+StringOperator - Arguments
+(:mod:`qurry.qurstrop.string_operator.arguments`)
+===========================================================
+
+"""
+
+from typing import Optional, Union, Iterable
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+from qiskit import QuantumCircuit
+
+from ...qurrium.experiment import ArgumentsPrototype
+from ...declare import BasicArgs, OutputArgs, AnalyzeArgs
+
+
+@dataclass(frozen=True)
+class StringOperatorArguments(ArgumentsPrototype):
+    """Arguments for the experiment."""
+
+    exp_name: str = "exps"
+    """The name of the experiment.
+    Naming this experiment to recognize it when the jobs are pending to IBMQ Service.
+    This name is also used for creating a folder to store the exports.
+    Defaults to `'experiment'`."""
+    num_qubits: int = 0
+    """The number of qubits."""
+    string: str = "i"
+    """The name of the string operator."""
+    strings: Optional[list[tuple[int, int]]] = None
+    """The position and the length of each string."""
+    configurations: Optional[list[str]] = None
+    """The basis of each qubit in each configuration, one circuit for each configuration."""
+    configuration_of_strings: Optional[list[int]] = None
+    """The index of configuration of each string."""
+    qubits_of_strings: Optional[list[list[int]]] = None
+    """The qubits of each string without the identities."""
+
+
+class StringOperatorMeasureArgs(BasicArgs, total=False):
+    """Output arguments for :meth:`output`."""
+
+    wave: Optional[Union[QuantumCircuit, Hashable]]
+    """The key or the circuit to execute."""
+    string: str
+    """The name of the string operator."""
+    strings: Optional[Iterable[tuple[int, int]]]
+    """The position and the length of each string."""
+
+
+class StringOperatorOutputArgs(OutputArgs):
+    """Output arguments for :meth:`output`."""
+
+    string: str
+    """The name of the string operator."""
+    strings: Optional[Iterable[tuple[int, int]]]
+    """The position and the length of each string."""
+
+
+class StringOperatorAnalyzeArgs(AnalyzeArgs, total=False):
+    """The input of the analyze method.
+
+    The post-processing of string operator does not need any input.
+    """
+
+
+SHORT_NAME = "qurstrop_string_operator"
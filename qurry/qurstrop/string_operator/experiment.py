@@ -0,0 +1,257 @@
+"""
+================================================================
+StringOperator - Experiment
+(:mod:`qurry.qurstrop.string_operator.experiment`)
+================================================================
+
+"""
+
+from typing import Optional, Type, Any, Iterable
+from collections.abc import Hashable
+import tqdm
+
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
+
+from .analysis import StringOperatorAnalysis
+from .arguments import StringOperatorArguments, SHORT_NAME
+from .utils import (
+    STRING_OPERATOR_LIB,
+    string_operator_min_length,
+    group_basis_configurations,
+    basis_rotation,
+)
+from ...qurrium.experiment import ExperimentPrototype, Commonparams
+from ...process.string_operator import string_operator_order, StringOperatorOrder
+
+
+class StringOperatorExperiment(ExperimentPrototype):
+    """The instance of experiment."""
+
+    __name__ = "StringOperatorExperiment"
+
+    @property
+    def arguments_instance(self) -> Type[StringOperatorArguments]:
+        """The arguments instance for this experiment."""
+        return StringOperatorArguments
+
+    args: StringOperatorArguments
+
+    @property
+    def analysis_instance(self) -> Type[StringOperatorAnalysis]:
+        """The analysis instance for this experiment."""
+        return StringOperatorAnalysis
+
+    @classmethod
+    def params_control(
+        cls,
+        targets: list[tuple[Hashable, QuantumCircuit]],
+        exp_name: str = "exps",
+        string: str = "i",
+        strings: Optional[Iterable[tuple[int, int]]] = None,
+        **custom_kwargs: Any,
+    ) -> tuple[StringOperatorArguments, Commonparams, dict[str, Any]]:
+        """Handling all arguments and initializing a single experiment.
+
+        Args:
+            targets (list[tuple[Hashable, QuantumCircuit]]):
+                The circuits of the experiment.
+            exp_name (str, optional):
+                The name of the experiment.
+                Naming this experiment to recognize it when the jobs are pending to IBMQ Service.
+                This name is also used for creating a folder to store the exports.
+                Defaults to `'exps'`.
+            string (str, optional):
+                The name of the string operator in
+                :data:`qurry.qurstrop.string_operator.utils.STRING_OPERATOR_LIB`.
+                Defaults to `'i'`.
+            strings (Optional[Iterable[tuple[int, int]]], optional):
+                The position of the first qubit and the length of each string.
+                The string from qubit 1 to qubit `num_qubits - 2` is used if it is None.
+                Defaults to None.
+            custom_kwargs (Any):
+                The custom parameters.
+
+        Raises:
+            ValueError: The number of target circuits should be 1.
+            ValueError: The string operator is not in the library.
+            ValueError: The string is out of the range of qubits or shorter than the operator.
+
+        Returns:
+            tuple[StringOperatorArguments, Commonparams, dict[str, Any]]:
+                The arguments of the experiment, the common parameters, and the custom parameters.
+        """
+        if len(targets) != 1:
+            raise ValueError("The number of target circuits should be 1.")
+        if string not in STRING_OPERATOR_LIB:
+            raise ValueError(
+                f"The string operator '{string}' is not in the library, "
+                + f"available string operators: {list(STRING_OPERATOR_LIB)}."
+            )
+
+        target_key, target_circuit = targets[0]
+        num_qubits = target_circuit.num_qubits
+        strings = (
+            [(1, num_qubits - 2)]
+            if strings is None
+            else [(int(position), int(length)) for position, length in strings]
+        )
+        min_length = string_operator_min_length(string)
+        for position, length in strings:
+            if position < 0 or position + length > num_qubits:
+                raise ValueError(
+                    f"The string at position {position} with length {length} "
+                    + f"is out of the range of {num_qubits} qubits."
+                )
+            if length < min_length:
+                raise ValueError(
+                    f"The string at position {position} with length {length} is shorter than "
+                    + f"the min length {min_length} of string operator '{string}'."
+                )
+
+        configurations, configuration_of_strings, qubits_of_strings = group_basis_configurations(
+            num_qubits, string, strings
+        )
+        exp_name = f"{exp_name}.str_{string}.N_str-{len(strings)}.{SHORT_NAME}"
+
+        # pylint: disable=protected-access
+        return StringOperatorArguments._filter(
+            exp_name=exp_name,
+            target_keys=[target_key],
+            num_qubits=num_qubits,
+            string=string,
+            strings=strings,
+            configurations=configurations,
+            configuration_of_strings=configuration_of_strings,
+            qubits_of_strings=qubits_of_strings,
+            **custom_kwargs,
+        )
+        # pylint: enable=protected-access
+
+    @classmethod
+    def method(
+        cls,
+        targets: list[tuple[Hashable, QuantumCircuit]],
+        arguments: StringOperatorArguments,
+        pbar: Optional[tqdm.tqdm] = None,
+    ) -> tuple[list[QuantumCircuit], dict[str, Any]]:
+        """The method to construct circuit.
+
+        The whole chain is measured once for each basis configuration,
+        instead of one circuit for each string.
+
+        Args:
+            targets (list[tuple[Hashable, QuantumCircuit]]):
+                The circuits of the experiment.
+            arguments (StringOperatorArguments):
+                The arguments of the experiment.
+            pbar (Optional[tqdm.tqdm], optional):
+                The progress bar. Defaults to None.
+
+        Returns:
+            tuple[list[QuantumCircuit], dict[str, Any]]:
+                The circuits of the experiment and the side products.
+        """
+        assert isinstance(
+            arguments.configurations, list
+        ), f"The configurations should be a list, got {arguments.configurations}."
+
+        target_key, target_circuit = targets[0]
+        target_key = "" if isinstance(target_key, int) else str(target_key)
+        num_qubits = arguments.num_qubits
+        prefix = arguments.exp_name if len(target_key) < 1 else f"{arguments.exp_name}.{target_key}"
+
+        circ_list = []
+        for config_idx, config in enumerate(arguments.configurations):
+            q_func = QuantumRegister(num_qubits, "q1")
+            c_meas = ClassicalRegister(num_qubits, "c1")
+            qc_exp = QuantumCircuit(q_func, c_meas)
+            qc_exp.name = f"{prefix}.config_{config_idx}"
+
+            qc_exp.compose(
+                target_circuit,
+                [q_func[i] for i in range(num_qubits)],
+                inplace=True,
+            )
+            qc_exp.barrier()
+            for qi, unit in enumerate(config):
+                basis_rotation(qc_exp, qi, unit)  # type: ignore
+            qc_exp.measure(q_func, c_meas)
+            circ_list.append(qc_exp)
+
+        return circ_list, {}
+
+    def analyze(
+        self,
+        pbar: Optional[tqdm.tqdm] = None,
+    ) -> StringOperatorAnalysis:
+        """Calculate the string order parameters.
+
+        Args:
+            pbar (Optional[tqdm.tqdm], optional):
+                The progress bar. Defaults to None.
+
+        Returns:
+            StringOperatorAnalysis: The result of the analysis.
+        """
+        assert isinstance(self.args.strings, list), "The strings should be a list."
+
+        shots = self.commons.shots
+        counts = self.afterwards.counts
+
+        qs = self.quantities(
+            shots=shots,
+            counts=counts,
+            qubits_of_strings=self.args.qubits_of_strings,
+            configuration_of_strings=self.args.configuration_of_strings,
+            pbar=pbar,
+        )
+
+        serial = len(self.reports)
+        analysis = self.analysis_instance(
+            serial=serial,
+            string=self.args.string,
+            strings=self.args.strings,
+            shots=shots,
+            **qs,  # type: ignore
+        )
+
+        self.reports[serial] = analysis
+        return analysis
+
+    @classmethod
+    def quantities(
+        cls,
+        shots: Optional[int] = None,
+        counts: Optional[list[dict[str, int]]] = None,
+        qubits_of_strings: Optional[list[list[int]]] = None,
+        configuration_of_strings: Optional[list[int]] = None,
+        pbar: Optional[tqdm.tqdm] = None,
+    ) -> StringOperatorOrder:
+        """Calculate the string order parameters.
+
+        Args:
+            shots (int): Shots of the experiment on quantum machine.
+            counts (list[dict[str, int]]): Counts of the experiment on quantum machine.
+            qubits_of_strings (Optional[list[list[int]]], optional):
+                The qubits of each string without the identities. Defaults to None.
+            configuration_of_strings (Optional[list[int]], optional):
+                The index of configuration of each string. Defaults to None.
+            pbar (Optional[tqdm.tqdm], optional):
+                The progress bar. Defaults to None.
+
+        Returns:
+            StringOperatorOrder: The string order parameters.
+        """
+
+        if shots is None or counts is None:
+            raise ValueError("shots and counts should be specified.")
+        if qubits_of_strings is None or configuration_of_strings is None:
+            raise ValueError("qubits_of_strings and configuration_of_strings should be specified.")
+
+        return string_operator_order(
+            shots=shots,
+            counts=counts,
+            qubits_of_strings=qubits_of_strings,
+            configuration_of_strings=configuration_of_strings,
+            pbar=pbar,
+        )
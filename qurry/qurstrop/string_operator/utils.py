@@ -0,0 +1,139 @@
+"""
+===========================================================
+StringOperator - Utils
+(:mod:`qurry.qurstrop.string_operator.utils`)
+===========================================================
+
+"""
+
+from typing import Union, Literal, Iterable
+import numpy as np
+
+from qiskit import QuantumCircuit
+
+StringOperatorUnit = Literal["i", "x", "y", "z"]
+"""The Pauli operator on a single qubit of the string."""
+StringOperatorLibType = dict[Union[int, Literal["filling"]], StringOperatorUnit]
+"""The string operator defined by its boundaries and filling.
+The keys are the offsets from the beginning of the string for non-negative integers,
+from the end of the string for negative integers,
+and `'filling'` for the other qubits in the string."""
+
+STRING_OPERATOR_LIB: dict[str, StringOperatorLibType] = {
+    "i": {
+        0: "i",
+        "filling": "x",
+        -1: "i",
+    },
+    "zy": {
+        0: "z",
+        1: "y",
+        "filling": "x",
+        -2: "y",
+        -1: "z",
+    },
+}
+"""The available string operators.
+
+- `'i'`: :math:`I X X \\cdots X X I`, the string of the trivial phase.
+- `'zy'`: :math:`Z Y X \\cdots X Y Z`, the string of the symmetry-protected topological phase.
+
+Reference:
+    Crossing a topological phase transition with a quantum computer -
+    Smith, Adam and Jobst, Bernhard and Green, Andrew G. and Pollmann, Frank,
+    [PhysRevResearch.4.L022020](https://link.aps.org/doi/10.1103/PhysRevResearch.4.L022020)
+"""
+
+
+def string_operator_min_length(string: str) -> int:
+    """The minimum length of the string operator, which is the number of its boundaries.
+
+    Args:
+        string (str): The name of the string operator.
+
+    Returns:
+        int: The minimum length.
+    """
+    return sum(1 for op in STRING_OPERATOR_LIB[string] if isinstance(op, int))
+
+
+def string_operator_bases(string: str, position: int, length: int) -> dict[int, StringOperatorUnit]:
+    """The Pauli operator on each qubit of the string, except the identities.
+
+    Args:
+        string (str): The name of the string operator.
+        position (int): The index of the first qubit of the string.
+        length (int): The number of qubits of the string.
+
+    Returns:
+        dict[int, StringOperatorUnit]: The Pauli operator of each qubit.
+    """
+    string_op = STRING_OPERATOR_LIB[string]
+    bases = {}
+    for offset in range(length):
+        if offset in string_op:
+            unit = string_op[offset]
+        elif offset - length in string_op:
+            unit = string_op[offset - length]
+        else:
+            unit = string_op["filling"]
+        if unit != "i":
+            bases[position + offset] = unit
+    return bases
+
+
+def group_basis_configurations(
+    num_qubits: int,
+    string: str,
+    strings: Iterable[tuple[int, int]],
+) -> tuple[list[str], list[int], list[list[int]]]:
+    """Group the strings into the basis configurations,
+    the strings in the same configuration have no conflict of the Pauli operators,
+    so they are measured by the same circuit.
+
+    Args:
+        num_qubits (int): The number of qubits.
+        string (str): The name of the string operator.
+        strings (Iterable[tuple[int, int]]): The position and the length of each string.
+
+    Returns:
+        tuple[list[str], list[int], list[list[int]]]:
+            The basis of each qubit in each configuration as a string,
+            the qubit which is not in any string of the configuration is measured by `'z'`,
+            the index of configuration of each string,
+            and the qubits of each string without the identities.
+    """
+    configurations: list[dict[int, StringOperatorUnit]] = []
+    configuration_of_strings = []
+    qubits_of_strings = []
+    for position, length in strings:
+        bases = string_operator_bases(string, position, length)
+        for config_idx, config in enumerate(configurations):
+            if all(config.get(qi, unit) == unit for qi, unit in bases.items()):
+                config.update(bases)
+                break
+        else:
+            config_idx = len(configurations)
+            configurations.append(dict(bases))
+        configuration_of_strings.append(config_idx)
+        qubits_of_strings.append(sorted(bases))
+
+    return (
+        ["".join(config.get(qi, "z") for qi in range(num_qubits)) for config in configurations],
+        configuration_of_strings,
+        qubits_of_strings,
+    )
+
+
+def basis_rotation(qc: QuantumCircuit, qubit: int, unit: StringOperatorUnit) -> None:
+    """Rotate the qubit to measure the Pauli operator by the computational basis.
+
+    Args:
+        qc (QuantumCircuit): The circuit.
+        qubit (int): The index of the qubit.
+        unit (StringOperatorUnit): The Pauli operator.
+    """
+    if unit == "x":
+        qc.ry(-np.pi / 2, qubit)
+    elif unit == "y":
+        qc.rx(np.pi / 2, qubit)
@@ -16,5 +16,6 @@ from .backend import (
     backend_name_getter,
 )
 from .parallelmanager import ParallelManager, workers_distribution, DEFAULT_POOL_SIZE
+from .concurrency import ConcurrencyBudget, get_concurrency, set_concurrency
 from .progressbar import qurry_progressbar, set_pbar_description
 from .datetime import current_time, DatetimeDict
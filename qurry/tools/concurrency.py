@@ -0,0 +1,205 @@
+"""
+================================================================
+Concurrency (:mod:`qurry.tools.concurrency`)
+================================================================
+
+The process-wide concurrency budget shared by the process pools of :class:`ParallelManager`,
+the thread pool of rayon in :mod:`qurry.boorust` and the threads of NumPy.
+
+The budget is the total number of threads that one analysis may occupy.
+The process pools launch `workers` processes,
+and each worker is limited to `threads_per_worker` threads for rayon and NumPy,
+so the nested calls from the pool workers to the Rust kernels
+do not oversubscribe the machine.
+The limits are set by :func:`worker_initializer` inside each worker,
+so the environment variables of this process are left untouched.
+The thread pool of rayon is sized by `RAYON_NUM_THREADS` instead of being built in advance,
+since a forked worker can not resize or use the pool built by its parent.
+The pools in a worker are run serially by the nested-parallelism guard.
+
+.. code-block:: python
+
+    from qurry.tools import set_concurrency
+
+    # Use 16 threads in total, by 4 workers with 4 threads each.
+    set_concurrency(16, workers=4)
+
+The budget can also be given by the environment variable `QURRY_NUM_THREADS`.
+
+"""
+
+import os
+import warnings
+from multiprocessing import cpu_count
+from typing import Optional, NamedTuple
+
+from ..exceptions import QurryWarning
+
+try:
+    from ..boorust import concurrency as boorust_concurrency  # type: ignore
+
+    RUST_AVAILABLE = True
+    FAILED_RUST_IMPORT = None
+except ImportError as err:
+    boorust_concurrency = None  # pylint: disable=invalid-name
+    RUST_AVAILABLE = False
+    FAILED_RUST_IMPORT = err
+
+try:
+    from threadpoolctl import threadpool_limits  # type: ignore
+except ImportError:
+    threadpool_limits = None  # pylint: disable=invalid-name
+
+QURRY_NUM_THREADS_ENV = "QURRY_NUM_THREADS"
+"""The environment variable of the total number of threads."""
+QURRY_WORKER_ENV = "QURRY_POOL_PARENT"
+"""The environment variable of the process id of the parent of a pool worker."""
+THREAD_LIMIT_ENVS = (
+    "RAYON_NUM_THREADS",
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+)
+"""The environment variables limiting the threads of rayon and the BLAS of NumPy."""
+
+
+def available_cpu_count() -> int:
+    """The number of CPUs which this process is allowed to run on.
+
+    Returns:
+        int: The number of available CPUs.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return max(len(os.sched_getaffinity(0)), 1)
+    return max(cpu_count(), 1)
+
+
+class ConcurrencyBudget(NamedTuple):
+    """The concurrency budget."""
+
+    total: int
+    """The total number of threads."""
+    workers: int
+    """The number of workers of process pools."""
+    threads_per_worker: int
+    """The number of threads of rayon and NumPy in each worker."""
+
+
+def _budget_from_env() -> ConcurrencyBudget:
+    total = available_cpu_count()
+    raw_total = os.environ.get(QURRY_NUM_THREADS_ENV)
+    if raw_total is not None:
+        try:
+            total = max(int(raw_total), 1)
+        except ValueError:
+            warnings.warn(
+                f"| Invalid {QURRY_NUM_THREADS_ENV}='{raw_total}', use {total} threads.",
+                category=QurryWarning,
+            )
+    return ConcurrencyBudget(total, total, 1)
+
+
+_BUDGET = _budget_from_env()
+
+
+def in_worker() -> bool:
+    """Whether this process is a worker of a process pool from :class:`ParallelManager`.
+
+    Returns:
+        bool: Whether this process is a worker.
+    """
+    parent = os.environ.get(QURRY_WORKER_ENV)
+    return parent is not None and parent != str(os.getpid())
+
+
+def get_concurrency() -> ConcurrencyBudget:
+    """Get the concurrency budget of this process.
+
+    The budget of a worker is always a single worker with `threads_per_worker` threads,
+    which is the guard of nested parallelism.
+
+    Returns:
+        ConcurrencyBudget: The concurrency budget.
+    """
+    if in_worker():
+        threads = int(os.environ.get(THREAD_LIMIT_ENVS[0], "1"))
+        return ConcurrencyBudget(threads, 1, threads)
+    return _BUDGET
+
+
+def set_concurrency(
+    total: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> ConcurrencyBudget:
+    """Set the concurrency budget of this process.
+
+    The thread pool of rayon in this process is sized to `total` by `RAYON_NUM_THREADS`,
+    which only takes effect before the first call of the Rust kernels,
+    and so are the threads of NumPy if `threadpoolctl` is installed.
+    The global thread pool of rayon is never built in this process by this function,
+    so it is still unbuilt in the workers forked from this process.
+
+    Args:
+        total (Optional[int], optional):
+            The total number of threads,
+            the number of available CPUs is used if it is None. Defaults to None.
+        workers (Optional[int], optional):
+            The number of workers of process pools, `total` is used if it is None.
+            Defaults to None.
+
+    Raises:
+        ValueError: If `total` or `workers` is not positive.
+
+    Returns:
+        ConcurrencyBudget: The new concurrency budget.
+    """
+    global _BUDGET  # pylint: disable=global-statement
+
+    if total is None:
+        total = available_cpu_count()
+    if workers is None:
+        workers = total
+    if total < 1 or workers < 1:
+        raise ValueError(f"total and workers should be positive, but get {total}, {workers}.")
+    if workers > total:
+        warnings.warn(
+            f"| Workers number {workers} is larger than the total threads {total}, "
+            + f"use {total} workers.",
+            category=QurryWarning,
+        )
+        workers = total
+
+    _BUDGET = ConcurrencyBudget(total, workers, max(total // workers, 1))
+    # The global thread pool of rayon is not built here but sized by the environment variable,
+    # since the forked workers would inherit a built pool without its threads.
+    os.environ[THREAD_LIMIT_ENVS[0]] = str(total)
+    if threadpool_limits is not None:
+        threadpool_limits(total)
+    return _BUDGET
+
+
+def worker_initializer(threads_per_worker: int) -> None:
+    """The initializer of the workers of process pools,
+    which limits the threads of rayon and NumPy in the worker.
+    A warning is raised if the thread pool of rayon is inherited from the parent process,
+    which can not be resized.
+
+    Args:
+        threads_per_worker (int): The number of threads in each worker.
+    """
+    os.environ[QURRY_WORKER_ENV] = str(os.getppid())
+    for env in THREAD_LIMIT_ENVS:
+        os.environ[env] = str(threads_per_worker)
+    if boorust_concurrency is not None and not boorust_concurrency.set_rayon_threads(
+        threads_per_worker
+    ):
+        warnings.warn(
+            "| The thread pool of rayon in the worker has been built before forking, "
+            + f"so it is not limited to {threads_per_worker} threads "
+            + "and the Rust kernels in the worker may be blocked. "
+            + "Avoid calling the Rust kernels before launching the process pools.",
+            category=QurryWarning,
+        )
+    if threadpool_limits is not None:
+        threadpool_limits(threads_per_worker)
+
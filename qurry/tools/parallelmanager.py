@@ -7,46 +7,66 @@ ProcessManager (:mod:`qurry.tools.processmanager`)
 
 import warnings
 from typing import Optional, Iterable, Callable, TypeVar, Any
-from multiprocessing import Pool, cpu_count
-from tqdm.contrib.concurrent import process_map
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Pool
+from multiprocessing.pool import Pool as ProcessPool
+from tqdm.auto import tqdm
 
 from .progressbar import default_setup
+from .concurrency import (
+    get_concurrency,
+    in_worker,
+    worker_initializer,
+)
 from ..exceptions import QurryWarning
 
 # Ready for issue #75 https://github.com/harui2019/qurry/issues/75
 
-DEFAULT_POOL_SIZE = cpu_count()
+DEFAULT_POOL_SIZE = get_concurrency().workers
+"""The workers number of the concurrency budget when :mod:`qurry` is imported,
+use :func:`get_concurrency` for the current one."""
 
 
 def workers_distribution(
     workers_num: Optional[int] = None,
-    default: int = DEFAULT_POOL_SIZE,
+    default: Optional[int] = None,
 ) -> int:
-    """Distribute the workers number.
+    """Distribute the workers number under the concurrency budget.
+    It is always 1 in the worker of a process pool to avoid nested parallelism.
 
     Args:
         workers_num (Optional[int], optional): Desired workers number. Defaults to None.
-        default (int, optional): Default workers number. Defaults to DEFAULT_POOL_SIZE.
+        default (Optional[int], optional):
+            Default workers number,
+            the workers number of the concurrency budget is used if it is None.
+            Defaults to None.
 
     Returns:
         int: Workers number.
     """
 
+    if in_worker():
+        return 1
+
+    budget = get_concurrency()
+    if default is None:
+        default = budget.workers
     if default < 1:
         warnings.warn(
-            f"| Available worker number {cpu_count()} is equal orsmaller than 2."
+            f"| Available worker number {default} is equal orsmaller than 2."
             + "This computer may not be able to run this program for "
             + "the program will allocate all available threads.",
             category=QurryWarning,
         )
-        default = cpu_count()
+        default = budget.workers
 
     if workers_num is None:
         launch_worker = default
     else:
-        if workers_num > cpu_count():
+        if workers_num > budget.total:
             warnings.warn(
-                f"| Worker number {workers_num} is larger than cpu count {cpu_count()}.",
+                f"| Worker number {workers_num} is larger than "
+                + f"the concurrency budget {budget.total}.",
                 category=QurryWarning,
             )
             launch_worker = default
@@ -62,6 +82,17 @@ def workers_distribution(
     return launch_worker
 
 
+def _chained_initializer(
+    threads_per_worker: int,
+    initializer: Optional[Callable[..., Any]],
+    initargs: Iterable[Any],
+) -> None:
+    """Limit the threads of the worker, then call the initializer given by `pool_kwargs`."""
+    worker_initializer(threads_per_worker)
+    if initializer is not None:
+        initializer(*initargs)
+
+
 # pylint: disable=invalid-name
 T_map = TypeVar("T_map")
 T_tgt = TypeVar("T_tgt")
@@ -73,14 +104,16 @@ class ParallelManager:
 
     def __init__(
         self,
-        workers_num: Optional[int] = DEFAULT_POOL_SIZE,
+        workers_num: Optional[int] = None,
         **pool_kwargs,
     ):
         """Initialize the process manager.
 
         Args:
             workers_num (Optional[int], optional):
-                Desired workers number. Defaults to DEFAULT_POOL_SIZE.
+                Desired workers number,
+                the workers number of the concurrency budget is used if it is None.
+                Defaults to None.
             **pool_kwargs: Other arguments for Pool.
         """
 
@@ -93,6 +126,20 @@ class ParallelManager:
 
         self.pool_kwargs = pool_kwargs
         self.workers_num = workers_distribution(workers_num)
+        self.threads_per_worker = max(get_concurrency().total // self.workers_num, 1)
+        """The threads of rayon and NumPy in each worker."""
+
+    def _pool(self) -> ProcessPool:
+        """Create the pool with the workers limited by the concurrency budget."""
+        pool_kwargs = dict(self.pool_kwargs)
+        initializer = pool_kwargs.pop("initializer", None)
+        initargs = pool_kwargs.pop("initargs", ())
+        return Pool(
+            processes=self.workers_num,
+            initializer=_chained_initializer,
+            initargs=(self.threads_per_worker, initializer, initargs),
+            **pool_kwargs,
+        )
 
     def starmap(
         self,
@@ -112,7 +159,7 @@ class ParallelManager:
         if self.workers_num == 1:
             return list(map(func, *zip(*args_list)))
 
-        with Pool(processes=self.workers_num, **self.pool_kwargs) as pool:
+        with self._pool() as pool:
             return pool.starmap(func, args_list)
 
     def map(
@@ -133,7 +180,7 @@ class ParallelManager:
         if self.workers_num == 1:
             return list(map(func, arg_list))
 
-        with Pool(processes=self.workers_num, **self.pool_kwargs) as pool:
+        with self._pool() as pool:
             return pool.map(func, arg_list)
 
     def process_map(
@@ -144,14 +191,16 @@ class ParallelManager:
         bar_ascii: str = "4squares",
         **kwargs,
     ) -> list[T_map]:
-        """Multiprocessing process_map.
+        """Multiprocessing map with a progress bar,
+        which is like :func:`tqdm.contrib.concurrent.process_map`,
+        but the threads of the workers are limited by the initializer in the workers.
 
         Args:
             func (Callable[[Any], T_map]): Function to be mapped.
             args (Iterable[Any]): Arguments to be mapped.
             bar_format (str, optional): Progress bar format. Defaults to "qurry-full".
             bar_ascii (str, optional): Progress bar ascii. Defaults to "4squares".
-            **kwargs: Other arguments.
+            **kwargs: Other arguments for the progress bar, and `chunksize` for the map.
 
         Returns:
             list[T_map]: Results.
@@ -160,12 +209,20 @@ class ParallelManager:
         result_setup = default_setup(bar_format, bar_ascii)
         actual_bar_format = result_setup["bar_format"]
         actual_ascii = result_setup["ascii"]
+        args_list = list(args_list)
+        chunksize = kwargs.pop("chunksize", 1)
 
-        return process_map(
-            func,
-            *zip(*args_list),
-            **kwargs,
-            ascii=actual_ascii,
-            bar_format=actual_bar_format,
+        with ProcessPoolExecutor(
             max_workers=self.workers_num,
-        )
+            initializer=worker_initializer,
+            initargs=(self.threads_per_worker,),
+        ) as executor:
+            return list(
+                tqdm(
+                    executor.map(func, *zip(*args_list), chunksize=chunksize),
+                    total=len(args_list),
+                    **kwargs,
+                    ascii=actual_ascii,
+                    bar_format=actual_bar_format,
+                )
+            )
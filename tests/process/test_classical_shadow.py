@@ -0,0 +1,326 @@
+"""
+================================================================
+Test - qurry.process.classical_shadow
+================================================================
+
+"""
+
+import pytest
+import numpy as np
+
+from qiskit.quantum_info import SparsePauliOp
+
+from qurry.process.classical_shadow import (
+    reduced_density_matrix,
+    expectation_product,
+    classical_shadow_complex,
+    shadow_observables,
+    trace_rho_square,
+    classical_shadow_subsystems,
+)
+from qurry.process.classical_shadow.classical_shadow import trace_rho_square_core
+from qurry.process.classical_shadow.purity import (
+    snapshot_outcomes,
+    marginal_distributions,
+    snapshot_distributions,
+    snapshot_overlaps,
+    trace_rho_square_groups,
+)
+from qurry.process.classical_shadow.rho_m_cell import rho_m_cell_py
+from qurry.process.classical_shadow.unitary_set import (
+    U_M_MATRIX,
+    OUTER_PRODUCT,
+    IDENTITY,
+    PAULI_MATRIX,
+)
+
+rng = np.random.default_rng(2019)
+NUM_QUBITS = 5
+test_counts = {
+    format(i, f"0{NUM_QUBITS}b"): int(v)
+    for i, v in enumerate(rng.integers(0, 50, 2**NUM_QUBITS))
+    if v > 0
+}
+test_direction = {i: int(d) for i, d in enumerate(rng.integers(0, 3, NUM_QUBITS))}
+
+
+def snapshot_reference(
+    single_counts: dict[str, int],
+    direction: dict[int, int],
+    selected_sorted: list[int],
+) -> np.ndarray:
+    """The snapshot averaged over the outcomes by the sum over bitstrings."""
+    shots = sum(single_counts.values())
+    rho_m = 0
+    for bitstring, num_counts in single_counts.items():
+        rho_m_s = np.ones((1, 1), dtype=np.complex128)
+        for q_i in selected_sorted:
+            rho_m_s = np.kron(
+                rho_m_s,
+                3
+                * U_M_MATRIX[direction[q_i]].conj().T
+                @ OUTER_PRODUCT[bitstring[len(bitstring) - q_i - 1]]
+                @ U_M_MATRIX[direction[q_i]]
+                - IDENTITY,
+            )
+        rho_m = rho_m + num_counts * rho_m_s / shots
+    return rho_m
+
+
+@pytest.mark.parametrize("selected", [[0, 1, 2, 3, 4], [3, 0], [2]])
+def test_rho_m_cell(selected: list[int]):
+    """Test the rho_m_i from the marginal frequencies against the sum over bitstrings."""
+
+    shots = sum(test_counts.values())
+    _, rho_m, rho_m_i, selected_sorted = rho_m_cell_py(0, test_counts, test_direction, selected)
+
+    assert selected_sorted == sorted(selected, reverse=True), "Wrong order of selected qubits."
+    for q_i in selected_sorted:
+        expected = sum(
+            num_counts
+            * (
+                3
+                * U_M_MATRIX[test_direction[q_i]].conj().T
+                @ OUTER_PRODUCT[bitstring[NUM_QUBITS - q_i - 1]]
+                @ U_M_MATRIX[test_direction[q_i]]
+                - IDENTITY
+            )
+            for bitstring, num_counts in test_counts.items()
+        ) / shots
+        assert np.allclose(rho_m_i[q_i], expected), f"Wrong rho_m_i of qubit {q_i}."
+    assert np.allclose(
+        rho_m, snapshot_reference(test_counts, test_direction, selected_sorted)
+    ), "Wrong rho_m."
+
+    _, rho_m_lazy, _, _ = rho_m_cell_py(0, test_counts, test_direction, selected, dense=False)
+    assert rho_m_lazy is None, "The dense rho_m should not be built."
+
+
+def random_shadow_counts(
+    num_n_u: int,
+    shots: int,
+) -> tuple[list[dict[str, int]], dict[int, dict[int, int]]]:
+    """Random counts and shadow directions of the random unitaries."""
+    counts = []
+    random_unitary_um = {}
+    for n_u_i in range(num_n_u):
+        outcomes = rng.integers(0, 2**NUM_QUBITS, shots)
+        values, nums = np.unique(outcomes, return_counts=True)
+        counts.append({format(v, f"0{NUM_QUBITS}b"): int(n) for v, n in zip(values, nums)})
+        random_unitary_um[n_u_i] = {i: int(d) for i, d in enumerate(rng.integers(0, 3, NUM_QUBITS))}
+    return counts, random_unitary_um
+
+
+def test_on_demand_shadow():
+    """Test the reduced density matrix and the expectation value on demand
+    against the dense snapshots, and the dense matrices are not built by default."""
+
+    num_n_u = 4
+    shots = 200
+    counts, random_unitary_um = random_shadow_counts(num_n_u, shots)
+
+    result = classical_shadow_complex(shots, counts, random_unitary_um, range(NUM_QUBITS))
+    assert result["expect_rho"] is None, "The expectation of Rho should not be built."
+    assert len(result["rho_m_dict"]) == 0, "The dense snapshots should not be built."
+
+    selected = [3, 1]
+    expected_rho = sum(
+        snapshot_reference(counts[n_u_i], random_unitary_um[n_u_i], sorted(selected, reverse=True))
+        for n_u_i in range(num_n_u)
+    ) / num_n_u
+    assert np.allclose(
+        reduced_density_matrix(shots, counts, random_unitary_um, selected), expected_rho
+    ), "Wrong reduced density matrix."
+
+    # The operator on the qubit 3 is the first factor of the Kronecker product.
+    expected_expectation = np.trace(np.kron(PAULI_MATRIX["X"], PAULI_MATRIX["Z"]) @ expected_rho)
+    assert np.isclose(
+        expectation_product(shots, counts, random_unitary_um, {1: "Z", 3: "X"}),
+        expected_expectation,
+    ), "Wrong expectation value."
+
+
+def test_shadow_observables():
+    """Test the Pauli observables in one pass against the expectation of each product
+    and the median of means against the group means."""
+
+    num_n_u = 30
+    shots = 100
+    counts, random_unitary_um = random_shadow_counts(num_n_u, shots)
+    labels = ["IIIZZ", "XIIYI", "ZZZZZ", "IIIII", "YXZIX"]
+
+    def product_of(label: str) -> dict[int, str]:
+        return {NUM_QUBITS - j - 1: p for j, p in enumerate(label) if p != "I"}
+
+    result = shadow_observables(shots, counts, random_unitary_um, labels, num_groups=1)
+    assert result["value"] is None, "The Pauli strings should not have the value."
+    for label, expectation in zip(labels, result["expectations"]):
+        assert np.isclose(
+            expectation,
+            expectation_product(shots, counts, random_unitary_um, product_of(label)),
+        ), f"Wrong expectation of {label}."
+
+    num_groups = 5
+    coefficients = [0.5, -1.0, 2.0, 1.0, 0.25]
+    result = shadow_observables(
+        shots, counts, random_unitary_um, SparsePauliOp(labels, coefficients), num_groups
+    )
+    group_size = num_n_u // num_groups
+    group_values = [
+        sum(
+            coefficient
+            * expectation_product(
+                shots,
+                counts[g * group_size : (g + 1) * group_size],
+                dict(enumerate(random_unitary_um[i] for i in range(g * group_size, num_n_u))),
+                product_of(label),
+            ).real
+            for label, coefficient in zip(labels, coefficients)
+        )
+        for g in range(num_groups)
+    ]
+    assert np.isclose(result["value"], np.median(group_values)), "Wrong median of means."
+    assert np.isclose(
+        result["value_error"], np.std(group_values, ddof=1) / np.sqrt(num_groups)
+    ), "Wrong error of median of means."
+
+
+def test_shadow_purity():
+    """Test the purity by the overlap kernel against the dense snapshots,
+    and the median of means against the U-statistics of each group."""
+
+    num_n_u = 12
+    shots = 64
+    counts, random_unitary_um = random_shadow_counts(num_n_u, shots)
+    selected = [4, 2, 0]
+
+    rho_m_dict = {
+        n_u_i: rho_m_cell_py(n_u_i, counts[n_u_i], random_unitary_um[n_u_i], selected)[1]
+        for n_u_i in range(num_n_u)
+    }
+    result = trace_rho_square(shots, counts, random_unitary_um, selected)
+    assert np.isclose(result["purity"], trace_rho_square_core(rho_m_dict)), "Wrong purity."
+    assert result["purity_error"] is None, "A single group should not have the error."
+
+    num_groups = 3
+    result = trace_rho_square(shots, counts, random_unitary_um, selected, num_groups=num_groups)
+    group_size = num_n_u // num_groups
+    group_purities = [
+        trace_rho_square_core(
+            {n_u_i: rho_m_dict[n_u_i] for n_u_i in range(g * group_size, (g + 1) * group_size)}
+        )
+        for g in range(num_groups)
+    ]
+    assert result["num_groups"] == num_groups, "Wrong number of groups."
+    assert np.isclose(result["purity"], np.median(group_purities)), "Wrong median of means."
+    assert np.isclose(
+        result["purity_error"], np.std(group_purities, ddof=1) / np.sqrt(num_groups)
+    ), "Wrong error of median of means."
+
+
+@pytest.mark.parametrize("selected", [[4, 3, 2, 1, 0], [4, 2, 0], [1]])
+def test_shadow_overlaps_sparse(selected: list[int]):
+    """Test the overlaps summed over the observed outcomes against the dense distributions."""
+
+    num_n_u = 8
+    shots = 16
+    counts, random_unitary_um = random_shadow_counts(num_n_u, shots)
+    outcomes, ratios, cell_index = snapshot_outcomes(shots, counts)
+    directions = np.array(
+        [[random_unitary_um[n_u_i][ci] for ci in selected] for n_u_i in range(num_n_u)]
+    )
+    first, second = np.triu_indices(num_n_u, k=1)
+
+    dense = marginal_distributions(outcomes, ratios, cell_index, num_n_u, selected, dense=True)
+    sparse = marginal_distributions(outcomes, ratios, cell_index, num_n_u, selected, dense=False)
+    assert sparse.dense is None, "The dense distributions should not be built."
+    assert np.allclose(
+        snapshot_overlaps(sparse, directions, first, second),
+        snapshot_overlaps(dense, directions, first, second),
+    ), "Wrong overlaps over the observed outcomes."
+
+
+def test_shadow_purity_many_qubits():
+    """Test the purity of a subsystem beyond the dense distributions,
+    where the extra qubits are always measured as 0,
+    so each of them multiplies the overlap by 5 or 1/2 for the same or different directions."""
+
+    num_n_u = 6
+    shots = 32
+    num_extra = 29
+    counts_small, random_unitary_um_small = random_shadow_counts(num_n_u, shots)
+    counts = [
+        {"0" * num_extra + bitstring: num for bitstring, num in single_counts.items()}
+        for single_counts in counts_small
+    ]
+    extra_directions = rng.integers(0, 3, (num_n_u, num_extra))
+    random_unitary_um = {
+        n_u_i: {
+            **random_unitary_um_small[n_u_i],
+            **{NUM_QUBITS + i: int(d) for i, d in enumerate(extra_directions[n_u_i])},
+        }
+        for n_u_i in range(num_n_u)
+    }
+    distributions, directions = snapshot_distributions(
+        shots, counts, random_unitary_um, list(range(NUM_QUBITS + num_extra))[::-1]
+    )
+    assert distributions.dense is None, "The dense distributions should not be built."
+    small_distributions, small_directions = snapshot_distributions(
+        shots, counts_small, random_unitary_um_small, list(range(NUM_QUBITS))[::-1]
+    )
+    first, second = np.triu_indices(num_n_u, k=1)
+    num_same = (extra_directions[first] == extra_directions[second]).sum(axis=1)
+    expected = snapshot_overlaps(
+        small_distributions, small_directions, first, second
+    ) * 5.0**num_same * 0.5 ** (num_extra - num_same)
+
+    purity, _, _ = trace_rho_square_groups(distributions, directions)
+    assert np.isclose(purity, expected.mean()), "Wrong purity of many qubits."
+
+
+def test_shadow_subsystems():
+    """Test the entropies of many subsystems in one pass against each subsystem alone."""
+
+    num_n_u = 10
+    shots = 64
+    counts, random_unitary_um = random_shadow_counts(num_n_u, shots)
+    subsystems = [[0], [1, 0], [4, 2, 0], [2, 3]]
+
+    result = classical_shadow_subsystems(shots, counts, random_unitary_um, subsystems)
+    subsystems_sorted = [sorted(subsystem, reverse=True) for subsystem in subsystems]
+    assert result["subsystems"] == subsystems_sorted, "Wrong order of subsystems."
+    for subsystem, purity, entropy in zip(subsystems, result["purities"], result["entropies"]):
+        expected = trace_rho_square(shots, counts, random_unitary_um, subsystem)
+        assert np.isclose(purity, expected["purity"]), f"Wrong purity of {subsystem}."
+        assert np.isclose(entropy, expected["entropy"]), f"Wrong entropy of {subsystem}."
+
+
+def test_shadow_subsystems_many_qubits():
+    """Test the entropies of the half-system cuts beyond the dense distributions,
+    which share the observed outcomes of the whole system, against each cut alone."""
+
+    num_n_u = 6
+    shots = 32
+    num_extra = 57
+    counts_small, random_unitary_um_small = random_shadow_counts(num_n_u, shots)
+    counts = [
+        {"0" * num_extra + bitstring: num for bitstring, num in single_counts.items()}
+        for single_counts in counts_small
+    ]
+    random_unitary_um = {
+        n_u_i: {
+            **random_unitary_um_small[n_u_i],
+            **{NUM_QUBITS + i: int(d) for i, d in enumerate(rng.integers(0, 3, num_extra))},
+        }
+        for n_u_i in range(num_n_u)
+    }
+    num_classical_register = NUM_QUBITS + num_extra
+    half = num_classical_register // 2
+    subsystems = [list(range(half)), list(range(half, num_classical_register)), [1, 0]]
+
+    result = classical_shadow_subsystems(shots, counts, random_unitary_um, subsystems)
+    for subsystem, purity in zip(result["subsystems"], result["purities"]):
+        expected, _, _ = trace_rho_square_groups(
+            *snapshot_distributions(shots, counts, random_unitary_um, subsystem)
+        )
+        assert np.isclose(purity, expected), f"Wrong purity of {subsystem}."
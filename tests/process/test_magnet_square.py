@@ -0,0 +1,48 @@
+"""
+================================================================
+Test - qurry.process.magnet_square
+================================================================
+
+"""
+
+import warnings
+import pytest
+import numpy as np
+
+from qurry.process.magnet_square.magsq_core import (
+    magnetic_square_core,
+    magnetic_square_core_pyrust,
+)
+from qurry.process.exceptions import PostProcessingRustUnavailableWarning
+
+rng = np.random.default_rng(2019)
+SHOTS = 1000
+test_counts = [
+    {
+        bits: int(num)
+        for bits, num in zip(
+            ["00", "01", "10", "11"], rng.multinomial(SHOTS, rng.dirichlet(np.ones(4)))
+        )
+        if num > 0
+    }
+    for _ in range(20)
+]
+
+
+@pytest.mark.parametrize("backend", ["Python", "Rust"])
+def test_magnetic_square_core(backend: str):
+    """Test the one-pass magnetic_square_core against the cells by magsq_cell_py."""
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", PostProcessingRustUnavailableWarning)
+        magnetsq, cells, length, _, _ = magnetic_square_core(
+            test_counts, SHOTS, 5, backend=backend
+        )
+    magnetsq_py, cells_py, _, _, _ = magnetic_square_core_pyrust(
+        test_counts, SHOTS, 5, 1, backend="Python"
+    )
+
+    assert length == len(test_counts), "The number of counts is not the same."
+    assert np.isclose(magnetsq, magnetsq_py), f"Magnet square: {magnetsq} != {magnetsq_py}."
+    for idx, cell in cells_py.items():
+        assert np.isclose(cells[idx], cell), f"Cell {idx}: {cells[idx]} != {cell}."
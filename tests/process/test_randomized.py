@@ -20,6 +20,13 @@ from qurry.process.randomized_measure.entangled_entropy_v1.entangled_entropy imp
 from qurry.process.randomized_measure.entangled_entropy.entangled_entropy_2 import (
     entangled_entropy_core_2,
 )
+from qurry.process.randomized_measure.entangled_entropy.bootstrap import (
+    purity_bootstrap,
+    purity_cells_resampled,
+)
+from qurry.process.randomized_measure.entangled_entropy.streaming import IncrementalPurity
+from qurry.process.randomized_measure.entangled_entropy.convergence import purity_convergence
+from qurry.process.randomized_measure.entangled_entropy.purity_cache import PurityCache
 from qurry.process.randomized_measure.wavefunction_overlap_v1.wavefunction_overlap import (
     overlap_echo_core,
 )
@@ -237,3 +244,192 @@ def test_overlap_echo_core(
         f"selected_classical_registers: {selected_classical_registers} != "
         + f"selected_classical_registers_by_cycling: {selected_classical_registers_by_cycling}"
     )
+
+
+@pytest.mark.parametrize("shot_resampling", [False, True])
+def test_purity_bootstrap(shot_resampling: bool):
+    """Test the purity_bootstrap function."""
+
+    source = easy_dummy["0"]
+    source_rng = np.random.default_rng(1)
+    counts = [
+        {k: int(v) for k, v in zip(source, sample) if v > 0}
+        for sample in source_rng.multinomial(
+            4096, np.array(list(source.values())) / sum(source.values()), size=10
+        )
+    ]
+    selected_classical_registers = [0, 1, 2]
+    purity_cells = entangled_entropy_core_2(
+        4096, counts, selected_classical_registers, backend="Python"
+    )[0]
+    purity = np.mean(list(purity_cells.values()))
+
+    rng = np.random.default_rng(0)
+    probs_cells = purity_cells_resampled(counts, [selected_classical_registers], 1, rng)[0]
+    assert probs_cells.shape == (1, len(counts)), f"Unexpected shape: {probs_cells.shape}."
+
+    result = purity_bootstrap(
+        purity_cells,
+        counts=counts,
+        selected_classical_registers=selected_classical_registers,
+        num_resamples=200,
+        shot_resampling=shot_resampling,
+        seed=42,
+    )
+    result_again = purity_bootstrap(
+        purity_cells,
+        counts=counts,
+        selected_classical_registers=selected_classical_registers,
+        num_resamples=200,
+        shot_resampling=shot_resampling,
+        seed=42,
+    )
+
+    assert result == result_again, "The bootstrap is not reproducible with the same seed."
+    assert result["purityCILow"] <= purity <= result["purityCIHigh"], (
+        f"The purity {purity} is not in the confidence interval "
+        + f"({result['purityCILow']}, {result['purityCIHigh']})."
+    )
+    assert result["entropyCILow"] <= result["entropyCIHigh"], (
+        f"The entropy confidence interval ({result['entropyCILow']}, {result['entropyCIHigh']}) "
+        + "is reversed."
+    )
+
+
+def test_incremental_purity():
+    """Test the IncrementalPurity with the batch result."""
+
+    source = easy_dummy["0"]
+    source_rng = np.random.default_rng(2)
+    counts = [
+        {k: int(v) for k, v in zip(source, sample) if v > 0}
+        for sample in source_rng.multinomial(
+            4096, np.array(list(source.values())) / sum(source.values()), size=12
+        )
+    ]
+    selected_classical_registers = [1, 3, 4]
+    purity_cells = entangled_entropy_core_2(
+        4096, counts, selected_classical_registers, backend="Python"
+    )[0]
+    purity_cell_values = np.array(list(purity_cells.values()))
+
+    estimator = IncrementalPurity(
+        selected_classical_registers, target_precision=1.0, min_cells=5, backend="Python"
+    )
+    estimator.update(counts[0])
+    assert not estimator.converged, "The estimator should not converge before min_cells."
+    estimator.update(counts[1:])
+
+    assert len(estimator) == len(counts), f"Unexpected number of cells: {len(estimator)}."
+    assert np.abs(estimator.purity - purity_cell_values.mean()) < 1e-12, (
+        f"The running purity {estimator.purity} is not equal to "
+        + f"the batch purity {purity_cell_values.mean()}."
+    )
+    assert np.abs(estimator.puritySD - purity_cell_values.std()) < 1e-12, (
+        f"The running puritySD {estimator.puritySD} is not equal to "
+        + f"the batch puritySD {purity_cell_values.std()}."
+    )
+    assert np.abs(estimator.purity_sem - purity_cell_values.std(ddof=1) / np.sqrt(12)) < 1e-12
+    assert estimator.converged, "The estimator should converge with the loose target."
+
+
+def test_purity_convergence():
+    """Test the purity_convergence function."""
+
+    source = easy_dummy["0"]
+    source_rng = np.random.default_rng(3)
+    counts = [
+        {k: int(v) for k, v in zip(source, sample) if v > 0}
+        for sample in source_rng.multinomial(
+            4096, np.array(list(source.values())) / sum(source.values()), size=8
+        )
+    ]
+    selected_classical_registers = [0, 2]
+    purity_cells = np.array(
+        list(
+            entangled_entropy_core_2(
+                4096, counts, selected_classical_registers, backend="Python"
+            )[0].values()
+        )
+    )
+
+    result = purity_convergence(
+        4096,
+        counts,
+        selected_classical_registers,
+        times_grid=[1, 4, 8],
+        shots_grid=[64, 4096],
+        seed=7,
+        backend="Python",
+    )
+
+    assert np.allclose(
+        result["purity_by_times"], [purity_cells[:t].mean() for t in (1, 4, 8)], atol=1e-12
+    ), f"The prefix purity {result['purity_by_times']} is not equal to the batch purity."
+    assert np.allclose(
+        result["puritySD_by_times"], [purity_cells[:t].std() for t in (1, 4, 8)], atol=1e-12
+    ), f"The prefix puritySD {result['puritySD_by_times']} is not equal to the batch one."
+    assert np.abs(result["purity_by_shots"][-1] - purity_cells.mean()) < 0.05, (
+        f"The purity of the full shots {result['purity_by_shots'][-1]} is far from "
+        + f"the batch purity {purity_cells.mean()}."
+    )
+
+
+def test_purity_cache(tmp_path):
+    """Test the PurityCache in memory and on disk."""
+
+    counts = [easy_dummy["0"], {k: v for k, v in reversed(easy_dummy["0"].items())}]
+    selected_classical_registers = [0, 1, 5]
+    expected = entangled_entropy_core_2(
+        4096, counts, selected_classical_registers, backend="Python"
+    )[0]
+
+    purity_cache = PurityCache(tmp_path)
+    first = purity_cache.entangled_entropy_core_2(
+        4096, counts, selected_classical_registers, backend="Python"
+    )[0]
+    second = purity_cache.entangled_entropy_core_2(
+        4096, counts, [5, 1, 0], backend="Python"
+    )[0]
+    assert (purity_cache.hits, purity_cache.misses) == (1, 1), f"Unexpected {purity_cache}."
+
+    reopened_cache = PurityCache(tmp_path)
+    reopened = reopened_cache.entangled_entropy_core_2(
+        4096, counts, selected_classical_registers, backend="Python"
+    )[0]
+    assert (reopened_cache.hits, reopened_cache.misses) == (1, 0), f"Unexpected {reopened_cache}."
+
+    for result in (first, second, reopened):
+        assert result == expected, f"The cached purity cells {result} != {expected}."
+
+
+@pytest.mark.parametrize(
+    "selected_classical_registers", [[0, 1, 5], list(range(8)), [], [0, 0], [3, 1, 3]]
+)
+def test_overlap_echo_dense(selected_classical_registers: list[int]):
+    """Test the backend 'Dense' of overlap_echo_core_2 against Python."""
+
+    rng = np.random.default_rng(11)
+    outcomes = list(easy_dummy["0"].keys())
+    probs = np.array(list(easy_dummy["0"].values()), dtype=np.float64)
+    first_counts, second_counts = [
+        [
+            {b: int(v) for b, v in zip(outcomes, rng.multinomial(4096, probs / probs.sum())) if v}
+            for _ in range(3)
+        ]
+        for _ in range(2)
+    ]
+
+    expected, expected_registers, _, _ = overlap_echo_core_2(
+        4096, first_counts, second_counts, selected_classical_registers, backend="Python"
+    )
+    dense, dense_registers, _, _ = overlap_echo_core_2(
+        4096, first_counts, second_counts, selected_classical_registers, backend="Dense"
+    )
+    assert dense_registers == expected_registers, (
+        f"The selected classical registers {dense_registers} != {expected_registers}."
+    )
+    for idx, value in expected.items():
+        assert np.abs(dense[idx] - value) < 1e-12, (
+            f"The dense echo cell {dense[idx]} != {value} for cell {idx}."
+        )
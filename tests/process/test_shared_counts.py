@@ -0,0 +1,50 @@
+"""
+================================================================
+Test the shared-memory transport of counts
+of qurry.process.utils.shared_counts
+================================================================
+
+"""
+
+import os
+
+from qurry.capsule import quickRead
+from qurry.tools import ParallelManager, get_concurrency, set_concurrency
+from qurry.process.utils import SharedCounts, read_shared_counts, counts_starmap
+from qurry.process.randomized_measure.entangled_entropy.purity_cell_2 import purity_cell_2_py
+
+FILE_LOCATION = os.path.join(os.path.dirname(__file__), "easy-dummy.json")
+
+easy_dummy: dict[str, dict[str, int]] = quickRead(FILE_LOCATION)
+
+
+def test_shared_counts():
+    """Test the counts read from shared memory and mapped over the workers."""
+
+    counts = [easy_dummy["0"], {}, {k: v for k, v in reversed(easy_dummy["0"].items())}]
+    with SharedCounts(counts) as shared:
+        for idx, single_counts in enumerate(counts):
+            assert read_shared_counts(shared.handle, idx) == single_counts, (
+                f"The counts {idx} read from shared memory is different."
+            )
+
+    selected_classical_registers = [0, 2, 5]
+    counts = [easy_dummy["0"]] * 4
+    expected = [
+        purity_cell_2_py(idx, single_counts, selected_classical_registers)
+        for idx, single_counts in enumerate(counts)
+    ]
+    original = get_concurrency()
+    try:
+        set_concurrency(2)
+        pool = ParallelManager(2)
+        assert pool.workers_num == 2, "The counts are not mapped by multiple workers."
+        result = counts_starmap(
+            pool,
+            purity_cell_2_py,
+            counts,
+            [(selected_classical_registers,) for _ in counts],
+        )
+    finally:
+        set_concurrency(original.total, original.workers)
+    assert result == expected, f"The purity cells {result} != {expected}."
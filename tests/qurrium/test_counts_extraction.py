@@ -0,0 +1,97 @@
+"""
+================================================================
+Test the bulk counts and memory extraction
+of qurry.qurrium.utils.construct
+================================================================
+
+"""
+
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
+
+from qurry.qurrent import EntropyMeasure
+from qurry.qurrent.randomized_measure import EntropyMeasureRandomizedExperiment
+from qurry.qurrium.utils import (
+    get_counts_and_exceptions,
+    get_int_counts_and_exceptions,
+    get_memory_and_exceptions,
+    memory_to_counts,
+)
+from qurry.tools.backend import GeneralSimulator
+from qurry.recipe import GHZ
+
+
+def test_bulk_counts_extraction():
+    """Test the counts are the same as :meth:`Result.get_counts`."""
+
+    circuits = []
+    for i in range(10):
+        qc = QuantumCircuit(
+            QuantumRegister(5), ClassicalRegister(2, "a"), ClassicalRegister(3, "b")
+        )
+        qc.h(range(i % 5 + 1))
+        qc.measure(range(5), range(5))
+        circuits.append(qc)
+    result = GeneralSimulator().run(circuits, shots=256).result()
+
+    counts, exceptions = get_counts_and_exceptions(result, num=10)
+    assert len(exceptions) == 0
+    assert counts == [result.get_counts(i) for i in range(10)]
+
+    counts_all, _ = get_counts_and_exceptions(result)
+    assert counts_all == counts
+
+    int_counts, _ = get_int_counts_and_exceptions(result, num=10)
+    for c, ic in zip(counts, int_counts):
+        assert ic == {int(k.replace(" ", ""), 2): v for k, v in c.items()}
+
+    counts_lost, exceptions_lost = get_counts_and_exceptions(result, result_idx_list=[0, 10])
+    assert counts_lost[0] == counts[0] and counts_lost[1] == {}
+    assert list(exceptions_lost) == [f"{result.job_id}.10"]
+
+
+def test_memory_retention(tmp_path):
+    """Test the per-shot memory is kept, exported and read back."""
+
+    exp_method = EntropyMeasure(method="randomized")
+    wave = exp_method.add(GHZ(4), "4-GHZ")
+    exp_id = exp_method.measure(
+        wave=wave, times=5, shots=128, backend=GeneralSimulator(), run_args={"memory": True}
+    )
+    exp = exp_method.exps[exp_id]
+    assert len(exp.afterwards.memory) == len(exp.afterwards.counts) == 5
+    for memory, counts in zip(exp.afterwards.memory, exp.afterwards.counts):
+        assert memory.shape == (128,)
+        assert memory_to_counts(memory, 4) == counts
+
+    exp_id, files = exp.write(save_location=tmp_path)
+    assert "memory" in files
+    exp_read = EntropyMeasureRandomizedExperiment._read_core(exp_id, files, tmp_path)
+    for memory_read, memory in zip(exp_read.afterwards.memory, exp.afterwards.memory):
+        assert (memory_read == memory).all()
+
+
+def test_memory_remote_retrieval():
+    """Test the per-shot memory is kept when the result is retrieved from remote jobs."""
+
+    backend = GeneralSimulator()
+    exp_method = EntropyMeasure(method="randomized")
+    wave = exp_method.add(GHZ(4), "4-GHZ")
+    exp_id = exp_method.build([wave], times=5, backend=backend)
+    exp = exp_method.exps[exp_id]
+
+    result = backend.run(exp.beforewards.circuit, shots=128, memory=True).result()
+    counts, _ = get_counts_and_exceptions(result, num=5)
+    memory, _ = get_memory_and_exceptions(result, num=5)
+    idx_circs = [3 + i for i in range(5)]
+    counts_taken = exp._remote_result_taking(
+        counts_tmp_container=dict(zip(idx_circs, counts)),
+        summoner_id=exp.commons.summoner_id,
+        idx_circs=idx_circs,
+        retrieve_times_name="retrieve.001",
+        memory_tmp_container=dict(zip(idx_circs, memory)),
+    )
+    assert counts_taken == counts
+    assert len(exp.afterwards.memory) == 5
+    for memory_taken, counts_single in zip(exp.afterwards.memory, counts):
+        assert memory_taken.shape == (128,)
+        assert memory_to_counts(memory_taken, 4) == counts_single
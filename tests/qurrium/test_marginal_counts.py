@@ -0,0 +1,54 @@
+"""
+================================================================
+Test the memoized marginal counts
+of qurry.qurrium.experiment.afterwards
+================================================================
+
+"""
+
+import numpy as np
+
+from qurry.qurrium.experiment.afterwards import After
+from qurry.process.utils import counts_marginal
+from qurry.process.randomized_measure.entangled_entropy.purity_cell_2 import purity_cell_2_py
+
+
+def test_marginal_counts():
+    """Test the marginal counts are memoized and renewed with the counts."""
+
+    rng = np.random.default_rng(5)
+    counts = [
+        {format(i, "05b"): int(v) for i, v in enumerate(rng.integers(0, 20, 32)) if v > 0}
+        for _ in range(4)
+    ]
+    afterwards = After(**After.default_value())
+    afterwards.counts.extend(counts)
+
+    superset = afterwards.marginal_counts([4, 1, 0])
+    assert superset == counts_marginal(counts, [0, 1, 4]), "Unexpected marginal counts."
+    assert afterwards.marginal_counts([0, 1, 4]) is superset, "The marginal counts is not cached."
+
+    subset = afterwards.marginal_counts([1, 4])
+    assert subset == counts_marginal(counts, [1, 4]), "Wrong marginal counts from superset."
+    for single_counts, single_subset in zip(counts, subset):
+        assert (
+            purity_cell_2_py(0, single_counts, [1, 4])[1]
+            == purity_cell_2_py(0, single_subset, [0, 1])[1]
+        ), "The purity cell of marginal counts is not the same."
+
+    afterwards.counts.append(dict(counts[0]))
+    afterwards.counts[1] = dict(counts[2])
+    renewed = afterwards.marginal_counts([1, 4])
+    assert renewed == counts_marginal(afterwards.counts, [1, 4]), "Marginal counts not renewed."
+
+
+def test_marginal_counts_replaced():
+    """Test the marginal counts are renewed when a freed counts is replaced."""
+
+    afterwards = After(**After.default_value())
+    afterwards.counts.append({"00": 5, "01": 5})
+    assert afterwards.marginal_counts([0]) == [{"0": 5, "1": 5}]
+
+    afterwards.counts[0] = None  # type: ignore
+    afterwards.counts[0] = {"01": 10}
+    assert afterwards.marginal_counts([0]) == [{"1": 10}], "Stale marginal counts."
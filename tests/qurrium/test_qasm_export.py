@@ -0,0 +1,71 @@
+"""
+================================================================
+Test the lazy and shared OpenQASM export of qurry.qurrium
+================================================================
+
+"""
+
+import pickle
+
+from qurry.qurrent import EntropyMeasure
+from qurry.tools.backend import GeneralSimulator
+from qurry.recipe import GHZ
+
+
+def test_lazy_and_shared_qasm(tmp_path):
+    """Test the OpenQASM strings are drawn on demand
+    and the same target is only stored once in a multimanager."""
+
+    backend = GeneralSimulator()
+    exp_method = EntropyMeasure(method="randomized")
+    wave = exp_method.add(GHZ(4), "4-GHZ")
+
+    exp_id = exp_method.build([wave], times=5, backend=backend)
+    exp = exp_method.exps[exp_id]
+    assert exp.qasm_pending == "qasm3", "OpenQASM should be deferred."
+    assert len(exp.beforewards.circuit_qasm) == 0, "OpenQASM should be deferred."
+    assert len(exp.circuit_qasm) == 5, "OpenQASM is not drawn on the first access."
+    assert exp.qasm_pending is None
+    assert exp.beforewards.circuit_qasm is exp.circuit_qasm
+    assert exp.beforewards.target_qasm[0][1].startswith("OPENQASM 3.0")
+
+    exp_id = exp_method.build([wave], times=5, backend=backend)
+    exp = exp_method.exps[exp_id]
+    assert exp.target_qasm[0][1].startswith("OPENQASM 3.0")
+    assert exp.qasm_pending is None
+    assert len(exp["circuit_qasm"]) == 5
+    assert all(qasm_str.startswith("OPENQASM 3.0") for qasm_str in exp.beforewards.circuit_qasm)
+
+    summoner_id = exp_method.multiOutput(
+        [{"wave": wave, "times": 5} for _ in range(3)],  # type: ignore
+        backend=backend,
+        summoner_name="shared_qasm",
+        save_location=tmp_path,
+    )
+    summoner_name = exp_method.multimanagers[summoner_id].summoner_name
+    qasm_files = list(tmp_path.glob(f"{summoner_name}/qasm/*.qasm"))
+    assert len(qasm_files) == 1, f"The target qasm is not shared: {qasm_files}."
+
+    multi_exp_ids = exp_method.multimanagers[summoner_id].beforewards.exps_config.keys()
+    target_qasm = [exp_method.exps[k].beforewards.target_qasm for k in multi_exp_ids]
+
+    read_summoner_id = exp_method.multiRead(summoner_name=summoner_name, save_location=tmp_path)
+    read_ids = exp_method.multimanagers[read_summoner_id].beforewards.exps_config.keys()
+    for i, k in enumerate(read_ids):
+        assert exp_method.exps[k].beforewards.target_qasm == target_qasm[i]
+
+
+def test_pickle_deferred_qasm():
+    """Test the experiment with the deferred OpenQASM strings can be pickled."""
+
+    backend = GeneralSimulator()
+    exp_method = EntropyMeasure(method="randomized")
+    wave = exp_method.add(GHZ(4), "4-GHZ")
+    exp_id = exp_method.build([wave], times=5, backend=backend)
+    exp = exp_method.exps[exp_id]
+
+    exp_loaded = pickle.loads(pickle.dumps(exp))
+    assert exp_loaded.qasm_pending == "qasm3", "OpenQASM should be still deferred."
+    assert len(exp_loaded.beforewards.circuit) == 5
+    assert exp_loaded.circuit_qasm == exp.circuit_qasm
+    assert exp_loaded.target_qasm == exp.target_qasm
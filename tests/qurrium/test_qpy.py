@@ -0,0 +1,36 @@
+"""
+================================================================
+Test the QPY circuit store of qurry.qurrium.experiment
+================================================================
+
+"""
+
+from qurry.qurrent import EntropyMeasure
+from qurry.qurrent.randomized_measure import EntropyMeasureRandomizedExperiment
+from qurry.tools.backend import GeneralSimulator
+from qurry.recipe import GHZ
+
+
+def test_qpy_export_and_read(tmp_path):
+    """Test the circuits exported as QPY are loaded back when reading."""
+
+    backend = GeneralSimulator()
+    exp_method = EntropyMeasure(method="randomized")
+    wave = exp_method.add(GHZ(4), "4-GHZ")
+
+    exp_id = exp_method.build([wave], times=5, backend=backend, qasm_version=None)
+    exp = exp_method.exps[exp_id]
+    assert len(exp.beforewards.circuit_qasm) == 0, "OpenQASM should not be generated."
+
+    exp_id, files = exp.write(save_location=tmp_path, export_qpy=True)
+    assert "qpy.target" in files and "qpy.circuit" in files
+    assert (tmp_path / files["qpy.circuit"]).exists()
+
+    exp_read = EntropyMeasureRandomizedExperiment._read_core(exp_id, files, tmp_path)
+    assert len(exp_read.beforewards.circuit) == len(exp.beforewards.circuit) == 5
+    for circ_read, circ in zip(exp_read.beforewards.circuit, exp.beforewards.circuit):
+        assert circ_read == circ, f"Circuit {circ.name} is not revived from QPY."
+    assert [k for k, _ in exp_read.beforewards.target] == [
+        str(k) for k, _ in exp.beforewards.target
+    ]
+    assert exp_read.beforewards.target[0][1] == exp.beforewards.target[0][1]
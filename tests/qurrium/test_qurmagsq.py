@@ -0,0 +1,75 @@
+"""
+================================================================
+Test the qurry.qurmagsq module MagnetSquare class.
+================================================================
+
+- [4-GHZ] and [6-GHZ]: The magnetization square is 1.0.
+- [4-trivial] and [6-trivial]: The magnetization square is about 1 / n.
+
+"""
+
+from itertools import permutations
+import pytest
+import numpy as np
+
+from qurry.qurmagsq import MagnetSquare
+from qurry.qurmagsq.magnet_square import MagnetSquareExperiment
+from qurry.process.utils import single_counts_marginal
+from qurry.process.magnet_square.magsq_cell import magsq_cell_py
+from qurry.recipe import TrivialParamagnet, GHZ
+
+SEED_SIMULATOR = 2019  # <harmony/>
+THREDHOLD = 0.1
+
+exp_magsq = MagnetSquare()
+answer = {}
+wave_adds = []
+for i in range(4, 7, 2):
+    wave_adds.append(exp_magsq.add(GHZ(i), f"{i}-GHZ"))
+    answer[f"{i}-GHZ"] = 1.0
+    wave_adds.append(exp_magsq.add(TrivialParamagnet(i), f"{i}-trivial"))
+    answer[f"{i}-trivial"] = 1.0 / i
+
+
+@pytest.mark.parametrize("wave", wave_adds)
+def test_magnet_square(wave: str):
+    """Test the magnetization square from the whole register
+    and the ZZ correlators against the pairwise cells."""
+
+    exp_id = exp_magsq.measure(wave=wave, shots=1024, run_args={"seed_simulator": SEED_SIMULATOR})
+    experiment = exp_magsq.exps[exp_id]
+    assert len(experiment.beforewards.circuit) == 1, "Only one circuit should be measured."
+
+    analysis = experiment.analyze()
+    assert np.abs(analysis.content.magnet_square - answer[wave]) < THREDHOLD, (
+        f"The magnetization square of {wave} is {analysis.content.magnet_square}, "
+        + f"but the answer is {answer[wave]}."
+    )
+
+    single_counts = experiment.afterwards.counts[0]
+    zz_correlators = analysis.content.zz_correlators
+    num_qubits = experiment.args.num_qubits
+    assert zz_correlators.shape == (num_qubits, num_qubits), "Wrong shape of ZZ correlators."
+    for qi, qj in permutations(range(num_qubits), 2):
+        _, cell = magsq_cell_py(0, single_counts_marginal(single_counts, [qi, qj]), 1024)
+        assert np.isclose(
+            zz_correlators[qi, qj], cell
+        ), f"The ZZ correlator of {qi} and {qj} is not the same as the pairwise cell."
+
+
+def test_zz_correlators_export(tmp_path):
+    """Test the ZZ correlators are exported and read back as an array."""
+
+    exp_id = exp_magsq.measure(
+        wave=wave_adds[-1], shots=1024, run_args={"seed_simulator": SEED_SIMULATOR}
+    )
+    experiment = exp_magsq.exps[exp_id]
+    analysis = experiment.analyze()
+
+    exp_id, files = experiment.write(save_location=tmp_path)
+    exp_read = MagnetSquareExperiment._read_core(exp_id, files, tmp_path)
+    zz_correlators_read = list(exp_read.reports.values())[-1].content.zz_correlators
+    assert isinstance(zz_correlators_read, np.ndarray), "The ZZ correlators are not an array."
+    assert np.allclose(
+        zz_correlators_read, analysis.content.zz_correlators
+    ), "The ZZ correlators are not read back."
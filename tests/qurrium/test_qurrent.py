@@ -357,3 +357,51 @@ def test_multi_output_03():
     assert (
         read_summoner_id == summoner_id
     ), f"The read summoner id is wrong: {read_summoner_id} != {summoner_id}."
+
+
+def test_measure_until_converged():
+    """Test the randomized measurement stops once the purity converges."""
+
+    exp_method = EntropyMeasure(method="randomized")
+    wave = exp_method.add(GHZ(4), "4-GHZ-converged")
+    seeds = {i: random_unitary_seeds[4][i] for i in range(100)}
+
+    exp_ids, estimator = exp_method.measure_until_converged(
+        wave=wave,
+        selected_qubits=[0, 1],
+        target_precision=0.05,
+        batch_times=10,
+        max_times=100,
+        min_times=20,
+        random_unitary_seeds=seeds,
+        shots=1024,
+        backend=backend,
+    )
+    assert estimator.converged, f"The purity does not converge: {estimator}."
+    assert 1 < len(exp_ids) < 10, f"The batches do not stop on convergence: {len(exp_ids)}."
+    assert len(estimator) == 10 * len(exp_ids)
+    assert np.abs(estimator.purity - 0.5) < THREDHOLD, (
+        "The randomized measurement result is wrong: "
+        + f"{np.abs(estimator.purity - 0.5)} !< {THREDHOLD}. {estimator.purity} != 0.5."
+    )
+
+
+def test_measure_until_converged_invalid():
+    """Test the invalid inputs of the batches are rejected before any batch is executed."""
+
+    exp_method = EntropyMeasure(method="randomized")
+    wave = exp_method.add(GHZ(4), "4-GHZ-converged-invalid")
+
+    with pytest.raises(ValueError, match="not measured"):
+        exp_method.measure_until_converged(
+            wave=wave, selected_qubits=[3], measure=(0, 2), batch_times=2, max_times=2, min_times=2
+        )
+    with pytest.raises(ValueError, match="missing"):
+        exp_method.measure_until_converged(
+            wave=wave,
+            batch_times=2,
+            max_times=4,
+            min_times=2,
+            random_unitary_seeds={i: random_unitary_seeds[4][i] for i in range(3)},
+        )
+    assert len(exp_method.exps) == 0, "No batch should be executed for the invalid inputs."
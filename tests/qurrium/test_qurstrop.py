@@ -0,0 +1,66 @@
+"""
+================================================================
+Test the qurry.qurstrop module StringOperator class.
+================================================================
+
+- [8-trivial] The string order of 'i' is 1.0.
+- [8-topological-period] The string order of 'zy' is 1.0 in magnitude.
+
+"""
+
+import pytest
+import numpy as np
+
+from qurry.qurstrop import StringOperator
+from qurry.qurstrop.string_operator.utils import group_basis_configurations
+from qurry.recipe import TrivialParamagnet, TopologicalParamagnet
+
+SEED_SIMULATOR = 2019  # <harmony/>
+THREDHOLD = 0.1
+STRINGS = [(0, 8), (1, 6), (2, 4), (0, 4), (4, 4)]
+
+exp_strop = StringOperator()
+wave_adds = [
+    (exp_strop.add(TrivialParamagnet(8), "8-trivial"), "i"),
+    (exp_strop.add(TopologicalParamagnet(8, "period"), "8-topological-period"), "zy"),
+]
+
+
+def test_group_basis_configurations():
+    """Test the strings without conflicts are grouped into the same configuration."""
+
+    configurations, configuration_of_strings, qubits_of_strings = group_basis_configurations(
+        8, "zy", STRINGS
+    )
+    assert configurations[configuration_of_strings[3]] == "zyyzzyyz", "Wrong configuration."
+    assert (
+        configuration_of_strings[3] == configuration_of_strings[4]
+    ), "The disjoint strings should be in the same configuration."
+    assert len(configurations) == 4, f"Unexpected number of configurations: {configurations}."
+    assert qubits_of_strings[0] == list(range(8)), "Wrong qubits of the string."
+
+
+@pytest.mark.parametrize("wave_string", wave_adds)
+def test_string_operator(wave_string: tuple[str, str]):
+    """Test the string order parameters of all strings."""
+
+    wave, string = wave_string
+    exp_id = exp_strop.measure(
+        wave=wave,
+        string=string,
+        strings=STRINGS,
+        shots=1024,
+        run_args={"seed_simulator": SEED_SIMULATOR},
+    )
+    experiment = exp_strop.exps[exp_id]
+    assert len(experiment.beforewards.circuit) == len(
+        experiment.args.configurations  # type: ignore
+    ), "One circuit should be measured for each configuration."
+
+    analysis = experiment.analyze()
+    assert len(analysis.content.orders) == len(STRINGS), "Wrong number of string orders."
+    for (position, length), order in zip(STRINGS, analysis.content.orders):
+        assert np.abs(np.abs(order) - 1.0) < THREDHOLD, (
+            f"The string order of '{string}' at position {position} with length {length} "
+            + f"of {wave} is {order}, but the answer is 1.0 in magnitude."
+        )
@@ -0,0 +1,72 @@
+"""
+================================================================
+Test the random unitary generation in qurry.qurrium.utils
+================================================================
+
+"""
+
+import numpy as np
+from qiskit.circuit.library import UGate
+from qiskit.quantum_info import Operator
+
+from qurry.qurrium.utils.randomized import (
+    random_unitary,
+    qubit_operator_to_pauli_coeff,
+    local_unitary_array_to_pauli_coeff,
+    unitary_array_to_u_angles,
+)
+from qurry.qurrium.utils.random_unitary import (
+    generate_random_unitary_seeds,
+    generate_random_unitary_array,
+)
+
+
+def test_random_unitary_array_matches_qiskit():
+    """Test the batched random unitary operators are the same as qiskit one by one."""
+
+    random_unitary_seeds = generate_random_unitary_seeds(10, 5, 20241025)
+    unitary_array = generate_random_unitary_array(10, 5, random_unitary_seeds)
+    assert unitary_array.shape == (10, 5, 2, 2)
+
+    for i in range(10):
+        for j in range(5):
+            expected = random_unitary(2, random_unitary_seeds[i][j]).data
+            assert np.allclose(
+                unitary_array[i, j], expected
+            ), f"The unitary operator at {i}, {j} is not the same as qiskit."
+
+
+def test_random_unitary_array_is_unitary():
+    """Test the batched random unitary operators without seeds are unitary."""
+
+    unitary_array = generate_random_unitary_array(20, 3)
+    products = unitary_array @ np.conj(np.swapaxes(unitary_array, -1, -2))
+    assert np.allclose(products, np.eye(2)), "The generated operators are not unitary."
+
+
+def test_random_unitary_array_pauli_coeff():
+    """Test the vectorized pauli coefficients are the same as the single one."""
+
+    unitary_array = generate_random_unitary_array(4, 3, generate_random_unitary_seeds(4, 3, 7))
+    randomized = local_unitary_array_to_pauli_coeff(unitary_array, [2, 3, 4])
+    for i in range(4):
+        for ui, qi in enumerate([2, 3, 4]):
+            assert np.allclose(
+                randomized[i][qi], qubit_operator_to_pauli_coeff(unitary_array[i, ui])
+            ), f"The pauli coefficients at {i}, {qi} are not the same."
+
+
+def test_unitary_array_to_u_angles():
+    """Test the Euler angles give the same operators up to a global phase."""
+
+    unitary_array = np.concatenate(
+        [
+            generate_random_unitary_array(1, 20).reshape(20, 2, 2),
+            np.array([[[0, 1], [1, 0]], [[0, -1j], [1j, 0]], [[1, 0], [0, -1]], np.eye(2)]),
+        ]
+    )
+    u_angles = unitary_array_to_u_angles(unitary_array)
+    for i, (theta, phi, lam) in enumerate(u_angles):
+        assert Operator(UGate(theta, phi, lam)).equiv(
+            Operator(unitary_array[i])
+        ), f"The Euler angles of operator {i} are not correct."
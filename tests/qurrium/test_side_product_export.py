@@ -0,0 +1,76 @@
+"""
+================================================================
+Test the binary export of side products of qurry.qurrium
+================================================================
+
+"""
+
+import numpy as np
+
+from qurry.qurrent import EntropyMeasure
+from qurry.qurrent.randomized_measure import EntropyMeasureRandomizedExperiment
+from qurry.qurrech import EchoListen
+from qurry.qurrech.randomized_measure import EchoListenRandomizedExperiment
+from qurry.qurrium.utils.random_unitary import (
+    generate_random_unitary_seeds,
+    generate_random_unitary_array,
+)
+from qurry.tools.backend import GeneralSimulator
+from qurry.recipe import GHZ
+
+
+def test_randomized_side_product_arrays(tmp_path):
+    """Test the random unitary operators are stored as arrays, exported as `.npy` and read back."""
+
+    exp_method = EntropyMeasure(method="randomized")
+    wave = exp_method.add(GHZ(4), "4-GHZ")
+    seeds = generate_random_unitary_seeds(5, 4, 1234)
+    exp_id = exp_method.measure(
+        wave=wave, times=5, shots=64, random_unitary_seeds=seeds, backend=GeneralSimulator()
+    )
+    exp = exp_method.exps[exp_id]
+
+    unitary_array = exp.beforewards.side_product["unitaryOP"]
+    assert unitary_array.shape == (5, 4, 2, 2) and unitary_array.dtype == np.complex128
+    assert np.allclose(unitary_array, generate_random_unitary_array(5, 4, seeds))
+    assert exp.beforewards.side_product["randomized"].shape == (5, 4, 3)
+
+    exp_id, files = exp.write(save_location=tmp_path)
+    assert files["tales.unitaryOP"].endswith(".npy")
+    assert files["tales.randomized"].endswith(".npy")
+    exp_read = EntropyMeasureRandomizedExperiment._read_core(exp_id, files, tmp_path)
+    for k in ["unitaryOP", "randomized"]:
+        assert np.array_equal(
+            exp_read.beforewards.side_product[k], exp.beforewards.side_product[k]
+        ), f"The side product {k} is not read back."
+
+
+def test_echo_randomized_side_product_arrays(tmp_path):
+    """Test the random unitary operators of the echo are stored as arrays and read back."""
+
+    exp_method = EchoListen(method="randomized")
+    wave = exp_method.add(GHZ(4), "4-GHZ")
+    seeds = generate_random_unitary_seeds(5, 4, 1234)
+    exp_id = exp_method.measure(
+        wave1=wave,
+        wave2=wave,
+        times=5,
+        shots=64,
+        random_unitary_seeds=seeds,
+        backend=GeneralSimulator(),
+    )
+    exp = exp_method.exps[exp_id]
+
+    unitary_array = exp.beforewards.side_product["unitaryOP"]
+    assert unitary_array.shape == (5, 4, 2, 2) and unitary_array.dtype == np.complex128
+    assert np.allclose(unitary_array, generate_random_unitary_array(5, 4, seeds))
+    assert exp.beforewards.side_product["randomized"].shape == (5, 4, 3)
+
+    exp_id, files = exp.write(save_location=tmp_path)
+    assert files["tales.unitaryOP"].endswith(".npy")
+    assert files["tales.randomized"].endswith(".npy")
+    exp_read = EchoListenRandomizedExperiment._read_core(exp_id, files, tmp_path)
+    for k in ["unitaryOP", "randomized"]:
+        assert np.array_equal(
+            exp_read.beforewards.side_product[k], exp.beforewards.side_product[k]
+        ), f"The side product {k} is not read back."
@@ -0,0 +1,60 @@
+"""
+================================================================
+Test the template bound circuits of qurry.qurrium.utils.build
+================================================================
+
+"""
+
+import pickle
+import pytest
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+
+from qurry.qurrium.utils import TemplateBoundCircuits
+
+
+def make_template_bound_circuits() -> TemplateBoundCircuits:
+    """Make the template bound circuits with a single parameterized template."""
+
+    theta = Parameter("theta")
+    template = QuantumCircuit(1)
+    template.rx(theta, 0)
+    return TemplateBoundCircuits(
+        templates=[template],
+        template_parameters=[[theta]],
+        bindings=[(0, [0.1]), (0, [0.2]), (0, [0.3])],
+        names=["a", "b", "c"],
+    )
+
+
+def test_template_bound_circuits():
+    """Test the circuits are bound before and after transpiling."""
+
+    template_bound = make_template_bound_circuits()
+    transpiled = template_bound.bind_transpiled(lambda circs: circs)
+    assert [c.name for c in transpiled] == ["a", "b", "c"]
+    assert all(len(c.parameters) == 0 for c in transpiled), "Not all parameters are bound."
+
+    circuits = template_bound.circuits()
+    assert [c.name for c in circuits] == ["a", "b", "c"]
+    assert all(len(c.parameters) == 0 for c in circuits), "Not all parameters are bound."
+    assert len(template_bound.templates[0].parameters) == 1, "The template is bound in place."
+
+
+def test_template_bound_circuits_pickle():
+    """Test the template bound circuits can be pickled."""
+
+    template_bound = make_template_bound_circuits()
+    loaded = pickle.loads(pickle.dumps(template_bound))
+    assert loaded.bindings == template_bound.bindings
+    assert loaded.names == template_bound.names
+    assert loaded.circuits() == template_bound.circuits()
+
+
+def test_template_bound_circuits_missing_parameters():
+    """Test the missing parameters of the transpiled templates are raised."""
+
+    template_bound = make_template_bound_circuits()
+    with pytest.raises(ValueError, match="theta"):
+        template_bound.bind_transpiled(lambda circs: [QuantumCircuit(1) for _ in circs])
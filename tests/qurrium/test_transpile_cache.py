@@ -0,0 +1,94 @@
+"""
+================================================================
+Test the transpile cache of qurry.qurrium.utils.transpile_cache
+================================================================
+
+"""
+
+import os
+import sys
+import subprocess
+from pathlib import Path
+
+import qurry
+from qurry.qurrent import EntropyMeasure
+from qurry.qurrium.utils.transpile_cache import TranspileCache, circuit_structure_hash
+from qurry.tools.backend import GeneralSimulator
+from qurry.recipe import GHZ, TrivialParamagnet
+
+
+def test_circuit_structure_hash():
+    """Test the structure hash ignores the name but not the structure."""
+
+    ghz_1 = GHZ(4)
+    ghz_2 = GHZ(4)
+    ghz_2.name = "another_name"
+    assert circuit_structure_hash(ghz_1) == circuit_structure_hash(ghz_2)
+    assert circuit_structure_hash(ghz_1) != circuit_structure_hash(TrivialParamagnet(4))
+
+
+def test_transpile_cache(tmp_path):
+    """Test the second build loads the transpiled circuits from the cache."""
+
+    backend = GeneralSimulator()
+    exp_method = EntropyMeasure(method="randomized")
+    exp_method.transpile_cache = TranspileCache(tmp_path, max_entries=4)
+    wave = exp_method.add(GHZ(4), "4-GHZ")
+
+    exp_id_1 = exp_method.build([wave], times=10, random_unitary_seeds=None, backend=backend)
+    assert exp_method.transpile_cache.misses == 1
+    assert exp_method.transpile_cache.hits == 0
+
+    exp_id_2 = exp_method.build([wave], times=10, random_unitary_seeds=None, backend=backend)
+    assert exp_method.transpile_cache.misses == 1
+    assert exp_method.transpile_cache.hits == 1
+    assert len(exp_method.transpile_cache.entries()) == 1
+
+    circuits_1 = exp_method.exps[exp_id_1].beforewards.circuit
+    circuits_2 = exp_method.exps[exp_id_2].beforewards.circuit
+    assert len(circuits_1) == len(circuits_2) == 10
+    assert all(len(c.parameters) == 0 for c in circuits_2), "Not all parameters are bound."
+    assert [c.name for c in circuits_1] == [c.name for c in circuits_2]
+
+    exp_method.build([wave], times=10, backend=backend, transpile_args={"optimization_level": 0})
+    assert exp_method.transpile_cache.misses == 2
+
+
+KEY_SCRIPT = """
+from qiskit.transpiler import CouplingMap
+from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
+from qurry.qurrium.utils.transpile_cache import TranspileCache
+from qurry.tools.backend import GeneralSimulator
+from qurry.recipe import GHZ
+
+backend = GeneralSimulator()
+print(
+    TranspileCache().key(
+        GHZ(4),
+        backend,
+        {"optimization_level": 1, "coupling_map": CouplingMap.from_line(4)},
+        ("preset", generate_preset_pass_manager(1, backend)),
+    )
+)
+"""
+
+
+def test_transpile_cache_key_across_processes():
+    """Test the key is the same across processes, so the cache can hit across sessions."""
+
+    keys = []
+    for hash_seed in ["1", "2"]:
+        env = {
+            **os.environ,
+            "PYTHONHASHSEED": hash_seed,
+            "PYTHONPATH": str(Path(qurry.__file__).parent.parent),
+        }
+        completed = subprocess.run(
+            [sys.executable, "-c", KEY_SCRIPT],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        keys.append(completed.stdout.strip().splitlines()[-1])
+    assert keys[0] == keys[1], f"The key is not stable across processes: {keys}."
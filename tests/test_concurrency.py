@@ -0,0 +1,75 @@
+"""
+============================================================================
+Test the concurrency budget of qurry.tools.
+============================================================================
+
+"""
+
+import os
+
+from qurry.tools import ParallelManager, get_concurrency, set_concurrency, workers_distribution
+
+
+def worker_budget(_: int) -> tuple[int, int, str, str]:
+    """Report the budget and the thread limit inside a worker."""
+    return (
+        workers_distribution(),
+        get_concurrency().total,
+        os.environ["OMP_NUM_THREADS"],
+        os.environ["RAYON_NUM_THREADS"],
+    )
+
+
+def test_concurrency_budget():
+    """Test the budget sizes the pools and limits the threads in the workers."""
+
+    original = get_concurrency()
+    original_rayon = os.environ.get("RAYON_NUM_THREADS")
+    try:
+        budget = set_concurrency(4, workers=2)
+        assert budget == (4, 2, 2), f"Unexpected budget {budget}."
+        assert os.environ["RAYON_NUM_THREADS"] == "4", "rayon is not sized by the budget."
+        assert workers_distribution() == 2, "The pool is not sized by the budget."
+
+        pool = ParallelManager()
+        assert (pool.workers_num, pool.threads_per_worker) == (2, 2), "Unexpected pool size."
+        for nested_workers, threads, omp, rayon in pool.map(worker_budget, range(4)):
+            assert nested_workers == 1, "The nested pool is not guarded."
+            assert (threads, omp, rayon) == (2, "2", "2"), f"Unexpected threads {threads}, {omp}."
+        assert "QURRY_POOL_PARENT" not in os.environ, "The parent is marked as a worker."
+    finally:
+        set_concurrency(original.total, original.workers)
+        if original_rayon is None:
+            os.environ.pop("RAYON_NUM_THREADS", None)
+        else:
+            os.environ["RAYON_NUM_THREADS"] = original_rayon
+
+
+def test_concurrency_parent_environment(monkeypatch):
+    """Test the threads of the workers are limited without touching the parent environment."""
+
+    original = get_concurrency()
+    original_rayon = os.environ.get("RAYON_NUM_THREADS")
+    original_putenv = os.putenv
+    parent_pid = os.getpid()
+    parent_envs = []
+
+    def recording_putenv(key, value):
+        if os.getpid() == parent_pid:
+            parent_envs.append(key)
+        original_putenv(key, value)
+
+    try:
+        set_concurrency(4, workers=2)
+        monkeypatch.setattr(os, "putenv", recording_putenv)
+        pool = ParallelManager()
+        for _, threads, omp, rayon in pool.process_map(worker_budget, [(i,) for i in range(4)]):
+            assert (threads, omp, rayon) == (2, "2", "2"), f"Unexpected threads {threads}, {omp}."
+        assert len(parent_envs) == 0, f"The parent environment is touched: {parent_envs}."
+    finally:
+        monkeypatch.undo()
+        set_concurrency(original.total, original.workers)
+        if original_rayon is None:
+            os.environ.pop("RAYON_NUM_THREADS", None)
+        else:
+            os.environ["RAYON_NUM_THREADS"] = original_rayon